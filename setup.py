@@ -19,7 +19,7 @@ setup(
     packages=find_packages(exclude=["tests"]),
     install_requires=open("requirements.txt", "r").readlines(),
     url="https://github.com/wtsi-hgi/unjsify_cwl",
-    package_data={'': ['*.js', "VERSION"]},
+    package_data={'': ['*.js', '*.cwl', "VERSION"]},
     include_package_data=True,
     license="MIT",
     description="TODO",
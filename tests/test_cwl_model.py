@@ -0,0 +1,219 @@
+import functools
+import http.server
+import json
+import os.path as path
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import ruamel.yaml as yaml
+
+from unjsify_cwl import cwl_model
+from unjsify_cwl.synthetic import packed_tools
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+class SlowHandler(http.server.SimpleHTTPRequestHandler):
+    """Serves files slowly enough that fetches made together overlap."""
+    lock = threading.Lock()
+    in_flight = 0
+    most_in_flight = 0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.most_in_flight = max(cls.most_in_flight, cls.in_flight)
+        try:
+            time.sleep(0.2)
+            return super().do_GET()
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+@pytest.fixture
+def http_root(tmp_path, monkeypatch):
+    """A directory served over HTTP, and the URL it is served at."""
+    # Keep the HTTP cache of the remote fetcher out of the real home directory
+    monkeypatch.setenv("HOME", str(tmp_path))
+    root = tmp_path / "http"
+    root.mkdir()
+    handler = type("Handler", (SlowHandler,), {"lock": threading.Lock()})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(handler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield root, "http://127.0.0.1:%d" % server.server_address[1], handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_fast_yaml_falls_back_to_round_trip(tmp_path):
+    # libyaml rejects a URL in a flow sequence, which ruamel reads
+    (tmp_path / "tool.cwl").write_text(
+        "cwlVersion: v1.0\n"
+        "class: CommandLineTool\n"
+        "baseCommand: [echo, http://example.org/x]\n"
+        "inputs: []\n"
+        "outputs: []\n"
+    )
+    url = (tmp_path / "tool.cwl").as_uri()
+
+    tool = cwl_model.load_document(url, "", cwl_model.LoadingOptions(fast_yaml=True))
+
+    assert tool.baseCommand == ["echo", "http://example.org/x"]
+
+def test_fast_yaml_loaded_document_errors_have_positions(tmp_path):
+    (tmp_path / "tool.cwl").write_text(
+        "cwlVersion: v1.0\n"
+        "class: CommandLineTool\n"
+        "baseCommand: echo\n"
+        "inputs: 5\n"
+        "outputs: []\n"
+    )
+    url = (tmp_path / "tool.cwl").as_uri()
+    loading_options = cwl_model.LoadingOptions(fast_yaml=True)
+    loading_options.idx[url] = yaml.safe_load((tmp_path / "tool.cwl").read_text())
+
+    with pytest.raises(cwl_model.ValidationException, match="tool.cwl:4:1:"):
+        cwl_model.load_document(url, "", loading_options)
+
+def test_generated_parsers_are_up_to_date():
+    subprocess.run([sys.executable, path.join(ROOT, "generate_parsers"), "--check"], check=True)
+
+def test_generated_parsers_match_generic_loaders():
+    # Exits with an error when any document loads differently
+    subprocess.run(
+        [sys.executable, path.join(ROOT, "benchmark_parsers"), "--width", "5", "--corrupted", "60", "--repeat", "1"],
+        check=True
+    )
+
+def test_trusted_load_matches_validated_load(tmp_path):
+    # Unions of records, arrays, enums and strings, whose alternates a trusted
+    # load picks without trying each in turn
+    packed = {
+        "cwlVersion": "v1.0",
+        "$graph": [{
+            "id": "tool",
+            "class": "CommandLineTool",
+            "requirements": [
+                {"class": "InlineJavascriptRequirement", "expressionLib": ["function f() { return 1; }"]},
+                {"class": "SchemaDefRequirement", "types": [{"name": "Mode", "type": "enum", "symbols": ["fast", "slow"]}]},
+                {"class": "InitialWorkDirRequirement", "listing": ["$(inputs.reads)", {"entryname": "config", "entry": "x"}]},
+                {"class": "EnvVarRequirement", "envDef": {"LANG": "C"}},
+            ],
+            "hints": {"ResourceRequirement": {"coresMin": 2}},
+            "baseCommand": "echo",
+            "arguments": ["--verbose", {"valueFrom": "$(inputs.count)", "position": 2}],
+            "inputs": {
+                "reads": {"type": {"type": "array", "items": "File"}, "secondaryFiles": [".bai", "$(self.basename).idx"]},
+                "mode": "#tool/Mode?",
+                "count": ["null", "int", {"type": "array", "items": "int"}],
+                "names": "string[]?",
+                "options": {"type": {"type": "record", "name": "Options", "fields": [
+                    {"name": "level", "type": {"type": "enum", "name": "Level", "symbols": ["low", "high"]}},
+                    {"name": "tags", "type": ["null", {"type": "array", "items": "string"}], "inputBinding": {"prefix": "-t"}},
+                ]}},
+                "reference": {"type": "File", "default": {"class": "File", "location": "ref.fa", "secondaryFiles": [{"class": "File", "location": "ref.fa.fai"}]}},
+            },
+            "outputs": {
+                "out": "stdout",
+                "logs": {"type": ["null", {"type": "array", "items": "File"}], "outputBinding": {"glob": ["*.log", "$(inputs.mode)"]}},
+            },
+        }, {
+            "id": "main",
+            "class": "Workflow",
+            "requirements": [{"class": "ScatterFeatureRequirement"}, {"class": "StepInputExpressionRequirement"}],
+            "inputs": {"reads": "File[]", "count": "int?", "options": "Any"},
+            "outputs": {"out": {"type": "File[]", "outputSource": "step/out"}},
+            "steps": {"step": {
+                "run": "#tool",
+                "scatter": "reads",
+                "in": {"reads": {"source": ["reads"], "linkMerge": "merge_flattened"}, "count": {"source": "count", "valueFrom": "$(self + 1)"}, "options": "options"},
+                "out": ["out", {"id": "logs"}],
+            }},
+        }],
+    }
+    (tmp_path / "packed.cwl").write_text(json.dumps(packed))
+    url = (tmp_path / "packed.cwl").as_uri()
+
+    trusted = cwl_model.save(cwl_model.load_document(url, "", cwl_model.LoadingOptions(validate=False)))
+    validated = cwl_model.save(cwl_model.load_document(url, "", cwl_model.LoadingOptions()))
+
+    assert trusted == validated
+
+def test_remote_imports_are_fetched_together(tmp_path, http_root):
+    root, base_url, handler = http_root
+    (root / "inputs.yml").write_text("message:\n  type: string\n  inputBinding: {position: 1}\n")
+    (root / "outputs.yml").write_text("out: stdout\n")
+    (tmp_path / "tool.cwl").write_text(
+        "cwlVersion: v1.0\n"
+        "class: CommandLineTool\n"
+        "baseCommand: echo\n"
+        "inputs:\n"
+        "  $import: %s/inputs.yml\n"
+        "outputs:\n"
+        "  $import: %s/outputs.yml\n" % (base_url, base_url)
+    )
+    url = (tmp_path / "tool.cwl").as_uri()
+
+    results = {}
+    for workers in (1, 8):
+        handler.most_in_flight = 0
+        results[workers] = cwl_model.save(cwl_model.load_document(url, "", cwl_model.LoadingOptions(fetch_workers=workers)))
+        assert handler.most_in_flight == min(workers, 2)
+
+    assert results[8] == results[1]
+    assert [i["id"] for i in results[8]["inputs"]] == [base_url + "/inputs.yml#message"]
+
+def test_missing_file_error_names_the_file(tmp_path):
+    # The URL of a file whose name has a space in it is percent-encoded
+    missing = tmp_path / "no such tool.cwl"
+
+    with pytest.raises(cwl_model.ValidationException) as excinfo:
+        cwl_model.LocalFetcher().fetch_text(missing.as_uri())
+
+    assert str(excinfo.value) == str(FileNotFoundError(2, "No such file or directory", str(missing)))
+
+def test_parallel_graph_load_matches_serial_load(tmp_path, monkeypatch):
+    (tmp_path / "packed.cwl").write_text(json.dumps(packed_tools(2 * cwl_model._PARALLEL_GRAPH_MIN_ENTRIES)))
+    url = (tmp_path / "packed.cwl").as_uri()
+
+    parallel_loads = []
+    parallel_graph_load = cwl_model._parallel_graph_load
+    def record_parallel_graph_load(*args):
+        result = parallel_graph_load(*args)
+        parallel_loads.append(result is not None)
+        return result
+    monkeypatch.setattr(cwl_model, "_parallel_graph_load", record_parallel_graph_load)
+
+    with ProcessPoolExecutor(2) as executor:
+        parallel = cwl_model.save(cwl_model.load_document(url, "", cwl_model.LoadingOptions(executor=executor)))
+    serial = cwl_model.save(cwl_model.load_document(url, "", cwl_model.LoadingOptions()))
+
+    assert parallel_loads == [True]
+    assert parallel == serial
+
+def test_document_reloader_matches_fresh_load(tmp_path):
+    packed = packed_tools(5)
+    (tmp_path / "packed.cwl").write_text(json.dumps(packed))
+    url = (tmp_path / "packed.cwl").as_uri()
+    reloader = cwl_model.DocumentReloader(url)
+
+    assert cwl_model.save(reloader.load()) == cwl_model.save(cwl_model.load_document(url, "", cwl_model.LoadingOptions()))
+    assert reloader.stats() == "0 processes reused, 5 loaded"
+
+    packed["$graph"][2]["baseCommand"] = ["echo", "changed"]
+    (tmp_path / "packed.cwl").write_text(json.dumps(packed))
+
+    assert cwl_model.save(reloader.load()) == cwl_model.save(cwl_model.load_document(url, "", cwl_model.LoadingOptions()))
+    assert reloader.stats() == "4 processes reused, 1 loaded"
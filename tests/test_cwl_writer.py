@@ -0,0 +1,28 @@
+import io
+import os.path as path
+
+import pytest
+import ruamel.yaml as yaml
+
+from unjsify_cwl import unjsify_cwl
+from unjsify_cwl.cwl_writer import dump_cwl
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+class NoAliasDumper(yaml.Dumper):
+    def ignore_aliases(self, data):
+        return True
+
+@pytest.mark.parametrize("cwl_path", ["test/test_tool.cwl", "test/test_workflow.cwl", "unjsify_cwl/eval_exprs_js.cwl"])
+def test_dump_cwl_matches_yaml_dump(cwl_path):
+    cwl = dict(unjsify_cwl.get_cwl(path.join(ROOT, cwl_path)))
+    # Nodes that appear more than once are written in full each time
+    shared = {"x": [1, "a"]}
+    cwl["shared"] = [shared, shared, [shared], {}]
+
+    written = io.StringIO()
+    dump_cwl(cwl, written)
+    dumped = io.StringIO()
+    yaml.dump(cwl, dumped, Dumper=NoAliasDumper, default_flow_style=False)
+
+    assert written.getvalue() == dumped.getvalue()
@@ -0,0 +1,171 @@
+import os
+import os.path as path
+import subprocess
+import sys
+
+import pytest
+
+from unjsify_cwl import cwl_model, unjsify_cwl
+from unjsify_cwl.synthetic import js_tool, packed_tools, workflow, write_cwl
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+def read_tree(root):
+    """The contents of every file under root, by path relative to root."""
+    files = {}
+    for dirpath, _, filenames in os.walk(str(root)):
+        for filename in filenames:
+            with open(path.join(dirpath, filename), "rb") as fp:
+                files[path.relpath(path.join(dirpath, filename), str(root))] = fp.read()
+    return files
+
+@pytest.fixture
+def workflow_dir(tmp_path):
+    """
+    A workflow that runs one tool file from two steps, two tool files with the
+    same content, and one subworkflow from two steps.
+    """
+    source = tmp_path / "source"
+    for i in range(3):
+        write_cwl(source / "tools" / f"tool{i}.cwl", js_tool(i))
+    write_cwl(source / "tools" / "copy.cwl", js_tool(0))
+    write_cwl(source / "sub.cwl", workflow([("s0", "tools/tool1.cwl"), ("s1", "tools/tool2.cwl")]))
+    write_cwl(source / "wf.cwl", workflow([
+        ("a", "tools/tool0.cwl"), ("b", "tools/tool0.cwl"), ("c", "tools/copy.cwl"),
+        ("d", "sub.cwl"), ("e", "sub.cwl"), ("f", "tools/tool1.cwl"),
+    ]))
+    return source
+
+@pytest.fixture
+def serial_output(workflow_dir, tmp_path):
+    """The files written by a run without any options."""
+    unjsify(workflow_dir / "wf.cwl", tmp_path / "serial")
+    return read_tree(tmp_path / "serial")
+
+def unjsify(cwl_filename, outdir, *args):
+    subprocess.run(
+        [sys.executable, "-m", "unjsify_cwl", str(cwl_filename), "-o", str(outdir)] + list(args),
+        cwd=ROOT, check=True
+    )
+
+def test_date_default(tmp_path):
+    # An unquoted date loads as a datetime.date rather than a string
+    (tmp_path / "tool.cwl").write_text(
+        "cwlVersion: v1.0\n"
+        "class: CommandLineTool\n"
+        "requirements:\n"
+        "- class: InlineJavascriptRequirement\n"
+        "baseCommand: echo\n"
+        "inputs:\n"
+        "  day:\n"
+        "    type: string\n"
+        "    default: 2001-12-14\n"
+        "    inputBinding:\n"
+        "      valueFrom: $(self + \"x\")\n"
+        "outputs: []\n"
+    )
+    write_cwl(tmp_path / "wf.cwl", {
+        "cwlVersion": "v1.0",
+        "class": "Workflow",
+        "inputs": [],
+        "outputs": [],
+        "steps": [{"id": "s1", "run": "./tool.cwl", "in": [], "out": []}],
+    })
+
+    unjsify(tmp_path / "wf.cwl", tmp_path / "out")
+
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["eval_exprs.cwl", "tool.cwl", "wf.cwl"]
+    assert "default: 2001-12-14" in (tmp_path / "out" / "tool.cwl").read_text()
+
+def test_serial_run_writes_every_document(serial_output):
+    assert sorted(serial_output) == [
+        "eval_exprs.cwl", "sub.cwl", "tools/copy.cwl", "tools/tool0.cwl", "tools/tool1.cwl", "tools/tool2.cwl", "wf.cwl"
+    ]
+
+@pytest.mark.parametrize("options", [
+    ["--jobs", "2"],
+    ["--load-workers", "2"],
+    ["--jobs", "2", "--load-workers", "2"],
+    ["--low-memory"],
+    ["--fast-yaml"],
+    ["--trusted"],
+])
+def test_options_match_serial_run(workflow_dir, serial_output, tmp_path, options):
+    unjsify(workflow_dir / "wf.cwl", tmp_path / "out", *options)
+
+    assert read_tree(tmp_path / "out") == serial_output
+
+def test_document_cache_matches_serial_run(workflow_dir, serial_output, tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    # The first run fills the cache and the second one reads from it
+    for run in ("miss", "hit"):
+        unjsify(workflow_dir / "wf.cwl", tmp_path / run, "--cache-dir", str(cache_dir))
+        assert read_tree(tmp_path / run) == serial_output
+        assert os.listdir(str(cache_dir))
+
+def test_verbose_run_reports_reuse(workflow_dir, tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-m", "unjsify_cwl", str(workflow_dir / "wf.cwl"), "-o", str(tmp_path / "out"), "--verbose"],
+        cwd=ROOT, check=True, stderr=subprocess.PIPE, universal_newlines=True
+    )
+
+    assert "unjsified 3 tools and 1 subworkflows, reused them 3 and 1 times" in result.stderr
+
+def test_fragment_load_matches_graph_entry(tmp_path):
+    packed = packed_tools(3)
+    write_cwl(tmp_path / "packed.cwl", packed)
+    packed_path = str(tmp_path / "packed.cwl")
+
+    fragment = unjsify_cwl.get_cwl(packed_path + "#tool1")
+
+    # Once the whole $graph is loaded, get_cwl picks the entry out of it
+    run = unjsify_cwl.UnjsifyRun()
+    unjsify_cwl.get_cwl(packed_path, run)
+    assert unjsify_cwl.get_cwl(packed_path + "#tool1", run) == fragment
+
+    # Only the entry asked for is validated
+    packed["$graph"][2]["inputs"] = 5
+    write_cwl(tmp_path / "packed.cwl", packed)
+    assert unjsify_cwl.get_cwl(packed_path + "#tool1") == fragment
+    with pytest.raises(cwl_model.ValidationException):
+        unjsify_cwl.get_cwl(packed_path)
+
+def test_packed_workflow(tmp_path):
+    graph = [dict(js_tool(i), id=f"tool{i}") for i in range(2)]
+    graph.append(dict(workflow([("a", "#tool0"), ("b", "#tool1"), ("c", "#tool0")]), id="main"))
+    write_cwl(tmp_path / "source" / "packed.cwl", {"cwlVersion": "v1.0", "$graph": graph})
+
+    unjsify(str(tmp_path / "source" / "packed.cwl") + "#main", tmp_path / "serial")
+    unjsify(str(tmp_path / "source" / "packed.cwl") + "#main", tmp_path / "jobs", "--jobs", "2")
+
+    output = read_tree(tmp_path / "serial")
+    assert sorted(output) == ["eval_exprs.cwl", "packed.cwl"]
+    assert read_tree(tmp_path / "jobs") == output
+
+    # The new entries run each other and eval_exprs.cwl
+    url = (tmp_path / "serial" / "packed.cwl").as_uri()
+    processes = {process.id: process for process in cwl_model.load_document(url, "", cwl_model.LoadingOptions())}
+    runs = [step.run for wrapper in processes[url + "#main"].steps for step in wrapper.run.steps]
+    assert sorted(set(runs)) == [(tmp_path / "serial" / "eval_exprs.cwl").as_uri(), url + "#tool0", url + "#tool1"]
+
+class ForgetfulDict(dict):
+    def __setitem__(self, key, value):
+        pass
+
+def test_memos_match_unmemoized_run(workflow_dir, serial_output, tmp_path):
+    # Run in this process
+    run = unjsify_cwl.unjsify(str(workflow_dir / "wf.cwl"), str(tmp_path / "memoized"), str(workflow_dir), "js")
+    assert read_tree(tmp_path / "memoized") == serial_output
+    # tool0 is reused by step b and, with the same content, by step c; sub.cwl by step e
+    assert run.counts["tool reuses"] == 3
+    assert run.counts["workflow reuses"] == 1
+
+    # A run that unjsifies every tool and subworkflow again for each step
+    run = unjsify_cwl.UnjsifyRun()
+    run.unjsified_tools = ForgetfulDict()
+    run.unjsified_workflows = ForgetfulDict()
+    unjsify_cwl.unjsify(str(workflow_dir / "wf.cwl"), str(tmp_path / "unmemoized"), str(workflow_dir), "js", run)
+    assert run.counts["tool reuses"] == run.counts["workflow reuses"] == 0
+
+    assert read_tree(tmp_path / "unmemoized") == serial_output
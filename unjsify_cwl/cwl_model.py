@@ -193,18 +193,255 @@ import six
 from six.moves import urllib, StringIO
 import ruamel.yaml as yaml
 import copy
+import hashlib
+import json
 import re
-from typing import List, Text, Dict, Union, Any, Sequence
+from types import MappingProxyType
+from typing import List, Text, Dict, Union, Any, Mapping, Sequence
 import uuid
+import weakref
 
 class ValidationException(Exception):
     pass
 
+class _SourceError(object):
+    """
+A validation failure at `key` of the source `node`, kept as a record and only
+formatted (with its file:line:col lead) when converted to text.
+    """
+    __slots__ = ("node", "key", "reason", "cause")
+
+    def __init__(self, node, key, reason, cause=None):
+        # type: (Any, Any, Text, Union[Exception, None]) -> None
+        self.node = node
+        self.key = key
+        self.reason = reason
+        self.cause = cause
+
+    def __str__(self):
+        msg = self.reason
+        if self.cause is not None:
+            msg += six.text_type(self.cause)
+        return SourceLine(self.node, self.key, str).makeError(msg)
+
+class _ErrorList(object):
+    """
+The message of a ValidationException made up of several errors, joined into
+text the first time it is needed.
+    """
+    __slots__ = ("errors", "heading", "_text")
+
+    def __init__(self, errors, heading=None):
+        # type: (List[Any], Union[Text, None]) -> None
+        self.errors = errors
+        self.heading = heading
+        self._text = None
+
+    def __str__(self):
+        if self._text is None:
+            lines = [six.text_type(e) for e in self.errors]
+            if self.heading is not None:
+                lines.insert(0, self.heading)
+            self._text = "\n".join(lines)
+        return self._text
+
+class _UnionErrors(_ErrorList):
+    """
+The message of a failed _UnionLoader: one bullet per alternate tried.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        if self._text is None:
+            self._text = bullets(["tried %s but\n%s" % (t, indent(six.text_type(e))) for t, e in self.errors], "- ")
+        return self._text
+
 class Savable(object):
-    pass
+    __slots__ = ()
+
+    # (name, loader, optional) for each field, in the order they are loaded
+    _fields = ()  # type: Tuple[Tuple[Text, str, bool], ...]
+    # The field that holds the identifier and the base URI of the other
+    # fields, and whether a missing one is generated rather than an error
+    _identifier = None  # type: Union[Text, None]
+    _identifier_uuid = False
+    # Whether a reload can reuse the record built from unchanged source
+    _reusable = False
+
+    def save_items(self, top=False, base_url=""):
+        # type: (bool, Text) -> Iterable[Tuple[Text, Any]]
+        """
+Yield the (key, value) pairs of the saved form of this record, leaving nested
+records and lists unsaved so they can be written out as they are reached.
+        """
+        return iter(())
+
+    def save(self, top=False, base_url=""):
+        r = {}
+        for k, v in self.save_items(top=top, base_url=base_url):
+            r[k] = save(v, top=False, base_url=base_url)
+        return r
+
+    def __getstate__(self):
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        # The shared empty mapping can't be pickled; put it back on load.
+        if state.get("extension_fields") is _no_extension_fields:
+            del state["extension_fields"]
+            state["_no_extension_fields"] = True
+        return state
+
+    def __setstate__(self, state):
+        for name, value in six.iteritems(state):
+            if name == "_no_extension_fields":
+                self.extension_fields = _no_extension_fields
+            else:
+                setattr(self, name, value)
+
+# Shared by every record that has no extension fields.
+_no_extension_fields = MappingProxyType({})  # type: Mapping[Text, Any]
+
+def _remote_fetcher(pool_size=10):
+    import functools
+    import os
+    import requests
+    from cachecontrol.adapter import CacheControlAdapter
+    from cachecontrol.wrapper import CacheControl
+    from cachecontrol.caches import FileCache
+    from schema_salad.ref_resolver import DefaultFetcher
+    if "HOME" in os.environ:
+        cache = FileCache(os.path.join(os.environ["HOME"], ".cache", "salad"))
+    elif "TMP" in os.environ:
+        cache = FileCache(os.path.join(os.environ["TMP"], ".cache", "salad"))
+    else:
+        cache = FileCache("/tmp", ".cache", "salad")
+    # Keep a connection open for each concurrent prefetch
+    adapter_class = functools.partial(CacheControlAdapter, pool_connections=pool_size, pool_maxsize=pool_size)
+    session = CacheControl(requests.Session(), cache=cache, adapter_class=adapter_class)
+    return DefaultFetcher({}, session)
+
+class LocalFetcher(object):
+    """
+Fetcher that reads file:// documents with plain OS calls.
+
+Anything else is handed to schema-salad's DefaultFetcher, which (along with
+requests and cachecontrol) is only imported the first time a remote URL is
+fetched.
+    """
+    def __init__(self):
+        self.cache = {}  # type: Dict[Text, Text]
+        self._remote = None
+        self.pool_size = 10
+
+    @property
+    def remote(self):
+        if self._remote is None:
+            self._remote = _remote_fetcher(self.pool_size)
+        return self._remote
+
+    def prefetch(self, urls, workers):
+        # type: (Iterable[Text], int) -> None
+        """
+Fetch the remote documents at `urls` into the cache, `workers` at a time over
+one session, so that fetch_text doesn't wait on each of them in turn. A
+document that can't be fetched is left for fetch_text to report.
+        """
+        urls = [url for url in urls if url not in self.cache]
+        if not urls:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        if self._remote is None:
+            self.pool_size = max(self.pool_size, workers)
+        remote = self.remote
+
+        def fetch(url):
+            try:
+                return remote.fetch_text(url)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(min(workers, len(urls))) as executor:
+            for url, text in zip(urls, executor.map(fetch, urls)):
+                if text is not None:
+                    self.cache[url] = text
+
+    def urljoin(self, base_url, url):  # type: (Text, Text) -> Text
+        if url.startswith("_:"):
+            return url
+
+        basesplit = urllib.parse.urlsplit(base_url)
+        split = urllib.parse.urlsplit(url)
+        if basesplit.scheme and basesplit.scheme != "file" and split.scheme == "file":
+            raise ValidationException(
+                "Not resolving potential remote exploit %s from base %s" % (url, base_url))
+
+        return urllib.parse.urljoin(base_url, url)
+
+    def fetch_text(self, url):  # type: (Text) -> Text
+        if url in self.cache:
+            return self.cache[url]
+
+        split = urllib.parse.urlsplit(url)
+        if split.scheme != "file":
+            return self.remote.fetch_text(url)
+
+        path = urllib.request.url2pathname(str(split.path))
+        try:
+            with open(path, encoding="utf-8") as fp:
+                return Text(fp.read())
+        except (OSError, IOError) as e:
+            if e.filename == path:
+                raise ValidationException(six.text_type(e))
+            else:
+                raise ValidationException("Error reading %s: %s" % (url, e))
+
+    def check_exists(self, url):  # type: (Text) -> bool
+        if url in self.cache:
+            return True
+
+        split = urllib.parse.urlsplit(url)
+        if split.scheme != "file":
+            return self.remote.check_exists(url)
+        return os.path.exists(urllib.request.url2pathname(str(split.path)))
+
+class _Memo(object):
+    """
+A bounded memo table that counts how often it is hit; when full, the oldest
+entry is dropped.
+    """
+    def __init__(self, max_size=65536):
+        # type: (int) -> None
+        self.max_size = max_size
+        self.table = {}  # type: Dict[Any, Any]
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        # type: (Any, Callable[[], Any]) -> Any
+        try:
+            value = self.table[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            if len(self.table) >= self.max_size:
+                del self.table[next(iter(self.table))]
+            self.table[key] = value
+            return value
+        self.hits += 1
+        return value
+
+    def __str__(self):
+        total = self.hits + self.misses
+        return "%d hits, %d misses (%.0f%% hit rate)" % (
+            self.hits, self.misses, 100.0 * self.hits / total if total else 0.0)
 
 class LoadingOptions(object):
-    def __init__(self, fetcher=None, namespaces=None, fileuri=None, copyfrom=None, schemas=None):
+    def __init__(self, fetcher=None, namespaces=None, fileuri=None, copyfrom=None, schemas=None, fast_yaml=None, executor=None, lazy_graph=None, low_memory=None, validate=None, fetch_workers=None):
         if copyfrom is not None:
             self.idx = copyfrom.idx
             if fetcher is None:
@@ -215,28 +452,55 @@ class LoadingOptions(object):
                 namespaces = copyfrom.namespaces
             if namespaces is None:
                 schemas = copyfrom.schemas
+            if fast_yaml is None:
+                fast_yaml = copyfrom.fast_yaml
+            if executor is None:
+                executor = copyfrom.executor
+            if lazy_graph is None:
+                lazy_graph = copyfrom.lazy_graph
+            if low_memory is None:
+                low_memory = copyfrom.low_memory
+            if validate is None:
+                validate = copyfrom.validate
+            if fetch_workers is None:
+                fetch_workers = copyfrom.fetch_workers
+            self.lazy_graphs = copyfrom.lazy_graphs
+            self.reuse = copyfrom.reuse
         else:
             self.idx = {}
+            self.lazy_graphs = {}  # type: Dict[Text, LazyGraph]
+            # Set by DocumentReloader to the records of its last load
+            self.reuse = None  # type: Union[_ReuseTable, None]
+
+        # Parse with the safe (libyaml when available) loader into plain
+        # dicts and lists; line/column information is only rebuilt when a
+        # document fails validation.
+        self.fast_yaml = bool(fast_yaml)
+
+        # A concurrent.futures executor (normally a process pool) to validate
+        # the entries of large $graph documents across.
+        self.executor = executor
+
+        # Load $graph documents as a LazyGraph, which validates each process
+        # the first time it is asked for.
+        self.lazy_graph = bool(lazy_graph)
+
+        # Only weakly hold on to the raw YAML of each document in idx once
+        # its records are built, instead of for as long as the idx lives.
+        self.low_memory = bool(low_memory)
+
+        # Check documents against the schema as they are loaded. Without it
+        # a document is only normalized, and invalid ones give undefined
+        # results rather than a ValidationException.
+        self.validate = validate is None or bool(validate)
+
+        # How many of the remote documents a document refers to through
+        # `run` or `$import` to fetch at once, as soon as it is parsed; 1 or
+        # less fetches each only when the loader reaches it.
+        self.fetch_workers = _DEFAULT_FETCH_WORKERS if fetch_workers is None else fetch_workers
 
         if fetcher is None:
-            import os
-            import requests
-            from cachecontrol.wrapper import CacheControl
-            from cachecontrol.caches import FileCache
-            from schema_salad.ref_resolver import DefaultFetcher
-            if "HOME" in os.environ:
-                session = CacheControl(
-                    requests.Session(),
-                    cache=FileCache(os.path.join(os.environ["HOME"], ".cache", "salad")))
-            elif "TMP" in os.environ:
-                session = CacheControl(
-                    requests.Session(),
-                    cache=FileCache(os.path.join(os.environ["TMP"], ".cache", "salad")))
-            else:
-                session = CacheControl(
-                    requests.Session(),
-                    cache=FileCache("/tmp", ".cache", "salad"))
-            self.fetcher = DefaultFetcher({}, session)
+            self.fetcher = LocalFetcher()
         else:
             self.fetcher = fetcher
 
@@ -247,13 +511,58 @@ class LoadingOptions(object):
         self.namespaces = namespaces
         self.schemas = schemas
 
+        # Vocabularies merged with each set of namespaces seen so far.
+        if copyfrom is not None:
+            self.vocab_tables = copyfrom.vocab_tables
+        else:
+            self.vocab_tables = {}  # type: Dict[Any, Tuple[Dict[Text, Text], Dict[Text, Text]]]
+
         if namespaces is not None:
-            self.vocab = self.vocab.copy()
-            self.rvocab = self.rvocab.copy()
-            for k,v in six.iteritems(namespaces):
-                self.vocab[k] = v
-                self.rvocab[v] = k
+            key = tuple(sorted(six.iteritems(namespaces)))
+            if key not in self.vocab_tables:
+                vocab = self.vocab.copy()
+                rvocab = self.rvocab.copy()
+                for k,v in six.iteritems(namespaces):
+                    vocab[k] = v
+                    rvocab[v] = k
+                self.vocab_tables[key] = (vocab, rvocab)
+            self.vocab, self.rvocab = self.vocab_tables[key]
+
+        # Expanded URLs depend on the fetcher and the namespaces, relative
+        # ones on nothing but their arguments.
+        if copyfrom is not None and self.fetcher is copyfrom.fetcher and namespaces == copyfrom.namespaces:
+            self.expand_url_memo = copyfrom.expand_url_memo
+        else:
+            self.expand_url_memo = _Memo()
+        if copyfrom is not None:
+            self.relative_uri_memo = copyfrom.relative_uri_memo
+        else:
+            self.relative_uri_memo = _Memo()
+
+        # One copy of each expanded or relative URI, as the same ids,
+        # references and type names turn up all over a large document
+        if copyfrom is not None:
+            self.strings = copyfrom.strings
+        else:
+            self.strings = {}  # type: Dict[Text, Text]
+
+    def __getstate__(self):
+        # Records loaded in a worker process come back with their
+        # LoadingOptions; leave out the raw documents and memo tables.
+        state = self.__dict__.copy()
+        state["idx"] = {}
+        state["executor"] = None
+        state["vocab_tables"] = {}
+        state["lazy_graphs"] = {}
+        state["expand_url_memo"] = _Memo()
+        state["relative_uri_memo"] = _Memo()
+        state["strings"] = {}
+        state["reuse"] = None
+        return state
 
+    def intern(self, s):
+        # type: (Text) -> Text
+        return self.strings.setdefault(s, s)
 
 
 def load_field(val, fieldtype, baseuri, loadingOptions):
@@ -270,6 +579,8 @@ def save(val, top=True, base_url=""):
         return val.save(top=top, base_url=base_url)
     if isinstance(val, list):
         return [save(v, top=False, base_url=base_url) for v in val]
+    if isinstance(val, dict):
+        return {k: save(v, top=False, base_url=base_url) for k, v in six.iteritems(val)}
     return val
 
 def expand_url(url,                 # type: Union[str, Text]
@@ -284,6 +595,12 @@ def expand_url(url,                 # type: Union[str, Text]
     if not isinstance(url, six.string_types):
         return url
 
+    return loadingOptions.expand_url_memo.get(
+        (url, base_url, scoped_id, vocab_term, scoped_ref),
+        lambda: loadingOptions.intern(_expand_url(url, base_url, loadingOptions, scoped_id, vocab_term, scoped_ref)))
+
+def _expand_url(url, base_url, loadingOptions, scoped_id, vocab_term, scoped_ref):
+    # type: (Text, Text, LoadingOptions, bool, bool, Union[int, None]) -> Text
     url = Text(url)
 
     if url in (u"@id", u"@type"):
@@ -342,12 +659,21 @@ class _Loader(object):
         # type: (Any, Text, LoadingOptions, Union[Text, None]) -> Any
         pass
 
+    def may_load(self, tp, discriminator):
+        # type: (type, Union[Text, None]) -> bool
+        """Return False only when a document of Python type `tp` with the given
+        `class` value can never be loaded by this loader."""
+        return True
+
 class _AnyLoader(_Loader):
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         if doc is not None:
             return doc
         raise ValidationException("Expected non-null")
 
+    def may_load(self, tp, discriminator):
+        return tp is not type(None)
+
 class _PrimitiveLoader(_Loader):
     def __init__(self, tp):
         # type: (Union[type, Sequence[type]]) -> None
@@ -358,6 +684,9 @@ class _PrimitiveLoader(_Loader):
             raise ValidationException("Expected a %s but got %s" % (self.tp, type(doc)))
         return doc
 
+    def may_load(self, tp, discriminator):
+        return issubclass(tp, self.tp)
+
     def __repr__(self):
         return str(self.tp)
 
@@ -365,25 +694,31 @@ class _ArrayLoader(_Loader):
     def __init__(self, items):
         # type: (_Loader) -> None
         self.items = items
+        self._item_loader = None  # type: Union[_UnionLoader, None]
 
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         if not isinstance(doc, list):
             raise ValidationException("Expected a list")
+        if self._item_loader is None:
+            self._item_loader = _UnionLoader((self, self.items))
         r = []
         errors = []
         for i in range(0, len(doc)):
             try:
-                lf = load_field(doc[i], _UnionLoader((self, self.items)), baseuri, loadingOptions)
+                lf = load_field(doc[i], self._item_loader, baseuri, loadingOptions)
                 if isinstance(lf, list):
                     r.extend(lf)
                 else:
                     r.append(lf)
             except ValidationException as e:
-                errors.append(SourceLine(doc, i, str).makeError(six.text_type(e)))
+                errors.append(_SourceError(doc, i, u"", e))
         if errors:
-            raise ValidationException("\n".join(errors))
+            raise ValidationException(_ErrorList(errors))
         return r
 
+    def may_load(self, tp, discriminator):
+        return issubclass(tp, list)
+
     def __repr__(self):
         return "array<%s>" % self.items
 
@@ -398,17 +733,26 @@ class _EnumLoader(_Loader):
         else:
             raise ValidationException("Expected one of %s" % (self.symbols,))
 
+    def may_load(self, tp, discriminator):
+        return issubclass(tp, six.string_types)
+
 
 class _RecordLoader(_Loader):
     def __init__(self, classtype):
         # type: (type) -> None
         self.classtype = classtype
+        self.discriminator = getattr(classtype, "discriminator", None)
 
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
         if not isinstance(doc, dict):
             raise ValidationException("Expected a dict")
         return self.classtype(doc, baseuri, loadingOptions, docRoot=docRoot)
 
+    def may_load(self, tp, discriminator):
+        if not issubclass(tp, dict):
+            return False
+        return self.discriminator is None or self.discriminator == discriminator
+
     def __repr__(self):
         return str(self.classtype)
 
@@ -417,15 +761,49 @@ class _UnionLoader(_Loader):
     def __init__(self, alternates):
         # type: (Sequence[_Loader]) -> None
         self.alternates = alternates
+        self._dispatch = {}  # type: Dict[Any, Tuple[_Loader, ...]]
+
+    def candidates(self, doc):
+        # type: (Any) -> Tuple[_Loader, ...]
+        """The alternates that could load `doc`, decided from its Python type
+        and, for mappings, its `class` field."""
+        tp = type(doc)
+        discriminator = None
+        if isinstance(doc, dict):
+            discriminator = doc.get("class")
+            if not isinstance(discriminator, six.string_types):
+                discriminator = None
+        key = (tp, discriminator)
+        try:
+            return self._dispatch[key]
+        except KeyError:
+            found = tuple(t for t in self.alternates if t.may_load(tp, discriminator))
+            self._dispatch[key] = found
+            return found
 
     def load(self, doc, baseuri, loadingOptions, docRoot=None):
-        errors = []
-        for t in self.alternates:
+        tried = {}
+        for t in self.candidates(doc):
             try:
                 return t.load(doc, baseuri, loadingOptions, docRoot=docRoot)
             except ValidationException as e:
-                errors.append("tried %s but\n%s" % (t, indent(str(e))))
-        raise ValidationException(bullets(errors, "- "))
+                tried[id(t)] = e
+
+        # Dispatch could not find a loader; try everything else so the
+        # error lists each alternate just as before.
+        errors = []
+        for t in self.alternates:
+            e = tried.get(id(t))
+            if e is None:
+                try:
+                    return t.load(doc, baseuri, loadingOptions, docRoot=docRoot)
+                except ValidationException as exc:
+                    e = exc
+            errors.append((t, e))
+        raise ValidationException(_UnionErrors(errors))
+
+    def may_load(self, tp, discriminator):
+        return any(t.may_load(tp, discriminator) for t in self.alternates)
 
     def __repr__(self):
         return " | ".join(str(a) for a in self.alternates)
@@ -526,7 +904,71 @@ class _IdMapLoader(_Loader):
         return self.inner.load(doc, baseuri, loadingOptions)
 
 
+def _failed(slow, doc, baseuri, loadingOptions, docRoot, probe):
+    if probe:
+        raise ValidationException("Not valid")
+    return slow(doc, baseuri, loadingOptions, docRoot)
+
+class _TrustedLoader(_Loader):
+    """
+Loads what `loader` does, with the parser generated for trusted input.
+    """
+    def __init__(self, loader):
+        # type: (_Loader) -> None
+        self.loader = loader
+
+    def load(self, doc, baseuri, loadingOptions, docRoot=None):
+        return self.loader.load(doc, baseuri, loadingOptions, docRoot=docRoot)
+
+    def may_load(self, tp, discriminator):
+        return self.loader.may_load(tp, discriminator)
+
+    def __repr__(self):
+        return repr(self.loader)
+
+_specialized = False
+_trusted_loaders = None  # type: Union[Dict[int, _TrustedLoader], None]
+
+def _specialize_loaders(specialized=True):
+    # type: (bool) -> None
+    """
+Replace the `load` of every module level loader with its generated parser, or
+with `specialized` False put the generic `load` back, to compare the two.
+    """
+    global _specialized
+    _specialized = True
+
+    from . import cwl_parsers
+    for loader, parser in cwl_parsers.parsers:
+        if specialized:
+            loader.load = parser
+        else:
+            loader.__dict__.pop("load", None)
+
+def _trusted_loader(loader):
+    # type: (_Loader) -> _Loader
+    """The loader to use in place of `loader` when validation is off."""
+    global _trusted_loaders
+    if isinstance(loader, _TrustedLoader):
+        return loader
+
+    if _trusted_loaders is None:
+        from . import cwl_parsers
+        _trusted_loaders = {}
+        for l, trusted, parser in cwl_parsers.trusted_loaders:
+            if parser is not None:
+                trusted.load = parser
+            _trusted_loaders[id(l)] = trusted
+
+    return _trusted_loaders.get(id(loader), loader)
+
+
 def _document_load(loader, doc, baseuri, loadingOptions):
+    if not _specialized:
+        _specialize_loaders()
+    if not loadingOptions.validate:
+        loader = _trusted_loader(loader)
+
     if isinstance(doc, six.string_types):
         return _document_load_by_url(loader, loadingOptions.fetcher.urljoin(baseuri, doc), loadingOptions)
 
@@ -543,6 +985,16 @@ def _document_load(loader, doc, baseuri, loadingOptions):
             baseuri = doc["$base"]
 
         if "$graph" in doc:
+            if loadingOptions.lazy_graph:
+                graph = loadingOptions.lazy_graphs.get(baseuri)
+                if graph is None or graph.graph is not doc["$graph"]:
+                    graph = LazyGraph(loader, doc["$graph"], baseuri, loadingOptions)
+                    loadingOptions.lazy_graphs[baseuri] = graph
+                return graph
+            if loadingOptions.executor is not None and loadingOptions.reuse is None and len(doc["$graph"]) >= _PARALLEL_GRAPH_MIN_ENTRIES:
+                result = _parallel_graph_load(loader, doc["$graph"], baseuri, loadingOptions)
+                if result is not None:
+                    return result
             return loader.load(doc["$graph"], baseuri, loadingOptions)
         else:
             return loader.load(doc, baseuri, loadingOptions, docRoot=baseuri)
@@ -552,25 +1004,324 @@ def _document_load(loader, doc, baseuri, loadingOptions):
 
     raise ValidationException()
 
-import sys
-def _document_load_by_url(loader, url, loadingOptions):
-    if url in loadingOptions.idx:
-        return _document_load(loader, loadingOptions.idx[url], url, loadingOptions)
+# $graph documents with fewer entries than this are always loaded serially.
+_PARALLEL_GRAPH_MIN_ENTRIES = 32
+_PARALLEL_GRAPH_CHUNK_SIZE = 16
 
-    text = loadingOptions.fetcher.fetch_text(url)
+def _load_graph_chunk(loader_name, chunk, baseuri, fileuri, namespaces, schemas, fast_yaml, validate):
+    if not _specialized:
+        _specialize_loaders()
+    loadingOptions = LoadingOptions(fileuri=fileuri, namespaces=namespaces, schemas=schemas, fast_yaml=fast_yaml, validate=validate)
+    loader = _document_loaders[loader_name]
+    if not validate:
+        loader = _trusted_loader(loader)
+    return loader.load(chunk, baseuri, loadingOptions)
+
+def _parallel_graph_load(loader, graph, baseuri, loadingOptions):
+    """
+Load the entries of `graph` in chunks across loadingOptions.executor and
+return them in their original order, or None when that is not possible or an
+entry fails to load; the caller then loads the graph serially, which also
+gives the usual validation error.
+    """
+    if isinstance(loader, _TrustedLoader):
+        loader = loader.loader
+    loader_name = None
+    for name, value in six.iteritems(_document_loaders):
+        if value is loader:
+            loader_name = name
+            break
+    if loader_name is None:
+        return None
+
+    futures = [
+        loadingOptions.executor.submit(
+            _load_graph_chunk, loader_name, graph[i:i + _PARALLEL_GRAPH_CHUNK_SIZE], baseuri,
+            loadingOptions.fileuri, loadingOptions.namespaces, loadingOptions.schemas,
+            loadingOptions.fast_yaml, loadingOptions.validate)
+        for i in range(0, len(graph), _PARALLEL_GRAPH_CHUNK_SIZE)
+    ]
+
+    r = []
+    try:
+        for future in futures:
+            r.extend(future.result())
+    except Exception:
+        for future in futures:
+            future.cancel()
+        return None
+    return r
+
+class LazyGraph(object):
+    """
+The processes of a $graph document, indexed by id and each validated the
+first time it is asked for.
+    """
+    def __init__(self, loader, graph, baseuri, loadingOptions):
+        # type: (_Loader, List[Any], Text, LoadingOptions) -> None
+        self.loader = loader
+        self.graph = graph
+        self.baseuri = baseuri
+        self.loadingOptions = loadingOptions
+        self.loaded = {}  # type: Dict[int, Any]
+        self._ids = None  # type: Union[Dict[Text, int], None]
+
+    def __len__(self):
+        return len(self.graph)
+
+    def __getitem__(self, i):
+        # type: (int) -> Any
+        if i not in self.loaded:
+            self.loaded[i] = self._load_entry(i)
+        return self.loaded[i]
+
+    def __iter__(self):
+        for i in range(len(self.graph)):
+            yield self[i]
+
+    @property
+    def ids(self):
+        # type: () -> Dict[Text, int]
+        if self._ids is None:
+            self._ids = {}
+            for i, entry in enumerate(self.graph):
+                if isinstance(entry, dict) and isinstance(entry.get("id"), six.string_types):
+                    self._ids[expand_url(entry["id"], self.baseuri, self.loadingOptions, scoped_id=True)] = i
+        return self._ids
+
+    def get(self, uri):
+        # type: (Text) -> Any
+        """Return the process with the (absolute) id `uri`, or None."""
+        i = self.ids.get(uri)
+        if i is None:
+            return None
+        return self[i]
+
+    def _load_entry(self, i):
+        try:
+            return load_field(self.graph[i], self.loader, self.baseuri, self.loadingOptions)
+        except ValidationException:
+            if not self.loadingOptions.fast_yaml or self.loadingOptions.fileuri is None:
+                raise
+        # As in _document_load_by_url, re-parse round-trip for the positions
+        url = self.loadingOptions.fileuri
+        doc = _yaml_load(self.loadingOptions.fetcher.fetch_text(url), url)
+        return load_field(doc["$graph"][i], self.loader, self.baseuri, self.loadingOptions)
+
+def _source_key(doc, baseuri, docRoot, loadingOptions):
+    # type: (Any, Text, Union[Text, None], LoadingOptions) -> Any
+    """
+What the record loaded from `doc` depends on, or None when that isn't all in
+`doc`: an $import or $include can change without `doc` changing.
+    """
+    try:
+        text = json.dumps(doc, sort_keys=True, default=six.text_type)
+    except (TypeError, ValueError):
+        return None
+    if '"$import"' in text or '"$include"' in text:
+        return None
+    namespaces = tuple(sorted(six.iteritems(loadingOptions.namespaces))) if loadingOptions.namespaces else None
+    return (hashlib.sha256(text.encode("utf-8")).digest(), baseuri, docRoot, namespaces)
+
+class _ReuseTable(object):
+    """
+The process records built by one load of a document, by _source_key, so that
+the next load can reuse those whose source hasn't changed.
+    """
+    def __init__(self, previous=None):
+        # type: (Union[_ReuseTable, None]) -> None
+        self.previous = previous.records if previous is not None else {}
+        # key: (record, the keys of the processes inlined in it)
+        self.records = {}  # type: Dict[Any, Tuple[Any, List[Any]]]
+        self.nested = []  # type: List[List[Any]]
+        self.reused = 0
+        self.built = 0
+
+    def load(self, parse, doc, baseuri, loadingOptions, docRoot, probe):
+        key = _source_key(doc, baseuri, docRoot, loadingOptions)
+        entry = self.previous.get(key) if key is not None else None
+        if entry is not None:
+            self.reused += 1
+            self.keep(entry)
+        else:
+            self.nested.append([])
+            try:
+                record = parse(doc, baseuri, loadingOptions, docRoot, probe)
+            finally:
+                nested = self.nested.pop()
+            self.built += 1
+            if key is None:
+                return record
+            entry = (record, nested)
+
+        self.records[key] = entry
+        if self.nested:
+            self.nested[-1].append(key)
+        return entry[0]
+
+    def keep(self, entry):
+        # Processes inlined in a reused one are reused with it
+        for key in entry[1]:
+            if key in self.previous and key not in self.records:
+                self.records[key] = self.previous[key]
+                self.keep(self.previous[key])
+
+class DocumentReloader(object):
+    """
+Loads the document at `url` again each time `load` is called, for tools that
+follow a document as it is edited. A workflow or tool, whether a $graph entry
+or the inline `run` of a step, whose source hasn't changed since the last
+successful load isn't validated again: its record from that load is returned.
+
+Every document is still read and parsed each time, so without loadingOptions
+the fast YAML loader is used.
+    """
+    def __init__(self, url, loadingOptions=None):
+        # type: (Text, Union[LoadingOptions, None]) -> None
+        self.url = url
+        self.loadingOptions = loadingOptions if loadingOptions is not None else LoadingOptions(fast_yaml=True)
+        self.last = None  # type: Union[_ReuseTable, None]
+
+    def load(self):
+        # type: () -> Any
+        loadingOptions = LoadingOptions(copyfrom=self.loadingOptions, lazy_graph=False)
+        # Read every document again, as any of them may have changed
+        loadingOptions.idx = {}
+        loadingOptions.lazy_graphs = {}
+        loadingOptions.reuse = _ReuseTable(self.last)
+        result = load_document(self.url, "", loadingOptions)
+        self.last = loadingOptions.reuse
+        return result
+
+    def stats(self):
+        # type: () -> Text
+        if self.last is None:
+            return "not loaded"
+        return "%d processes reused, %d loaded" % (self.last.reused, self.last.built)
+
+try:
+    from ruamel.yaml import CSafeLoader as _FastYAMLLoader
+except ImportError:
+    from ruamel.yaml import SafeLoader as _FastYAMLLoader
+
+def _yaml_load(text, url, round_trip=True):
     if isinstance(text, bytes):
         textIO = StringIO(text.decode('utf-8'))
     else:
         textIO = StringIO(text)
     textIO.name = url    # type: ignore
+    if not round_trip:
+        return yaml.load(textIO, Loader=_FastYAMLLoader)
     result = yaml.round_trip_load(textIO)
     add_lc_filename(result, url)
+    return result
+
+def _document_load_by_url(loader, url, loadingOptions):
+    doc = loadingOptions.idx.get(url)
+    if isinstance(doc, weakref.ref):
+        doc = doc()
+        if doc is None:
+            del loadingOptions.idx[url]
+    if url in loadingOptions.idx:
+        docLoadingOptions = LoadingOptions(copyfrom=loadingOptions, fileuri=url)
+        try:
+            return _document_load(loader, doc, url, docLoadingOptions)
+        except ValidationException:
+            # A fast parse has no positions; as in _document_load_text,
+            # re-parse round-trip so the error carries them.
+            if not loadingOptions.fast_yaml or isinstance(doc, CommentedBase):
+                raise
+        doc = _yaml_load(loadingOptions.fetcher.fetch_text(url), url)
+        loadingOptions.idx[url] = doc
+        return _document_load(loader, doc, url, docLoadingOptions)
+
+    if not loadingOptions.low_memory:
+        return _document_load_text(loader, url, loadingOptions)
+
+    try:
+        return _document_load_text(loader, url, loadingOptions)
+    finally:
+        # The records are built; only keep the raw document, and its
+        # line/column information, while something else holds on to it.
+        _release_document(loadingOptions.idx, url)
+
+_DEFAULT_FETCH_WORKERS = 8
+
+def _remote_references(doc, url, loadingOptions):
+    # type: (Any, Text, LoadingOptions) -> List[Text]
+    """
+The http(s) documents that `doc`, read from `url`, refers to with `$import`,
+and that haven't been loaded yet.
+    """
+    references = []  # type: List[Text]
+
+    def add(reference):
+        if not isinstance(reference, six.string_types):
+            return
+        try:
+            target = urllib.parse.urldefrag(loadingOptions.fetcher.urljoin(url, reference))[0]
+        except ValidationException:
+            return
+        if urllib.parse.urlsplit(target).scheme in ("http", "https") and target not in loadingOptions.idx and target not in references:
+            references.append(target)
+
+    def find(node):
+        if isinstance(node, dict):
+            if "$import" in node:
+                add(node["$import"])
+            for value in six.itervalues(node):
+                find(value)
+        elif isinstance(node, list):
+            for value in node:
+                find(value)
+
+    find(doc)
+    return references
+
+def _release_document(idx, url):
+    doc = idx.get(url)
+    try:
+        idx[url] = weakref.ref(doc)
+    except TypeError:
+        # Plain dicts and lists can't be weakly referenced; load them again if needed
+        del idx[url]
+
+def _document_load_text(loader, url, loadingOptions):
+    text = loadingOptions.fetcher.fetch_text(url)
+    fast_yaml = loadingOptions.fast_yaml
+    try:
+        result = _yaml_load(text, url, round_trip=not fast_yaml)
+    except yaml.YAMLError:
+        # libyaml rejects some documents that ruamel reads, such as a
+        # flow sequence holding a URL; parse those round-trip instead.
+        if not fast_yaml:
+            raise
+        fast_yaml = False
+        result = _yaml_load(text, url)
 
     loadingOptions.idx[url] = result
 
+    # Only documents that $import something, and are remote themselves or
+    # name a remote URL, need searching
+    remote = "$import" in text and (not url.startswith("file://") or "http:" in text or "https:" in text)
+    if remote and loadingOptions.fetch_workers > 1 and hasattr(loadingOptions.fetcher, "prefetch"):
+        references = _remote_references(result, url, loadingOptions)
+        if len(references) > 1:
+            loadingOptions.fetcher.prefetch(references, loadingOptions.fetch_workers)
+
     loadingOptions = LoadingOptions(copyfrom=loadingOptions, fileuri=url)
 
-    return _document_load(loader, result, url, loadingOptions)
+    if not fast_yaml:
+        return _document_load(loader, result, url, loadingOptions)
+
+    try:
+        return _document_load(loader, result, url, loadingOptions)
+    except ValidationException:
+        # Re-parse this file round-trip so the error carries the same
+        # file:line:col positions as a normal load.
+        result = _yaml_load(text, url)
+        loadingOptions.idx[url] = result
+        return _document_load(loader, result, url, loadingOptions)
 
 def file_uri(path, split_frag=False):  # type: (str, bool) -> str
     if path.startswith("file://"):
@@ -593,10 +1344,28 @@ def prefix_url(url, namespaces):
             return k+":"+url[len(v):]
     return url
 
+def relative_uri_item(uri, base_url, scoped_id, loadingOptions):
+    """
+Like save_relative_uri, but leave records (e.g. an inline `run`) unsaved.
+    """
+    if isinstance(uri, list):
+        return [relative_uri_item(u, base_url, scoped_id, loadingOptions) for u in uri]
+    elif isinstance(uri, str):
+        return loadingOptions.relative_uri_memo.get(
+            (uri, base_url, scoped_id), lambda: loadingOptions.intern(save_relative_uri(uri, base_url, scoped_id)))
+    else:
+        return uri
+
+# A URL that urlsplit finds a scheme in
+_url_scheme = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*:")
+
 def save_relative_uri(uri, base_url, scoped_id):
     if isinstance(uri, list):
         return [save_relative_uri(u, base_url, scoped_id) for u in uri]
     elif isinstance(uri, str):
+        if not base_url and _url_scheme.match(uri):
+            # Nothing with a scheme is relative to an empty base
+            return uri
         urisplit = urllib.parse.urlsplit(uri)
         basesplit = urllib.parse.urlsplit(base_url)
         if urisplit.scheme == basesplit.scheme and urisplit.netloc == basesplit.netloc:
@@ -617,18 +1386,16 @@ class RecordField(Savable):
     """
 A field of a record.
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'name', 'doc', 'type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -643,103 +1410,103 @@ A field of a record.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'RecordField'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'RecordField'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'name', u'doc', u'type'])
+    _fields = ((u'name', 'uri_strtype_True_False_None', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'type', 'typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2', False), )
+    _identifier = u'name'
+    _identifier_uuid = False
 
 
 class RecordSchema(Savable):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'fields', 'type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'fields' in doc:
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'RecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'RecordSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.fields is not None:
-            r['fields'] = save(self.fields, top=False, base_url=base_url)
+            yield 'fields', self.fields
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'fields', u'type'])
+    _fields = ((u'fields', 'idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader', True), (u'type', 'typedsl_Record_symbolLoader_2', False), )
 
 
 class EnumSchema(Savable):
@@ -747,105 +1514,101 @@ class EnumSchema(Savable):
 Define an enumerated type.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'symbols', 'type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'EnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'EnumSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.symbols is not None:
-            r['symbols'] = save_relative_uri(self.symbols, base_url, True)
+            yield 'symbols', relative_uri_item(self.symbols, base_url, True, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'symbols', u'type'])
+    _fields = ((u'symbols', 'uri_array_of_strtype_True_False_None', False), (u'type', 'typedsl_Enum_symbolLoader_2', False), )
 
 
 class ArraySchema(Savable):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'items', 'type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'ArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'ArraySchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.items is not None:
-            r['items'] = save_relative_uri(self.items, base_url, False)
+            yield 'items', relative_uri_item(self.items, base_url, False, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'items', u'type'])
+    _fields = ((u'items', 'uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2', False), (u'type', 'typedsl_Array_symbolLoader_2', False), )
 
 
 class File(Savable):
@@ -918,11 +1681,9 @@ An ExpressionTool may forward file references from input to output by using
 the same value for `location`.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'location', 'path', 'basename', 'dirname', 'nameroot', 'nameext', 'checksum', 'size', 'secondaryFiles', 'format', 'contents',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -933,7 +1694,7 @@ the same value for `location`.
             try:
                 self.location = load_field(doc.get('location'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'location', str).makeError("the `location` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'location', "the `location` field is not valid because:\n", e))
         else:
             self.location = None
 
@@ -941,7 +1702,7 @@ the same value for `location`.
             try:
                 self.path = load_field(doc.get('path'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'path', str).makeError("the `path` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'path', "the `path` field is not valid because:\n", e))
         else:
             self.path = None
 
@@ -949,7 +1710,7 @@ the same value for `location`.
             try:
                 self.basename = load_field(doc.get('basename'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'basename', str).makeError("the `basename` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'basename', "the `basename` field is not valid because:\n", e))
         else:
             self.basename = None
 
@@ -957,7 +1718,7 @@ the same value for `location`.
             try:
                 self.dirname = load_field(doc.get('dirname'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dirname', str).makeError("the `dirname` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dirname', "the `dirname` field is not valid because:\n", e))
         else:
             self.dirname = None
 
@@ -965,7 +1726,7 @@ the same value for `location`.
             try:
                 self.nameroot = load_field(doc.get('nameroot'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'nameroot', str).makeError("the `nameroot` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'nameroot', "the `nameroot` field is not valid because:\n", e))
         else:
             self.nameroot = None
 
@@ -973,7 +1734,7 @@ the same value for `location`.
             try:
                 self.nameext = load_field(doc.get('nameext'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'nameext', str).makeError("the `nameext` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'nameext', "the `nameext` field is not valid because:\n", e))
         else:
             self.nameext = None
 
@@ -981,7 +1742,7 @@ the same value for `location`.
             try:
                 self.checksum = load_field(doc.get('checksum'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'checksum', str).makeError("the `checksum` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'checksum', "the `checksum` field is not valid because:\n", e))
         else:
             self.checksum = None
 
@@ -989,7 +1750,7 @@ the same value for `location`.
             try:
                 self.size = load_field(doc.get('size'), union_of_None_type_or_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'size', str).makeError("the `size` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'size', "the `size` field is not valid because:\n", e))
         else:
             self.size = None
 
@@ -997,7 +1758,7 @@ the same value for `location`.
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -1005,7 +1766,7 @@ the same value for `location`.
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -1013,70 +1774,71 @@ the same value for `location`.
             try:
                 self.contents = load_field(doc.get('contents'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'contents', str).makeError("the `contents` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'contents', "the `contents` field is not valid because:\n", e))
         else:
             self.contents = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `location`, `path`, `basename`, `dirname`, `nameroot`, `nameext`, `checksum`, `size`, `secondaryFiles`, `format`, `contents`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `location`, `path`, `basename`, `dirname`, `nameroot`, `nameext`, `checksum`, `size`, `secondaryFiles`, `format`, `contents`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'File'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'File'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'File'
+        yield 'class', 'File'
 
         if self.location is not None:
-            r['location'] = save_relative_uri(self.location, base_url, False)
+            yield 'location', relative_uri_item(self.location, base_url, False, self.loadingOptions)
 
         if self.path is not None:
-            r['path'] = save_relative_uri(self.path, base_url, False)
+            yield 'path', relative_uri_item(self.path, base_url, False, self.loadingOptions)
 
         if self.basename is not None:
-            r['basename'] = save(self.basename, top=False, base_url=base_url)
+            yield 'basename', self.basename
 
         if self.dirname is not None:
-            r['dirname'] = save(self.dirname, top=False, base_url=base_url)
+            yield 'dirname', self.dirname
 
         if self.nameroot is not None:
-            r['nameroot'] = save(self.nameroot, top=False, base_url=base_url)
+            yield 'nameroot', self.nameroot
 
         if self.nameext is not None:
-            r['nameext'] = save(self.nameext, top=False, base_url=base_url)
+            yield 'nameext', self.nameext
 
         if self.checksum is not None:
-            r['checksum'] = save(self.checksum, top=False, base_url=base_url)
+            yield 'checksum', self.checksum
 
         if self.size is not None:
-            r['size'] = save(self.size, top=False, base_url=base_url)
+            yield 'size', self.size
 
         if self.secondaryFiles is not None:
-            r['secondaryFiles'] = save(self.secondaryFiles, top=False, base_url=base_url)
+            yield 'secondaryFiles', self.secondaryFiles
 
         if self.format is not None:
-            r['format'] = save_relative_uri(self.format, base_url, True)
+            yield 'format', relative_uri_item(self.format, base_url, True, self.loadingOptions)
 
         if self.contents is not None:
-            r['contents'] = save(self.contents, top=False, base_url=base_url)
+            yield 'contents', self.contents
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'location', u'path', u'basename', u'dirname', u'nameroot', u'nameext', u'checksum', u'size', u'secondaryFiles', u'format', u'contents'])
+    discriminator = u'File'
+    _fields = ((u'location', 'uri_union_of_None_type_or_strtype_False_False_None', True), (u'path', 'uri_union_of_None_type_or_strtype_False_False_None', True), (u'basename', 'union_of_None_type_or_strtype', True), (u'dirname', 'union_of_None_type_or_strtype', True), (u'nameroot', 'union_of_None_type_or_strtype', True), (u'nameext', 'union_of_None_type_or_strtype', True), (u'checksum', 'union_of_None_type_or_strtype', True), (u'size', 'union_of_None_type_or_inttype', True), (u'secondaryFiles', 'union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader', True), (u'format', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'contents', 'union_of_None_type_or_strtype', True), )
 
 
 class Directory(Savable):
@@ -1126,11 +1888,9 @@ Name conflicts (the same `basename` appearing multiple times in `listing`
 or in any entry in `secondaryFiles` in the listing) is a fatal error.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'location', 'path', 'basename', 'listing',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -1141,7 +1901,7 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
             try:
                 self.location = load_field(doc.get('location'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'location', str).makeError("the `location` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'location', "the `location` field is not valid because:\n", e))
         else:
             self.location = None
 
@@ -1149,7 +1909,7 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
             try:
                 self.path = load_field(doc.get('path'), uri_union_of_None_type_or_strtype_False_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'path', str).makeError("the `path` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'path', "the `path` field is not valid because:\n", e))
         else:
             self.path = None
 
@@ -1157,7 +1917,7 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
             try:
                 self.basename = load_field(doc.get('basename'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'basename', str).makeError("the `basename` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'basename', "the `basename` field is not valid because:\n", e))
         else:
             self.basename = None
 
@@ -1165,86 +1925,85 @@ or in any entry in `secondaryFiles` in the listing) is a fatal error.
             try:
                 self.listing = load_field(doc.get('listing'), union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'listing', str).makeError("the `listing` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'listing', "the `listing` field is not valid because:\n", e))
         else:
             self.listing = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `location`, `path`, `basename`, `listing`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `location`, `path`, `basename`, `listing`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'Directory'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'Directory'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'Directory'
+        yield 'class', 'Directory'
 
         if self.location is not None:
-            r['location'] = save_relative_uri(self.location, base_url, False)
+            yield 'location', relative_uri_item(self.location, base_url, False, self.loadingOptions)
 
         if self.path is not None:
-            r['path'] = save_relative_uri(self.path, base_url, False)
+            yield 'path', relative_uri_item(self.path, base_url, False, self.loadingOptions)
 
         if self.basename is not None:
-            r['basename'] = save(self.basename, top=False, base_url=base_url)
+            yield 'basename', self.basename
 
         if self.listing is not None:
-            r['listing'] = save(self.listing, top=False, base_url=base_url)
+            yield 'listing', self.listing
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'location', u'path', u'basename', u'listing'])
+    discriminator = u'Directory'
+    _fields = ((u'location', 'uri_union_of_None_type_or_strtype_False_False_None', True), (u'path', 'uri_union_of_None_type_or_strtype_False_False_None', True), (u'basename', 'union_of_None_type_or_strtype', True), (u'listing', 'union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader', True), )
 
 
 class SchemaBase(Savable):
-    pass
+    __slots__ = ()
 
 class Parameter(SchemaBase):
     """
 Define an input or output parameter to a process.
 
     """
-    pass
+    __slots__ = ()
 
 class InputBinding(Savable):
-    pass
+    __slots__ = ()
 
 class OutputBinding(Savable):
-    pass
+    __slots__ = ()
 
 class InputSchema(SchemaBase):
-    pass
+    __slots__ = ()
 
 class OutputSchema(SchemaBase):
-    pass
+    __slots__ = ()
 
 class InputRecordField(RecordField):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('inputBinding', 'label',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -1259,20 +2018,20 @@ class InputRecordField(RecordField):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'inputBinding' in doc:
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
@@ -1280,65 +2039,65 @@ class InputRecordField(RecordField):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`, `inputBinding`, `label`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`, `inputBinding`, `label`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'InputRecordField'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'InputRecordField'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.inputBinding is not None:
-            r['inputBinding'] = save(self.inputBinding, top=False, base_url=base_url)
+            yield 'inputBinding', self.inputBinding
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'name', u'doc', u'type', u'inputBinding', u'label'])
+    _fields = ((u'name', 'uri_strtype_True_False_None', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'type', 'typedsl_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2', False), (u'inputBinding', 'union_of_None_type_or_CommandLineBindingLoader', True), (u'label', 'union_of_None_type_or_strtype', True), )
+    _identifier = u'name'
+    _identifier_uuid = False
 
 
 class InputRecordSchema(RecordSchema, InputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('name', 'label',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -1353,75 +2112,75 @@ class InputRecordSchema(RecordSchema, InputSchema):
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_InputRecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'InputRecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'InputRecordSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.fields is not None:
-            r['fields'] = save(self.fields, top=False, base_url=base_url)
+            yield 'fields', self.fields
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'fields', u'type', u'label', u'name'])
+    _fields = ((u'name', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'fields', 'idmap_fields_union_of_None_type_or_array_of_InputRecordFieldLoader', True), (u'type', 'typedsl_Record_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), )
+    _identifier = u'name'
+    _identifier_uuid = True
 
 
 class InputEnumSchema(EnumSchema, InputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('name', 'label', 'inputBinding',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -1435,18 +2194,18 @@ class InputEnumSchema(EnumSchema, InputSchema):
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1454,75 +2213,75 @@ class InputEnumSchema(EnumSchema, InputSchema):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`, `label`, `name`, `inputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`, `label`, `name`, `inputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'InputEnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'InputEnumSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.symbols is not None:
-            r['symbols'] = save_relative_uri(self.symbols, base_url, True)
+            yield 'symbols', relative_uri_item(self.symbols, base_url, True, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.inputBinding is not None:
-            r['inputBinding'] = save(self.inputBinding, top=False, base_url=base_url)
+            yield 'inputBinding', self.inputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'symbols', u'type', u'label', u'name', u'inputBinding'])
+    _fields = ((u'name', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'symbols', 'uri_array_of_strtype_True_False_None', False), (u'type', 'typedsl_Enum_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), (u'inputBinding', 'union_of_None_type_or_CommandLineBindingLoader', True), )
+    _identifier = u'name'
+    _identifier_uuid = True
 
 
 class InputArraySchema(ArraySchema, InputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('label', 'inputBinding',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1530,62 +2289,60 @@ class InputArraySchema(ArraySchema, InputSchema):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`, `label`, `inputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`, `label`, `inputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'InputArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'InputArraySchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.items is not None:
-            r['items'] = save_relative_uri(self.items, base_url, False)
+            yield 'items', relative_uri_item(self.items, base_url, False, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.inputBinding is not None:
-            r['inputBinding'] = save(self.inputBinding, top=False, base_url=base_url)
+            yield 'inputBinding', self.inputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'items', u'type', u'label', u'inputBinding'])
+    _fields = ((u'items', 'uri_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_False_True_2', False), (u'type', 'typedsl_Array_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), (u'inputBinding', 'union_of_None_type_or_CommandLineBindingLoader', True), )
 
 
 class OutputRecordField(RecordField):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('outputBinding',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -1600,150 +2357,148 @@ class OutputRecordField(RecordField):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'outputBinding' in doc:
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`, `outputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`, `outputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'OutputRecordField'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'OutputRecordField'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'name', u'doc', u'type', u'outputBinding'])
+    _fields = ((u'name', 'uri_strtype_True_False_None', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'type', 'typedsl_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2', False), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), )
+    _identifier = u'name'
+    _identifier_uuid = False
 
 
 class OutputRecordSchema(RecordSchema, OutputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('label',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'fields' in doc:
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_OutputRecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`, `label`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`, `label`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'OutputRecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'OutputRecordSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.fields is not None:
-            r['fields'] = save(self.fields, top=False, base_url=base_url)
+            yield 'fields', self.fields
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'fields', u'type', u'label'])
+    _fields = ((u'fields', 'idmap_fields_union_of_None_type_or_array_of_OutputRecordFieldLoader', True), (u'type', 'typedsl_Record_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), )
 
 
 class OutputEnumSchema(EnumSchema, OutputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('label', 'outputBinding',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1751,72 +2506,70 @@ class OutputEnumSchema(EnumSchema, OutputSchema):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`, `label`, `outputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`, `label`, `outputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'OutputEnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'OutputEnumSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.symbols is not None:
-            r['symbols'] = save_relative_uri(self.symbols, base_url, True)
+            yield 'symbols', relative_uri_item(self.symbols, base_url, True, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'symbols', u'type', u'label', u'outputBinding'])
+    _fields = ((u'symbols', 'uri_array_of_strtype_True_False_None', False), (u'type', 'typedsl_Enum_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), )
 
 
 class OutputArraySchema(ArraySchema, OutputSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('label', 'outputBinding',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1824,62 +2577,60 @@ class OutputArraySchema(ArraySchema, OutputSchema):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`, `label`, `outputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`, `label`, `outputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'OutputArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'OutputArraySchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.items is not None:
-            r['items'] = save_relative_uri(self.items, base_url, False)
+            yield 'items', relative_uri_item(self.items, base_url, False, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'items', u'type', u'label', u'outputBinding'])
+    _fields = ((u'items', 'uri_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_False_True_2', False), (u'type', 'typedsl_Array_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), )
 
 
 class InputParameter(Parameter):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'id', 'label', 'secondaryFiles', 'streamable', 'doc', 'format', 'inputBinding', 'default', 'type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -1894,7 +2645,7 @@ class InputParameter(Parameter):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -1902,7 +2653,7 @@ class InputParameter(Parameter):
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -1910,7 +2661,7 @@ class InputParameter(Parameter):
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -1918,7 +2669,7 @@ class InputParameter(Parameter):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -1926,7 +2677,7 @@ class InputParameter(Parameter):
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -1934,7 +2685,7 @@ class InputParameter(Parameter):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
@@ -1942,7 +2693,7 @@ class InputParameter(Parameter):
             try:
                 self.default = load_field(doc.get('default'), union_of_None_type_or_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'default', str).makeError("the `default` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'default', "the `default` field is not valid because:\n", e))
         else:
             self.default = None
 
@@ -1950,77 +2701,77 @@ class InputParameter(Parameter):
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `format`, `inputBinding`, `default`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `format`, `inputBinding`, `default`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'InputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'InputParameter'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.secondaryFiles is not None:
-            r['secondaryFiles'] = save(self.secondaryFiles, top=False, base_url=base_url)
+            yield 'secondaryFiles', self.secondaryFiles
 
         if self.streamable is not None:
-            r['streamable'] = save(self.streamable, top=False, base_url=base_url)
+            yield 'streamable', self.streamable
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.format is not None:
-            r['format'] = save_relative_uri(self.format, base_url, True)
+            yield 'format', relative_uri_item(self.format, base_url, True, self.loadingOptions)
 
         if self.inputBinding is not None:
-            r['inputBinding'] = save(self.inputBinding, top=False, base_url=base_url)
+            yield 'inputBinding', self.inputBinding
 
         if self.default is not None:
-            r['default'] = save(self.default, top=False, base_url=base_url)
+            yield 'default', self.default
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'label', u'secondaryFiles', u'streamable', u'doc', u'id', u'format', u'inputBinding', u'default', u'type'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), (u'label', 'union_of_None_type_or_strtype', True), (u'secondaryFiles', 'union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader', True), (u'streamable', 'union_of_None_type_or_booltype', True), (u'doc', 'union_of_None_type_or_strtype_or_array_of_strtype', True), (u'format', 'uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None', True), (u'inputBinding', 'union_of_None_type_or_CommandLineBindingLoader', True), (u'default', 'union_of_None_type_or_Any_type', True), (u'type', 'typedsl_union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class OutputParameter(Parameter):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'id', 'label', 'secondaryFiles', 'streamable', 'doc', 'outputBinding', 'format',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -2035,7 +2786,7 @@ class OutputParameter(Parameter):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -2043,7 +2794,7 @@ class OutputParameter(Parameter):
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -2051,7 +2802,7 @@ class OutputParameter(Parameter):
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -2059,7 +2810,7 @@ class OutputParameter(Parameter):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -2067,7 +2818,7 @@ class OutputParameter(Parameter):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
@@ -2075,56 +2826,58 @@ class OutputParameter(Parameter):
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'OutputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'OutputParameter'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.secondaryFiles is not None:
-            r['secondaryFiles'] = save(self.secondaryFiles, top=False, base_url=base_url)
+            yield 'secondaryFiles', self.secondaryFiles
 
         if self.streamable is not None:
-            r['streamable'] = save(self.streamable, top=False, base_url=base_url)
+            yield 'streamable', self.streamable
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if self.format is not None:
-            r['format'] = save_relative_uri(self.format, base_url, True)
+            yield 'format', relative_uri_item(self.format, base_url, True, self.loadingOptions)
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'label', u'secondaryFiles', u'streamable', u'doc', u'id', u'outputBinding', u'format'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), (u'label', 'union_of_None_type_or_strtype', True), (u'secondaryFiles', 'union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader', True), (u'streamable', 'union_of_None_type_or_booltype', True), (u'doc', 'union_of_None_type_or_strtype_or_array_of_strtype', True), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), (u'format', 'uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class ProcessRequirement(Savable):
@@ -2137,7 +2890,7 @@ Process requirements are the primary mechanism for specifying extensions to
 the CWL core specification.
 
     """
-    pass
+    __slots__ = ()
 
 class Process(Savable):
     """
@@ -2147,7 +2900,9 @@ document.  Note that the `Process` object is abstract and cannot be
 directly executed.
 
     """
-    pass
+    __slots__ = ()
+
+    _reusable = True
 
 class InlineJavascriptRequirement(ProcessRequirement):
     """
@@ -2156,11 +2911,9 @@ If this requirement is not present, the workflow platform must not perform expre
 interpolatation.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'expressionLib',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -2171,40 +2924,41 @@ interpolatation.
             try:
                 self.expressionLib = load_field(doc.get('expressionLib'), union_of_None_type_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'expressionLib', str).makeError("the `expressionLib` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'expressionLib', "the `expressionLib` field is not valid because:\n", e))
         else:
             self.expressionLib = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `expressionLib`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `expressionLib`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'InlineJavascriptRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'InlineJavascriptRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'InlineJavascriptRequirement'
+        yield 'class', 'InlineJavascriptRequirement'
 
         if self.expressionLib is not None:
-            r['expressionLib'] = save(self.expressionLib, top=False, base_url=base_url)
+            yield 'expressionLib', self.expressionLib
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'expressionLib'])
+    discriminator = u'InlineJavascriptRequirement'
+    _fields = ((u'expressionLib', 'union_of_None_type_or_array_of_strtype', True), )
 
 
 class SchemaDefRequirement(ProcessRequirement):
@@ -2218,11 +2972,9 @@ processed in the order listed such that later schema definitions may refer
 to earlier schema definitions.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'types',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -2232,38 +2984,39 @@ to earlier schema definitions.
         try:
             self.types = load_field(doc.get('types'), array_of_union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'types', str).makeError("the `types` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'types', "the `types` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `types`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `types`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'SchemaDefRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'SchemaDefRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'SchemaDefRequirement'
+        yield 'class', 'SchemaDefRequirement'
 
         if self.types is not None:
-            r['types'] = save(self.types, top=False, base_url=base_url)
+            yield 'types', self.types
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'types'])
+    discriminator = u'SchemaDefRequirement'
+    _fields = ((u'types', 'array_of_union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader', False), )
 
 
 class EnvironmentDef(Savable):
@@ -2273,54 +3026,52 @@ by the workflow platform when executing the command line tool.  May be the
 result of executing an expression, such as getting a parameter from input.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'envName', 'envValue',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.envName = load_field(doc.get('envName'), strtype, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'envName', str).makeError("the `envName` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'envName', "the `envName` field is not valid because:\n", e))
 
         try:
             self.envValue = load_field(doc.get('envValue'), union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'envValue', str).makeError("the `envValue` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'envValue', "the `envValue` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `envName`, `envValue`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `envName`, `envValue`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'EnvironmentDef'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'EnvironmentDef'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.envName is not None:
-            r['envName'] = save(self.envName, top=False, base_url=base_url)
+            yield 'envName', self.envName
 
         if self.envValue is not None:
-            r['envValue'] = save(self.envValue, top=False, base_url=base_url)
+            yield 'envValue', self.envValue
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'envName', u'envValue'])
+    _fields = ((u'envName', 'strtype', False), (u'envValue', 'union_of_strtype_or_ExpressionLoader', False), )
 
 
 class CommandLineBinding(InputBinding):
@@ -2358,18 +3109,16 @@ effective value.
   - **null**: Add nothing.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'loadContents', 'position', 'prefix', 'separate', 'itemSeparator', 'valueFrom', 'shellQuote',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'loadContents' in doc:
             try:
                 self.loadContents = load_field(doc.get('loadContents'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'loadContents', str).makeError("the `loadContents` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'loadContents', "the `loadContents` field is not valid because:\n", e))
         else:
             self.loadContents = None
 
@@ -2377,7 +3126,7 @@ effective value.
             try:
                 self.position = load_field(doc.get('position'), union_of_None_type_or_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'position', str).makeError("the `position` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'position', "the `position` field is not valid because:\n", e))
         else:
             self.position = None
 
@@ -2385,7 +3134,7 @@ effective value.
             try:
                 self.prefix = load_field(doc.get('prefix'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'prefix', str).makeError("the `prefix` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'prefix', "the `prefix` field is not valid because:\n", e))
         else:
             self.prefix = None
 
@@ -2393,7 +3142,7 @@ effective value.
             try:
                 self.separate = load_field(doc.get('separate'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'separate', str).makeError("the `separate` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'separate', "the `separate` field is not valid because:\n", e))
         else:
             self.separate = None
 
@@ -2401,7 +3150,7 @@ effective value.
             try:
                 self.itemSeparator = load_field(doc.get('itemSeparator'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'itemSeparator', str).makeError("the `itemSeparator` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'itemSeparator', "the `itemSeparator` field is not valid because:\n", e))
         else:
             self.itemSeparator = None
 
@@ -2409,7 +3158,7 @@ effective value.
             try:
                 self.valueFrom = load_field(doc.get('valueFrom'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'valueFrom', str).makeError("the `valueFrom` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'valueFrom', "the `valueFrom` field is not valid because:\n", e))
         else:
             self.valueFrom = None
 
@@ -2417,56 +3166,56 @@ effective value.
             try:
                 self.shellQuote = load_field(doc.get('shellQuote'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'shellQuote', str).makeError("the `shellQuote` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'shellQuote', "the `shellQuote` field is not valid because:\n", e))
         else:
             self.shellQuote = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `loadContents`, `position`, `prefix`, `separate`, `itemSeparator`, `valueFrom`, `shellQuote`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `loadContents`, `position`, `prefix`, `separate`, `itemSeparator`, `valueFrom`, `shellQuote`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandLineBinding'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandLineBinding'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.loadContents is not None:
-            r['loadContents'] = save(self.loadContents, top=False, base_url=base_url)
+            yield 'loadContents', self.loadContents
 
         if self.position is not None:
-            r['position'] = save(self.position, top=False, base_url=base_url)
+            yield 'position', self.position
 
         if self.prefix is not None:
-            r['prefix'] = save(self.prefix, top=False, base_url=base_url)
+            yield 'prefix', self.prefix
 
         if self.separate is not None:
-            r['separate'] = save(self.separate, top=False, base_url=base_url)
+            yield 'separate', self.separate
 
         if self.itemSeparator is not None:
-            r['itemSeparator'] = save(self.itemSeparator, top=False, base_url=base_url)
+            yield 'itemSeparator', self.itemSeparator
 
         if self.valueFrom is not None:
-            r['valueFrom'] = save(self.valueFrom, top=False, base_url=base_url)
+            yield 'valueFrom', self.valueFrom
 
         if self.shellQuote is not None:
-            r['shellQuote'] = save(self.shellQuote, top=False, base_url=base_url)
+            yield 'shellQuote', self.shellQuote
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'loadContents', u'position', u'prefix', u'separate', u'itemSeparator', u'valueFrom', u'shellQuote'])
+    _fields = ((u'loadContents', 'union_of_None_type_or_booltype', True), (u'position', 'union_of_None_type_or_inttype', True), (u'prefix', 'union_of_None_type_or_strtype', True), (u'separate', 'union_of_None_type_or_booltype', True), (u'itemSeparator', 'union_of_None_type_or_strtype', True), (u'valueFrom', 'union_of_None_type_or_strtype_or_ExpressionLoader', True), (u'shellQuote', 'union_of_None_type_or_booltype', True), )
 
 
 class CommandOutputBinding(OutputBinding):
@@ -2483,18 +3232,16 @@ following order:
   - secondaryFiles
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'glob', 'loadContents', 'outputEval',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'glob' in doc:
             try:
                 self.glob = load_field(doc.get('glob'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'glob', str).makeError("the `glob` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'glob', "the `glob` field is not valid because:\n", e))
         else:
             self.glob = None
 
@@ -2502,7 +3249,7 @@ following order:
             try:
                 self.loadContents = load_field(doc.get('loadContents'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'loadContents', str).makeError("the `loadContents` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'loadContents', "the `loadContents` field is not valid because:\n", e))
         else:
             self.loadContents = None
 
@@ -2510,59 +3257,57 @@ following order:
             try:
                 self.outputEval = load_field(doc.get('outputEval'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputEval', str).makeError("the `outputEval` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputEval', "the `outputEval` field is not valid because:\n", e))
         else:
             self.outputEval = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `glob`, `loadContents`, `outputEval`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `glob`, `loadContents`, `outputEval`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputBinding'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandOutputBinding'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.glob is not None:
-            r['glob'] = save(self.glob, top=False, base_url=base_url)
+            yield 'glob', self.glob
 
         if self.loadContents is not None:
-            r['loadContents'] = save(self.loadContents, top=False, base_url=base_url)
+            yield 'loadContents', self.loadContents
 
         if self.outputEval is not None:
-            r['outputEval'] = save(self.outputEval, top=False, base_url=base_url)
+            yield 'outputEval', self.outputEval
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'glob', u'loadContents', u'outputEval'])
+    _fields = ((u'glob', 'union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_strtype', True), (u'loadContents', 'union_of_None_type_or_booltype', True), (u'outputEval', 'union_of_None_type_or_strtype_or_ExpressionLoader', True), )
 
 
 class CommandInputRecordField(InputRecordField):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2577,20 +3322,20 @@ class CommandInputRecordField(InputRecordField):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'inputBinding' in doc:
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
@@ -2598,65 +3343,65 @@ class CommandInputRecordField(InputRecordField):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`, `inputBinding`, `label`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`, `inputBinding`, `label`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputRecordField'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandInputRecordField'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.inputBinding is not None:
-            r['inputBinding'] = save(self.inputBinding, top=False, base_url=base_url)
+            yield 'inputBinding', self.inputBinding
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'name', u'doc', u'type', u'inputBinding', u'label'])
+    _fields = ((u'name', 'uri_strtype_True_False_None', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'type', 'typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2', False), (u'inputBinding', 'union_of_None_type_or_CommandLineBindingLoader', True), (u'label', 'union_of_None_type_or_strtype', True), )
+    _identifier = u'name'
+    _identifier_uuid = False
 
 
 class CommandInputRecordSchema(InputRecordSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2671,75 +3416,75 @@ class CommandInputRecordSchema(InputRecordSchema):
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_CommandInputRecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputRecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandInputRecordSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.fields is not None:
-            r['fields'] = save(self.fields, top=False, base_url=base_url)
+            yield 'fields', self.fields
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'fields', u'type', u'label', u'name'])
+    _fields = ((u'name', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'fields', 'idmap_fields_union_of_None_type_or_array_of_CommandInputRecordFieldLoader', True), (u'type', 'typedsl_Record_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), )
+    _identifier = u'name'
+    _identifier_uuid = True
 
 
 class CommandInputEnumSchema(InputEnumSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2753,18 +3498,18 @@ class CommandInputEnumSchema(InputEnumSchema):
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -2772,75 +3517,75 @@ class CommandInputEnumSchema(InputEnumSchema):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`, `label`, `name`, `inputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`, `label`, `name`, `inputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputEnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandInputEnumSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.symbols is not None:
-            r['symbols'] = save_relative_uri(self.symbols, base_url, True)
+            yield 'symbols', relative_uri_item(self.symbols, base_url, True, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.inputBinding is not None:
-            r['inputBinding'] = save(self.inputBinding, top=False, base_url=base_url)
+            yield 'inputBinding', self.inputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'symbols', u'type', u'label', u'name', u'inputBinding'])
+    _fields = ((u'name', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'symbols', 'uri_array_of_strtype_True_False_None', False), (u'type', 'typedsl_Enum_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), (u'inputBinding', 'union_of_None_type_or_CommandLineBindingLoader', True), )
+    _identifier = u'name'
+    _identifier_uuid = True
 
 
 class CommandInputArraySchema(InputArraySchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -2848,62 +3593,60 @@ class CommandInputArraySchema(InputArraySchema):
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`, `label`, `inputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`, `label`, `inputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandInputArraySchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.items is not None:
-            r['items'] = save_relative_uri(self.items, base_url, False)
+            yield 'items', relative_uri_item(self.items, base_url, False, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.inputBinding is not None:
-            r['inputBinding'] = save(self.inputBinding, top=False, base_url=base_url)
+            yield 'inputBinding', self.inputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'items', u'type', u'label', u'inputBinding'])
+    _fields = ((u'items', 'uri_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_False_True_2', False), (u'type', 'typedsl_Array_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), (u'inputBinding', 'union_of_None_type_or_CommandLineBindingLoader', True), )
 
 
 class CommandOutputRecordField(OutputRecordField):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -2918,75 +3661,75 @@ class CommandOutputRecordField(OutputRecordField):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'outputBinding' in doc:
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `name`, `doc`, `type`, `outputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `name`, `doc`, `type`, `outputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputRecordField'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandOutputRecordField'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'name', u'doc', u'type', u'outputBinding'])
+    _fields = ((u'name', 'uri_strtype_True_False_None', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'type', 'typedsl_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2', False), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), )
+    _identifier = u'name'
+    _identifier_uuid = False
 
 
 class CommandOutputRecordSchema(OutputRecordSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('name',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'name' in doc:
             try:
                 self.name = load_field(doc.get('name'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'name', str).makeError("the `name` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'name', "the `name` field is not valid because:\n", e))
         else:
             self.name = None
 
@@ -3001,85 +3744,85 @@ class CommandOutputRecordSchema(OutputRecordSchema):
             try:
                 self.fields = load_field(doc.get('fields'), idmap_fields_union_of_None_type_or_array_of_CommandOutputRecordFieldLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'fields', str).makeError("the `fields` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'fields', "the `fields` field is not valid because:\n", e))
         else:
             self.fields = None
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Record_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `fields`, `type`, `label`, `name`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputRecordSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandOutputRecordSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.name is not None:
-            r['name'] = save_relative_uri(self.name, base_url, True)
+            yield 'name', relative_uri_item(self.name, base_url, True, self.loadingOptions)
 
         if self.fields is not None:
-            r['fields'] = save(self.fields, top=False, base_url=base_url)
+            yield 'fields', self.fields
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'fields', u'type', u'label', u'name'])
+    _fields = ((u'name', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'fields', 'idmap_fields_union_of_None_type_or_array_of_CommandOutputRecordFieldLoader', True), (u'type', 'typedsl_Record_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), )
+    _identifier = u'name'
+    _identifier_uuid = True
 
 
 class CommandOutputEnumSchema(OutputEnumSchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.symbols = load_field(doc.get('symbols'), uri_array_of_strtype_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'symbols', str).makeError("the `symbols` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'symbols', "the `symbols` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Enum_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3087,72 +3830,70 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `symbols`, `type`, `label`, `outputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `symbols`, `type`, `label`, `outputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputEnumSchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandOutputEnumSchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.symbols is not None:
-            r['symbols'] = save_relative_uri(self.symbols, base_url, True)
+            yield 'symbols', relative_uri_item(self.symbols, base_url, True, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'symbols', u'type', u'label', u'outputBinding'])
+    _fields = ((u'symbols', 'uri_array_of_strtype_True_False_None', False), (u'type', 'typedsl_Enum_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), )
 
 
 class CommandOutputArraySchema(OutputArraySchema):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.items = load_field(doc.get('items'), uri_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_False_True_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'items', str).makeError("the `items` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'items', "the `items` field is not valid because:\n", e))
 
         try:
             self.type = load_field(doc.get('type'), typedsl_Array_symbolLoader_2, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
 
         if 'label' in doc:
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3160,65 +3901,63 @@ class CommandOutputArraySchema(OutputArraySchema):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `items`, `type`, `label`, `outputBinding`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `items`, `type`, `label`, `outputBinding`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputArraySchema'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandOutputArraySchema'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.items is not None:
-            r['items'] = save_relative_uri(self.items, base_url, False)
+            yield 'items', relative_uri_item(self.items, base_url, False, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'items', u'type', u'label', u'outputBinding'])
+    _fields = ((u'items', 'uri_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_False_True_2', False), (u'type', 'typedsl_Array_symbolLoader_2', False), (u'label', 'union_of_None_type_or_strtype', True), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), )
 
 
 class CommandInputParameter(InputParameter):
     """
 An input parameter for a CommandLineTool.
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ()
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -3233,7 +3972,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3241,7 +3980,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -3249,7 +3988,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -3257,7 +3996,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -3265,7 +4004,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -3273,7 +4012,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.inputBinding = load_field(doc.get('inputBinding'), union_of_None_type_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'inputBinding', str).makeError("the `inputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'inputBinding', "the `inputBinding` field is not valid because:\n", e))
         else:
             self.inputBinding = None
 
@@ -3281,7 +4020,7 @@ An input parameter for a CommandLineTool.
             try:
                 self.default = load_field(doc.get('default'), union_of_None_type_or_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'default', str).makeError("the `default` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'default', "the `default` field is not valid because:\n", e))
         else:
             self.default = None
 
@@ -3289,80 +4028,80 @@ An input parameter for a CommandLineTool.
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `format`, `inputBinding`, `default`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `format`, `inputBinding`, `default`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandInputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandInputParameter'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.secondaryFiles is not None:
-            r['secondaryFiles'] = save(self.secondaryFiles, top=False, base_url=base_url)
+            yield 'secondaryFiles', self.secondaryFiles
 
         if self.streamable is not None:
-            r['streamable'] = save(self.streamable, top=False, base_url=base_url)
+            yield 'streamable', self.streamable
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.format is not None:
-            r['format'] = save_relative_uri(self.format, base_url, True)
+            yield 'format', relative_uri_item(self.format, base_url, True, self.loadingOptions)
 
         if self.inputBinding is not None:
-            r['inputBinding'] = save(self.inputBinding, top=False, base_url=base_url)
+            yield 'inputBinding', self.inputBinding
 
         if self.default is not None:
-            r['default'] = save(self.default, top=False, base_url=base_url)
+            yield 'default', self.default
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'label', u'secondaryFiles', u'streamable', u'doc', u'id', u'format', u'inputBinding', u'default', u'type'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), (u'label', 'union_of_None_type_or_strtype', True), (u'secondaryFiles', 'union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader', True), (u'streamable', 'union_of_None_type_or_booltype', True), (u'doc', 'union_of_None_type_or_strtype_or_array_of_strtype', True), (u'format', 'uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None', True), (u'inputBinding', 'union_of_None_type_or_CommandLineBindingLoader', True), (u'default', 'union_of_None_type_or_Any_type', True), (u'type', 'typedsl_union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class CommandOutputParameter(OutputParameter):
     """
 An output parameter for a CommandLineTool.
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -3377,7 +4116,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3385,7 +4124,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -3393,7 +4132,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -3401,7 +4140,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -3409,7 +4148,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
@@ -3417,7 +4156,7 @@ An output parameter for a CommandLineTool.
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -3425,59 +4164,61 @@ An output parameter for a CommandLineTool.
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandOutputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandOutputParameter'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.secondaryFiles is not None:
-            r['secondaryFiles'] = save(self.secondaryFiles, top=False, base_url=base_url)
+            yield 'secondaryFiles', self.secondaryFiles
 
         if self.streamable is not None:
-            r['streamable'] = save(self.streamable, top=False, base_url=base_url)
+            yield 'streamable', self.streamable
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if self.format is not None:
-            r['format'] = save_relative_uri(self.format, base_url, True)
+            yield 'format', relative_uri_item(self.format, base_url, True, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'label', u'secondaryFiles', u'streamable', u'doc', u'id', u'outputBinding', u'format', u'type'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), (u'label', 'union_of_None_type_or_strtype', True), (u'secondaryFiles', 'union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader', True), (u'streamable', 'union_of_None_type_or_booltype', True), (u'doc', 'union_of_None_type_or_strtype_or_array_of_strtype', True), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), (u'format', 'uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None', True), (u'type', 'typedsl_union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class CommandLineTool(Process):
@@ -3485,11 +4226,9 @@ class CommandLineTool(Process):
 This defines the schema of the CWL Command Line Tool Description document.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'id', 'inputs', 'outputs', 'requirements', 'hints', 'label', 'doc', 'cwlVersion', 'baseCommand', 'arguments', 'stdin', 'stderr', 'stdout', 'successCodes', 'temporaryFailCodes', 'permanentFailCodes',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -3500,7 +4239,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.id = load_field(doc.get('id'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -3514,18 +4253,18 @@ This defines the schema of the CWL Command Line Tool Description document.
         try:
             self.inputs = load_field(doc.get('inputs'), idmap_inputs_array_of_CommandInputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'inputs', str).makeError("the `inputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'inputs', "the `inputs` field is not valid because:\n", e))
 
         try:
             self.outputs = load_field(doc.get('outputs'), idmap_outputs_array_of_CommandOutputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'outputs', str).makeError("the `outputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'outputs', "the `outputs` field is not valid because:\n", e))
 
         if 'requirements' in doc:
             try:
                 self.requirements = load_field(doc.get('requirements'), idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'requirements', str).makeError("the `requirements` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'requirements', "the `requirements` field is not valid because:\n", e))
         else:
             self.requirements = None
 
@@ -3533,7 +4272,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.hints = load_field(doc.get('hints'), idmap_hints_union_of_None_type_or_array_of_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'hints', str).makeError("the `hints` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'hints', "the `hints` field is not valid because:\n", e))
         else:
             self.hints = None
 
@@ -3541,7 +4280,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -3549,7 +4288,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -3557,7 +4296,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.cwlVersion = load_field(doc.get('cwlVersion'), uri_union_of_None_type_or_CWLVersionLoader_False_True_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'cwlVersion', str).makeError("the `cwlVersion` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'cwlVersion', "the `cwlVersion` field is not valid because:\n", e))
         else:
             self.cwlVersion = None
 
@@ -3565,7 +4304,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.baseCommand = load_field(doc.get('baseCommand'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'baseCommand', str).makeError("the `baseCommand` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'baseCommand', "the `baseCommand` field is not valid because:\n", e))
         else:
             self.baseCommand = None
 
@@ -3573,7 +4312,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.arguments = load_field(doc.get('arguments'), union_of_None_type_or_array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'arguments', str).makeError("the `arguments` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'arguments', "the `arguments` field is not valid because:\n", e))
         else:
             self.arguments = None
 
@@ -3581,7 +4320,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.stdin = load_field(doc.get('stdin'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'stdin', str).makeError("the `stdin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'stdin', "the `stdin` field is not valid because:\n", e))
         else:
             self.stdin = None
 
@@ -3589,7 +4328,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.stderr = load_field(doc.get('stderr'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'stderr', str).makeError("the `stderr` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'stderr', "the `stderr` field is not valid because:\n", e))
         else:
             self.stderr = None
 
@@ -3597,7 +4336,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.stdout = load_field(doc.get('stdout'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'stdout', str).makeError("the `stdout` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'stdout', "the `stdout` field is not valid because:\n", e))
         else:
             self.stdout = None
 
@@ -3605,7 +4344,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.successCodes = load_field(doc.get('successCodes'), union_of_None_type_or_array_of_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'successCodes', str).makeError("the `successCodes` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'successCodes', "the `successCodes` field is not valid because:\n", e))
         else:
             self.successCodes = None
 
@@ -3613,7 +4352,7 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.temporaryFailCodes = load_field(doc.get('temporaryFailCodes'), union_of_None_type_or_array_of_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'temporaryFailCodes', str).makeError("the `temporaryFailCodes` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'temporaryFailCodes', "the `temporaryFailCodes` field is not valid because:\n", e))
         else:
             self.temporaryFailCodes = None
 
@@ -3621,85 +4360,88 @@ This defines the schema of the CWL Command Line Tool Description document.
             try:
                 self.permanentFailCodes = load_field(doc.get('permanentFailCodes'), union_of_None_type_or_array_of_inttype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'permanentFailCodes', str).makeError("the `permanentFailCodes` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'permanentFailCodes', "the `permanentFailCodes` field is not valid because:\n", e))
         else:
             self.permanentFailCodes = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `baseCommand`, `arguments`, `stdin`, `stderr`, `stdout`, `successCodes`, `temporaryFailCodes`, `permanentFailCodes`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `baseCommand`, `arguments`, `stdin`, `stderr`, `stdout`, `successCodes`, `temporaryFailCodes`, `permanentFailCodes`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'CommandLineTool'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'CommandLineTool'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'CommandLineTool'
+        yield 'class', 'CommandLineTool'
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.inputs is not None:
-            r['inputs'] = save(self.inputs, top=False, base_url=base_url)
+            yield 'inputs', self.inputs
 
         if self.outputs is not None:
-            r['outputs'] = save(self.outputs, top=False, base_url=base_url)
+            yield 'outputs', self.outputs
 
         if self.requirements is not None:
-            r['requirements'] = save(self.requirements, top=False, base_url=base_url)
+            yield 'requirements', self.requirements
 
         if self.hints is not None:
-            r['hints'] = save(self.hints, top=False, base_url=base_url)
+            yield 'hints', self.hints
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.cwlVersion is not None:
-            r['cwlVersion'] = save_relative_uri(self.cwlVersion, base_url, False)
+            yield 'cwlVersion', relative_uri_item(self.cwlVersion, base_url, False, self.loadingOptions)
 
         if self.baseCommand is not None:
-            r['baseCommand'] = save(self.baseCommand, top=False, base_url=base_url)
+            yield 'baseCommand', self.baseCommand
 
         if self.arguments is not None:
-            r['arguments'] = save(self.arguments, top=False, base_url=base_url)
+            yield 'arguments', self.arguments
 
         if self.stdin is not None:
-            r['stdin'] = save(self.stdin, top=False, base_url=base_url)
+            yield 'stdin', self.stdin
 
         if self.stderr is not None:
-            r['stderr'] = save(self.stderr, top=False, base_url=base_url)
+            yield 'stderr', self.stderr
 
         if self.stdout is not None:
-            r['stdout'] = save(self.stdout, top=False, base_url=base_url)
+            yield 'stdout', self.stdout
 
         if self.successCodes is not None:
-            r['successCodes'] = save(self.successCodes, top=False, base_url=base_url)
+            yield 'successCodes', self.successCodes
 
         if self.temporaryFailCodes is not None:
-            r['temporaryFailCodes'] = save(self.temporaryFailCodes, top=False, base_url=base_url)
+            yield 'temporaryFailCodes', self.temporaryFailCodes
 
         if self.permanentFailCodes is not None:
-            r['permanentFailCodes'] = save(self.permanentFailCodes, top=False, base_url=base_url)
+            yield 'permanentFailCodes', self.permanentFailCodes
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'id', u'inputs', u'outputs', u'requirements', u'hints', u'label', u'doc', u'cwlVersion', u'class', u'baseCommand', u'arguments', u'stdin', u'stderr', u'stdout', u'successCodes', u'temporaryFailCodes', u'permanentFailCodes'])
+    discriminator = u'CommandLineTool'
+    _fields = ((u'id', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'inputs', 'idmap_inputs_array_of_CommandInputParameterLoader', False), (u'outputs', 'idmap_outputs_array_of_CommandOutputParameterLoader', False), (u'requirements', 'idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader', True), (u'hints', 'idmap_hints_union_of_None_type_or_array_of_Any_type', True), (u'label', 'union_of_None_type_or_strtype', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'cwlVersion', 'uri_union_of_None_type_or_CWLVersionLoader_False_True_None', True), (u'baseCommand', 'union_of_None_type_or_strtype_or_array_of_strtype', True), (u'arguments', 'union_of_None_type_or_array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader', True), (u'stdin', 'union_of_None_type_or_strtype_or_ExpressionLoader', True), (u'stderr', 'union_of_None_type_or_strtype_or_ExpressionLoader', True), (u'stdout', 'union_of_None_type_or_strtype_or_ExpressionLoader', True), (u'successCodes', 'union_of_None_type_or_array_of_inttype', True), (u'temporaryFailCodes', 'union_of_None_type_or_array_of_inttype', True), (u'permanentFailCodes', 'union_of_None_type_or_array_of_inttype', True), )
+    _identifier = u'id'
+    _identifier_uuid = True
 
 
 class DockerRequirement(ProcessRequirement):
@@ -3737,11 +4479,9 @@ using `--env` or `--env-file` and interact with the container's preexisting
 environment as defined by Docker.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'dockerPull', 'dockerLoad', 'dockerFile', 'dockerImport', 'dockerImageId', 'dockerOutputDirectory',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -3752,7 +4492,7 @@ environment as defined by Docker.
             try:
                 self.dockerPull = load_field(doc.get('dockerPull'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerPull', str).makeError("the `dockerPull` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerPull', "the `dockerPull` field is not valid because:\n", e))
         else:
             self.dockerPull = None
 
@@ -3760,7 +4500,7 @@ environment as defined by Docker.
             try:
                 self.dockerLoad = load_field(doc.get('dockerLoad'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerLoad', str).makeError("the `dockerLoad` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerLoad', "the `dockerLoad` field is not valid because:\n", e))
         else:
             self.dockerLoad = None
 
@@ -3768,7 +4508,7 @@ environment as defined by Docker.
             try:
                 self.dockerFile = load_field(doc.get('dockerFile'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerFile', str).makeError("the `dockerFile` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerFile', "the `dockerFile` field is not valid because:\n", e))
         else:
             self.dockerFile = None
 
@@ -3776,7 +4516,7 @@ environment as defined by Docker.
             try:
                 self.dockerImport = load_field(doc.get('dockerImport'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerImport', str).makeError("the `dockerImport` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerImport', "the `dockerImport` field is not valid because:\n", e))
         else:
             self.dockerImport = None
 
@@ -3784,7 +4524,7 @@ environment as defined by Docker.
             try:
                 self.dockerImageId = load_field(doc.get('dockerImageId'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerImageId', str).makeError("the `dockerImageId` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerImageId', "the `dockerImageId` field is not valid because:\n", e))
         else:
             self.dockerImageId = None
 
@@ -3792,55 +4532,56 @@ environment as defined by Docker.
             try:
                 self.dockerOutputDirectory = load_field(doc.get('dockerOutputDirectory'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'dockerOutputDirectory', str).makeError("the `dockerOutputDirectory` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'dockerOutputDirectory', "the `dockerOutputDirectory` field is not valid because:\n", e))
         else:
             self.dockerOutputDirectory = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `dockerPull`, `dockerLoad`, `dockerFile`, `dockerImport`, `dockerImageId`, `dockerOutputDirectory`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `dockerPull`, `dockerLoad`, `dockerFile`, `dockerImport`, `dockerImageId`, `dockerOutputDirectory`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'DockerRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'DockerRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'DockerRequirement'
+        yield 'class', 'DockerRequirement'
 
         if self.dockerPull is not None:
-            r['dockerPull'] = save(self.dockerPull, top=False, base_url=base_url)
+            yield 'dockerPull', self.dockerPull
 
         if self.dockerLoad is not None:
-            r['dockerLoad'] = save(self.dockerLoad, top=False, base_url=base_url)
+            yield 'dockerLoad', self.dockerLoad
 
         if self.dockerFile is not None:
-            r['dockerFile'] = save(self.dockerFile, top=False, base_url=base_url)
+            yield 'dockerFile', self.dockerFile
 
         if self.dockerImport is not None:
-            r['dockerImport'] = save(self.dockerImport, top=False, base_url=base_url)
+            yield 'dockerImport', self.dockerImport
 
         if self.dockerImageId is not None:
-            r['dockerImageId'] = save(self.dockerImageId, top=False, base_url=base_url)
+            yield 'dockerImageId', self.dockerImageId
 
         if self.dockerOutputDirectory is not None:
-            r['dockerOutputDirectory'] = save(self.dockerOutputDirectory, top=False, base_url=base_url)
+            yield 'dockerOutputDirectory', self.dockerOutputDirectory
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'dockerPull', u'dockerLoad', u'dockerFile', u'dockerImport', u'dockerImageId', u'dockerOutputDirectory'])
+    discriminator = u'DockerRequirement'
+    _fields = ((u'dockerPull', 'union_of_None_type_or_strtype', True), (u'dockerLoad', 'union_of_None_type_or_strtype', True), (u'dockerFile', 'union_of_None_type_or_strtype', True), (u'dockerImport', 'union_of_None_type_or_strtype', True), (u'dockerImageId', 'union_of_None_type_or_strtype', True), (u'dockerOutputDirectory', 'union_of_None_type_or_strtype', True), )
 
 
 class SoftwareRequirement(ProcessRequirement):
@@ -3849,11 +4590,9 @@ A list of software packages that should be configured in the environment of
 the defined process.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'packages',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -3863,58 +4602,57 @@ the defined process.
         try:
             self.packages = load_field(doc.get('packages'), idmap_packages_array_of_SoftwarePackageLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'packages', str).makeError("the `packages` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'packages', "the `packages` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `packages`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `packages`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'SoftwareRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'SoftwareRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'SoftwareRequirement'
+        yield 'class', 'SoftwareRequirement'
 
         if self.packages is not None:
-            r['packages'] = save(self.packages, top=False, base_url=base_url)
+            yield 'packages', self.packages
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'packages'])
+    discriminator = u'SoftwareRequirement'
+    _fields = ((u'packages', 'idmap_packages_array_of_SoftwarePackageLoader', False), )
 
 
 class SoftwarePackage(Savable):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'package', 'version', 'specs',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         try:
             self.package = load_field(doc.get('package'), strtype, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'package', str).makeError("the `package` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'package', "the `package` field is not valid because:\n", e))
 
         if 'version' in doc:
             try:
                 self.version = load_field(doc.get('version'), union_of_None_type_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'version', str).makeError("the `version` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'version', "the `version` field is not valid because:\n", e))
         else:
             self.version = None
 
@@ -3922,44 +4660,44 @@ class SoftwarePackage(Savable):
             try:
                 self.specs = load_field(doc.get('specs'), union_of_None_type_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'specs', str).makeError("the `specs` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'specs', "the `specs` field is not valid because:\n", e))
         else:
             self.specs = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `package`, `version`, `specs`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `package`, `version`, `specs`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'SoftwarePackage'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'SoftwarePackage'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.package is not None:
-            r['package'] = save(self.package, top=False, base_url=base_url)
+            yield 'package', self.package
 
         if self.version is not None:
-            r['version'] = save(self.version, top=False, base_url=base_url)
+            yield 'version', self.version
 
         if self.specs is not None:
-            r['specs'] = save(self.specs, top=False, base_url=base_url)
+            yield 'specs', self.specs
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'package', u'version', u'specs'])
+    _fields = ((u'package', 'strtype', False), (u'version', 'union_of_None_type_or_array_of_strtype', True), (u'specs', 'union_of_None_type_or_array_of_strtype', True), )
 
 
 class Dirent(Savable):
@@ -3970,79 +4708,75 @@ executing an expression, such as building a configuration file from a
 template.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'entryname', 'entry', 'writable',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'entryname' in doc:
             try:
                 self.entryname = load_field(doc.get('entryname'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'entryname', str).makeError("the `entryname` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'entryname', "the `entryname` field is not valid because:\n", e))
         else:
             self.entryname = None
 
         try:
             self.entry = load_field(doc.get('entry'), union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'entry', str).makeError("the `entry` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'entry', "the `entry` field is not valid because:\n", e))
 
         if 'writable' in doc:
             try:
                 self.writable = load_field(doc.get('writable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'writable', str).makeError("the `writable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'writable', "the `writable` field is not valid because:\n", e))
         else:
             self.writable = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `entryname`, `entry`, `writable`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `entryname`, `entry`, `writable`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'Dirent'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'Dirent'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.entryname is not None:
-            r['entryname'] = save(self.entryname, top=False, base_url=base_url)
+            yield 'entryname', self.entryname
 
         if self.entry is not None:
-            r['entry'] = save(self.entry, top=False, base_url=base_url)
+            yield 'entry', self.entry
 
         if self.writable is not None:
-            r['writable'] = save(self.writable, top=False, base_url=base_url)
+            yield 'writable', self.writable
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'entryname', u'entry', u'writable'])
+    _fields = ((u'entryname', 'union_of_None_type_or_strtype_or_ExpressionLoader', True), (u'entry', 'union_of_strtype_or_ExpressionLoader', False), (u'writable', 'union_of_None_type_or_booltype', True), )
 
 
 class InitialWorkDirRequirement(ProcessRequirement):
     """
 Define a list of files and subdirectories that must be created by the workflow platform in the designated output directory prior to executing the command line tool.
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'listing',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4052,38 +4786,39 @@ Define a list of files and subdirectories that must be created by the workflow p
         try:
             self.listing = load_field(doc.get('listing'), union_of_array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'listing', str).makeError("the `listing` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'listing', "the `listing` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `listing`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `listing`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'InitialWorkDirRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'InitialWorkDirRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'InitialWorkDirRequirement'
+        yield 'class', 'InitialWorkDirRequirement'
 
         if self.listing is not None:
-            r['listing'] = save(self.listing, top=False, base_url=base_url)
+            yield 'listing', self.listing
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'listing'])
+    discriminator = u'InitialWorkDirRequirement'
+    _fields = ((u'listing', 'union_of_array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader_or_strtype_or_ExpressionLoader', False), )
 
 
 class EnvVarRequirement(ProcessRequirement):
@@ -4092,11 +4827,9 @@ Define a list of environment variables which will be set in the
 execution environment of the tool.  See `EnvironmentDef` for details.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'envDef',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4106,38 +4839,39 @@ execution environment of the tool.  See `EnvironmentDef` for details.
         try:
             self.envDef = load_field(doc.get('envDef'), idmap_envDef_array_of_EnvironmentDefLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'envDef', str).makeError("the `envDef` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'envDef', "the `envDef` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `envDef`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `envDef`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'EnvVarRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'EnvVarRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'EnvVarRequirement'
+        yield 'class', 'EnvVarRequirement'
 
         if self.envDef is not None:
-            r['envDef'] = save(self.envDef, top=False, base_url=base_url)
+            yield 'envDef', self.envDef
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'envDef'])
+    discriminator = u'EnvVarRequirement'
+    _fields = ((u'envDef', 'idmap_envDef_array_of_EnvironmentDefLoader', False), )
 
 
 class ShellCommandRequirement(ProcessRequirement):
@@ -4151,11 +4885,9 @@ argument is joined into the command string without quoting, which allows
 the use of shell metacharacters such as `|` for pipes.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4163,32 +4895,33 @@ the use of shell metacharacters such as `|` for pipes.
             raise ValidationException("Not a ShellCommandRequirement")
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'ShellCommandRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'ShellCommandRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'ShellCommandRequirement'
+        yield 'class', 'ShellCommandRequirement'
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class'])
+    discriminator = u'ShellCommandRequirement'
+    _fields = ()
 
 
 class ResourceRequirement(ProcessRequirement):
@@ -4215,11 +4948,9 @@ It is an error if the value of any of these fields is negative.
 If neither "min" nor "max" is specified for a resource, an implementation may provide a default.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'coresMin', 'coresMax', 'ramMin', 'ramMax', 'tmpdirMin', 'tmpdirMax', 'outdirMin', 'outdirMax',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4230,7 +4961,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.coresMin = load_field(doc.get('coresMin'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'coresMin', str).makeError("the `coresMin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'coresMin', "the `coresMin` field is not valid because:\n", e))
         else:
             self.coresMin = None
 
@@ -4238,7 +4969,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.coresMax = load_field(doc.get('coresMax'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'coresMax', str).makeError("the `coresMax` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'coresMax', "the `coresMax` field is not valid because:\n", e))
         else:
             self.coresMax = None
 
@@ -4246,7 +4977,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.ramMin = load_field(doc.get('ramMin'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'ramMin', str).makeError("the `ramMin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'ramMin', "the `ramMin` field is not valid because:\n", e))
         else:
             self.ramMin = None
 
@@ -4254,7 +4985,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.ramMax = load_field(doc.get('ramMax'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'ramMax', str).makeError("the `ramMax` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'ramMax', "the `ramMax` field is not valid because:\n", e))
         else:
             self.ramMax = None
 
@@ -4262,7 +4993,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.tmpdirMin = load_field(doc.get('tmpdirMin'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'tmpdirMin', str).makeError("the `tmpdirMin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'tmpdirMin', "the `tmpdirMin` field is not valid because:\n", e))
         else:
             self.tmpdirMin = None
 
@@ -4270,7 +5001,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.tmpdirMax = load_field(doc.get('tmpdirMax'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'tmpdirMax', str).makeError("the `tmpdirMax` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'tmpdirMax', "the `tmpdirMax` field is not valid because:\n", e))
         else:
             self.tmpdirMax = None
 
@@ -4278,7 +5009,7 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.outdirMin = load_field(doc.get('outdirMin'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outdirMin', str).makeError("the `outdirMin` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outdirMin', "the `outdirMin` field is not valid because:\n", e))
         else:
             self.outdirMin = None
 
@@ -4286,76 +5017,75 @@ If neither "min" nor "max" is specified for a resource, an implementation may pr
             try:
                 self.outdirMax = load_field(doc.get('outdirMax'), union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outdirMax', str).makeError("the `outdirMax` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outdirMax', "the `outdirMax` field is not valid because:\n", e))
         else:
             self.outdirMax = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`, `coresMin`, `coresMax`, `ramMin`, `ramMax`, `tmpdirMin`, `tmpdirMax`, `outdirMin`, `outdirMax`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`, `coresMin`, `coresMax`, `ramMin`, `ramMax`, `tmpdirMin`, `tmpdirMax`, `outdirMin`, `outdirMax`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'ResourceRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'ResourceRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'ResourceRequirement'
+        yield 'class', 'ResourceRequirement'
 
         if self.coresMin is not None:
-            r['coresMin'] = save(self.coresMin, top=False, base_url=base_url)
+            yield 'coresMin', self.coresMin
 
         if self.coresMax is not None:
-            r['coresMax'] = save(self.coresMax, top=False, base_url=base_url)
+            yield 'coresMax', self.coresMax
 
         if self.ramMin is not None:
-            r['ramMin'] = save(self.ramMin, top=False, base_url=base_url)
+            yield 'ramMin', self.ramMin
 
         if self.ramMax is not None:
-            r['ramMax'] = save(self.ramMax, top=False, base_url=base_url)
+            yield 'ramMax', self.ramMax
 
         if self.tmpdirMin is not None:
-            r['tmpdirMin'] = save(self.tmpdirMin, top=False, base_url=base_url)
+            yield 'tmpdirMin', self.tmpdirMin
 
         if self.tmpdirMax is not None:
-            r['tmpdirMax'] = save(self.tmpdirMax, top=False, base_url=base_url)
+            yield 'tmpdirMax', self.tmpdirMax
 
         if self.outdirMin is not None:
-            r['outdirMin'] = save(self.outdirMin, top=False, base_url=base_url)
+            yield 'outdirMin', self.outdirMin
 
         if self.outdirMax is not None:
-            r['outdirMax'] = save(self.outdirMax, top=False, base_url=base_url)
+            yield 'outdirMax', self.outdirMax
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class', u'coresMin', u'coresMax', u'ramMin', u'ramMax', u'tmpdirMin', u'tmpdirMax', u'outdirMin', u'outdirMax'])
+    discriminator = u'ResourceRequirement'
+    _fields = ((u'coresMin', 'union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader', True), (u'coresMax', 'union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader', True), (u'ramMin', 'union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader', True), (u'ramMax', 'union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader', True), (u'tmpdirMin', 'union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader', True), (u'tmpdirMax', 'union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader', True), (u'outdirMin', 'union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader', True), (u'outdirMax', 'union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader', True), )
 
 
 class ExpressionToolOutputParameter(OutputParameter):
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4370,7 +5100,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -4378,7 +5108,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -4386,7 +5116,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -4394,7 +5124,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -4402,7 +5132,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
@@ -4410,7 +5140,7 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -4418,59 +5148,61 @@ class ExpressionToolOutputParameter(OutputParameter):
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'ExpressionToolOutputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'ExpressionToolOutputParameter'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.secondaryFiles is not None:
-            r['secondaryFiles'] = save(self.secondaryFiles, top=False, base_url=base_url)
+            yield 'secondaryFiles', self.secondaryFiles
 
         if self.streamable is not None:
-            r['streamable'] = save(self.streamable, top=False, base_url=base_url)
+            yield 'streamable', self.streamable
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if self.format is not None:
-            r['format'] = save_relative_uri(self.format, base_url, True)
+            yield 'format', relative_uri_item(self.format, base_url, True, self.loadingOptions)
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'label', u'secondaryFiles', u'streamable', u'doc', u'id', u'outputBinding', u'format', u'type'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), (u'label', 'union_of_None_type_or_strtype', True), (u'secondaryFiles', 'union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader', True), (u'streamable', 'union_of_None_type_or_booltype', True), (u'doc', 'union_of_None_type_or_strtype_or_array_of_strtype', True), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), (u'format', 'uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None', True), (u'type', 'typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class ExpressionTool(Process):
@@ -4478,11 +5210,9 @@ class ExpressionTool(Process):
 Execute an expression as a Workflow step.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'id', 'inputs', 'outputs', 'requirements', 'hints', 'label', 'doc', 'cwlVersion', 'expression',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -4493,7 +5223,7 @@ Execute an expression as a Workflow step.
             try:
                 self.id = load_field(doc.get('id'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4507,18 +5237,18 @@ Execute an expression as a Workflow step.
         try:
             self.inputs = load_field(doc.get('inputs'), idmap_inputs_array_of_InputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'inputs', str).makeError("the `inputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'inputs', "the `inputs` field is not valid because:\n", e))
 
         try:
             self.outputs = load_field(doc.get('outputs'), idmap_outputs_array_of_ExpressionToolOutputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'outputs', str).makeError("the `outputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'outputs', "the `outputs` field is not valid because:\n", e))
 
         if 'requirements' in doc:
             try:
                 self.requirements = load_field(doc.get('requirements'), idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'requirements', str).makeError("the `requirements` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'requirements', "the `requirements` field is not valid because:\n", e))
         else:
             self.requirements = None
 
@@ -4526,7 +5256,7 @@ Execute an expression as a Workflow step.
             try:
                 self.hints = load_field(doc.get('hints'), idmap_hints_union_of_None_type_or_array_of_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'hints', str).makeError("the `hints` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'hints', "the `hints` field is not valid because:\n", e))
         else:
             self.hints = None
 
@@ -4534,7 +5264,7 @@ Execute an expression as a Workflow step.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -4542,7 +5272,7 @@ Execute an expression as a Workflow step.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -4550,69 +5280,72 @@ Execute an expression as a Workflow step.
             try:
                 self.cwlVersion = load_field(doc.get('cwlVersion'), uri_union_of_None_type_or_CWLVersionLoader_False_True_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'cwlVersion', str).makeError("the `cwlVersion` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'cwlVersion', "the `cwlVersion` field is not valid because:\n", e))
         else:
             self.cwlVersion = None
 
         try:
             self.expression = load_field(doc.get('expression'), union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'expression', str).makeError("the `expression` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'expression', "the `expression` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `expression`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `expression`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'ExpressionTool'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'ExpressionTool'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'ExpressionTool'
+        yield 'class', 'ExpressionTool'
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.inputs is not None:
-            r['inputs'] = save(self.inputs, top=False, base_url=base_url)
+            yield 'inputs', self.inputs
 
         if self.outputs is not None:
-            r['outputs'] = save(self.outputs, top=False, base_url=base_url)
+            yield 'outputs', self.outputs
 
         if self.requirements is not None:
-            r['requirements'] = save(self.requirements, top=False, base_url=base_url)
+            yield 'requirements', self.requirements
 
         if self.hints is not None:
-            r['hints'] = save(self.hints, top=False, base_url=base_url)
+            yield 'hints', self.hints
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.cwlVersion is not None:
-            r['cwlVersion'] = save_relative_uri(self.cwlVersion, base_url, False)
+            yield 'cwlVersion', relative_uri_item(self.cwlVersion, base_url, False, self.loadingOptions)
 
         if self.expression is not None:
-            r['expression'] = save(self.expression, top=False, base_url=base_url)
+            yield 'expression', self.expression
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'id', u'inputs', u'outputs', u'requirements', u'hints', u'label', u'doc', u'cwlVersion', u'class', u'expression'])
+    discriminator = u'ExpressionTool'
+    _fields = ((u'id', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'inputs', 'idmap_inputs_array_of_InputParameterLoader', False), (u'outputs', 'idmap_outputs_array_of_ExpressionToolOutputParameterLoader', False), (u'requirements', 'idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader', True), (u'hints', 'idmap_hints_union_of_None_type_or_array_of_Any_type', True), (u'label', 'union_of_None_type_or_strtype', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'cwlVersion', 'uri_union_of_None_type_or_CWLVersionLoader_False_True_None', True), (u'expression', 'union_of_strtype_or_ExpressionLoader', False), )
+    _identifier = u'id'
+    _identifier_uuid = True
 
 
 class WorkflowOutputParameter(OutputParameter):
@@ -4622,18 +5355,16 @@ connected to one or more parameters defined in the workflow that will
 provide the value of the output parameter.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('outputSource', 'linkMerge', 'type',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4648,7 +5379,7 @@ provide the value of the output parameter.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -4656,7 +5387,7 @@ provide the value of the output parameter.
             try:
                 self.secondaryFiles = load_field(doc.get('secondaryFiles'), union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'secondaryFiles', str).makeError("the `secondaryFiles` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'secondaryFiles', "the `secondaryFiles` field is not valid because:\n", e))
         else:
             self.secondaryFiles = None
 
@@ -4664,7 +5395,7 @@ provide the value of the output parameter.
             try:
                 self.streamable = load_field(doc.get('streamable'), union_of_None_type_or_booltype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'streamable', str).makeError("the `streamable` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'streamable', "the `streamable` field is not valid because:\n", e))
         else:
             self.streamable = None
 
@@ -4672,7 +5403,7 @@ provide the value of the output parameter.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype_or_array_of_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -4680,7 +5411,7 @@ provide the value of the output parameter.
             try:
                 self.outputBinding = load_field(doc.get('outputBinding'), union_of_None_type_or_CommandOutputBindingLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputBinding', str).makeError("the `outputBinding` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputBinding', "the `outputBinding` field is not valid because:\n", e))
         else:
             self.outputBinding = None
 
@@ -4688,7 +5419,7 @@ provide the value of the output parameter.
             try:
                 self.format = load_field(doc.get('format'), uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'format', str).makeError("the `format` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'format', "the `format` field is not valid because:\n", e))
         else:
             self.format = None
 
@@ -4696,7 +5427,7 @@ provide the value of the output parameter.
             try:
                 self.outputSource = load_field(doc.get('outputSource'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'outputSource', str).makeError("the `outputSource` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'outputSource', "the `outputSource` field is not valid because:\n", e))
         else:
             self.outputSource = None
 
@@ -4704,7 +5435,7 @@ provide the value of the output parameter.
             try:
                 self.linkMerge = load_field(doc.get('linkMerge'), union_of_None_type_or_LinkMergeMethodLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'linkMerge', str).makeError("the `linkMerge` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'linkMerge', "the `linkMerge` field is not valid because:\n", e))
         else:
             self.linkMerge = None
 
@@ -4712,69 +5443,71 @@ provide the value of the output parameter.
             try:
                 self.type = load_field(doc.get('type'), typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'type', str).makeError("the `type` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'type', "the `type` field is not valid because:\n", e))
         else:
             self.type = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `outputSource`, `linkMerge`, `type`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `label`, `secondaryFiles`, `streamable`, `doc`, `id`, `outputBinding`, `format`, `outputSource`, `linkMerge`, `type`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'WorkflowOutputParameter'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'WorkflowOutputParameter'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.secondaryFiles is not None:
-            r['secondaryFiles'] = save(self.secondaryFiles, top=False, base_url=base_url)
+            yield 'secondaryFiles', self.secondaryFiles
 
         if self.streamable is not None:
-            r['streamable'] = save(self.streamable, top=False, base_url=base_url)
+            yield 'streamable', self.streamable
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.outputBinding is not None:
-            r['outputBinding'] = save(self.outputBinding, top=False, base_url=base_url)
+            yield 'outputBinding', self.outputBinding
 
         if self.format is not None:
-            r['format'] = save_relative_uri(self.format, base_url, True)
+            yield 'format', relative_uri_item(self.format, base_url, True, self.loadingOptions)
 
         if self.outputSource is not None:
-            r['outputSource'] = save_relative_uri(self.outputSource, base_url, False)
+            yield 'outputSource', relative_uri_item(self.outputSource, base_url, False, self.loadingOptions)
 
         if self.linkMerge is not None:
-            r['linkMerge'] = save(self.linkMerge, top=False, base_url=base_url)
+            yield 'linkMerge', self.linkMerge
 
         if self.type is not None:
-            r['type'] = save(self.type, top=False, base_url=base_url)
+            yield 'type', self.type
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'label', u'secondaryFiles', u'streamable', u'doc', u'id', u'outputBinding', u'format', u'outputSource', u'linkMerge', u'type'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), (u'label', 'union_of_None_type_or_strtype', True), (u'secondaryFiles', 'union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader', True), (u'streamable', 'union_of_None_type_or_booltype', True), (u'doc', 'union_of_None_type_or_strtype_or_array_of_strtype', True), (u'outputBinding', 'union_of_None_type_or_CommandOutputBindingLoader', True), (u'format', 'uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None', True), (u'outputSource', 'uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0', True), (u'linkMerge', 'union_of_None_type_or_LinkMergeMethodLoader', True), (u'type', 'typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class Sink(Savable):
-    pass
+    __slots__ = ()
 
 class WorkflowStepInput(Sink):
     """
@@ -4819,18 +5552,16 @@ specified, the default method is "merge_nested".
      single elements.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'id', 'source', 'linkMerge', 'default', 'valueFrom',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4845,7 +5576,7 @@ specified, the default method is "merge_nested".
             try:
                 self.source = load_field(doc.get('source'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_2, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'source', str).makeError("the `source` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'source', "the `source` field is not valid because:\n", e))
         else:
             self.source = None
 
@@ -4853,7 +5584,7 @@ specified, the default method is "merge_nested".
             try:
                 self.linkMerge = load_field(doc.get('linkMerge'), union_of_None_type_or_LinkMergeMethodLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'linkMerge', str).makeError("the `linkMerge` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'linkMerge', "the `linkMerge` field is not valid because:\n", e))
         else:
             self.linkMerge = None
 
@@ -4861,7 +5592,7 @@ specified, the default method is "merge_nested".
             try:
                 self.default = load_field(doc.get('default'), union_of_None_type_or_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'default', str).makeError("the `default` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'default', "the `default` field is not valid because:\n", e))
         else:
             self.default = None
 
@@ -4869,50 +5600,52 @@ specified, the default method is "merge_nested".
             try:
                 self.valueFrom = load_field(doc.get('valueFrom'), union_of_None_type_or_strtype_or_ExpressionLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'valueFrom', str).makeError("the `valueFrom` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'valueFrom', "the `valueFrom` field is not valid because:\n", e))
         else:
             self.valueFrom = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `source`, `linkMerge`, `id`, `default`, `valueFrom`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `source`, `linkMerge`, `id`, `default`, `valueFrom`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'WorkflowStepInput'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'WorkflowStepInput'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.source is not None:
-            r['source'] = save_relative_uri(self.source, base_url, False)
+            yield 'source', relative_uri_item(self.source, base_url, False, self.loadingOptions)
 
         if self.linkMerge is not None:
-            r['linkMerge'] = save(self.linkMerge, top=False, base_url=base_url)
+            yield 'linkMerge', self.linkMerge
 
         if self.default is not None:
-            r['default'] = save(self.default, top=False, base_url=base_url)
+            yield 'default', self.default
 
         if self.valueFrom is not None:
-            r['valueFrom'] = save(self.valueFrom, top=False, base_url=base_url)
+            yield 'valueFrom', self.valueFrom
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'source', u'linkMerge', u'id', u'default', u'valueFrom'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), (u'source', 'uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_2', True), (u'linkMerge', 'union_of_None_type_or_LinkMergeMethodLoader', True), (u'default', 'union_of_None_type_or_Any_type', True), (u'valueFrom', 'union_of_None_type_or_strtype_or_ExpressionLoader', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class WorkflowStepOutput(Savable):
@@ -4923,18 +5656,16 @@ as a `source` to connect with input parameters of other workflow steps, or
 with an output parameter of the process.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'id',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -4946,33 +5677,35 @@ with an output parameter of the process.
                 raise ValidationException("Missing id")
         baseuri = self.id
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'WorkflowStepOutput'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'WorkflowStepOutput'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'id'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class WorkflowStep(Savable):
@@ -5034,18 +5767,16 @@ It is a fatal error if a workflow directly or indirectly invokes itself as
 a subworkflow (recursive workflows are not allowed).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'id', 'in_', 'out', 'requirements', 'hints', 'label', 'doc', 'run', 'scatter', 'scatterMethod',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
         if 'id' in doc:
             try:
                 self.id = load_field(doc.get('id'), uri_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -5059,18 +5790,18 @@ a subworkflow (recursive workflows are not allowed).
         try:
             self.in_ = load_field(doc.get('in'), idmap_in__array_of_WorkflowStepInputLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'in', str).makeError("the `in` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'in', "the `in` field is not valid because:\n", e))
 
         try:
             self.out = load_field(doc.get('out'), uri_union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader_True_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'out', str).makeError("the `out` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'out', "the `out` field is not valid because:\n", e))
 
         if 'requirements' in doc:
             try:
                 self.requirements = load_field(doc.get('requirements'), idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'requirements', str).makeError("the `requirements` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'requirements', "the `requirements` field is not valid because:\n", e))
         else:
             self.requirements = None
 
@@ -5078,7 +5809,7 @@ a subworkflow (recursive workflows are not allowed).
             try:
                 self.hints = load_field(doc.get('hints'), idmap_hints_union_of_None_type_or_array_of_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'hints', str).makeError("the `hints` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'hints', "the `hints` field is not valid because:\n", e))
         else:
             self.hints = None
 
@@ -5086,7 +5817,7 @@ a subworkflow (recursive workflows are not allowed).
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -5094,20 +5825,20 @@ a subworkflow (recursive workflows are not allowed).
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
         try:
             self.run = load_field(doc.get('run'), uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'run', str).makeError("the `run` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'run', "the `run` field is not valid because:\n", e))
 
         if 'scatter' in doc:
             try:
                 self.scatter = load_field(doc.get('scatter'), uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'scatter', str).makeError("the `scatter` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'scatter', "the `scatter` field is not valid because:\n", e))
         else:
             self.scatter = None
 
@@ -5115,65 +5846,67 @@ a subworkflow (recursive workflows are not allowed).
             try:
                 self.scatterMethod = load_field(doc.get('scatterMethod'), uri_union_of_None_type_or_ScatterMethodLoader_False_True_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'scatterMethod', str).makeError("the `scatterMethod` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'scatterMethod', "the `scatterMethod` field is not valid because:\n", e))
         else:
             self.scatterMethod = None
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`, `in`, `out`, `requirements`, `hints`, `label`, `doc`, `run`, `scatter`, `scatterMethod`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`, `in`, `out`, `requirements`, `hints`, `label`, `doc`, `run`, `scatter`, `scatterMethod`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'WorkflowStep'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'WorkflowStep'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.in_ is not None:
-            r['in'] = save(self.in_, top=False, base_url=base_url)
+            yield 'in', self.in_
 
         if self.out is not None:
-            r['out'] = save_relative_uri(self.out, base_url, True)
+            yield 'out', relative_uri_item(self.out, base_url, True, self.loadingOptions)
 
         if self.requirements is not None:
-            r['requirements'] = save(self.requirements, top=False, base_url=base_url)
+            yield 'requirements', self.requirements
 
         if self.hints is not None:
-            r['hints'] = save(self.hints, top=False, base_url=base_url)
+            yield 'hints', self.hints
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.run is not None:
-            r['run'] = save_relative_uri(self.run, base_url, False)
+            yield 'run', relative_uri_item(self.run, base_url, False, self.loadingOptions)
 
         if self.scatter is not None:
-            r['scatter'] = save_relative_uri(self.scatter, base_url, False)
+            yield 'scatter', relative_uri_item(self.scatter, base_url, False, self.loadingOptions)
 
         if self.scatterMethod is not None:
-            r['scatterMethod'] = save_relative_uri(self.scatterMethod, base_url, False)
+            yield 'scatterMethod', relative_uri_item(self.scatterMethod, base_url, False, self.loadingOptions)
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'id', u'in', u'out', u'requirements', u'hints', u'label', u'doc', u'run', u'scatter', u'scatterMethod'])
+    _fields = ((u'id', 'uri_strtype_True_False_None', True), (u'in', 'idmap_in__array_of_WorkflowStepInputLoader', False), (u'out', 'uri_union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader_True_False_None', False), (u'requirements', 'idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader', True), (u'hints', 'idmap_hints_union_of_None_type_or_array_of_Any_type', True), (u'label', 'union_of_None_type_or_strtype', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'run', 'uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None', False), (u'scatter', 'uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0', True), (u'scatterMethod', 'uri_union_of_None_type_or_ScatterMethodLoader_False_True_None', True), )
+    _identifier = u'id'
+    _identifier_uuid = False
 
 
 class Workflow(Process):
@@ -5225,11 +5958,9 @@ available as standard [extensions](#Extensions_and_Metadata) to core
 workflow semantics.
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields', 'id', 'inputs', 'outputs', 'requirements', 'hints', 'label', 'doc', 'cwlVersion', 'steps',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5240,7 +5971,7 @@ workflow semantics.
             try:
                 self.id = load_field(doc.get('id'), uri_union_of_None_type_or_strtype_True_False_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'id', str).makeError("the `id` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'id', "the `id` field is not valid because:\n", e))
         else:
             self.id = None
 
@@ -5254,18 +5985,18 @@ workflow semantics.
         try:
             self.inputs = load_field(doc.get('inputs'), idmap_inputs_array_of_InputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'inputs', str).makeError("the `inputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'inputs', "the `inputs` field is not valid because:\n", e))
 
         try:
             self.outputs = load_field(doc.get('outputs'), idmap_outputs_array_of_WorkflowOutputParameterLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'outputs', str).makeError("the `outputs` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'outputs', "the `outputs` field is not valid because:\n", e))
 
         if 'requirements' in doc:
             try:
                 self.requirements = load_field(doc.get('requirements'), idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'requirements', str).makeError("the `requirements` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'requirements', "the `requirements` field is not valid because:\n", e))
         else:
             self.requirements = None
 
@@ -5273,7 +6004,7 @@ workflow semantics.
             try:
                 self.hints = load_field(doc.get('hints'), idmap_hints_union_of_None_type_or_array_of_Any_type, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'hints', str).makeError("the `hints` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'hints', "the `hints` field is not valid because:\n", e))
         else:
             self.hints = None
 
@@ -5281,7 +6012,7 @@ workflow semantics.
             try:
                 self.label = load_field(doc.get('label'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'label', str).makeError("the `label` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'label', "the `label` field is not valid because:\n", e))
         else:
             self.label = None
 
@@ -5289,7 +6020,7 @@ workflow semantics.
             try:
                 self.doc = load_field(doc.get('doc'), union_of_None_type_or_strtype, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'doc', str).makeError("the `doc` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'doc', "the `doc` field is not valid because:\n", e))
         else:
             self.doc = None
 
@@ -5297,69 +6028,72 @@ workflow semantics.
             try:
                 self.cwlVersion = load_field(doc.get('cwlVersion'), uri_union_of_None_type_or_CWLVersionLoader_False_True_None, baseuri, loadingOptions)
             except ValidationException as e:
-                errors.append(SourceLine(doc, 'cwlVersion', str).makeError("the `cwlVersion` field is not valid because:\n"+str(e)))
+                errors.append(_SourceError(doc, 'cwlVersion', "the `cwlVersion` field is not valid because:\n", e))
         else:
             self.cwlVersion = None
 
         try:
             self.steps = load_field(doc.get('steps'), idmap_steps_union_of_array_of_WorkflowStepLoader, baseuri, loadingOptions)
         except ValidationException as e:
-            errors.append(SourceLine(doc, 'steps', str).makeError("the `steps` field is not valid because:\n"+str(e)))
+            errors.append(_SourceError(doc, 'steps', "the `steps` field is not valid because:\n", e))
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `steps`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `id`, `inputs`, `outputs`, `requirements`, `hints`, `label`, `doc`, `cwlVersion`, `class`, `steps`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'Workflow'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'Workflow'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'Workflow'
+        yield 'class', 'Workflow'
 
         if self.id is not None:
-            r['id'] = save_relative_uri(self.id, base_url, True)
+            yield 'id', relative_uri_item(self.id, base_url, True, self.loadingOptions)
 
         if self.inputs is not None:
-            r['inputs'] = save(self.inputs, top=False, base_url=base_url)
+            yield 'inputs', self.inputs
 
         if self.outputs is not None:
-            r['outputs'] = save(self.outputs, top=False, base_url=base_url)
+            yield 'outputs', self.outputs
 
         if self.requirements is not None:
-            r['requirements'] = save(self.requirements, top=False, base_url=base_url)
+            yield 'requirements', self.requirements
 
         if self.hints is not None:
-            r['hints'] = save(self.hints, top=False, base_url=base_url)
+            yield 'hints', self.hints
 
         if self.label is not None:
-            r['label'] = save(self.label, top=False, base_url=base_url)
+            yield 'label', self.label
 
         if self.doc is not None:
-            r['doc'] = save(self.doc, top=False, base_url=base_url)
+            yield 'doc', self.doc
 
         if self.cwlVersion is not None:
-            r['cwlVersion'] = save_relative_uri(self.cwlVersion, base_url, False)
+            yield 'cwlVersion', relative_uri_item(self.cwlVersion, base_url, False, self.loadingOptions)
 
         if self.steps is not None:
-            r['steps'] = save(self.steps, top=False, base_url=base_url)
+            yield 'steps', self.steps
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'id', u'inputs', u'outputs', u'requirements', u'hints', u'label', u'doc', u'cwlVersion', u'class', u'steps'])
+    discriminator = u'Workflow'
+    _fields = ((u'id', 'uri_union_of_None_type_or_strtype_True_False_None', True), (u'inputs', 'idmap_inputs_array_of_InputParameterLoader', False), (u'outputs', 'idmap_outputs_array_of_WorkflowOutputParameterLoader', False), (u'requirements', 'idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader', True), (u'hints', 'idmap_hints_union_of_None_type_or_array_of_Any_type', True), (u'label', 'union_of_None_type_or_strtype', True), (u'doc', 'union_of_None_type_or_strtype', True), (u'cwlVersion', 'uri_union_of_None_type_or_CWLVersionLoader_False_True_None', True), (u'steps', 'idmap_steps_union_of_array_of_WorkflowStepLoader', False), )
+    _identifier = u'id'
+    _identifier_uuid = True
 
 
 class SubworkflowFeatureRequirement(ProcessRequirement):
@@ -5368,11 +6102,9 @@ Indicates that the workflow platform must support nested workflows in
 the `run` field of [WorkflowStep](#WorkflowStep).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5380,32 +6112,33 @@ the `run` field of [WorkflowStep](#WorkflowStep).
             raise ValidationException("Not a SubworkflowFeatureRequirement")
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'SubworkflowFeatureRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'SubworkflowFeatureRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'SubworkflowFeatureRequirement'
+        yield 'class', 'SubworkflowFeatureRequirement'
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class'])
+    discriminator = u'SubworkflowFeatureRequirement'
+    _fields = ()
 
 
 class ScatterFeatureRequirement(ProcessRequirement):
@@ -5414,11 +6147,9 @@ Indicates that the workflow platform must support the `scatter` and
 `scatterMethod` fields of [WorkflowStep](#WorkflowStep).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5426,32 +6157,33 @@ Indicates that the workflow platform must support the `scatter` and
             raise ValidationException("Not a ScatterFeatureRequirement")
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'ScatterFeatureRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'ScatterFeatureRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'ScatterFeatureRequirement'
+        yield 'class', 'ScatterFeatureRequirement'
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class'])
+    discriminator = u'ScatterFeatureRequirement'
+    _fields = ()
 
 
 class MultipleInputFeatureRequirement(ProcessRequirement):
@@ -5460,11 +6192,9 @@ Indicates that the workflow platform must support multiple inbound data links
 listed in the `source` field of [WorkflowStepInput](#WorkflowStepInput).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5472,32 +6202,33 @@ listed in the `source` field of [WorkflowStepInput](#WorkflowStepInput).
             raise ValidationException("Not a MultipleInputFeatureRequirement")
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'MultipleInputFeatureRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'MultipleInputFeatureRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'MultipleInputFeatureRequirement'
+        yield 'class', 'MultipleInputFeatureRequirement'
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class'])
+    discriminator = u'MultipleInputFeatureRequirement'
+    _fields = ()
 
 
 class StepInputExpressionRequirement(ProcessRequirement):
@@ -5506,11 +6237,9 @@ Indicate that the workflow platform must support the `valueFrom` field
 of [WorkflowStepInput](#WorkflowStepInput).
 
     """
-    def __init__(self, _doc, baseuri, loadingOptions, docRoot=None):
-        doc = copy.copy(_doc)
-        if hasattr(_doc, 'lc'):
-            doc.lc.data = _doc.lc.data
-            doc.lc.filename = _doc.lc.filename
+    __slots__ = ('loadingOptions', 'extension_fields',)
+
+    def __init__(self, doc, baseuri, loadingOptions, docRoot=None):
         errors = []
         self.loadingOptions = loadingOptions
 
@@ -5518,32 +6247,33 @@ of [WorkflowStepInput](#WorkflowStepInput).
             raise ValidationException("Not a StepInputExpressionRequirement")
 
 
-        self.extension_fields = {}
+        self.extension_fields = _no_extension_fields
         for k in doc.keys():
             if k not in self.attrs:
                 if ":" in k:
                     ex = expand_url(k, u"", loadingOptions, scoped_id=False, vocab_term=False)
+                    if self.extension_fields is _no_extension_fields:
+                        self.extension_fields = {}
                     self.extension_fields[ex] = doc[k]
                 else:
-                    errors.append(SourceLine(doc, k, str).makeError("invalid field `%s`, expected one of: `class`" % (k)))
+                    errors.append(_SourceError(doc, k, "invalid field `%s`, expected one of: `class`" % (k)))
                     break
 
         if errors:
-            raise ValidationException("Trying 'StepInputExpressionRequirement'\n"+"\n".join(errors))
+            raise ValidationException(_ErrorList(errors, "Trying 'StepInputExpressionRequirement'"))
 
-    def save(self, top=False, base_url=""):
-        r = {}
+    def save_items(self, top=False, base_url=""):
         for ef in self.extension_fields:
-            r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            yield prefix_url(ef, self.loadingOptions.vocab), self.extension_fields[ef]
 
-        r['class'] = 'StepInputExpressionRequirement'
+        yield 'class', 'StepInputExpressionRequirement'
 
         if top and self.loadingOptions.namespaces:
-            r["$namespaces"] = self.loadingOptions.namespaces
-
-        return r
+            yield "$namespaces", self.loadingOptions.namespaces
 
     attrs = frozenset([u'class'])
+    discriminator = u'StepInputExpressionRequirement'
+    _fields = ()
 
 
 _vocab = {
@@ -5959,6 +6689,12 @@ union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader = _Unio
 array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader = _ArrayLoader(union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
 union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader = _UnionLoader((CommandLineToolLoader, ExpressionToolLoader, WorkflowLoader, array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader,))
 
+# The loaders whole documents are loaded with, by name, which is how a process
+# pool worker is told what to load the chunks of a $graph with
+_document_loaders = {
+    "document": union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader,
+}
+
 
 
 def load_document(doc, baseuri=None, loadingOptions=None):
@@ -5966,4 +6702,9 @@ def load_document(doc, baseuri=None, loadingOptions=None):
         baseuri = file_uri(os.getcwd()) + "/"
     if loadingOptions is None:
         loadingOptions = LoadingOptions()
-    return _document_load(union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, doc, baseuri, loadingOptions)
+    try:
+        return _document_load(_document_loaders["document"], doc, baseuri, loadingOptions)
+    except ValidationException as e:
+        # Format the message now rather than handing back references to the
+        # source documents.
+        six.raise_from(ValidationException(six.text_type(e)), None)
@@ -0,0 +1,13114 @@
+# Generated from the loaders of cwl_model by ./generate_parsers; do not edit.
+from __future__ import absolute_import
+import copy
+import uuid
+
+from . import cwl_model as m
+from .cwl_model import (ValidationException, expand_url, load_field,
+                        _failed, _no_extension_fields, _TrustedLoader)
+
+_slow0 = m._UnionLoader.load.__get__(m.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
+_slow1 = m._ArrayLoader.load.__get__(m.array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
+_slow2 = m._UnionLoader.load.__get__(m.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
+_slow3 = m._UnionLoader.load.__get__(m.union_of_array_of_WorkflowStepLoader)
+_slow4 = m._ArrayLoader.load.__get__(m.array_of_WorkflowStepLoader)
+_slow5 = m._ArrayLoader.load.__get__(m.array_of_WorkflowOutputParameterLoader)
+_symbols6 = frozenset(['dotproduct', 'flat_crossproduct', 'nested_crossproduct'])
+_slow7 = m._UnionLoader.load.__get__(m.union_of_None_type_or_ScatterMethodLoader)
+_type8 = (str, str)
+_slow9 = m._UnionLoader.load.__get__(m.union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
+_slow10 = m._UnionLoader.load.__get__(m.union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader)
+_slow11 = m._ArrayLoader.load.__get__(m.array_of_union_of_strtype_or_WorkflowStepOutputLoader)
+_slow12 = m._UnionLoader.load.__get__(m.union_of_strtype_or_WorkflowStepOutputLoader)
+_slow13 = m._ArrayLoader.load.__get__(m.array_of_WorkflowStepInputLoader)
+_symbols14 = frozenset(['merge_flattened', 'merge_nested'])
+_slow15 = m._UnionLoader.load.__get__(m.union_of_None_type_or_LinkMergeMethodLoader)
+_slow16 = m._ArrayLoader.load.__get__(m.array_of_ExpressionToolOutputParameterLoader)
+_resolve17 = m.typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2.resolve
+_symbols18 = frozenset(['Directory', 'File'])
+_slow19 = m._UnionLoader.load.__get__(m.union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype)
+_type20 = int
+_symbols21 = frozenset(['ExpressionPlaceholder'])
+_slow22 = m._UnionLoader.load.__get__(m.union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader)
+_slow23 = m._ArrayLoader.load.__get__(m.array_of_EnvironmentDefLoader)
+_slow24 = m._UnionLoader.load.__get__(m.union_of_array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader_or_strtype_or_ExpressionLoader)
+_slow25 = m._ArrayLoader.load.__get__(m.array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader)
+_slow26 = m._UnionLoader.load.__get__(m.union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader)
+_slow27 = m._ArrayLoader.load.__get__(m.array_of_SoftwarePackageLoader)
+_slow28 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_inttype)
+_slow29 = m._ArrayLoader.load.__get__(m.array_of_inttype)
+_slow30 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader)
+_slow31 = m._ArrayLoader.load.__get__(m.array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader)
+_slow32 = m._UnionLoader.load.__get__(m.union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader)
+_slow33 = m._ArrayLoader.load.__get__(m.array_of_CommandOutputParameterLoader)
+_slow34 = m._ArrayLoader.load.__get__(m.array_of_CommandInputParameterLoader)
+_resolve35 = m.typedsl_union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2.resolve
+_symbols36 = frozenset(['stdout'])
+_symbols37 = frozenset(['stderr'])
+_slow38 = m._UnionLoader.load.__get__(m.union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype)
+_resolve39 = m.typedsl_union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2.resolve
+_slow40 = m._UnionLoader.load.__get__(m.union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype)
+_slow41 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_CommandOutputRecordFieldLoader)
+_slow42 = m._ArrayLoader.load.__get__(m.array_of_CommandOutputRecordFieldLoader)
+_resolve43 = m.typedsl_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2.resolve
+_slow44 = m._UnionLoader.load.__get__(m.union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype)
+_slow45 = m._ArrayLoader.load.__get__(m.array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype)
+_slow46 = m._UnionLoader.load.__get__(m.union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype)
+_slow47 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_CommandInputRecordFieldLoader)
+_slow48 = m._ArrayLoader.load.__get__(m.array_of_CommandInputRecordFieldLoader)
+_resolve49 = m.typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2.resolve
+_slow50 = m._UnionLoader.load.__get__(m.union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype)
+_slow51 = m._ArrayLoader.load.__get__(m.array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype)
+_slow52 = m._UnionLoader.load.__get__(m.union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype)
+_slow53 = m._UnionLoader.load.__get__(m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_strtype)
+_slow54 = m._ArrayLoader.load.__get__(m.array_of_union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader)
+_slow55 = m._UnionLoader.load.__get__(m.union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader)
+_slow56 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_strtype)
+_symbols57 = frozenset(['draft-2', 'draft-3', 'draft-3.dev1', 'draft-3.dev2', 'draft-3.dev3', 'draft-3.dev4', 'draft-3.dev5', 'draft-4.dev1', 'draft-4.dev2', 'draft-4.dev3', 'v1.0', 'v1.0.dev4'])
+_slow58 = m._UnionLoader.load.__get__(m.union_of_None_type_or_CWLVersionLoader)
+_slow59 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_Any_type)
+_slow60 = m._ArrayLoader.load.__get__(m.array_of_Any_type)
+_slow61 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader)
+_slow62 = m._ArrayLoader.load.__get__(m.array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader)
+_slow63 = m._UnionLoader.load.__get__(m.union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader)
+_slow64 = m._ArrayLoader.load.__get__(m.array_of_OutputParameterLoader)
+_slow65 = m._ArrayLoader.load.__get__(m.array_of_InputParameterLoader)
+_slow66 = m._UnionLoader.load.__get__(m.union_of_None_type_or_strtype_or_ExpressionLoader)
+_resolve67 = m.typedsl_union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2.resolve
+_slow68 = m._UnionLoader.load.__get__(m.union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype)
+_slow69 = m._UnionLoader.load.__get__(m.union_of_None_type_or_Any_type)
+_slow70 = m._UnionLoader.load.__get__(m.union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader)
+_slow71 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_OutputRecordFieldLoader)
+_slow72 = m._ArrayLoader.load.__get__(m.array_of_OutputRecordFieldLoader)
+_slow73 = m._UnionLoader.load.__get__(m.union_of_None_type_or_CommandOutputBindingLoader)
+_resolve74 = m.typedsl_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2.resolve
+_slow75 = m._UnionLoader.load.__get__(m.union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype)
+_slow76 = m._ArrayLoader.load.__get__(m.array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype)
+_slow77 = m._UnionLoader.load.__get__(m.union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype)
+_slow78 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_InputRecordFieldLoader)
+_slow79 = m._ArrayLoader.load.__get__(m.array_of_InputRecordFieldLoader)
+_slow80 = m._UnionLoader.load.__get__(m.union_of_None_type_or_CommandLineBindingLoader)
+_resolve81 = m.typedsl_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2.resolve
+_slow82 = m._UnionLoader.load.__get__(m.union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype)
+_slow83 = m._ArrayLoader.load.__get__(m.array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype)
+_slow84 = m._UnionLoader.load.__get__(m.union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype)
+_slow85 = m._UnionLoader.load.__get__(m.union_of_None_type_or_strtype_or_array_of_strtype)
+_type86 = bool
+_slow87 = m._UnionLoader.load.__get__(m.union_of_None_type_or_booltype)
+_slow88 = m._UnionLoader.load.__get__(m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader)
+_slow89 = m._ArrayLoader.load.__get__(m.array_of_union_of_strtype_or_ExpressionLoader)
+_slow90 = m._UnionLoader.load.__get__(m.union_of_strtype_or_ExpressionLoader)
+_symbols91 = frozenset(['Directory'])
+_slow92 = m._EnumLoader.load.__get__(m.Directory_classLoader)
+_slow93 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader)
+_slow94 = m._ArrayLoader.load.__get__(m.array_of_union_of_FileLoader_or_DirectoryLoader)
+_slow95 = m._UnionLoader.load.__get__(m.union_of_FileLoader_or_DirectoryLoader)
+_slow96 = m._UnionLoader.load.__get__(m.union_of_None_type_or_inttype)
+_symbols97 = frozenset(['File'])
+_slow98 = m._EnumLoader.load.__get__(m.File_classLoader)
+_resolve99 = m.typedsl_Array_symbolLoader_2.resolve
+_symbols100 = frozenset(['array'])
+_slow101 = m._EnumLoader.load.__get__(m.Array_symbolLoader)
+_symbols102 = frozenset(['boolean', 'double', 'float', 'int', 'long', 'null', 'string'])
+_resolve103 = m.typedsl_Enum_symbolLoader_2.resolve
+_symbols104 = frozenset(['enum'])
+_slow105 = m._EnumLoader.load.__get__(m.Enum_symbolLoader)
+_slow106 = m._ArrayLoader.load.__get__(m.array_of_strtype)
+_resolve107 = m.typedsl_Record_symbolLoader_2.resolve
+_symbols108 = frozenset(['record'])
+_slow109 = m._EnumLoader.load.__get__(m.Record_symbolLoader)
+_slow110 = m._UnionLoader.load.__get__(m.union_of_None_type_or_array_of_RecordFieldLoader)
+_slow111 = m._ArrayLoader.load.__get__(m.array_of_RecordFieldLoader)
+_resolve112 = m.typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2.resolve
+_slow113 = m._UnionLoader.load.__get__(m.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype)
+_slow114 = m._ArrayLoader.load.__get__(m.array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype)
+_slow115 = m._UnionLoader.load.__get__(m.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype)
+_slow116 = m._UnionLoader.load.__get__(m.union_of_None_type_or_strtype)
+_slow117 = m._RecordLoader.load.__get__(m.StepInputExpressionRequirementLoader)
+_attrs118 = m.StepInputExpressionRequirement.attrs
+_StepInputExpressionRequirement119 = m.StepInputExpressionRequirement
+_slow120 = m._RecordLoader.load.__get__(m.MultipleInputFeatureRequirementLoader)
+_attrs121 = m.MultipleInputFeatureRequirement.attrs
+_MultipleInputFeatureRequirement122 = m.MultipleInputFeatureRequirement
+_slow123 = m._RecordLoader.load.__get__(m.ScatterFeatureRequirementLoader)
+_attrs124 = m.ScatterFeatureRequirement.attrs
+_ScatterFeatureRequirement125 = m.ScatterFeatureRequirement
+_slow126 = m._RecordLoader.load.__get__(m.SubworkflowFeatureRequirementLoader)
+_attrs127 = m.SubworkflowFeatureRequirement.attrs
+_SubworkflowFeatureRequirement128 = m.SubworkflowFeatureRequirement
+_slow129 = m._RecordLoader.load.__get__(m.WorkflowLoader)
+_attrs130 = m.Workflow.attrs
+_Workflow131 = m.Workflow
+_loader132 = m.uri_union_of_None_type_or_strtype_True_False_None
+_loader133 = m.idmap_inputs_array_of_InputParameterLoader
+_loader134 = m.idmap_outputs_array_of_WorkflowOutputParameterLoader
+_loader135 = m.idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader
+_loader136 = m.idmap_hints_union_of_None_type_or_array_of_Any_type
+_loader137 = m.union_of_None_type_or_strtype
+_loader138 = m.uri_union_of_None_type_or_CWLVersionLoader_False_True_None
+_loader139 = m.idmap_steps_union_of_array_of_WorkflowStepLoader
+_slow140 = m._RecordLoader.load.__get__(m.WorkflowStepLoader)
+_attrs141 = m.WorkflowStep.attrs
+_WorkflowStep142 = m.WorkflowStep
+_loader143 = m.uri_strtype_True_False_None
+_loader144 = m.idmap_in__array_of_WorkflowStepInputLoader
+_loader145 = m.uri_union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader_True_False_None
+_loader146 = m.uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None
+_loader147 = m.uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0
+_loader148 = m.uri_union_of_None_type_or_ScatterMethodLoader_False_True_None
+_slow149 = m._EnumLoader.load.__get__(m.ScatterMethodLoader)
+_slow150 = m._RecordLoader.load.__get__(m.WorkflowStepOutputLoader)
+_attrs151 = m.WorkflowStepOutput.attrs
+_WorkflowStepOutput152 = m.WorkflowStepOutput
+_slow153 = m._RecordLoader.load.__get__(m.WorkflowStepInputLoader)
+_attrs154 = m.WorkflowStepInput.attrs
+_WorkflowStepInput155 = m.WorkflowStepInput
+_loader156 = m.uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_2
+_loader157 = m.union_of_None_type_or_LinkMergeMethodLoader
+_loader158 = m.union_of_None_type_or_Any_type
+_loader159 = m.union_of_None_type_or_strtype_or_ExpressionLoader
+_slow160 = m._RecordLoader.load.__get__(m.SinkLoader)
+_slow161 = m._RecordLoader.load.__get__(m.WorkflowOutputParameterLoader)
+_attrs162 = m.WorkflowOutputParameter.attrs
+_WorkflowOutputParameter163 = m.WorkflowOutputParameter
+_loader164 = m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader
+_loader165 = m.union_of_None_type_or_booltype
+_loader166 = m.union_of_None_type_or_strtype_or_array_of_strtype
+_loader167 = m.union_of_None_type_or_CommandOutputBindingLoader
+_loader168 = m.uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None
+_loader169 = m.typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2
+_slow170 = m._EnumLoader.load.__get__(m.LinkMergeMethodLoader)
+_slow171 = m._RecordLoader.load.__get__(m.ExpressionToolLoader)
+_attrs172 = m.ExpressionTool.attrs
+_ExpressionTool173 = m.ExpressionTool
+_loader174 = m.idmap_outputs_array_of_ExpressionToolOutputParameterLoader
+_loader175 = m.union_of_strtype_or_ExpressionLoader
+_slow176 = m._RecordLoader.load.__get__(m.ExpressionToolOutputParameterLoader)
+_attrs177 = m.ExpressionToolOutputParameter.attrs
+_ExpressionToolOutputParameter178 = m.ExpressionToolOutputParameter
+_slow179 = m._RecordLoader.load.__get__(m.ResourceRequirementLoader)
+_attrs180 = m.ResourceRequirement.attrs
+_ResourceRequirement181 = m.ResourceRequirement
+_loader182 = m.union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader
+_slow183 = m._RecordLoader.load.__get__(m.ShellCommandRequirementLoader)
+_attrs184 = m.ShellCommandRequirement.attrs
+_ShellCommandRequirement185 = m.ShellCommandRequirement
+_slow186 = m._RecordLoader.load.__get__(m.EnvVarRequirementLoader)
+_attrs187 = m.EnvVarRequirement.attrs
+_EnvVarRequirement188 = m.EnvVarRequirement
+_loader189 = m.idmap_envDef_array_of_EnvironmentDefLoader
+_slow190 = m._RecordLoader.load.__get__(m.InitialWorkDirRequirementLoader)
+_attrs191 = m.InitialWorkDirRequirement.attrs
+_InitialWorkDirRequirement192 = m.InitialWorkDirRequirement
+_loader193 = m.union_of_array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader_or_strtype_or_ExpressionLoader
+_slow194 = m._RecordLoader.load.__get__(m.DirentLoader)
+_attrs195 = m.Dirent.attrs
+_Dirent196 = m.Dirent
+_slow197 = m._RecordLoader.load.__get__(m.SoftwarePackageLoader)
+_attrs198 = m.SoftwarePackage.attrs
+_SoftwarePackage199 = m.SoftwarePackage
+_loader200 = m.strtype
+_loader201 = m.union_of_None_type_or_array_of_strtype
+_slow202 = m._RecordLoader.load.__get__(m.SoftwareRequirementLoader)
+_attrs203 = m.SoftwareRequirement.attrs
+_SoftwareRequirement204 = m.SoftwareRequirement
+_loader205 = m.idmap_packages_array_of_SoftwarePackageLoader
+_slow206 = m._RecordLoader.load.__get__(m.DockerRequirementLoader)
+_attrs207 = m.DockerRequirement.attrs
+_DockerRequirement208 = m.DockerRequirement
+_slow209 = m._RecordLoader.load.__get__(m.CommandLineToolLoader)
+_attrs210 = m.CommandLineTool.attrs
+_CommandLineTool211 = m.CommandLineTool
+_loader212 = m.idmap_inputs_array_of_CommandInputParameterLoader
+_loader213 = m.idmap_outputs_array_of_CommandOutputParameterLoader
+_loader214 = m.union_of_None_type_or_array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader
+_loader215 = m.union_of_None_type_or_array_of_inttype
+_slow216 = m._EnumLoader.load.__get__(m.stderrLoader)
+_slow217 = m._EnumLoader.load.__get__(m.stdoutLoader)
+_slow218 = m._RecordLoader.load.__get__(m.CommandOutputParameterLoader)
+_attrs219 = m.CommandOutputParameter.attrs
+_CommandOutputParameter220 = m.CommandOutputParameter
+_loader221 = m.typedsl_union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2
+_slow222 = m._RecordLoader.load.__get__(m.CommandInputParameterLoader)
+_attrs223 = m.CommandInputParameter.attrs
+_CommandInputParameter224 = m.CommandInputParameter
+_loader225 = m.uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None
+_loader226 = m.union_of_None_type_or_CommandLineBindingLoader
+_loader227 = m.typedsl_union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2
+_slow228 = m._RecordLoader.load.__get__(m.CommandOutputArraySchemaLoader)
+_attrs229 = m.CommandOutputArraySchema.attrs
+_CommandOutputArraySchema230 = m.CommandOutputArraySchema
+_loader231 = m.uri_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_False_True_2
+_loader232 = m.typedsl_Array_symbolLoader_2
+_slow233 = m._RecordLoader.load.__get__(m.CommandOutputEnumSchemaLoader)
+_attrs234 = m.CommandOutputEnumSchema.attrs
+_CommandOutputEnumSchema235 = m.CommandOutputEnumSchema
+_loader236 = m.uri_array_of_strtype_True_False_None
+_loader237 = m.typedsl_Enum_symbolLoader_2
+_slow238 = m._RecordLoader.load.__get__(m.CommandOutputRecordSchemaLoader)
+_attrs239 = m.CommandOutputRecordSchema.attrs
+_CommandOutputRecordSchema240 = m.CommandOutputRecordSchema
+_loader241 = m.idmap_fields_union_of_None_type_or_array_of_CommandOutputRecordFieldLoader
+_loader242 = m.typedsl_Record_symbolLoader_2
+_slow243 = m._RecordLoader.load.__get__(m.CommandOutputRecordFieldLoader)
+_attrs244 = m.CommandOutputRecordField.attrs
+_CommandOutputRecordField245 = m.CommandOutputRecordField
+_loader246 = m.typedsl_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2
+_slow247 = m._RecordLoader.load.__get__(m.CommandInputArraySchemaLoader)
+_attrs248 = m.CommandInputArraySchema.attrs
+_CommandInputArraySchema249 = m.CommandInputArraySchema
+_loader250 = m.uri_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_False_True_2
+_slow251 = m._RecordLoader.load.__get__(m.CommandInputEnumSchemaLoader)
+_attrs252 = m.CommandInputEnumSchema.attrs
+_CommandInputEnumSchema253 = m.CommandInputEnumSchema
+_slow254 = m._RecordLoader.load.__get__(m.CommandInputRecordSchemaLoader)
+_attrs255 = m.CommandInputRecordSchema.attrs
+_CommandInputRecordSchema256 = m.CommandInputRecordSchema
+_loader257 = m.idmap_fields_union_of_None_type_or_array_of_CommandInputRecordFieldLoader
+_slow258 = m._RecordLoader.load.__get__(m.CommandInputRecordFieldLoader)
+_attrs259 = m.CommandInputRecordField.attrs
+_CommandInputRecordField260 = m.CommandInputRecordField
+_loader261 = m.typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2
+_slow262 = m._RecordLoader.load.__get__(m.CommandOutputBindingLoader)
+_attrs263 = m.CommandOutputBinding.attrs
+_CommandOutputBinding264 = m.CommandOutputBinding
+_loader265 = m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_strtype
+_slow266 = m._RecordLoader.load.__get__(m.CommandLineBindingLoader)
+_attrs267 = m.CommandLineBinding.attrs
+_CommandLineBinding268 = m.CommandLineBinding
+_loader269 = m.union_of_None_type_or_inttype
+_slow270 = m._RecordLoader.load.__get__(m.EnvironmentDefLoader)
+_attrs271 = m.EnvironmentDef.attrs
+_EnvironmentDef272 = m.EnvironmentDef
+_slow273 = m._RecordLoader.load.__get__(m.SchemaDefRequirementLoader)
+_attrs274 = m.SchemaDefRequirement.attrs
+_SchemaDefRequirement275 = m.SchemaDefRequirement
+_loader276 = m.array_of_union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader
+_slow277 = m._RecordLoader.load.__get__(m.InlineJavascriptRequirementLoader)
+_attrs278 = m.InlineJavascriptRequirement.attrs
+_InlineJavascriptRequirement279 = m.InlineJavascriptRequirement
+_slow280 = m._RecordLoader.load.__get__(m.ProcessLoader)
+_slow281 = m._RecordLoader.load.__get__(m.ProcessRequirementLoader)
+_slow282 = m._RecordLoader.load.__get__(m.OutputParameterLoader)
+_attrs283 = m.OutputParameter.attrs
+_OutputParameter284 = m.OutputParameter
+_slow285 = m._RecordLoader.load.__get__(m.InputParameterLoader)
+_attrs286 = m.InputParameter.attrs
+_InputParameter287 = m.InputParameter
+_loader288 = m.typedsl_union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2
+_slow289 = m._RecordLoader.load.__get__(m.OutputArraySchemaLoader)
+_attrs290 = m.OutputArraySchema.attrs
+_OutputArraySchema291 = m.OutputArraySchema
+_loader292 = m.uri_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_False_True_2
+_slow293 = m._RecordLoader.load.__get__(m.OutputEnumSchemaLoader)
+_attrs294 = m.OutputEnumSchema.attrs
+_OutputEnumSchema295 = m.OutputEnumSchema
+_slow296 = m._RecordLoader.load.__get__(m.OutputRecordSchemaLoader)
+_attrs297 = m.OutputRecordSchema.attrs
+_OutputRecordSchema298 = m.OutputRecordSchema
+_loader299 = m.idmap_fields_union_of_None_type_or_array_of_OutputRecordFieldLoader
+_slow300 = m._RecordLoader.load.__get__(m.OutputRecordFieldLoader)
+_attrs301 = m.OutputRecordField.attrs
+_OutputRecordField302 = m.OutputRecordField
+_loader303 = m.typedsl_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2
+_slow304 = m._RecordLoader.load.__get__(m.InputArraySchemaLoader)
+_attrs305 = m.InputArraySchema.attrs
+_InputArraySchema306 = m.InputArraySchema
+_loader307 = m.uri_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_False_True_2
+_slow308 = m._RecordLoader.load.__get__(m.InputEnumSchemaLoader)
+_attrs309 = m.InputEnumSchema.attrs
+_InputEnumSchema310 = m.InputEnumSchema
+_slow311 = m._RecordLoader.load.__get__(m.InputRecordSchemaLoader)
+_attrs312 = m.InputRecordSchema.attrs
+_InputRecordSchema313 = m.InputRecordSchema
+_loader314 = m.idmap_fields_union_of_None_type_or_array_of_InputRecordFieldLoader
+_slow315 = m._RecordLoader.load.__get__(m.InputRecordFieldLoader)
+_attrs316 = m.InputRecordField.attrs
+_InputRecordField317 = m.InputRecordField
+_loader318 = m.typedsl_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2
+_slow319 = m._RecordLoader.load.__get__(m.OutputSchemaLoader)
+_slow320 = m._RecordLoader.load.__get__(m.InputSchemaLoader)
+_slow321 = m._RecordLoader.load.__get__(m.OutputBindingLoader)
+_slow322 = m._RecordLoader.load.__get__(m.InputBindingLoader)
+_slow323 = m._EnumLoader.load.__get__(m.ExpressionLoader)
+_slow324 = m._RecordLoader.load.__get__(m.ParameterLoader)
+_slow325 = m._RecordLoader.load.__get__(m.SchemaBaseLoader)
+_slow326 = m._RecordLoader.load.__get__(m.DirectoryLoader)
+_attrs327 = m.Directory.attrs
+_Directory328 = m.Directory
+_loader329 = m.uri_union_of_None_type_or_strtype_False_False_None
+_loader330 = m.union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader
+_slow331 = m._RecordLoader.load.__get__(m.FileLoader)
+_attrs332 = m.File.attrs
+_File333 = m.File
+_slow334 = m._EnumLoader.load.__get__(m.CWLTypeLoader)
+_slow335 = m._EnumLoader.load.__get__(m.CWLVersionLoader)
+_slow336 = m._RecordLoader.load.__get__(m.ArraySchemaLoader)
+_attrs337 = m.ArraySchema.attrs
+_ArraySchema338 = m.ArraySchema
+_loader339 = m.uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2
+_slow340 = m._RecordLoader.load.__get__(m.EnumSchemaLoader)
+_attrs341 = m.EnumSchema.attrs
+_EnumSchema342 = m.EnumSchema
+_slow343 = m._RecordLoader.load.__get__(m.RecordSchemaLoader)
+_attrs344 = m.RecordSchema.attrs
+_RecordSchema345 = m.RecordSchema
+_loader346 = m.idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader
+_slow347 = m._RecordLoader.load.__get__(m.RecordFieldLoader)
+_attrs348 = m.RecordField.attrs
+_RecordField349 = m.RecordField
+_loader350 = m.typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2
+_symbols351 = frozenset(['Any'])
+_slow352 = m._EnumLoader.load.__get__(m.AnyLoader)
+_slow353 = m._EnumLoader.load.__get__(m.PrimitiveTypeLoader)
+_slow354 = m._PrimitiveLoader.load.__get__(m.None_type)
+_type355 = float
+_slow356 = m._PrimitiveLoader.load.__get__(m.floattype)
+_slow357 = m._AnyLoader.load.__get__(m.Any_type)
+_slow358 = m._PrimitiveLoader.load.__get__(m.strtype)
+_slow359 = m._PrimitiveLoader.load.__get__(m.booltype)
+_slow360 = m._PrimitiveLoader.load.__get__(m.inttype)
+_trusted361 = _TrustedLoader(m.inttype)
+_trusted362 = _TrustedLoader(m.booltype)
+_trusted363 = _TrustedLoader(m.strtype)
+_trusted364 = _TrustedLoader(m.Any_type)
+_trusted365 = _TrustedLoader(m.floattype)
+_trusted366 = _TrustedLoader(m.None_type)
+_trusted367 = _TrustedLoader(m.PrimitiveTypeLoader)
+_trusted368 = _TrustedLoader(m.AnyLoader)
+_trusted369 = _TrustedLoader(m.RecordFieldLoader)
+_trusted370 = _TrustedLoader(m.RecordSchemaLoader)
+_trusted371 = _TrustedLoader(m.EnumSchemaLoader)
+_trusted372 = _TrustedLoader(m.ArraySchemaLoader)
+_trusted373 = _TrustedLoader(m.CWLVersionLoader)
+_trusted374 = _TrustedLoader(m.CWLTypeLoader)
+_trusted375 = _TrustedLoader(m.FileLoader)
+_trusted376 = _TrustedLoader(m.DirectoryLoader)
+_trusted377 = _TrustedLoader(m.SchemaBaseLoader)
+_trusted378 = _TrustedLoader(m.ParameterLoader)
+_trusted379 = _TrustedLoader(m.ExpressionLoader)
+_trusted380 = _TrustedLoader(m.InputBindingLoader)
+_trusted381 = _TrustedLoader(m.OutputBindingLoader)
+_trusted382 = _TrustedLoader(m.InputSchemaLoader)
+_trusted383 = _TrustedLoader(m.OutputSchemaLoader)
+_trusted384 = _TrustedLoader(m.InputRecordFieldLoader)
+_trusted385 = _TrustedLoader(m.InputRecordSchemaLoader)
+_trusted386 = _TrustedLoader(m.InputEnumSchemaLoader)
+_trusted387 = _TrustedLoader(m.InputArraySchemaLoader)
+_trusted388 = _TrustedLoader(m.OutputRecordFieldLoader)
+_trusted389 = _TrustedLoader(m.OutputRecordSchemaLoader)
+_trusted390 = _TrustedLoader(m.OutputEnumSchemaLoader)
+_trusted391 = _TrustedLoader(m.OutputArraySchemaLoader)
+_trusted392 = _TrustedLoader(m.InputParameterLoader)
+_trusted393 = _TrustedLoader(m.OutputParameterLoader)
+_trusted394 = _TrustedLoader(m.ProcessRequirementLoader)
+_trusted395 = _TrustedLoader(m.ProcessLoader)
+_trusted396 = _TrustedLoader(m.InlineJavascriptRequirementLoader)
+_trusted397 = _TrustedLoader(m.SchemaDefRequirementLoader)
+_trusted398 = _TrustedLoader(m.EnvironmentDefLoader)
+_trusted399 = _TrustedLoader(m.CommandLineBindingLoader)
+_trusted400 = _TrustedLoader(m.CommandOutputBindingLoader)
+_trusted401 = _TrustedLoader(m.CommandInputRecordFieldLoader)
+_trusted402 = _TrustedLoader(m.CommandInputRecordSchemaLoader)
+_trusted403 = _TrustedLoader(m.CommandInputEnumSchemaLoader)
+_trusted404 = _TrustedLoader(m.CommandInputArraySchemaLoader)
+_trusted405 = _TrustedLoader(m.CommandOutputRecordFieldLoader)
+_trusted406 = _TrustedLoader(m.CommandOutputRecordSchemaLoader)
+_trusted407 = _TrustedLoader(m.CommandOutputEnumSchemaLoader)
+_trusted408 = _TrustedLoader(m.CommandOutputArraySchemaLoader)
+_trusted409 = _TrustedLoader(m.CommandInputParameterLoader)
+_trusted410 = _TrustedLoader(m.CommandOutputParameterLoader)
+_trusted411 = _TrustedLoader(m.stdoutLoader)
+_trusted412 = _TrustedLoader(m.stderrLoader)
+_trusted413 = _TrustedLoader(m.CommandLineToolLoader)
+_trusted414 = _TrustedLoader(m.DockerRequirementLoader)
+_trusted415 = _TrustedLoader(m.SoftwareRequirementLoader)
+_trusted416 = _TrustedLoader(m.SoftwarePackageLoader)
+_trusted417 = _TrustedLoader(m.DirentLoader)
+_trusted418 = _TrustedLoader(m.InitialWorkDirRequirementLoader)
+_trusted419 = _TrustedLoader(m.EnvVarRequirementLoader)
+_trusted420 = _TrustedLoader(m.ShellCommandRequirementLoader)
+_trusted421 = _TrustedLoader(m.ResourceRequirementLoader)
+_trusted422 = _TrustedLoader(m.ExpressionToolOutputParameterLoader)
+_trusted423 = _TrustedLoader(m.ExpressionToolLoader)
+_trusted424 = _TrustedLoader(m.LinkMergeMethodLoader)
+_trusted425 = _TrustedLoader(m.WorkflowOutputParameterLoader)
+_trusted426 = _TrustedLoader(m.SinkLoader)
+_trusted427 = _TrustedLoader(m.WorkflowStepInputLoader)
+_trusted428 = _TrustedLoader(m.WorkflowStepOutputLoader)
+_trusted429 = _TrustedLoader(m.ScatterMethodLoader)
+_trusted430 = _TrustedLoader(m.WorkflowStepLoader)
+_trusted431 = _TrustedLoader(m.WorkflowLoader)
+_trusted432 = _TrustedLoader(m.SubworkflowFeatureRequirementLoader)
+_trusted433 = _TrustedLoader(m.ScatterFeatureRequirementLoader)
+_trusted434 = _TrustedLoader(m.MultipleInputFeatureRequirementLoader)
+_trusted435 = _TrustedLoader(m.StepInputExpressionRequirementLoader)
+_trusted436 = _TrustedLoader(m.uri_strtype_True_False_None)
+_trusted437 = _TrustedLoader(m.union_of_None_type_or_strtype)
+_trusted438 = _TrustedLoader(m.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype)
+_trusted439 = _TrustedLoader(m.array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype)
+_trusted440 = _TrustedLoader(m.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype)
+_trusted441 = _TrustedLoader(m.typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2)
+_trusted442 = _TrustedLoader(m.array_of_RecordFieldLoader)
+_trusted443 = _TrustedLoader(m.union_of_None_type_or_array_of_RecordFieldLoader)
+_trusted444 = _TrustedLoader(m.idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader)
+_trusted445 = _TrustedLoader(m.Record_symbolLoader)
+_trusted446 = _TrustedLoader(m.typedsl_Record_symbolLoader_2)
+_trusted447 = _TrustedLoader(m.array_of_strtype)
+_trusted448 = _TrustedLoader(m.uri_array_of_strtype_True_False_None)
+_trusted449 = _TrustedLoader(m.Enum_symbolLoader)
+_trusted450 = _TrustedLoader(m.typedsl_Enum_symbolLoader_2)
+_trusted451 = _TrustedLoader(m.uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2)
+_trusted452 = _TrustedLoader(m.Array_symbolLoader)
+_trusted453 = _TrustedLoader(m.typedsl_Array_symbolLoader_2)
+_trusted454 = _TrustedLoader(m.File_classLoader)
+_trusted455 = _TrustedLoader(m.uri_File_classLoader_False_True_None)
+_trusted456 = _TrustedLoader(m.uri_union_of_None_type_or_strtype_False_False_None)
+_trusted457 = _TrustedLoader(m.union_of_None_type_or_inttype)
+_trusted458 = _TrustedLoader(m.union_of_FileLoader_or_DirectoryLoader)
+_trusted459 = _TrustedLoader(m.array_of_union_of_FileLoader_or_DirectoryLoader)
+_trusted460 = _TrustedLoader(m.union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader)
+_trusted461 = _TrustedLoader(m.uri_union_of_None_type_or_strtype_True_False_None)
+_trusted462 = _TrustedLoader(m.Directory_classLoader)
+_trusted463 = _TrustedLoader(m.uri_Directory_classLoader_False_True_None)
+_trusted464 = _TrustedLoader(m.union_of_strtype_or_ExpressionLoader)
+_trusted465 = _TrustedLoader(m.array_of_union_of_strtype_or_ExpressionLoader)
+_trusted466 = _TrustedLoader(m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader)
+_trusted467 = _TrustedLoader(m.union_of_None_type_or_booltype)
+_trusted468 = _TrustedLoader(m.union_of_None_type_or_strtype_or_array_of_strtype)
+_trusted469 = _TrustedLoader(m.union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype)
+_trusted470 = _TrustedLoader(m.array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype)
+_trusted471 = _TrustedLoader(m.union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype)
+_trusted472 = _TrustedLoader(m.typedsl_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2)
+_trusted473 = _TrustedLoader(m.union_of_None_type_or_CommandLineBindingLoader)
+_trusted474 = _TrustedLoader(m.array_of_InputRecordFieldLoader)
+_trusted475 = _TrustedLoader(m.union_of_None_type_or_array_of_InputRecordFieldLoader)
+_trusted476 = _TrustedLoader(m.idmap_fields_union_of_None_type_or_array_of_InputRecordFieldLoader)
+_trusted477 = _TrustedLoader(m.uri_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_False_True_2)
+_trusted478 = _TrustedLoader(m.union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype)
+_trusted479 = _TrustedLoader(m.array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype)
+_trusted480 = _TrustedLoader(m.union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype)
+_trusted481 = _TrustedLoader(m.typedsl_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2)
+_trusted482 = _TrustedLoader(m.union_of_None_type_or_CommandOutputBindingLoader)
+_trusted483 = _TrustedLoader(m.array_of_OutputRecordFieldLoader)
+_trusted484 = _TrustedLoader(m.union_of_None_type_or_array_of_OutputRecordFieldLoader)
+_trusted485 = _TrustedLoader(m.idmap_fields_union_of_None_type_or_array_of_OutputRecordFieldLoader)
+_trusted486 = _TrustedLoader(m.uri_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_False_True_2)
+_trusted487 = _TrustedLoader(m.union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader)
+_trusted488 = _TrustedLoader(m.uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None)
+_trusted489 = _TrustedLoader(m.union_of_None_type_or_Any_type)
+_trusted490 = _TrustedLoader(m.union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype)
+_trusted491 = _TrustedLoader(m.typedsl_union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2)
+_trusted492 = _TrustedLoader(m.union_of_None_type_or_strtype_or_ExpressionLoader)
+_trusted493 = _TrustedLoader(m.uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None)
+_trusted494 = _TrustedLoader(m.array_of_InputParameterLoader)
+_trusted495 = _TrustedLoader(m.idmap_inputs_array_of_InputParameterLoader)
+_trusted496 = _TrustedLoader(m.array_of_OutputParameterLoader)
+_trusted497 = _TrustedLoader(m.idmap_outputs_array_of_OutputParameterLoader)
+_trusted498 = _TrustedLoader(m.union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader)
+_trusted499 = _TrustedLoader(m.array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader)
+_trusted500 = _TrustedLoader(m.union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader)
+_trusted501 = _TrustedLoader(m.idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader)
+_trusted502 = _TrustedLoader(m.array_of_Any_type)
+_trusted503 = _TrustedLoader(m.union_of_None_type_or_array_of_Any_type)
+_trusted504 = _TrustedLoader(m.idmap_hints_union_of_None_type_or_array_of_Any_type)
+_trusted505 = _TrustedLoader(m.union_of_None_type_or_CWLVersionLoader)
+_trusted506 = _TrustedLoader(m.uri_union_of_None_type_or_CWLVersionLoader_False_True_None)
+_trusted507 = _TrustedLoader(m.uri_strtype_False_True_None)
+_trusted508 = _TrustedLoader(m.union_of_None_type_or_array_of_strtype)
+_trusted509 = _TrustedLoader(m.union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader)
+_trusted510 = _TrustedLoader(m.array_of_union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader)
+_trusted511 = _TrustedLoader(m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_strtype)
+_trusted512 = _TrustedLoader(m.union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype)
+_trusted513 = _TrustedLoader(m.array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype)
+_trusted514 = _TrustedLoader(m.union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype)
+_trusted515 = _TrustedLoader(m.typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2)
+_trusted516 = _TrustedLoader(m.array_of_CommandInputRecordFieldLoader)
+_trusted517 = _TrustedLoader(m.union_of_None_type_or_array_of_CommandInputRecordFieldLoader)
+_trusted518 = _TrustedLoader(m.idmap_fields_union_of_None_type_or_array_of_CommandInputRecordFieldLoader)
+_trusted519 = _TrustedLoader(m.uri_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_False_True_2)
+_trusted520 = _TrustedLoader(m.union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype)
+_trusted521 = _TrustedLoader(m.array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype)
+_trusted522 = _TrustedLoader(m.union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype)
+_trusted523 = _TrustedLoader(m.typedsl_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2)
+_trusted524 = _TrustedLoader(m.array_of_CommandOutputRecordFieldLoader)
+_trusted525 = _TrustedLoader(m.union_of_None_type_or_array_of_CommandOutputRecordFieldLoader)
+_trusted526 = _TrustedLoader(m.idmap_fields_union_of_None_type_or_array_of_CommandOutputRecordFieldLoader)
+_trusted527 = _TrustedLoader(m.uri_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_False_True_2)
+_trusted528 = _TrustedLoader(m.union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype)
+_trusted529 = _TrustedLoader(m.typedsl_union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2)
+_trusted530 = _TrustedLoader(m.union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype)
+_trusted531 = _TrustedLoader(m.typedsl_union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2)
+_trusted532 = _TrustedLoader(m.array_of_CommandInputParameterLoader)
+_trusted533 = _TrustedLoader(m.idmap_inputs_array_of_CommandInputParameterLoader)
+_trusted534 = _TrustedLoader(m.array_of_CommandOutputParameterLoader)
+_trusted535 = _TrustedLoader(m.idmap_outputs_array_of_CommandOutputParameterLoader)
+_trusted536 = _TrustedLoader(m.union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader)
+_trusted537 = _TrustedLoader(m.array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader)
+_trusted538 = _TrustedLoader(m.union_of_None_type_or_array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader)
+_trusted539 = _TrustedLoader(m.array_of_inttype)
+_trusted540 = _TrustedLoader(m.union_of_None_type_or_array_of_inttype)
+_trusted541 = _TrustedLoader(m.array_of_SoftwarePackageLoader)
+_trusted542 = _TrustedLoader(m.idmap_packages_array_of_SoftwarePackageLoader)
+_trusted543 = _TrustedLoader(m.union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader)
+_trusted544 = _TrustedLoader(m.array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader)
+_trusted545 = _TrustedLoader(m.union_of_array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader_or_strtype_or_ExpressionLoader)
+_trusted546 = _TrustedLoader(m.array_of_EnvironmentDefLoader)
+_trusted547 = _TrustedLoader(m.idmap_envDef_array_of_EnvironmentDefLoader)
+_trusted548 = _TrustedLoader(m.union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader)
+_trusted549 = _TrustedLoader(m.union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype)
+_trusted550 = _TrustedLoader(m.typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2)
+_trusted551 = _TrustedLoader(m.array_of_ExpressionToolOutputParameterLoader)
+_trusted552 = _TrustedLoader(m.idmap_outputs_array_of_ExpressionToolOutputParameterLoader)
+_trusted553 = _TrustedLoader(m.uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0)
+_trusted554 = _TrustedLoader(m.union_of_None_type_or_LinkMergeMethodLoader)
+_trusted555 = _TrustedLoader(m.uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_2)
+_trusted556 = _TrustedLoader(m.array_of_WorkflowStepInputLoader)
+_trusted557 = _TrustedLoader(m.idmap_in__array_of_WorkflowStepInputLoader)
+_trusted558 = _TrustedLoader(m.union_of_strtype_or_WorkflowStepOutputLoader)
+_trusted559 = _TrustedLoader(m.array_of_union_of_strtype_or_WorkflowStepOutputLoader)
+_trusted560 = _TrustedLoader(m.union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader)
+_trusted561 = _TrustedLoader(m.uri_union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader_True_False_None)
+_trusted562 = _TrustedLoader(m.union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
+_trusted563 = _TrustedLoader(m.uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None)
+_trusted564 = _TrustedLoader(m.union_of_None_type_or_ScatterMethodLoader)
+_trusted565 = _TrustedLoader(m.uri_union_of_None_type_or_ScatterMethodLoader_False_True_None)
+_trusted566 = _TrustedLoader(m.array_of_WorkflowOutputParameterLoader)
+_trusted567 = _TrustedLoader(m.idmap_outputs_array_of_WorkflowOutputParameterLoader)
+_trusted568 = _TrustedLoader(m.array_of_WorkflowStepLoader)
+_trusted569 = _TrustedLoader(m.union_of_array_of_WorkflowStepLoader)
+_trusted570 = _TrustedLoader(m.idmap_steps_union_of_array_of_WorkflowStepLoader)
+_trusted571 = _TrustedLoader(m.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
+_trusted572 = _TrustedLoader(m.array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
+_trusted573 = _TrustedLoader(m.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader)
+
+def _parse212(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse211(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'CommandLineTool':
+            try:
+                return _parse52(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ExpressionTool':
+            try:
+                return _parse62(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'Workflow':
+            try:
+                return _parse70(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow0(doc, baseuri, loadingOptions, docRoot)
+
+def _parse211(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow1, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse211(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow1(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse210(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow1, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse210(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'CommandLineTool':
+            try:
+                return _parse52(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ExpressionTool':
+            try:
+                return _parse62(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'Workflow':
+            try:
+                return _parse70(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow2(doc, baseuri, loadingOptions, docRoot)
+
+def _parse209(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'None': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _parse208(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse208(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse207(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow3(doc, baseuri, loadingOptions, docRoot)
+
+def _parse207(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow4, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse207(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow4(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse69(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow4, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse206(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _parse205(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse205(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow5, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse205(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow5(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse64(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow5, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse204(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if (doc is None or (isinstance(doc, str) and doc in _symbols6)):
+        return doc
+    return _parse203(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse203(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or (isinstance(doc, str) and doc in _symbols6)):
+        return doc
+    return _failed(_slow7, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse202(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, False, None)
+    return _parse201(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse201(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'CommandLineTool':
+            try:
+                return _parse52(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ExpressionTool':
+            try:
+                return _parse62(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'Workflow':
+            try:
+                return _parse70(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow9(doc, baseuri, loadingOptions, docRoot)
+
+def _parse200(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    return _parse199(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse199(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse198(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow10(doc, baseuri, loadingOptions, docRoot)
+
+def _parse198(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow11, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse198(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow11(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse197(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow11, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse197(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse67(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow12(doc, baseuri, loadingOptions, docRoot)
+
+def _parse196(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'source': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _parse195(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse195(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow13, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse195(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow13(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse66(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow13, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse194(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, False, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, False, 2)
+    return _parse107(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse193(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or (isinstance(doc, str) and doc in _symbols14)):
+        return doc
+    return _failed(_slow15, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse192(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, False, 0) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, False, 0)
+    return _parse107(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse191(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _parse190(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse190(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow16, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse190(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow16(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse61(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow16, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse189(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve17(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve17(doc, baseuri, loadingOptions)
+    return _parse188(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse188(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse118(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse28(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse29(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse30(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow19(doc, baseuri, loadingOptions, docRoot)
+
+def _parse187(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or isinstance(doc, _type20) or isinstance(doc, _type8) or (isinstance(doc, str) and doc in _symbols21)):
+        return doc
+    return _failed(_slow22, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse186(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'envValue': val}
+            v['envName'] = k
+            r.append(v)
+        doc = r
+    return _parse185(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse185(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow23, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse185(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow23(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse37(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow23, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse184(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse183(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow24(doc, baseuri, loadingOptions, docRoot)
+
+def _parse183(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow25, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse183(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow25(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse182(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow25, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse182(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'Directory':
+            try:
+                return _parse15(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            try:
+                return _parse56(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'File':
+            try:
+                return _parse14(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            try:
+                return _parse56(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            try:
+                return _parse56(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow26(doc, baseuri, loadingOptions, docRoot)
+
+def _parse181(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'specs': val}
+            v['package'] = k
+            r.append(v)
+        doc = r
+    return _parse180(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse180(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow27, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse180(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow27(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse55(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow27, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse179(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse178(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow28(doc, baseuri, loadingOptions, docRoot)
+
+def _parse178(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow29, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse178(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow29(doc, baseuri, loadingOptions, docRoot)
+            if isinstance(item, _type20):
+                r.append(item)
+                continue
+            lf = _parse0(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow29, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse177(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse176(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow30(doc, baseuri, loadingOptions, docRoot)
+
+def _parse176(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow31, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse176(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow31(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse175(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow31, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse175(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse38(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow32(doc, baseuri, loadingOptions, docRoot)
+
+def _parse174(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _parse173(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse173(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow33, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse173(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow33(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse49(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow33, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse172(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _parse171(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse171(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow34, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse171(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow34(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse48(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow34, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse170(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve35(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve35(doc, baseuri, loadingOptions)
+    return _parse169(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse169(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols36):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols37):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse160(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse45(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse46(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse47(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow38(doc, baseuri, loadingOptions, docRoot)
+
+def _parse168(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve39(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve39(doc, baseuri, loadingOptions)
+    return _parse167(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse167(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse152(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse41(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse42(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse43(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow40(doc, baseuri, loadingOptions, docRoot)
+
+def _parse166(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _parse161(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse165(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _parse164(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse164(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse163(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow41(doc, baseuri, loadingOptions, docRoot)
+
+def _parse163(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow42, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse163(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow42(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse44(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow42, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse162(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve43(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve43(doc, baseuri, loadingOptions)
+    return _parse161(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse161(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse160(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse45(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse46(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse47(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow44(doc, baseuri, loadingOptions, docRoot)
+
+def _parse160(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow45, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse160(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow45(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse159(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow45, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse159(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse45(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse46(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse47(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow46(doc, baseuri, loadingOptions, docRoot)
+
+def _parse158(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _parse153(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse157(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _parse156(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse156(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse155(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow47(doc, baseuri, loadingOptions, docRoot)
+
+def _parse155(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow48, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse155(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow48(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse40(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow48, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse154(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve49(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve49(doc, baseuri, loadingOptions)
+    return _parse153(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse153(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse152(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse41(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse42(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse43(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow50(doc, baseuri, loadingOptions, docRoot)
+
+def _parse152(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow51, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse152(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow51(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse151(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow51, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse151(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse41(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse42(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse43(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow52(doc, baseuri, loadingOptions, docRoot)
+
+def _parse150(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse86(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow53(doc, baseuri, loadingOptions, docRoot)
+
+def _parse149(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow54, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse149(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow54(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse148(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow54, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse148(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse24(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse25(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse26(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow55(doc, baseuri, loadingOptions, docRoot)
+
+def _parse147(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse86(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow56(doc, baseuri, loadingOptions, docRoot)
+
+def _parse146(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if isinstance(doc, _type8):
+        return doc
+    return _parse2(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse145(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if (doc is None or (isinstance(doc, str) and doc in _symbols57)):
+        return doc
+    return _parse144(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse144(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or (isinstance(doc, str) and doc in _symbols57)):
+        return doc
+    return _failed(_slow58, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse143(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'None': val}
+            v['class'] = k
+            r.append(v)
+        doc = r
+    return _parse142(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse142(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse141(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow59(doc, baseuri, loadingOptions, docRoot)
+
+def _parse141(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow60, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse141(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow60(doc, baseuri, loadingOptions, docRoot)
+            if item is not None:
+                r.append(item)
+                continue
+            lf = _parse3(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow60, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse140(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'None': val}
+            v['class'] = k
+            r.append(v)
+        doc = r
+    return _parse139(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse139(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse138(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow61(doc, baseuri, loadingOptions, docRoot)
+
+def _parse138(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow62, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse138(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow62(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse137(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow62, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse137(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'DockerRequirement':
+            try:
+                return _parse53(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'EnvVarRequirement':
+            try:
+                return _parse58(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'InitialWorkDirRequirement':
+            try:
+                return _parse57(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'InlineJavascriptRequirement':
+            try:
+                return _parse35(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'MultipleInputFeatureRequirement':
+            try:
+                return _parse73(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ResourceRequirement':
+            try:
+                return _parse60(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ScatterFeatureRequirement':
+            try:
+                return _parse72(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'SchemaDefRequirement':
+            try:
+                return _parse36(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ShellCommandRequirement':
+            try:
+                return _parse59(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'SoftwareRequirement':
+            try:
+                return _parse54(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'StepInputExpressionRequirement':
+            try:
+                return _parse74(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'SubworkflowFeatureRequirement':
+            try:
+                return _parse71(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow63(doc, baseuri, loadingOptions, docRoot)
+
+def _parse136(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _parse135(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse135(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow64, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse135(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow64(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse32(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow64, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse134(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _parse133(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse133(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow65, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse133(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow65(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse31(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow65, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse132(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    if (doc is None or isinstance(doc, _type8) or (isinstance(doc, str) and doc in _symbols21)):
+        return doc
+    return _parse131(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse131(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or isinstance(doc, _type8) or (isinstance(doc, str) and doc in _symbols21)):
+        return doc
+    return _failed(_slow66, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse130(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve67(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve67(doc, baseuri, loadingOptions)
+    return _parse129(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse129(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse109(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse24(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse25(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse26(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow68(doc, baseuri, loadingOptions, docRoot)
+
+def _parse128(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or doc is not None):
+        return doc
+    return _failed(_slow69, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse127(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    return _parse126(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse126(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse86(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow70(doc, baseuri, loadingOptions, docRoot)
+
+def _parse125(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _parse119(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse124(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _parse123(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse123(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse122(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow71(doc, baseuri, loadingOptions, docRoot)
+
+def _parse122(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow72, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse122(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow72(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse27(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow72, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse121(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse39(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow73(doc, baseuri, loadingOptions, docRoot)
+
+def _parse120(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve74(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve74(doc, baseuri, loadingOptions)
+    return _parse119(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse119(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse118(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse28(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse29(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse30(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow75(doc, baseuri, loadingOptions, docRoot)
+
+def _parse118(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow76, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse118(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow76(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse117(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow76, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse117(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse28(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse29(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse30(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow77(doc, baseuri, loadingOptions, docRoot)
+
+def _parse116(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _parse110(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse115(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _parse114(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse114(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse113(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow78(doc, baseuri, loadingOptions, docRoot)
+
+def _parse113(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow79, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse113(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow79(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse23(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow79, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse112(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse38(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow80(doc, baseuri, loadingOptions, docRoot)
+
+def _parse111(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve81(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve81(doc, baseuri, loadingOptions)
+    return _parse110(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse110(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse109(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse24(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse25(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse26(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow82(doc, baseuri, loadingOptions, docRoot)
+
+def _parse109(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow83, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse109(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow83(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse108(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow83, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse108(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse24(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse25(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse26(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow84(doc, baseuri, loadingOptions, docRoot)
+
+def _parse107(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse86(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow85(doc, baseuri, loadingOptions, docRoot)
+
+def _parse106(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or isinstance(doc, _type86)):
+        return doc
+    return _failed(_slow87, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse105(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse104(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow88(doc, baseuri, loadingOptions, docRoot)
+
+def _parse104(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow89, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse104(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow89(doc, baseuri, loadingOptions, docRoot)
+            if (isinstance(item, _type8) or (isinstance(item, str) and item in _symbols21)):
+                r.append(item)
+                continue
+            lf = _parse103(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow89, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse103(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, _type8) or (isinstance(doc, str) and doc in _symbols21)):
+        return doc
+    return _failed(_slow90, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse102(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if (isinstance(doc, str) and doc in _symbols91):
+        return doc
+    return _parse101(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse101(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols91):
+        return doc
+    return _failed(_slow92, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse100(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    if (doc is None or isinstance(doc, _type8)):
+        return doc
+    return _parse76(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse99(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse98(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow93(doc, baseuri, loadingOptions, docRoot)
+
+def _parse98(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow94, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse98(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow94(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse97(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow94, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse97(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'Directory':
+            try:
+                return _parse15(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'File':
+            try:
+                return _parse14(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow95(doc, baseuri, loadingOptions, docRoot)
+
+def _parse96(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or isinstance(doc, _type20)):
+        return doc
+    return _failed(_slow96, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse95(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, False, None)
+    if (doc is None or isinstance(doc, _type8)):
+        return doc
+    return _parse76(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse94(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if (isinstance(doc, str) and doc in _symbols97):
+        return doc
+    return _parse93(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse93(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols97):
+        return doc
+    return _failed(_slow98, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse92(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve99(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve99(doc, baseuri, loadingOptions)
+    return _parse91(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse91(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols100):
+        return doc
+    return _failed(_slow101, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse90(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _parse79(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse89(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve103(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve103(doc, baseuri, loadingOptions)
+    return _parse88(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse88(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols104):
+        return doc
+    return _failed(_slow105, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse87(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    return _parse86(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse86(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow106, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse86(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow106(doc, baseuri, loadingOptions, docRoot)
+            if isinstance(item, _type8):
+                r.append(item)
+                continue
+            lf = _parse2(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow106, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse85(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve107(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve107(doc, baseuri, loadingOptions)
+    return _parse84(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse84(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols108):
+        return doc
+    return _failed(_slow109, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse83(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _parse82(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse82(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse81(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow110(doc, baseuri, loadingOptions, docRoot)
+
+def _parse81(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow111, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse81(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow111(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse8(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow111, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse80(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve112(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve112(doc, baseuri, loadingOptions)
+    return _parse79(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse79(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols102):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        try:
+            return _parse78(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse9(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse10(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse11(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow113(doc, baseuri, loadingOptions, docRoot)
+
+def _parse78(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow114, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_parse78(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow114(doc, baseuri, loadingOptions, docRoot)
+            lf = _parse77(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow114, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _parse77(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols102):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse9(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse10(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse11(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow115(doc, baseuri, loadingOptions, docRoot)
+
+def _parse76(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (doc is None or isinstance(doc, _type8)):
+        return doc
+    return _failed(_slow116, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse75(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    if isinstance(doc, _type8):
+        return doc
+    return _parse2(doc, baseuri, loadingOptions, probe=probe)
+
+def _parse74(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse213(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow117, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse213(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'StepInputExpressionRequirement':
+        return _failed(_StepInputExpressionRequirement119, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs118.issuperset(doc):
+        for k in doc:
+            if k not in _attrs118:
+                if ':' not in k:
+                    return _failed(_StepInputExpressionRequirement119, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _StepInputExpressionRequirement119.__new__(_StepInputExpressionRequirement119)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_StepInputExpressionRequirement119, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs118:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse73(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse214(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow120, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse214(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'MultipleInputFeatureRequirement':
+        return _failed(_MultipleInputFeatureRequirement122, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs121.issuperset(doc):
+        for k in doc:
+            if k not in _attrs121:
+                if ':' not in k:
+                    return _failed(_MultipleInputFeatureRequirement122, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _MultipleInputFeatureRequirement122.__new__(_MultipleInputFeatureRequirement122)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_MultipleInputFeatureRequirement122, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs121:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse72(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse215(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow123, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse215(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'ScatterFeatureRequirement':
+        return _failed(_ScatterFeatureRequirement125, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs124.issuperset(doc):
+        for k in doc:
+            if k not in _attrs124:
+                if ':' not in k:
+                    return _failed(_ScatterFeatureRequirement125, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _ScatterFeatureRequirement125.__new__(_ScatterFeatureRequirement125)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_ScatterFeatureRequirement125, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs124:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse71(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse216(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow126, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse216(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'SubworkflowFeatureRequirement':
+        return _failed(_SubworkflowFeatureRequirement128, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs127.issuperset(doc):
+        for k in doc:
+            if k not in _attrs127:
+                if ':' not in k:
+                    return _failed(_SubworkflowFeatureRequirement128, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _SubworkflowFeatureRequirement128.__new__(_SubworkflowFeatureRequirement128)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_SubworkflowFeatureRequirement128, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs127:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse70(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse217(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow129, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse217_fresh(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'Workflow':
+        return _failed(_Workflow131, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs130.issuperset(doc):
+        for k in doc:
+            if k not in _attrs130:
+                if ':' not in k:
+                    return _failed(_Workflow131, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _Workflow131.__new__(_Workflow131)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.id = v
+                else:
+                    self.id = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                self.id = '_:' + str(uuid.uuid4())
+        base = self.id
+        v = doc.get('inputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.inputs = load_field(v, _loader133, base, loadingOptions)
+        else:
+            self.inputs = _parse134(v, base, loadingOptions, probe=True)
+        v = doc.get('outputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.outputs = load_field(v, _loader134, base, loadingOptions)
+        else:
+            self.outputs = _parse206(v, base, loadingOptions, probe=True)
+        if 'requirements' in doc:
+            v = doc['requirements']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.requirements = load_field(v, _loader135, base, loadingOptions)
+            else:
+                self.requirements = _parse140(v, base, loadingOptions, probe=True)
+        else:
+            self.requirements = None
+        if 'hints' in doc:
+            v = doc['hints']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.hints = load_field(v, _loader136, base, loadingOptions)
+            else:
+                self.hints = _parse143(v, base, loadingOptions, probe=True)
+        else:
+            self.hints = None
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        if 'cwlVersion' in doc:
+            v = doc['cwlVersion']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, True, None)
+                if (v is None or (isinstance(v, str) and v in _symbols57)):
+                    self.cwlVersion = v
+                else:
+                    self.cwlVersion = _parse144(v, base, loadingOptions, probe=True)
+            else:
+                self.cwlVersion = load_field(v, _loader138, base, loadingOptions)
+        else:
+            self.cwlVersion = None
+        v = doc.get('steps')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.steps = load_field(v, _loader139, base, loadingOptions)
+        else:
+            self.steps = _parse209(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_Workflow131, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs130:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse217(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if loadingOptions.reuse is None:
+        return _parse217_fresh(doc, baseuri, loadingOptions, docRoot, probe)
+    return loadingOptions.reuse.load(_parse217_fresh, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse69(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse218(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow140, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse218(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs141.issuperset(doc):
+        for k in doc:
+            if k not in _attrs141:
+                if ':' not in k:
+                    return _failed(_WorkflowStep142, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _WorkflowStep142.__new__(_WorkflowStep142)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        v = doc.get('in')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.in_ = load_field(v, _loader144, base, loadingOptions)
+        else:
+            self.in_ = _parse196(v, base, loadingOptions, probe=True)
+        v = doc.get('out')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.out = load_field(v, _loader145, base, loadingOptions)
+        else:
+            self.out = _parse200(v, base, loadingOptions, probe=True)
+        if 'requirements' in doc:
+            v = doc['requirements']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.requirements = load_field(v, _loader135, base, loadingOptions)
+            else:
+                self.requirements = _parse140(v, base, loadingOptions, probe=True)
+        else:
+            self.requirements = None
+        if 'hints' in doc:
+            v = doc['hints']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.hints = load_field(v, _loader136, base, loadingOptions)
+            else:
+                self.hints = _parse143(v, base, loadingOptions, probe=True)
+        else:
+            self.hints = None
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('run')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.run = load_field(v, _loader146, base, loadingOptions)
+        else:
+            self.run = _parse202(v, base, loadingOptions, probe=True)
+        if 'scatter' in doc:
+            v = doc['scatter']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.scatter = load_field(v, _loader147, base, loadingOptions)
+            else:
+                self.scatter = _parse192(v, base, loadingOptions, probe=True)
+        else:
+            self.scatter = None
+        if 'scatterMethod' in doc:
+            v = doc['scatterMethod']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, True, None)
+                if (v is None or (isinstance(v, str) and v in _symbols6)):
+                    self.scatterMethod = v
+                else:
+                    self.scatterMethod = _parse203(v, base, loadingOptions, probe=True)
+            else:
+                self.scatterMethod = load_field(v, _loader148, base, loadingOptions)
+        else:
+            self.scatterMethod = None
+    except ValidationException:
+        return _failed(_WorkflowStep142, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs141:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse68(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols6):
+        return doc
+    return _failed(_slow149, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse67(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse219(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow150, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse219(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs151.issuperset(doc):
+        for k in doc:
+            if k not in _attrs151:
+                if ':' not in k:
+                    return _failed(_WorkflowStepOutput152, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _WorkflowStepOutput152.__new__(_WorkflowStepOutput152)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+    except ValidationException:
+        return _failed(_WorkflowStepOutput152, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs151:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse66(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse220(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow153, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse220(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs154.issuperset(doc):
+        for k in doc:
+            if k not in _attrs154:
+                if ':' not in k:
+                    return _failed(_WorkflowStepInput155, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _WorkflowStepInput155.__new__(_WorkflowStepInput155)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'source' in doc:
+            v = doc['source']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.source = load_field(v, _loader156, base, loadingOptions)
+            else:
+                self.source = _parse194(v, base, loadingOptions, probe=True)
+        else:
+            self.source = None
+        if 'linkMerge' in doc:
+            v = doc['linkMerge']
+            if (v is None or (isinstance(v, str) and v in _symbols14)):
+                self.linkMerge = v
+            else:
+                self.linkMerge = load_field(v, _loader157, base, loadingOptions)
+        else:
+            self.linkMerge = None
+        if 'default' in doc:
+            v = doc['default']
+            if not isinstance(v, dict) and (v is None or v is not None):
+                self.default = v
+            else:
+                self.default = load_field(v, _loader158, base, loadingOptions)
+        else:
+            self.default = None
+        if 'valueFrom' in doc:
+            v = doc['valueFrom']
+            if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.valueFrom = v
+            else:
+                self.valueFrom = load_field(v, _loader159, base, loadingOptions)
+        else:
+            self.valueFrom = None
+    except ValidationException:
+        return _failed(_WorkflowStepInput155, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs154:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse65(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow160(doc, baseuri, loadingOptions, docRoot)
+
+def _parse64(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse221(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow161, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse221(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs162.issuperset(doc):
+        for k in doc:
+            if k not in _attrs162:
+                if ':' not in k:
+                    return _failed(_WorkflowOutputParameter163, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _WorkflowOutputParameter163.__new__(_WorkflowOutputParameter163)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _loader164, base, loadingOptions)
+            else:
+                self.secondaryFiles = _parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if (v is None or isinstance(v, _type86)):
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _loader166, base, loadingOptions)
+            else:
+                self.doc = _parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                    self.format = v
+                else:
+                    self.format = _parse131(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _loader168, base, loadingOptions)
+        else:
+            self.format = None
+        if 'outputSource' in doc:
+            v = doc['outputSource']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputSource = load_field(v, _loader147, base, loadingOptions)
+            else:
+                self.outputSource = _parse192(v, base, loadingOptions, probe=True)
+        else:
+            self.outputSource = None
+        if 'linkMerge' in doc:
+            v = doc['linkMerge']
+            if (v is None or (isinstance(v, str) and v in _symbols14)):
+                self.linkMerge = v
+            else:
+                self.linkMerge = load_field(v, _loader157, base, loadingOptions)
+        else:
+            self.linkMerge = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _loader169, base, loadingOptions)
+            else:
+                self.type = _parse189(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_WorkflowOutputParameter163, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs162:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse63(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols14):
+        return doc
+    return _failed(_slow170, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse62(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse222(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow171, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse222_fresh(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'ExpressionTool':
+        return _failed(_ExpressionTool173, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs172.issuperset(doc):
+        for k in doc:
+            if k not in _attrs172:
+                if ':' not in k:
+                    return _failed(_ExpressionTool173, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _ExpressionTool173.__new__(_ExpressionTool173)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.id = v
+                else:
+                    self.id = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                self.id = '_:' + str(uuid.uuid4())
+        base = self.id
+        v = doc.get('inputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.inputs = load_field(v, _loader133, base, loadingOptions)
+        else:
+            self.inputs = _parse134(v, base, loadingOptions, probe=True)
+        v = doc.get('outputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.outputs = load_field(v, _loader174, base, loadingOptions)
+        else:
+            self.outputs = _parse191(v, base, loadingOptions, probe=True)
+        if 'requirements' in doc:
+            v = doc['requirements']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.requirements = load_field(v, _loader135, base, loadingOptions)
+            else:
+                self.requirements = _parse140(v, base, loadingOptions, probe=True)
+        else:
+            self.requirements = None
+        if 'hints' in doc:
+            v = doc['hints']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.hints = load_field(v, _loader136, base, loadingOptions)
+            else:
+                self.hints = _parse143(v, base, loadingOptions, probe=True)
+        else:
+            self.hints = None
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        if 'cwlVersion' in doc:
+            v = doc['cwlVersion']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, True, None)
+                if (v is None or (isinstance(v, str) and v in _symbols57)):
+                    self.cwlVersion = v
+                else:
+                    self.cwlVersion = _parse144(v, base, loadingOptions, probe=True)
+            else:
+                self.cwlVersion = load_field(v, _loader138, base, loadingOptions)
+        else:
+            self.cwlVersion = None
+        v = doc.get('expression')
+        if (isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+            self.expression = v
+        else:
+            self.expression = load_field(v, _loader175, base, loadingOptions)
+    except ValidationException:
+        return _failed(_ExpressionTool173, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs172:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse222(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if loadingOptions.reuse is None:
+        return _parse222_fresh(doc, baseuri, loadingOptions, docRoot, probe)
+    return loadingOptions.reuse.load(_parse222_fresh, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse61(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse223(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow176, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse223(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs177.issuperset(doc):
+        for k in doc:
+            if k not in _attrs177:
+                if ':' not in k:
+                    return _failed(_ExpressionToolOutputParameter178, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _ExpressionToolOutputParameter178.__new__(_ExpressionToolOutputParameter178)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _loader164, base, loadingOptions)
+            else:
+                self.secondaryFiles = _parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if (v is None or isinstance(v, _type86)):
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _loader166, base, loadingOptions)
+            else:
+                self.doc = _parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                    self.format = v
+                else:
+                    self.format = _parse131(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _loader168, base, loadingOptions)
+        else:
+            self.format = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _loader169, base, loadingOptions)
+            else:
+                self.type = _parse189(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_ExpressionToolOutputParameter178, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs177:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse60(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse224(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow179, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse224(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'ResourceRequirement':
+        return _failed(_ResourceRequirement181, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs180.issuperset(doc):
+        for k in doc:
+            if k not in _attrs180:
+                if ':' not in k:
+                    return _failed(_ResourceRequirement181, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _ResourceRequirement181.__new__(_ResourceRequirement181)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'coresMin' in doc:
+            v = doc['coresMin']
+            if (v is None or isinstance(v, _type20) or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.coresMin = v
+            else:
+                self.coresMin = load_field(v, _loader182, base, loadingOptions)
+        else:
+            self.coresMin = None
+        if 'coresMax' in doc:
+            v = doc['coresMax']
+            if (v is None or isinstance(v, _type20) or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.coresMax = v
+            else:
+                self.coresMax = load_field(v, _loader182, base, loadingOptions)
+        else:
+            self.coresMax = None
+        if 'ramMin' in doc:
+            v = doc['ramMin']
+            if (v is None or isinstance(v, _type20) or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.ramMin = v
+            else:
+                self.ramMin = load_field(v, _loader182, base, loadingOptions)
+        else:
+            self.ramMin = None
+        if 'ramMax' in doc:
+            v = doc['ramMax']
+            if (v is None or isinstance(v, _type20) or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.ramMax = v
+            else:
+                self.ramMax = load_field(v, _loader182, base, loadingOptions)
+        else:
+            self.ramMax = None
+        if 'tmpdirMin' in doc:
+            v = doc['tmpdirMin']
+            if (v is None or isinstance(v, _type20) or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.tmpdirMin = v
+            else:
+                self.tmpdirMin = load_field(v, _loader182, base, loadingOptions)
+        else:
+            self.tmpdirMin = None
+        if 'tmpdirMax' in doc:
+            v = doc['tmpdirMax']
+            if (v is None or isinstance(v, _type20) or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.tmpdirMax = v
+            else:
+                self.tmpdirMax = load_field(v, _loader182, base, loadingOptions)
+        else:
+            self.tmpdirMax = None
+        if 'outdirMin' in doc:
+            v = doc['outdirMin']
+            if (v is None or isinstance(v, _type20) or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.outdirMin = v
+            else:
+                self.outdirMin = load_field(v, _loader182, base, loadingOptions)
+        else:
+            self.outdirMin = None
+        if 'outdirMax' in doc:
+            v = doc['outdirMax']
+            if (v is None or isinstance(v, _type20) or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.outdirMax = v
+            else:
+                self.outdirMax = load_field(v, _loader182, base, loadingOptions)
+        else:
+            self.outdirMax = None
+    except ValidationException:
+        return _failed(_ResourceRequirement181, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs180:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse59(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse225(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow183, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse225(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'ShellCommandRequirement':
+        return _failed(_ShellCommandRequirement185, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs184.issuperset(doc):
+        for k in doc:
+            if k not in _attrs184:
+                if ':' not in k:
+                    return _failed(_ShellCommandRequirement185, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _ShellCommandRequirement185.__new__(_ShellCommandRequirement185)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_ShellCommandRequirement185, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs184:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse58(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse226(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow186, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse226(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'EnvVarRequirement':
+        return _failed(_EnvVarRequirement188, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs187.issuperset(doc):
+        for k in doc:
+            if k not in _attrs187:
+                if ':' not in k:
+                    return _failed(_EnvVarRequirement188, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _EnvVarRequirement188.__new__(_EnvVarRequirement188)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('envDef')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.envDef = load_field(v, _loader189, base, loadingOptions)
+        else:
+            self.envDef = _parse186(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_EnvVarRequirement188, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs187:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse57(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse227(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow190, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse227(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'InitialWorkDirRequirement':
+        return _failed(_InitialWorkDirRequirement192, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs191.issuperset(doc):
+        for k in doc:
+            if k not in _attrs191:
+                if ':' not in k:
+                    return _failed(_InitialWorkDirRequirement192, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _InitialWorkDirRequirement192.__new__(_InitialWorkDirRequirement192)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('listing')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.listing = load_field(v, _loader193, base, loadingOptions)
+        else:
+            self.listing = _parse184(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_InitialWorkDirRequirement192, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs191:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse56(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse228(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow194, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse228(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs195.issuperset(doc):
+        for k in doc:
+            if k not in _attrs195:
+                if ':' not in k:
+                    return _failed(_Dirent196, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _Dirent196.__new__(_Dirent196)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'entryname' in doc:
+            v = doc['entryname']
+            if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.entryname = v
+            else:
+                self.entryname = load_field(v, _loader159, base, loadingOptions)
+        else:
+            self.entryname = None
+        v = doc.get('entry')
+        if (isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+            self.entry = v
+        else:
+            self.entry = load_field(v, _loader175, base, loadingOptions)
+        if 'writable' in doc:
+            v = doc['writable']
+            if (v is None or isinstance(v, _type86)):
+                self.writable = v
+            else:
+                self.writable = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.writable = None
+    except ValidationException:
+        return _failed(_Dirent196, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs195:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse55(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse229(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow197, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse229(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs198.issuperset(doc):
+        for k in doc:
+            if k not in _attrs198:
+                if ':' not in k:
+                    return _failed(_SoftwarePackage199, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _SoftwarePackage199.__new__(_SoftwarePackage199)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('package')
+        if isinstance(v, _type8):
+            self.package = v
+        else:
+            self.package = load_field(v, _loader200, base, loadingOptions)
+        if 'version' in doc:
+            v = doc['version']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.version = load_field(v, _loader201, base, loadingOptions)
+            else:
+                self.version = _parse147(v, base, loadingOptions, probe=True)
+        else:
+            self.version = None
+        if 'specs' in doc:
+            v = doc['specs']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.specs = load_field(v, _loader201, base, loadingOptions)
+            else:
+                self.specs = _parse147(v, base, loadingOptions, probe=True)
+        else:
+            self.specs = None
+    except ValidationException:
+        return _failed(_SoftwarePackage199, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs198:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse54(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse230(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow202, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse230(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'SoftwareRequirement':
+        return _failed(_SoftwareRequirement204, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs203.issuperset(doc):
+        for k in doc:
+            if k not in _attrs203:
+                if ':' not in k:
+                    return _failed(_SoftwareRequirement204, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _SoftwareRequirement204.__new__(_SoftwareRequirement204)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('packages')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.packages = load_field(v, _loader205, base, loadingOptions)
+        else:
+            self.packages = _parse181(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_SoftwareRequirement204, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs203:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse53(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse231(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow206, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse231(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'DockerRequirement':
+        return _failed(_DockerRequirement208, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs207.issuperset(doc):
+        for k in doc:
+            if k not in _attrs207:
+                if ':' not in k:
+                    return _failed(_DockerRequirement208, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _DockerRequirement208.__new__(_DockerRequirement208)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'dockerPull' in doc:
+            v = doc['dockerPull']
+            if (v is None or isinstance(v, _type8)):
+                self.dockerPull = v
+            else:
+                self.dockerPull = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.dockerPull = None
+        if 'dockerLoad' in doc:
+            v = doc['dockerLoad']
+            if (v is None or isinstance(v, _type8)):
+                self.dockerLoad = v
+            else:
+                self.dockerLoad = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.dockerLoad = None
+        if 'dockerFile' in doc:
+            v = doc['dockerFile']
+            if (v is None or isinstance(v, _type8)):
+                self.dockerFile = v
+            else:
+                self.dockerFile = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.dockerFile = None
+        if 'dockerImport' in doc:
+            v = doc['dockerImport']
+            if (v is None or isinstance(v, _type8)):
+                self.dockerImport = v
+            else:
+                self.dockerImport = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.dockerImport = None
+        if 'dockerImageId' in doc:
+            v = doc['dockerImageId']
+            if (v is None or isinstance(v, _type8)):
+                self.dockerImageId = v
+            else:
+                self.dockerImageId = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.dockerImageId = None
+        if 'dockerOutputDirectory' in doc:
+            v = doc['dockerOutputDirectory']
+            if (v is None or isinstance(v, _type8)):
+                self.dockerOutputDirectory = v
+            else:
+                self.dockerOutputDirectory = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.dockerOutputDirectory = None
+    except ValidationException:
+        return _failed(_DockerRequirement208, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs207:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse52(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse232(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow209, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse232_fresh(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'CommandLineTool':
+        return _failed(_CommandLineTool211, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs210.issuperset(doc):
+        for k in doc:
+            if k not in _attrs210:
+                if ':' not in k:
+                    return _failed(_CommandLineTool211, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandLineTool211.__new__(_CommandLineTool211)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.id = v
+                else:
+                    self.id = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                self.id = '_:' + str(uuid.uuid4())
+        base = self.id
+        v = doc.get('inputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.inputs = load_field(v, _loader212, base, loadingOptions)
+        else:
+            self.inputs = _parse172(v, base, loadingOptions, probe=True)
+        v = doc.get('outputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.outputs = load_field(v, _loader213, base, loadingOptions)
+        else:
+            self.outputs = _parse174(v, base, loadingOptions, probe=True)
+        if 'requirements' in doc:
+            v = doc['requirements']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.requirements = load_field(v, _loader135, base, loadingOptions)
+            else:
+                self.requirements = _parse140(v, base, loadingOptions, probe=True)
+        else:
+            self.requirements = None
+        if 'hints' in doc:
+            v = doc['hints']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.hints = load_field(v, _loader136, base, loadingOptions)
+            else:
+                self.hints = _parse143(v, base, loadingOptions, probe=True)
+        else:
+            self.hints = None
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        if 'cwlVersion' in doc:
+            v = doc['cwlVersion']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, True, None)
+                if (v is None or (isinstance(v, str) and v in _symbols57)):
+                    self.cwlVersion = v
+                else:
+                    self.cwlVersion = _parse144(v, base, loadingOptions, probe=True)
+            else:
+                self.cwlVersion = load_field(v, _loader138, base, loadingOptions)
+        else:
+            self.cwlVersion = None
+        if 'baseCommand' in doc:
+            v = doc['baseCommand']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.baseCommand = load_field(v, _loader166, base, loadingOptions)
+            else:
+                self.baseCommand = _parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.baseCommand = None
+        if 'arguments' in doc:
+            v = doc['arguments']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.arguments = load_field(v, _loader214, base, loadingOptions)
+            else:
+                self.arguments = _parse177(v, base, loadingOptions, probe=True)
+        else:
+            self.arguments = None
+        if 'stdin' in doc:
+            v = doc['stdin']
+            if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.stdin = v
+            else:
+                self.stdin = load_field(v, _loader159, base, loadingOptions)
+        else:
+            self.stdin = None
+        if 'stderr' in doc:
+            v = doc['stderr']
+            if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.stderr = v
+            else:
+                self.stderr = load_field(v, _loader159, base, loadingOptions)
+        else:
+            self.stderr = None
+        if 'stdout' in doc:
+            v = doc['stdout']
+            if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.stdout = v
+            else:
+                self.stdout = load_field(v, _loader159, base, loadingOptions)
+        else:
+            self.stdout = None
+        if 'successCodes' in doc:
+            v = doc['successCodes']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.successCodes = load_field(v, _loader215, base, loadingOptions)
+            else:
+                self.successCodes = _parse179(v, base, loadingOptions, probe=True)
+        else:
+            self.successCodes = None
+        if 'temporaryFailCodes' in doc:
+            v = doc['temporaryFailCodes']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.temporaryFailCodes = load_field(v, _loader215, base, loadingOptions)
+            else:
+                self.temporaryFailCodes = _parse179(v, base, loadingOptions, probe=True)
+        else:
+            self.temporaryFailCodes = None
+        if 'permanentFailCodes' in doc:
+            v = doc['permanentFailCodes']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.permanentFailCodes = load_field(v, _loader215, base, loadingOptions)
+            else:
+                self.permanentFailCodes = _parse179(v, base, loadingOptions, probe=True)
+        else:
+            self.permanentFailCodes = None
+    except ValidationException:
+        return _failed(_CommandLineTool211, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs210:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse232(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if loadingOptions.reuse is None:
+        return _parse232_fresh(doc, baseuri, loadingOptions, docRoot, probe)
+    return loadingOptions.reuse.load(_parse232_fresh, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse51(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols37):
+        return doc
+    return _failed(_slow216, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse50(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols36):
+        return doc
+    return _failed(_slow217, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse49(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse233(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow218, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse233(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs219.issuperset(doc):
+        for k in doc:
+            if k not in _attrs219:
+                if ':' not in k:
+                    return _failed(_CommandOutputParameter220, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandOutputParameter220.__new__(_CommandOutputParameter220)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _loader164, base, loadingOptions)
+            else:
+                self.secondaryFiles = _parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if (v is None or isinstance(v, _type86)):
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _loader166, base, loadingOptions)
+            else:
+                self.doc = _parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                    self.format = v
+                else:
+                    self.format = _parse131(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _loader168, base, loadingOptions)
+        else:
+            self.format = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _loader221, base, loadingOptions)
+            else:
+                self.type = _parse170(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_CommandOutputParameter220, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs219:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse48(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse234(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow222, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse234(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs223.issuperset(doc):
+        for k in doc:
+            if k not in _attrs223:
+                if ':' not in k:
+                    return _failed(_CommandInputParameter224, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandInputParameter224.__new__(_CommandInputParameter224)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _loader164, base, loadingOptions)
+            else:
+                self.secondaryFiles = _parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if (v is None or isinstance(v, _type86)):
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _loader166, base, loadingOptions)
+            else:
+                self.doc = _parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.format = load_field(v, _loader225, base, loadingOptions)
+            else:
+                self.format = _parse127(v, base, loadingOptions, probe=True)
+        else:
+            self.format = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _loader226, base, loadingOptions)
+            else:
+                self.inputBinding = _parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+        if 'default' in doc:
+            v = doc['default']
+            if not isinstance(v, dict) and (v is None or v is not None):
+                self.default = v
+            else:
+                self.default = load_field(v, _loader158, base, loadingOptions)
+        else:
+            self.default = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _loader227, base, loadingOptions)
+            else:
+                self.type = _parse168(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_CommandInputParameter224, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs223:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse47(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse235(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow228, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse235(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs229.issuperset(doc):
+        for k in doc:
+            if k not in _attrs229:
+                if ':' not in k:
+                    return _failed(_CommandOutputArraySchema230, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandOutputArraySchema230.__new__(_CommandOutputArraySchema230)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _loader231, base, loadingOptions)
+        else:
+            self.items = _parse166(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader232, base, loadingOptions)
+        else:
+            self.type = _parse92(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_CommandOutputArraySchema230, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs229:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse46(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse236(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow233, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse236(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs234.issuperset(doc):
+        for k in doc:
+            if k not in _attrs234:
+                if ':' not in k:
+                    return _failed(_CommandOutputEnumSchema235, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandOutputEnumSchema235.__new__(_CommandOutputEnumSchema235)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _loader236, base, loadingOptions)
+        else:
+            self.symbols = _parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader237, base, loadingOptions)
+        else:
+            self.type = _parse89(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_CommandOutputEnumSchema235, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs234:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse45(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse237(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow238, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse237(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs239.issuperset(doc):
+        for k in doc:
+            if k not in _attrs239:
+                if ':' not in k:
+                    return _failed(_CommandOutputRecordSchema240, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandOutputRecordSchema240.__new__(_CommandOutputRecordSchema240)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.name = v
+                else:
+                    self.name = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _loader241, base, loadingOptions)
+            else:
+                self.fields = _parse165(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader242, base, loadingOptions)
+        else:
+            self.type = _parse85(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_CommandOutputRecordSchema240, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs239:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse44(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse238(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow243, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse238(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs244.issuperset(doc):
+        for k in doc:
+            if k not in _attrs244:
+                if ':' not in k:
+                    return _failed(_CommandOutputRecordField245, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandOutputRecordField245.__new__(_CommandOutputRecordField245)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.name = v
+                else:
+                    self.name = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader246, base, loadingOptions)
+        else:
+            self.type = _parse162(v, base, loadingOptions, probe=True)
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_CommandOutputRecordField245, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs244:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse43(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse239(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow247, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse239(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs248.issuperset(doc):
+        for k in doc:
+            if k not in _attrs248:
+                if ':' not in k:
+                    return _failed(_CommandInputArraySchema249, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandInputArraySchema249.__new__(_CommandInputArraySchema249)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _loader250, base, loadingOptions)
+        else:
+            self.items = _parse158(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader232, base, loadingOptions)
+        else:
+            self.type = _parse92(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _loader226, base, loadingOptions)
+            else:
+                self.inputBinding = _parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+    except ValidationException:
+        return _failed(_CommandInputArraySchema249, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs248:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse42(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse240(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow251, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse240(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs252.issuperset(doc):
+        for k in doc:
+            if k not in _attrs252:
+                if ':' not in k:
+                    return _failed(_CommandInputEnumSchema253, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandInputEnumSchema253.__new__(_CommandInputEnumSchema253)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.name = v
+                else:
+                    self.name = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _loader236, base, loadingOptions)
+        else:
+            self.symbols = _parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader237, base, loadingOptions)
+        else:
+            self.type = _parse89(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _loader226, base, loadingOptions)
+            else:
+                self.inputBinding = _parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+    except ValidationException:
+        return _failed(_CommandInputEnumSchema253, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs252:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse41(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse241(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow254, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse241(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs255.issuperset(doc):
+        for k in doc:
+            if k not in _attrs255:
+                if ':' not in k:
+                    return _failed(_CommandInputRecordSchema256, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandInputRecordSchema256.__new__(_CommandInputRecordSchema256)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.name = v
+                else:
+                    self.name = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _loader257, base, loadingOptions)
+            else:
+                self.fields = _parse157(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader242, base, loadingOptions)
+        else:
+            self.type = _parse85(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_CommandInputRecordSchema256, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs255:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse40(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse242(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow258, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse242(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs259.issuperset(doc):
+        for k in doc:
+            if k not in _attrs259:
+                if ':' not in k:
+                    return _failed(_CommandInputRecordField260, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandInputRecordField260.__new__(_CommandInputRecordField260)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.name = v
+                else:
+                    self.name = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader261, base, loadingOptions)
+        else:
+            self.type = _parse154(v, base, loadingOptions, probe=True)
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _loader226, base, loadingOptions)
+            else:
+                self.inputBinding = _parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_CommandInputRecordField260, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs259:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse39(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse243(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow262, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse243(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs263.issuperset(doc):
+        for k in doc:
+            if k not in _attrs263:
+                if ':' not in k:
+                    return _failed(_CommandOutputBinding264, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandOutputBinding264.__new__(_CommandOutputBinding264)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'glob' in doc:
+            v = doc['glob']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.glob = load_field(v, _loader265, base, loadingOptions)
+            else:
+                self.glob = _parse150(v, base, loadingOptions, probe=True)
+        else:
+            self.glob = None
+        if 'loadContents' in doc:
+            v = doc['loadContents']
+            if (v is None or isinstance(v, _type86)):
+                self.loadContents = v
+            else:
+                self.loadContents = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.loadContents = None
+        if 'outputEval' in doc:
+            v = doc['outputEval']
+            if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.outputEval = v
+            else:
+                self.outputEval = load_field(v, _loader159, base, loadingOptions)
+        else:
+            self.outputEval = None
+    except ValidationException:
+        return _failed(_CommandOutputBinding264, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs263:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse38(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse244(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow266, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse244(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs267.issuperset(doc):
+        for k in doc:
+            if k not in _attrs267:
+                if ':' not in k:
+                    return _failed(_CommandLineBinding268, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _CommandLineBinding268.__new__(_CommandLineBinding268)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'loadContents' in doc:
+            v = doc['loadContents']
+            if (v is None or isinstance(v, _type86)):
+                self.loadContents = v
+            else:
+                self.loadContents = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.loadContents = None
+        if 'position' in doc:
+            v = doc['position']
+            if (v is None or isinstance(v, _type20)):
+                self.position = v
+            else:
+                self.position = load_field(v, _loader269, base, loadingOptions)
+        else:
+            self.position = None
+        if 'prefix' in doc:
+            v = doc['prefix']
+            if (v is None or isinstance(v, _type8)):
+                self.prefix = v
+            else:
+                self.prefix = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.prefix = None
+        if 'separate' in doc:
+            v = doc['separate']
+            if (v is None or isinstance(v, _type86)):
+                self.separate = v
+            else:
+                self.separate = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.separate = None
+        if 'itemSeparator' in doc:
+            v = doc['itemSeparator']
+            if (v is None or isinstance(v, _type8)):
+                self.itemSeparator = v
+            else:
+                self.itemSeparator = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.itemSeparator = None
+        if 'valueFrom' in doc:
+            v = doc['valueFrom']
+            if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                self.valueFrom = v
+            else:
+                self.valueFrom = load_field(v, _loader159, base, loadingOptions)
+        else:
+            self.valueFrom = None
+        if 'shellQuote' in doc:
+            v = doc['shellQuote']
+            if (v is None or isinstance(v, _type86)):
+                self.shellQuote = v
+            else:
+                self.shellQuote = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.shellQuote = None
+    except ValidationException:
+        return _failed(_CommandLineBinding268, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs267:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse37(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse245(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow270, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse245(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs271.issuperset(doc):
+        for k in doc:
+            if k not in _attrs271:
+                if ':' not in k:
+                    return _failed(_EnvironmentDef272, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _EnvironmentDef272.__new__(_EnvironmentDef272)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('envName')
+        if isinstance(v, _type8):
+            self.envName = v
+        else:
+            self.envName = load_field(v, _loader200, base, loadingOptions)
+        v = doc.get('envValue')
+        if (isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+            self.envValue = v
+        else:
+            self.envValue = load_field(v, _loader175, base, loadingOptions)
+    except ValidationException:
+        return _failed(_EnvironmentDef272, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs271:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse36(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse246(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow273, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse246(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'SchemaDefRequirement':
+        return _failed(_SchemaDefRequirement275, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs274.issuperset(doc):
+        for k in doc:
+            if k not in _attrs274:
+                if ':' not in k:
+                    return _failed(_SchemaDefRequirement275, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _SchemaDefRequirement275.__new__(_SchemaDefRequirement275)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('types')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.types = load_field(v, _loader276, base, loadingOptions)
+        else:
+            self.types = _parse149(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_SchemaDefRequirement275, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs274:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse35(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse247(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow277, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse247(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'InlineJavascriptRequirement':
+        return _failed(_InlineJavascriptRequirement279, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs278.issuperset(doc):
+        for k in doc:
+            if k not in _attrs278:
+                if ':' not in k:
+                    return _failed(_InlineJavascriptRequirement279, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _InlineJavascriptRequirement279.__new__(_InlineJavascriptRequirement279)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'expressionLib' in doc:
+            v = doc['expressionLib']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.expressionLib = load_field(v, _loader201, base, loadingOptions)
+            else:
+                self.expressionLib = _parse147(v, base, loadingOptions, probe=True)
+        else:
+            self.expressionLib = None
+    except ValidationException:
+        return _failed(_InlineJavascriptRequirement279, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs278:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse34(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow280(doc, baseuri, loadingOptions, docRoot)
+
+def _parse33(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow281(doc, baseuri, loadingOptions, docRoot)
+
+def _parse32(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse248(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow282, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse248(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs283.issuperset(doc):
+        for k in doc:
+            if k not in _attrs283:
+                if ':' not in k:
+                    return _failed(_OutputParameter284, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _OutputParameter284.__new__(_OutputParameter284)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _loader164, base, loadingOptions)
+            else:
+                self.secondaryFiles = _parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if (v is None or isinstance(v, _type86)):
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _loader166, base, loadingOptions)
+            else:
+                self.doc = _parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8) or (isinstance(v, str) and v in _symbols21)):
+                    self.format = v
+                else:
+                    self.format = _parse131(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _loader168, base, loadingOptions)
+        else:
+            self.format = None
+    except ValidationException:
+        return _failed(_OutputParameter284, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs283:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse31(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse249(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow285, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse249(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs286.issuperset(doc):
+        for k in doc:
+            if k not in _attrs286:
+                if ':' not in k:
+                    return _failed(_InputParameter287, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _InputParameter287.__new__(_InputParameter287)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.id = v
+                else:
+                    self.id = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _loader164, base, loadingOptions)
+            else:
+                self.secondaryFiles = _parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if (v is None or isinstance(v, _type86)):
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _loader165, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _loader166, base, loadingOptions)
+            else:
+                self.doc = _parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.format = load_field(v, _loader225, base, loadingOptions)
+            else:
+                self.format = _parse127(v, base, loadingOptions, probe=True)
+        else:
+            self.format = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _loader226, base, loadingOptions)
+            else:
+                self.inputBinding = _parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+        if 'default' in doc:
+            v = doc['default']
+            if not isinstance(v, dict) and (v is None or v is not None):
+                self.default = v
+            else:
+                self.default = load_field(v, _loader158, base, loadingOptions)
+        else:
+            self.default = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _loader288, base, loadingOptions)
+            else:
+                self.type = _parse130(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_InputParameter287, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs286:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse30(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse250(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow289, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse250(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs290.issuperset(doc):
+        for k in doc:
+            if k not in _attrs290:
+                if ':' not in k:
+                    return _failed(_OutputArraySchema291, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _OutputArraySchema291.__new__(_OutputArraySchema291)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _loader292, base, loadingOptions)
+        else:
+            self.items = _parse125(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader232, base, loadingOptions)
+        else:
+            self.type = _parse92(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_OutputArraySchema291, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs290:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse29(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse251(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow293, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse251(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs294.issuperset(doc):
+        for k in doc:
+            if k not in _attrs294:
+                if ':' not in k:
+                    return _failed(_OutputEnumSchema295, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _OutputEnumSchema295.__new__(_OutputEnumSchema295)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _loader236, base, loadingOptions)
+        else:
+            self.symbols = _parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader237, base, loadingOptions)
+        else:
+            self.type = _parse89(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_OutputEnumSchema295, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs294:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse28(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse252(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow296, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse252(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs297.issuperset(doc):
+        for k in doc:
+            if k not in _attrs297:
+                if ':' not in k:
+                    return _failed(_OutputRecordSchema298, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _OutputRecordSchema298.__new__(_OutputRecordSchema298)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _loader299, base, loadingOptions)
+            else:
+                self.fields = _parse124(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader242, base, loadingOptions)
+        else:
+            self.type = _parse85(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_OutputRecordSchema298, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs297:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse27(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse253(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow300, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse253(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs301.issuperset(doc):
+        for k in doc:
+            if k not in _attrs301:
+                if ':' not in k:
+                    return _failed(_OutputRecordField302, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _OutputRecordField302.__new__(_OutputRecordField302)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.name = v
+                else:
+                    self.name = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader303, base, loadingOptions)
+        else:
+            self.type = _parse120(v, base, loadingOptions, probe=True)
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _loader167, base, loadingOptions)
+            else:
+                self.outputBinding = _parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_OutputRecordField302, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs301:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse26(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse254(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow304, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse254(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs305.issuperset(doc):
+        for k in doc:
+            if k not in _attrs305:
+                if ':' not in k:
+                    return _failed(_InputArraySchema306, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _InputArraySchema306.__new__(_InputArraySchema306)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _loader307, base, loadingOptions)
+        else:
+            self.items = _parse116(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader232, base, loadingOptions)
+        else:
+            self.type = _parse92(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _loader226, base, loadingOptions)
+            else:
+                self.inputBinding = _parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+    except ValidationException:
+        return _failed(_InputArraySchema306, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs305:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse25(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse255(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow308, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse255(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs309.issuperset(doc):
+        for k in doc:
+            if k not in _attrs309:
+                if ':' not in k:
+                    return _failed(_InputEnumSchema310, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _InputEnumSchema310.__new__(_InputEnumSchema310)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.name = v
+                else:
+                    self.name = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _loader236, base, loadingOptions)
+        else:
+            self.symbols = _parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader237, base, loadingOptions)
+        else:
+            self.type = _parse89(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _loader226, base, loadingOptions)
+            else:
+                self.inputBinding = _parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+    except ValidationException:
+        return _failed(_InputEnumSchema310, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs309:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse24(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse256(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow311, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse256(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs312.issuperset(doc):
+        for k in doc:
+            if k not in _attrs312:
+                if ':' not in k:
+                    return _failed(_InputRecordSchema313, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _InputRecordSchema313.__new__(_InputRecordSchema313)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.name = v
+                else:
+                    self.name = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _loader314, base, loadingOptions)
+            else:
+                self.fields = _parse115(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader242, base, loadingOptions)
+        else:
+            self.type = _parse85(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_InputRecordSchema313, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs312:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse23(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse257(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow315, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse257(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs316.issuperset(doc):
+        for k in doc:
+            if k not in _attrs316:
+                if ':' not in k:
+                    return _failed(_InputRecordField317, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _InputRecordField317.__new__(_InputRecordField317)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.name = v
+                else:
+                    self.name = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader318, base, loadingOptions)
+        else:
+            self.type = _parse111(v, base, loadingOptions, probe=True)
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _loader226, base, loadingOptions)
+            else:
+                self.inputBinding = _parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+        if 'label' in doc:
+            v = doc['label']
+            if (v is None or isinstance(v, _type8)):
+                self.label = v
+            else:
+                self.label = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_InputRecordField317, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs316:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse22(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow319(doc, baseuri, loadingOptions, docRoot)
+
+def _parse21(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow320(doc, baseuri, loadingOptions, docRoot)
+
+def _parse20(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow321(doc, baseuri, loadingOptions, docRoot)
+
+def _parse19(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow322(doc, baseuri, loadingOptions, docRoot)
+
+def _parse18(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols21):
+        return doc
+    return _failed(_slow323, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse17(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow324(doc, baseuri, loadingOptions, docRoot)
+
+def _parse16(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow325(doc, baseuri, loadingOptions, docRoot)
+
+def _parse15(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse258(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow326, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse258(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'Directory':
+        return _failed(_Directory328, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs327.issuperset(doc):
+        for k in doc:
+            if k not in _attrs327:
+                if ':' not in k:
+                    return _failed(_Directory328, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _Directory328.__new__(_Directory328)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'location' in doc:
+            v = doc['location']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.location = v
+                else:
+                    self.location = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.location = load_field(v, _loader329, base, loadingOptions)
+        else:
+            self.location = None
+        if 'path' in doc:
+            v = doc['path']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.path = v
+                else:
+                    self.path = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.path = load_field(v, _loader329, base, loadingOptions)
+        else:
+            self.path = None
+        if 'basename' in doc:
+            v = doc['basename']
+            if (v is None or isinstance(v, _type8)):
+                self.basename = v
+            else:
+                self.basename = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.basename = None
+        if 'listing' in doc:
+            v = doc['listing']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.listing = load_field(v, _loader330, base, loadingOptions)
+            else:
+                self.listing = _parse99(v, base, loadingOptions, probe=True)
+        else:
+            self.listing = None
+    except ValidationException:
+        return _failed(_Directory328, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs327:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse14(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse259(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow331, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse259(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'File':
+        return _failed(_File333, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs332.issuperset(doc):
+        for k in doc:
+            if k not in _attrs332:
+                if ':' not in k:
+                    return _failed(_File333, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _File333.__new__(_File333)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'location' in doc:
+            v = doc['location']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.location = v
+                else:
+                    self.location = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.location = load_field(v, _loader329, base, loadingOptions)
+        else:
+            self.location = None
+        if 'path' in doc:
+            v = doc['path']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.path = v
+                else:
+                    self.path = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.path = load_field(v, _loader329, base, loadingOptions)
+        else:
+            self.path = None
+        if 'basename' in doc:
+            v = doc['basename']
+            if (v is None or isinstance(v, _type8)):
+                self.basename = v
+            else:
+                self.basename = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.basename = None
+        if 'dirname' in doc:
+            v = doc['dirname']
+            if (v is None or isinstance(v, _type8)):
+                self.dirname = v
+            else:
+                self.dirname = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.dirname = None
+        if 'nameroot' in doc:
+            v = doc['nameroot']
+            if (v is None or isinstance(v, _type8)):
+                self.nameroot = v
+            else:
+                self.nameroot = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.nameroot = None
+        if 'nameext' in doc:
+            v = doc['nameext']
+            if (v is None or isinstance(v, _type8)):
+                self.nameext = v
+            else:
+                self.nameext = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.nameext = None
+        if 'checksum' in doc:
+            v = doc['checksum']
+            if (v is None or isinstance(v, _type8)):
+                self.checksum = v
+            else:
+                self.checksum = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.checksum = None
+        if 'size' in doc:
+            v = doc['size']
+            if (v is None or isinstance(v, _type20)):
+                self.size = v
+            else:
+                self.size = load_field(v, _loader269, base, loadingOptions)
+        else:
+            self.size = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _loader330, base, loadingOptions)
+            else:
+                self.secondaryFiles = _parse99(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if (v is None or isinstance(v, _type8)):
+                    self.format = v
+                else:
+                    self.format = _parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _loader132, base, loadingOptions)
+        else:
+            self.format = None
+        if 'contents' in doc:
+            v = doc['contents']
+            if (v is None or isinstance(v, _type8)):
+                self.contents = v
+            else:
+                self.contents = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.contents = None
+    except ValidationException:
+        return _failed(_File333, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs332:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse13(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols18):
+        return doc
+    return _failed(_slow334, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse12(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols57):
+        return doc
+    return _failed(_slow335, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse11(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse260(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow336, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse260(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs337.issuperset(doc):
+        for k in doc:
+            if k not in _attrs337:
+                if ':' not in k:
+                    return _failed(_ArraySchema338, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _ArraySchema338.__new__(_ArraySchema338)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _loader339, base, loadingOptions)
+        else:
+            self.items = _parse90(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader232, base, loadingOptions)
+        else:
+            self.type = _parse92(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_ArraySchema338, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs337:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse10(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse261(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow340, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse261(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs341.issuperset(doc):
+        for k in doc:
+            if k not in _attrs341:
+                if ':' not in k:
+                    return _failed(_EnumSchema342, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _EnumSchema342.__new__(_EnumSchema342)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _loader236, base, loadingOptions)
+        else:
+            self.symbols = _parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader237, base, loadingOptions)
+        else:
+            self.type = _parse89(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_EnumSchema342, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs341:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse9(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse262(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow343, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse262(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs344.issuperset(doc):
+        for k in doc:
+            if k not in _attrs344:
+                if ':' not in k:
+                    return _failed(_RecordSchema345, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _RecordSchema345.__new__(_RecordSchema345)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _loader346, base, loadingOptions)
+            else:
+                self.fields = _parse83(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader242, base, loadingOptions)
+        else:
+            self.type = _parse85(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_RecordSchema345, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs344:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse8(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _parse263(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow347, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse263(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs348.issuperset(doc):
+        for k in doc:
+            if k not in _attrs348:
+                if ':' not in k:
+                    return _failed(_RecordField349, doc, baseuri, loadingOptions, docRoot, probe)
+                extension = True
+    self = _RecordField349.__new__(_RecordField349)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if isinstance(v, _type8):
+                    self.name = v
+                else:
+                    self.name = _parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _loader143, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if (v is None or isinstance(v, _type8)):
+                self.doc = v
+            else:
+                self.doc = load_field(v, _loader137, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _loader350, base, loadingOptions)
+        else:
+            self.type = _parse80(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_RecordField349, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs348:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _parse7(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols351):
+        return doc
+    return _failed(_slow352, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse6(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if (isinstance(doc, str) and doc in _symbols102):
+        return doc
+    return _failed(_slow353, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse5(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return doc
+    return _failed(_slow354, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse4(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, _type355):
+        return doc
+    return _failed(_slow356, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse3(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is not None:
+        return doc
+    return _failed(_slow357, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse2(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, _type8):
+        return doc
+    return _failed(_slow358, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse1(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, _type86):
+        return doc
+    return _failed(_slow359, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _parse0(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, _type20):
+        return doc
+    return _failed(_slow360, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse212(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse211(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'CommandLineTool':
+            return _trusted_parse52(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ExpressionTool':
+            return _trusted_parse62(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'Workflow':
+            return _trusted_parse70(doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow0, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow0(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse211(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow1, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse211(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow1(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse210(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow1, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse210(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'CommandLineTool':
+            return _trusted_parse52(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ExpressionTool':
+            return _trusted_parse62(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'Workflow':
+            return _trusted_parse70(doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow2, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow2(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse209(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'None': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse208(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse208(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse207(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow3, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow3(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse207(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow4, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse207(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow4(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse69(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow4, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse206(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse205(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse205(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow5, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse205(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow5(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse64(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow5, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse204(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if True:
+        return doc
+    return _trusted_parse203(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse203(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow7, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse202(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, False, None)
+    return _trusted_parse201(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse201(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'CommandLineTool':
+            return _trusted_parse52(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ExpressionTool':
+            return _trusted_parse62(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'Workflow':
+            return _trusted_parse70(doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow9, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow9(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse200(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    return _trusted_parse199(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse199(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse198(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow10, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow10(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse198(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow11, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse198(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow11(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse197(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow11, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse197(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow12, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _trusted_parse67(doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow12(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse196(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'source': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse195(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse195(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow13, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse195(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow13(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse66(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow13, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse194(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, False, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, False, 2)
+    return _trusted_parse107(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse193(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow15, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse192(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, False, 0) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, False, 0)
+    return _trusted_parse107(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse191(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse190(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse190(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow16, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse190(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow16(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse61(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow16, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse189(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve17(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve17(doc, baseuri, loadingOptions)
+    return _trusted_parse188(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse188(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse118(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse28(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse29(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse30(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow19, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow19(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse187(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow22, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse186(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'envValue': val}
+            v['envName'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse185(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse185(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow23, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse185(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow23(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse37(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow23, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse184(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse183(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow24, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow24(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse183(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow25, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse183(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow25(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse182(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow25, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse182(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'Directory':
+            try:
+                return _parse15(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            try:
+                return _parse56(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'File':
+            try:
+                return _parse14(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            try:
+                return _parse56(doc, baseuri, loadingOptions, docRoot, True)
+            except ValidationException:
+                pass
+            return _failed(_slow26, doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _trusted_parse56(doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow26(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse181(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'specs': val}
+            v['package'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse180(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse180(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow27, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse180(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow27(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse55(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow27, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse179(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse178(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow28, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow28(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse178(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow29, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse178(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow29(doc, baseuri, loadingOptions, docRoot)
+            if True:
+                r.append(item)
+                continue
+            lf = _trusted_parse0(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow29, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse177(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse176(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow30, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow30(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse176(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow31, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse176(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow31(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse175(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow31, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse175(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow32, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _trusted_parse38(doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow32(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse174(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse173(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse173(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow33, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse173(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow33(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse49(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow33, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse172(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse171(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse171(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow34, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse171(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow34(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse48(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow34, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse170(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve35(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve35(doc, baseuri, loadingOptions)
+    return _trusted_parse169(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse169(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols36):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols37):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse160(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse45(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse46(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse47(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow38, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow38(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse168(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve39(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve39(doc, baseuri, loadingOptions)
+    return _trusted_parse167(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse167(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse152(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse41(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse42(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse43(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow40, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow40(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse166(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _trusted_parse161(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse165(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse164(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse164(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse163(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow41, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow41(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse163(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow42, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse163(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow42(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse44(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow42, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse162(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve43(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve43(doc, baseuri, loadingOptions)
+    return _trusted_parse161(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse161(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse160(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse45(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse46(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse47(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow44, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow44(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse160(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow45, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse160(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow45(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse159(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow45, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse159(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse45(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse46(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse47(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow46, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow46(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse158(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _trusted_parse153(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse157(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse156(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse156(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse155(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow47, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow47(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse155(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow48, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse155(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow48(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse40(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow48, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse154(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve49(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve49(doc, baseuri, loadingOptions)
+    return _trusted_parse153(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse153(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse152(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse41(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse42(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse43(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow50, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow50(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse152(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow51, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse152(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow51(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse151(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow51, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse151(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse41(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse42(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse43(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow52, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow52(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse150(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse86(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow53, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow53(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse149(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow54, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse149(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow54(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse148(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow54, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse148(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse24(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse25(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse26(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow55, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow55(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse147(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse86(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow56, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow56(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse146(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if True:
+        return doc
+    return _trusted_parse2(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse145(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if True:
+        return doc
+    return _trusted_parse144(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse144(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow58, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse143(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'None': val}
+            v['class'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse142(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse142(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse141(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow59, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow59(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse141(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow60, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse141(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow60(doc, baseuri, loadingOptions, docRoot)
+            if True:
+                r.append(item)
+                continue
+            lf = _trusted_parse3(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow60, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse140(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'None': val}
+            v['class'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse139(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse139(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse138(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow61, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow61(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse138(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow62, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse138(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow62(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse137(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow62, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse137(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'DockerRequirement':
+            return _trusted_parse53(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'EnvVarRequirement':
+            return _trusted_parse58(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'InitialWorkDirRequirement':
+            return _trusted_parse57(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'InlineJavascriptRequirement':
+            return _trusted_parse35(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'MultipleInputFeatureRequirement':
+            return _trusted_parse73(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ResourceRequirement':
+            return _trusted_parse60(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ScatterFeatureRequirement':
+            return _trusted_parse72(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'SchemaDefRequirement':
+            return _trusted_parse36(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'ShellCommandRequirement':
+            return _trusted_parse59(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'SoftwareRequirement':
+            return _trusted_parse54(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'StepInputExpressionRequirement':
+            return _trusted_parse74(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'SubworkflowFeatureRequirement':
+            return _trusted_parse71(doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow63, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow63(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse136(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse135(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse135(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow64, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse135(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow64(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse32(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow64, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse134(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['id'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse133(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse133(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow65, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse133(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow65(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse31(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow65, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse132(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    if True:
+        return doc
+    return _trusted_parse131(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse131(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow66, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse130(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve67(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve67(doc, baseuri, loadingOptions)
+    return _trusted_parse129(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse129(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse109(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse24(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse25(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse26(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow68, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow68(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse128(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow69, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse127(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    return _trusted_parse126(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse126(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse86(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow70, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow70(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse125(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _trusted_parse119(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse124(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse123(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse123(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse122(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow71, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow71(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse122(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow72, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse122(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow72(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse27(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow72, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse121(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow73, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _trusted_parse39(doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow73(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse120(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve74(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve74(doc, baseuri, loadingOptions)
+    return _trusted_parse119(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse119(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse118(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse28(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse29(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse30(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow75, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow75(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse118(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow76, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse118(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow76(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse117(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow76, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse117(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse28(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse29(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse30(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow77, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow77(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse116(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _trusted_parse110(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse115(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse114(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse114(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse113(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow78, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow78(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse113(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow79, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse113(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow79(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse23(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow79, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse112(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow80, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _trusted_parse38(doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow80(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse111(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve81(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve81(doc, baseuri, loadingOptions)
+    return _trusted_parse110(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse110(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse109(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse24(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse25(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse26(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow82, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow82(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse109(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow83, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse109(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow83(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse108(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow83, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse108(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols18):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse24(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse25(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse26(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow84, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow84(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse107(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse86(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow85, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow85(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse106(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow87, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse105(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if isinstance(doc, _type8):
+            return doc
+        if (isinstance(doc, str) and doc in _symbols21):
+            return doc
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse104(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow88, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow88(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse104(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow89, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse104(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow89(doc, baseuri, loadingOptions, docRoot)
+            if True:
+                r.append(item)
+                continue
+            lf = _trusted_parse103(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow89, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse103(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow90, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse102(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if True:
+        return doc
+    return _trusted_parse101(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse101(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow92, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse100(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    if True:
+        return doc
+    return _trusted_parse76(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse99(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse98(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow93, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow93(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse98(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow94, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse98(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow94(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse97(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow94, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse97(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        if doc.get('class') == 'Directory':
+            return _trusted_parse15(doc, baseuri, loadingOptions, docRoot, probe)
+        elif doc.get('class') == 'File':
+            return _trusted_parse14(doc, baseuri, loadingOptions, docRoot, probe)
+        else:
+            return _failed(_slow95, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow95(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse96(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow96, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse95(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, False, None)
+    if True:
+        return doc
+    return _trusted_parse76(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse94(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, None)
+    if True:
+        return doc
+    return _trusted_parse93(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse93(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow98, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse92(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve99(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve99(doc, baseuri, loadingOptions)
+    return _trusted_parse91(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse91(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow101, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse90(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, False, True, 2) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, False, True, 2)
+    return _trusted_parse79(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse89(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve103(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve103(doc, baseuri, loadingOptions)
+    return _trusted_parse88(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse88(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow105, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse87(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    return _trusted_parse86(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse86(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow106, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse86(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow106(doc, baseuri, loadingOptions, docRoot)
+            if True:
+                r.append(item)
+                continue
+            lf = _trusted_parse2(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow106, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse85(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve107(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve107(doc, baseuri, loadingOptions)
+    return _trusted_parse84(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse84(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow109, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse83(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        r = []
+        for k in sorted(doc.keys()):
+            val = doc[k]
+            if isinstance(val, dict):
+                v = copy.copy(val)
+                if hasattr(val, 'lc'):
+                    v.lc.data = val.lc.data
+                    v.lc.filename = val.lc.filename
+            else:
+                v = {'type': val}
+            v['name'] = k
+            r.append(v)
+        doc = r
+    return _trusted_parse82(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse82(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        if doc is None:
+            return doc
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse81(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        return _failed(_slow110, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow110(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse81(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow111, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse81(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow111(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse8(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow111, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse80(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        r = []
+        for d in doc:
+            if isinstance(d, str):
+                resolved = _resolve112(d, baseuri, loadingOptions)
+                if isinstance(resolved, list):
+                    for i in resolved:
+                        if i not in r:
+                            r.append(i)
+                elif resolved not in r:
+                    r.append(resolved)
+            else:
+                r.append(d)
+        doc = r
+    elif isinstance(doc, str):
+        doc = _resolve112(doc, baseuri, loadingOptions)
+    return _trusted_parse79(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse79(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols102):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _trusted_parse78(doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse9(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse10(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse11(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow113, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow113(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse78(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if not isinstance(doc, list):
+        return _failed(_slow114, doc, baseuri, loadingOptions, docRoot, probe)
+    r = []
+    try:
+        for item in doc:
+            if isinstance(item, list):
+                r.extend(_trusted_parse78(item, baseuri, loadingOptions, probe=True))
+                continue
+            if isinstance(item, dict) and ('$import' in item or '$include' in item):
+                return _slow114(doc, baseuri, loadingOptions, docRoot)
+            lf = _trusted_parse77(item, baseuri, loadingOptions, probe=True)
+            if isinstance(lf, list):
+                r.extend(lf)
+            else:
+                r.append(lf)
+    except ValidationException:
+        return _failed(_slow114, doc, baseuri, loadingOptions, docRoot, probe)
+    return r
+
+def _trusted_parse77(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc is None:
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, bool):
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, int):
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, float):
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, str):
+        if (isinstance(doc, str) and doc in _symbols102):
+            return doc
+        if isinstance(doc, _type8):
+            return doc
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, list):
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    elif isinstance(doc, dict):
+        try:
+            return _parse9(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse10(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        try:
+            return _parse11(doc, baseuri, loadingOptions, docRoot, True)
+        except ValidationException:
+            pass
+        return _failed(_slow115, doc, baseuri, loadingOptions, docRoot, probe)
+    return _slow115(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse76(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow116, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse75(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, list):
+        doc = [expand_url(i, baseuri, loadingOptions, True, False, None) for i in doc]
+    elif isinstance(doc, str):
+        doc = expand_url(doc, baseuri, loadingOptions, True, False, None)
+    if True:
+        return doc
+    return _trusted_parse2(doc, baseuri, loadingOptions, probe=probe)
+
+def _trusted_parse74(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse213(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow117, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse213(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'StepInputExpressionRequirement':
+        return _failed(_StepInputExpressionRequirement119, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs118.issuperset(doc):
+        for k in doc:
+            if k not in _attrs118:
+                extension = True
+    self = _StepInputExpressionRequirement119.__new__(_StepInputExpressionRequirement119)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_StepInputExpressionRequirement119, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs118:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse73(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse214(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow120, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse214(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'MultipleInputFeatureRequirement':
+        return _failed(_MultipleInputFeatureRequirement122, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs121.issuperset(doc):
+        for k in doc:
+            if k not in _attrs121:
+                extension = True
+    self = _MultipleInputFeatureRequirement122.__new__(_MultipleInputFeatureRequirement122)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_MultipleInputFeatureRequirement122, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs121:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse72(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse215(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow123, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse215(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'ScatterFeatureRequirement':
+        return _failed(_ScatterFeatureRequirement125, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs124.issuperset(doc):
+        for k in doc:
+            if k not in _attrs124:
+                extension = True
+    self = _ScatterFeatureRequirement125.__new__(_ScatterFeatureRequirement125)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_ScatterFeatureRequirement125, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs124:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse71(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse216(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow126, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse216(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'SubworkflowFeatureRequirement':
+        return _failed(_SubworkflowFeatureRequirement128, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs127.issuperset(doc):
+        for k in doc:
+            if k not in _attrs127:
+                extension = True
+    self = _SubworkflowFeatureRequirement128.__new__(_SubworkflowFeatureRequirement128)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_SubworkflowFeatureRequirement128, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs127:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse70(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse217(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow129, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse217_fresh(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'Workflow':
+        return _failed(_Workflow131, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs130.issuperset(doc):
+        for k in doc:
+            if k not in _attrs130:
+                extension = True
+    self = _Workflow131.__new__(_Workflow131)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                self.id = '_:' + str(uuid.uuid4())
+        base = self.id
+        v = doc.get('inputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.inputs = load_field(v, _trusted495, base, loadingOptions)
+        else:
+            self.inputs = _trusted_parse134(v, base, loadingOptions, probe=True)
+        v = doc.get('outputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.outputs = load_field(v, _trusted567, base, loadingOptions)
+        else:
+            self.outputs = _trusted_parse206(v, base, loadingOptions, probe=True)
+        if 'requirements' in doc:
+            v = doc['requirements']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.requirements = load_field(v, _trusted501, base, loadingOptions)
+            else:
+                self.requirements = _trusted_parse140(v, base, loadingOptions, probe=True)
+        else:
+            self.requirements = None
+        if 'hints' in doc:
+            v = doc['hints']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.hints = load_field(v, _trusted504, base, loadingOptions)
+            else:
+                self.hints = _trusted_parse143(v, base, loadingOptions, probe=True)
+        else:
+            self.hints = None
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        if 'cwlVersion' in doc:
+            v = doc['cwlVersion']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, True, None)
+                if True:
+                    self.cwlVersion = v
+                else:
+                    self.cwlVersion = _trusted_parse144(v, base, loadingOptions, probe=True)
+            else:
+                self.cwlVersion = load_field(v, _trusted506, base, loadingOptions)
+        else:
+            self.cwlVersion = None
+        v = doc.get('steps')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.steps = load_field(v, _trusted570, base, loadingOptions)
+        else:
+            self.steps = _trusted_parse209(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_Workflow131, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs130:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse217(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if loadingOptions.reuse is None:
+        return _trusted_parse217_fresh(doc, baseuri, loadingOptions, docRoot, probe)
+    return loadingOptions.reuse.load(_trusted_parse217_fresh, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse69(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse218(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow140, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse218(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs141.issuperset(doc):
+        for k in doc:
+            if k not in _attrs141:
+                extension = True
+    self = _WorkflowStep142.__new__(_WorkflowStep142)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        v = doc.get('in')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.in_ = load_field(v, _trusted557, base, loadingOptions)
+        else:
+            self.in_ = _trusted_parse196(v, base, loadingOptions, probe=True)
+        v = doc.get('out')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.out = load_field(v, _trusted561, base, loadingOptions)
+        else:
+            self.out = _trusted_parse200(v, base, loadingOptions, probe=True)
+        if 'requirements' in doc:
+            v = doc['requirements']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.requirements = load_field(v, _trusted501, base, loadingOptions)
+            else:
+                self.requirements = _trusted_parse140(v, base, loadingOptions, probe=True)
+        else:
+            self.requirements = None
+        if 'hints' in doc:
+            v = doc['hints']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.hints = load_field(v, _trusted504, base, loadingOptions)
+            else:
+                self.hints = _trusted_parse143(v, base, loadingOptions, probe=True)
+        else:
+            self.hints = None
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('run')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.run = load_field(v, _trusted563, base, loadingOptions)
+        else:
+            self.run = _trusted_parse202(v, base, loadingOptions, probe=True)
+        if 'scatter' in doc:
+            v = doc['scatter']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.scatter = load_field(v, _trusted553, base, loadingOptions)
+            else:
+                self.scatter = _trusted_parse192(v, base, loadingOptions, probe=True)
+        else:
+            self.scatter = None
+        if 'scatterMethod' in doc:
+            v = doc['scatterMethod']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, True, None)
+                if True:
+                    self.scatterMethod = v
+                else:
+                    self.scatterMethod = _trusted_parse203(v, base, loadingOptions, probe=True)
+            else:
+                self.scatterMethod = load_field(v, _trusted565, base, loadingOptions)
+        else:
+            self.scatterMethod = None
+    except ValidationException:
+        return _failed(_WorkflowStep142, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs141:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse68(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow149, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse67(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse219(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow150, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse219(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs151.issuperset(doc):
+        for k in doc:
+            if k not in _attrs151:
+                extension = True
+    self = _WorkflowStepOutput152.__new__(_WorkflowStepOutput152)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+    except ValidationException:
+        return _failed(_WorkflowStepOutput152, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs151:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse66(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse220(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow153, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse220(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs154.issuperset(doc):
+        for k in doc:
+            if k not in _attrs154:
+                extension = True
+    self = _WorkflowStepInput155.__new__(_WorkflowStepInput155)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'source' in doc:
+            v = doc['source']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.source = load_field(v, _trusted555, base, loadingOptions)
+            else:
+                self.source = _trusted_parse194(v, base, loadingOptions, probe=True)
+        else:
+            self.source = None
+        if 'linkMerge' in doc:
+            v = doc['linkMerge']
+            if True:
+                self.linkMerge = v
+            else:
+                self.linkMerge = load_field(v, _trusted554, base, loadingOptions)
+        else:
+            self.linkMerge = None
+        if 'default' in doc:
+            v = doc['default']
+            if not isinstance(v, dict) and True:
+                self.default = v
+            else:
+                self.default = load_field(v, _trusted489, base, loadingOptions)
+        else:
+            self.default = None
+        if 'valueFrom' in doc:
+            v = doc['valueFrom']
+            if True:
+                self.valueFrom = v
+            else:
+                self.valueFrom = load_field(v, _trusted492, base, loadingOptions)
+        else:
+            self.valueFrom = None
+    except ValidationException:
+        return _failed(_WorkflowStepInput155, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs154:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse65(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow160(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse64(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse221(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow161, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse221(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs162.issuperset(doc):
+        for k in doc:
+            if k not in _attrs162:
+                extension = True
+    self = _WorkflowOutputParameter163.__new__(_WorkflowOutputParameter163)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _trusted466, base, loadingOptions)
+            else:
+                self.secondaryFiles = _trusted_parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if True:
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _trusted468, base, loadingOptions)
+            else:
+                self.doc = _trusted_parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.format = v
+                else:
+                    self.format = _trusted_parse131(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _trusted493, base, loadingOptions)
+        else:
+            self.format = None
+        if 'outputSource' in doc:
+            v = doc['outputSource']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputSource = load_field(v, _trusted553, base, loadingOptions)
+            else:
+                self.outputSource = _trusted_parse192(v, base, loadingOptions, probe=True)
+        else:
+            self.outputSource = None
+        if 'linkMerge' in doc:
+            v = doc['linkMerge']
+            if True:
+                self.linkMerge = v
+            else:
+                self.linkMerge = load_field(v, _trusted554, base, loadingOptions)
+        else:
+            self.linkMerge = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _trusted550, base, loadingOptions)
+            else:
+                self.type = _trusted_parse189(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_WorkflowOutputParameter163, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs162:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse63(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow170, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse62(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse222(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow171, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse222_fresh(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'ExpressionTool':
+        return _failed(_ExpressionTool173, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs172.issuperset(doc):
+        for k in doc:
+            if k not in _attrs172:
+                extension = True
+    self = _ExpressionTool173.__new__(_ExpressionTool173)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                self.id = '_:' + str(uuid.uuid4())
+        base = self.id
+        v = doc.get('inputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.inputs = load_field(v, _trusted495, base, loadingOptions)
+        else:
+            self.inputs = _trusted_parse134(v, base, loadingOptions, probe=True)
+        v = doc.get('outputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.outputs = load_field(v, _trusted552, base, loadingOptions)
+        else:
+            self.outputs = _trusted_parse191(v, base, loadingOptions, probe=True)
+        if 'requirements' in doc:
+            v = doc['requirements']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.requirements = load_field(v, _trusted501, base, loadingOptions)
+            else:
+                self.requirements = _trusted_parse140(v, base, loadingOptions, probe=True)
+        else:
+            self.requirements = None
+        if 'hints' in doc:
+            v = doc['hints']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.hints = load_field(v, _trusted504, base, loadingOptions)
+            else:
+                self.hints = _trusted_parse143(v, base, loadingOptions, probe=True)
+        else:
+            self.hints = None
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        if 'cwlVersion' in doc:
+            v = doc['cwlVersion']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, True, None)
+                if True:
+                    self.cwlVersion = v
+                else:
+                    self.cwlVersion = _trusted_parse144(v, base, loadingOptions, probe=True)
+            else:
+                self.cwlVersion = load_field(v, _trusted506, base, loadingOptions)
+        else:
+            self.cwlVersion = None
+        v = doc.get('expression')
+        if True:
+            self.expression = v
+        else:
+            self.expression = load_field(v, _trusted464, base, loadingOptions)
+    except ValidationException:
+        return _failed(_ExpressionTool173, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs172:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse222(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if loadingOptions.reuse is None:
+        return _trusted_parse222_fresh(doc, baseuri, loadingOptions, docRoot, probe)
+    return loadingOptions.reuse.load(_trusted_parse222_fresh, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse61(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse223(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow176, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse223(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs177.issuperset(doc):
+        for k in doc:
+            if k not in _attrs177:
+                extension = True
+    self = _ExpressionToolOutputParameter178.__new__(_ExpressionToolOutputParameter178)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _trusted466, base, loadingOptions)
+            else:
+                self.secondaryFiles = _trusted_parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if True:
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _trusted468, base, loadingOptions)
+            else:
+                self.doc = _trusted_parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.format = v
+                else:
+                    self.format = _trusted_parse131(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _trusted493, base, loadingOptions)
+        else:
+            self.format = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _trusted550, base, loadingOptions)
+            else:
+                self.type = _trusted_parse189(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_ExpressionToolOutputParameter178, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs177:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse60(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse224(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow179, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse224(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'ResourceRequirement':
+        return _failed(_ResourceRequirement181, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs180.issuperset(doc):
+        for k in doc:
+            if k not in _attrs180:
+                extension = True
+    self = _ResourceRequirement181.__new__(_ResourceRequirement181)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'coresMin' in doc:
+            v = doc['coresMin']
+            if True:
+                self.coresMin = v
+            else:
+                self.coresMin = load_field(v, _trusted548, base, loadingOptions)
+        else:
+            self.coresMin = None
+        if 'coresMax' in doc:
+            v = doc['coresMax']
+            if True:
+                self.coresMax = v
+            else:
+                self.coresMax = load_field(v, _trusted548, base, loadingOptions)
+        else:
+            self.coresMax = None
+        if 'ramMin' in doc:
+            v = doc['ramMin']
+            if True:
+                self.ramMin = v
+            else:
+                self.ramMin = load_field(v, _trusted548, base, loadingOptions)
+        else:
+            self.ramMin = None
+        if 'ramMax' in doc:
+            v = doc['ramMax']
+            if True:
+                self.ramMax = v
+            else:
+                self.ramMax = load_field(v, _trusted548, base, loadingOptions)
+        else:
+            self.ramMax = None
+        if 'tmpdirMin' in doc:
+            v = doc['tmpdirMin']
+            if True:
+                self.tmpdirMin = v
+            else:
+                self.tmpdirMin = load_field(v, _trusted548, base, loadingOptions)
+        else:
+            self.tmpdirMin = None
+        if 'tmpdirMax' in doc:
+            v = doc['tmpdirMax']
+            if True:
+                self.tmpdirMax = v
+            else:
+                self.tmpdirMax = load_field(v, _trusted548, base, loadingOptions)
+        else:
+            self.tmpdirMax = None
+        if 'outdirMin' in doc:
+            v = doc['outdirMin']
+            if True:
+                self.outdirMin = v
+            else:
+                self.outdirMin = load_field(v, _trusted548, base, loadingOptions)
+        else:
+            self.outdirMin = None
+        if 'outdirMax' in doc:
+            v = doc['outdirMax']
+            if True:
+                self.outdirMax = v
+            else:
+                self.outdirMax = load_field(v, _trusted548, base, loadingOptions)
+        else:
+            self.outdirMax = None
+    except ValidationException:
+        return _failed(_ResourceRequirement181, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs180:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse59(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse225(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow183, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse225(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'ShellCommandRequirement':
+        return _failed(_ShellCommandRequirement185, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs184.issuperset(doc):
+        for k in doc:
+            if k not in _attrs184:
+                extension = True
+    self = _ShellCommandRequirement185.__new__(_ShellCommandRequirement185)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        pass
+    except ValidationException:
+        return _failed(_ShellCommandRequirement185, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs184:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse58(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse226(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow186, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse226(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'EnvVarRequirement':
+        return _failed(_EnvVarRequirement188, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs187.issuperset(doc):
+        for k in doc:
+            if k not in _attrs187:
+                extension = True
+    self = _EnvVarRequirement188.__new__(_EnvVarRequirement188)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('envDef')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.envDef = load_field(v, _trusted547, base, loadingOptions)
+        else:
+            self.envDef = _trusted_parse186(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_EnvVarRequirement188, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs187:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse57(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse227(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow190, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse227(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'InitialWorkDirRequirement':
+        return _failed(_InitialWorkDirRequirement192, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs191.issuperset(doc):
+        for k in doc:
+            if k not in _attrs191:
+                extension = True
+    self = _InitialWorkDirRequirement192.__new__(_InitialWorkDirRequirement192)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('listing')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.listing = load_field(v, _trusted545, base, loadingOptions)
+        else:
+            self.listing = _trusted_parse184(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_InitialWorkDirRequirement192, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs191:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse56(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse228(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow194, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse228(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs195.issuperset(doc):
+        for k in doc:
+            if k not in _attrs195:
+                extension = True
+    self = _Dirent196.__new__(_Dirent196)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'entryname' in doc:
+            v = doc['entryname']
+            if True:
+                self.entryname = v
+            else:
+                self.entryname = load_field(v, _trusted492, base, loadingOptions)
+        else:
+            self.entryname = None
+        v = doc.get('entry')
+        if True:
+            self.entry = v
+        else:
+            self.entry = load_field(v, _trusted464, base, loadingOptions)
+        if 'writable' in doc:
+            v = doc['writable']
+            if True:
+                self.writable = v
+            else:
+                self.writable = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.writable = None
+    except ValidationException:
+        return _failed(_Dirent196, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs195:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse55(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse229(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow197, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse229(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs198.issuperset(doc):
+        for k in doc:
+            if k not in _attrs198:
+                extension = True
+    self = _SoftwarePackage199.__new__(_SoftwarePackage199)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('package')
+        if True:
+            self.package = v
+        else:
+            self.package = load_field(v, _trusted363, base, loadingOptions)
+        if 'version' in doc:
+            v = doc['version']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.version = load_field(v, _trusted508, base, loadingOptions)
+            else:
+                self.version = _trusted_parse147(v, base, loadingOptions, probe=True)
+        else:
+            self.version = None
+        if 'specs' in doc:
+            v = doc['specs']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.specs = load_field(v, _trusted508, base, loadingOptions)
+            else:
+                self.specs = _trusted_parse147(v, base, loadingOptions, probe=True)
+        else:
+            self.specs = None
+    except ValidationException:
+        return _failed(_SoftwarePackage199, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs198:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse54(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse230(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow202, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse230(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'SoftwareRequirement':
+        return _failed(_SoftwareRequirement204, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs203.issuperset(doc):
+        for k in doc:
+            if k not in _attrs203:
+                extension = True
+    self = _SoftwareRequirement204.__new__(_SoftwareRequirement204)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('packages')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.packages = load_field(v, _trusted542, base, loadingOptions)
+        else:
+            self.packages = _trusted_parse181(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_SoftwareRequirement204, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs203:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse53(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse231(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow206, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse231(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'DockerRequirement':
+        return _failed(_DockerRequirement208, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs207.issuperset(doc):
+        for k in doc:
+            if k not in _attrs207:
+                extension = True
+    self = _DockerRequirement208.__new__(_DockerRequirement208)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'dockerPull' in doc:
+            v = doc['dockerPull']
+            if True:
+                self.dockerPull = v
+            else:
+                self.dockerPull = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.dockerPull = None
+        if 'dockerLoad' in doc:
+            v = doc['dockerLoad']
+            if True:
+                self.dockerLoad = v
+            else:
+                self.dockerLoad = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.dockerLoad = None
+        if 'dockerFile' in doc:
+            v = doc['dockerFile']
+            if True:
+                self.dockerFile = v
+            else:
+                self.dockerFile = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.dockerFile = None
+        if 'dockerImport' in doc:
+            v = doc['dockerImport']
+            if True:
+                self.dockerImport = v
+            else:
+                self.dockerImport = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.dockerImport = None
+        if 'dockerImageId' in doc:
+            v = doc['dockerImageId']
+            if True:
+                self.dockerImageId = v
+            else:
+                self.dockerImageId = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.dockerImageId = None
+        if 'dockerOutputDirectory' in doc:
+            v = doc['dockerOutputDirectory']
+            if True:
+                self.dockerOutputDirectory = v
+            else:
+                self.dockerOutputDirectory = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.dockerOutputDirectory = None
+    except ValidationException:
+        return _failed(_DockerRequirement208, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs207:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse52(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse232(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow209, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse232_fresh(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'CommandLineTool':
+        return _failed(_CommandLineTool211, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs210.issuperset(doc):
+        for k in doc:
+            if k not in _attrs210:
+                extension = True
+    self = _CommandLineTool211.__new__(_CommandLineTool211)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                self.id = '_:' + str(uuid.uuid4())
+        base = self.id
+        v = doc.get('inputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.inputs = load_field(v, _trusted533, base, loadingOptions)
+        else:
+            self.inputs = _trusted_parse172(v, base, loadingOptions, probe=True)
+        v = doc.get('outputs')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.outputs = load_field(v, _trusted535, base, loadingOptions)
+        else:
+            self.outputs = _trusted_parse174(v, base, loadingOptions, probe=True)
+        if 'requirements' in doc:
+            v = doc['requirements']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.requirements = load_field(v, _trusted501, base, loadingOptions)
+            else:
+                self.requirements = _trusted_parse140(v, base, loadingOptions, probe=True)
+        else:
+            self.requirements = None
+        if 'hints' in doc:
+            v = doc['hints']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.hints = load_field(v, _trusted504, base, loadingOptions)
+            else:
+                self.hints = _trusted_parse143(v, base, loadingOptions, probe=True)
+        else:
+            self.hints = None
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        if 'cwlVersion' in doc:
+            v = doc['cwlVersion']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, True, None)
+                if True:
+                    self.cwlVersion = v
+                else:
+                    self.cwlVersion = _trusted_parse144(v, base, loadingOptions, probe=True)
+            else:
+                self.cwlVersion = load_field(v, _trusted506, base, loadingOptions)
+        else:
+            self.cwlVersion = None
+        if 'baseCommand' in doc:
+            v = doc['baseCommand']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.baseCommand = load_field(v, _trusted468, base, loadingOptions)
+            else:
+                self.baseCommand = _trusted_parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.baseCommand = None
+        if 'arguments' in doc:
+            v = doc['arguments']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.arguments = load_field(v, _trusted538, base, loadingOptions)
+            else:
+                self.arguments = _trusted_parse177(v, base, loadingOptions, probe=True)
+        else:
+            self.arguments = None
+        if 'stdin' in doc:
+            v = doc['stdin']
+            if True:
+                self.stdin = v
+            else:
+                self.stdin = load_field(v, _trusted492, base, loadingOptions)
+        else:
+            self.stdin = None
+        if 'stderr' in doc:
+            v = doc['stderr']
+            if True:
+                self.stderr = v
+            else:
+                self.stderr = load_field(v, _trusted492, base, loadingOptions)
+        else:
+            self.stderr = None
+        if 'stdout' in doc:
+            v = doc['stdout']
+            if True:
+                self.stdout = v
+            else:
+                self.stdout = load_field(v, _trusted492, base, loadingOptions)
+        else:
+            self.stdout = None
+        if 'successCodes' in doc:
+            v = doc['successCodes']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.successCodes = load_field(v, _trusted540, base, loadingOptions)
+            else:
+                self.successCodes = _trusted_parse179(v, base, loadingOptions, probe=True)
+        else:
+            self.successCodes = None
+        if 'temporaryFailCodes' in doc:
+            v = doc['temporaryFailCodes']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.temporaryFailCodes = load_field(v, _trusted540, base, loadingOptions)
+            else:
+                self.temporaryFailCodes = _trusted_parse179(v, base, loadingOptions, probe=True)
+        else:
+            self.temporaryFailCodes = None
+        if 'permanentFailCodes' in doc:
+            v = doc['permanentFailCodes']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.permanentFailCodes = load_field(v, _trusted540, base, loadingOptions)
+            else:
+                self.permanentFailCodes = _trusted_parse179(v, base, loadingOptions, probe=True)
+        else:
+            self.permanentFailCodes = None
+    except ValidationException:
+        return _failed(_CommandLineTool211, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs210:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse232(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if loadingOptions.reuse is None:
+        return _trusted_parse232_fresh(doc, baseuri, loadingOptions, docRoot, probe)
+    return loadingOptions.reuse.load(_trusted_parse232_fresh, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse51(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow216, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse50(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow217, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse49(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse233(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow218, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse233(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs219.issuperset(doc):
+        for k in doc:
+            if k not in _attrs219:
+                extension = True
+    self = _CommandOutputParameter220.__new__(_CommandOutputParameter220)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _trusted466, base, loadingOptions)
+            else:
+                self.secondaryFiles = _trusted_parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if True:
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _trusted468, base, loadingOptions)
+            else:
+                self.doc = _trusted_parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.format = v
+                else:
+                    self.format = _trusted_parse131(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _trusted493, base, loadingOptions)
+        else:
+            self.format = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _trusted531, base, loadingOptions)
+            else:
+                self.type = _trusted_parse170(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_CommandOutputParameter220, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs219:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse48(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse234(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow222, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse234(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs223.issuperset(doc):
+        for k in doc:
+            if k not in _attrs223:
+                extension = True
+    self = _CommandInputParameter224.__new__(_CommandInputParameter224)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _trusted466, base, loadingOptions)
+            else:
+                self.secondaryFiles = _trusted_parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if True:
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _trusted468, base, loadingOptions)
+            else:
+                self.doc = _trusted_parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.format = load_field(v, _trusted488, base, loadingOptions)
+            else:
+                self.format = _trusted_parse127(v, base, loadingOptions, probe=True)
+        else:
+            self.format = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _trusted473, base, loadingOptions)
+            else:
+                self.inputBinding = _trusted_parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+        if 'default' in doc:
+            v = doc['default']
+            if not isinstance(v, dict) and True:
+                self.default = v
+            else:
+                self.default = load_field(v, _trusted489, base, loadingOptions)
+        else:
+            self.default = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _trusted529, base, loadingOptions)
+            else:
+                self.type = _trusted_parse168(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_CommandInputParameter224, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs223:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse47(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse235(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow228, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse235(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs229.issuperset(doc):
+        for k in doc:
+            if k not in _attrs229:
+                extension = True
+    self = _CommandOutputArraySchema230.__new__(_CommandOutputArraySchema230)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _trusted527, base, loadingOptions)
+        else:
+            self.items = _trusted_parse166(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted453, base, loadingOptions)
+        else:
+            self.type = _trusted_parse92(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_CommandOutputArraySchema230, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs229:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse46(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse236(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow233, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse236(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs234.issuperset(doc):
+        for k in doc:
+            if k not in _attrs234:
+                extension = True
+    self = _CommandOutputEnumSchema235.__new__(_CommandOutputEnumSchema235)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _trusted448, base, loadingOptions)
+        else:
+            self.symbols = _trusted_parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted450, base, loadingOptions)
+        else:
+            self.type = _trusted_parse89(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_CommandOutputEnumSchema235, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs234:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse45(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse237(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow238, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse237(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs239.issuperset(doc):
+        for k in doc:
+            if k not in _attrs239:
+                extension = True
+    self = _CommandOutputRecordSchema240.__new__(_CommandOutputRecordSchema240)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _trusted526, base, loadingOptions)
+            else:
+                self.fields = _trusted_parse165(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted446, base, loadingOptions)
+        else:
+            self.type = _trusted_parse85(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_CommandOutputRecordSchema240, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs239:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse44(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse238(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow243, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse238(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs244.issuperset(doc):
+        for k in doc:
+            if k not in _attrs244:
+                extension = True
+    self = _CommandOutputRecordField245.__new__(_CommandOutputRecordField245)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted523, base, loadingOptions)
+        else:
+            self.type = _trusted_parse162(v, base, loadingOptions, probe=True)
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_CommandOutputRecordField245, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs244:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse43(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse239(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow247, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse239(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs248.issuperset(doc):
+        for k in doc:
+            if k not in _attrs248:
+                extension = True
+    self = _CommandInputArraySchema249.__new__(_CommandInputArraySchema249)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _trusted519, base, loadingOptions)
+        else:
+            self.items = _trusted_parse158(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted453, base, loadingOptions)
+        else:
+            self.type = _trusted_parse92(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _trusted473, base, loadingOptions)
+            else:
+                self.inputBinding = _trusted_parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+    except ValidationException:
+        return _failed(_CommandInputArraySchema249, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs248:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse42(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse240(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow251, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse240(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs252.issuperset(doc):
+        for k in doc:
+            if k not in _attrs252:
+                extension = True
+    self = _CommandInputEnumSchema253.__new__(_CommandInputEnumSchema253)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _trusted448, base, loadingOptions)
+        else:
+            self.symbols = _trusted_parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted450, base, loadingOptions)
+        else:
+            self.type = _trusted_parse89(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _trusted473, base, loadingOptions)
+            else:
+                self.inputBinding = _trusted_parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+    except ValidationException:
+        return _failed(_CommandInputEnumSchema253, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs252:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse41(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse241(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow254, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse241(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs255.issuperset(doc):
+        for k in doc:
+            if k not in _attrs255:
+                extension = True
+    self = _CommandInputRecordSchema256.__new__(_CommandInputRecordSchema256)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _trusted518, base, loadingOptions)
+            else:
+                self.fields = _trusted_parse157(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted446, base, loadingOptions)
+        else:
+            self.type = _trusted_parse85(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_CommandInputRecordSchema256, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs255:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse40(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse242(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow258, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse242(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs259.issuperset(doc):
+        for k in doc:
+            if k not in _attrs259:
+                extension = True
+    self = _CommandInputRecordField260.__new__(_CommandInputRecordField260)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted515, base, loadingOptions)
+        else:
+            self.type = _trusted_parse154(v, base, loadingOptions, probe=True)
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _trusted473, base, loadingOptions)
+            else:
+                self.inputBinding = _trusted_parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_CommandInputRecordField260, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs259:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse39(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse243(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow262, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse243(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs263.issuperset(doc):
+        for k in doc:
+            if k not in _attrs263:
+                extension = True
+    self = _CommandOutputBinding264.__new__(_CommandOutputBinding264)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'glob' in doc:
+            v = doc['glob']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.glob = load_field(v, _trusted511, base, loadingOptions)
+            else:
+                self.glob = _trusted_parse150(v, base, loadingOptions, probe=True)
+        else:
+            self.glob = None
+        if 'loadContents' in doc:
+            v = doc['loadContents']
+            if True:
+                self.loadContents = v
+            else:
+                self.loadContents = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.loadContents = None
+        if 'outputEval' in doc:
+            v = doc['outputEval']
+            if True:
+                self.outputEval = v
+            else:
+                self.outputEval = load_field(v, _trusted492, base, loadingOptions)
+        else:
+            self.outputEval = None
+    except ValidationException:
+        return _failed(_CommandOutputBinding264, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs263:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse38(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse244(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow266, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse244(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs267.issuperset(doc):
+        for k in doc:
+            if k not in _attrs267:
+                extension = True
+    self = _CommandLineBinding268.__new__(_CommandLineBinding268)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'loadContents' in doc:
+            v = doc['loadContents']
+            if True:
+                self.loadContents = v
+            else:
+                self.loadContents = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.loadContents = None
+        if 'position' in doc:
+            v = doc['position']
+            if True:
+                self.position = v
+            else:
+                self.position = load_field(v, _trusted457, base, loadingOptions)
+        else:
+            self.position = None
+        if 'prefix' in doc:
+            v = doc['prefix']
+            if True:
+                self.prefix = v
+            else:
+                self.prefix = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.prefix = None
+        if 'separate' in doc:
+            v = doc['separate']
+            if True:
+                self.separate = v
+            else:
+                self.separate = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.separate = None
+        if 'itemSeparator' in doc:
+            v = doc['itemSeparator']
+            if True:
+                self.itemSeparator = v
+            else:
+                self.itemSeparator = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.itemSeparator = None
+        if 'valueFrom' in doc:
+            v = doc['valueFrom']
+            if True:
+                self.valueFrom = v
+            else:
+                self.valueFrom = load_field(v, _trusted492, base, loadingOptions)
+        else:
+            self.valueFrom = None
+        if 'shellQuote' in doc:
+            v = doc['shellQuote']
+            if True:
+                self.shellQuote = v
+            else:
+                self.shellQuote = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.shellQuote = None
+    except ValidationException:
+        return _failed(_CommandLineBinding268, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs267:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse37(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse245(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow270, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse245(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs271.issuperset(doc):
+        for k in doc:
+            if k not in _attrs271:
+                extension = True
+    self = _EnvironmentDef272.__new__(_EnvironmentDef272)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('envName')
+        if True:
+            self.envName = v
+        else:
+            self.envName = load_field(v, _trusted363, base, loadingOptions)
+        v = doc.get('envValue')
+        if True:
+            self.envValue = v
+        else:
+            self.envValue = load_field(v, _trusted464, base, loadingOptions)
+    except ValidationException:
+        return _failed(_EnvironmentDef272, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs271:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse36(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse246(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow273, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse246(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'SchemaDefRequirement':
+        return _failed(_SchemaDefRequirement275, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs274.issuperset(doc):
+        for k in doc:
+            if k not in _attrs274:
+                extension = True
+    self = _SchemaDefRequirement275.__new__(_SchemaDefRequirement275)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('types')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.types = load_field(v, _trusted510, base, loadingOptions)
+        else:
+            self.types = _trusted_parse149(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_SchemaDefRequirement275, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs274:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse35(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse247(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow277, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse247(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'InlineJavascriptRequirement':
+        return _failed(_InlineJavascriptRequirement279, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs278.issuperset(doc):
+        for k in doc:
+            if k not in _attrs278:
+                extension = True
+    self = _InlineJavascriptRequirement279.__new__(_InlineJavascriptRequirement279)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'expressionLib' in doc:
+            v = doc['expressionLib']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.expressionLib = load_field(v, _trusted508, base, loadingOptions)
+            else:
+                self.expressionLib = _trusted_parse147(v, base, loadingOptions, probe=True)
+        else:
+            self.expressionLib = None
+    except ValidationException:
+        return _failed(_InlineJavascriptRequirement279, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs278:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse34(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow280(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse33(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow281(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse32(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse248(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow282, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse248(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs283.issuperset(doc):
+        for k in doc:
+            if k not in _attrs283:
+                extension = True
+    self = _OutputParameter284.__new__(_OutputParameter284)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _trusted466, base, loadingOptions)
+            else:
+                self.secondaryFiles = _trusted_parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if True:
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _trusted468, base, loadingOptions)
+            else:
+                self.doc = _trusted_parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.format = v
+                else:
+                    self.format = _trusted_parse131(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _trusted493, base, loadingOptions)
+        else:
+            self.format = None
+    except ValidationException:
+        return _failed(_OutputParameter284, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs283:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse31(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse249(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow285, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse249(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs286.issuperset(doc):
+        for k in doc:
+            if k not in _attrs286:
+                extension = True
+    self = _InputParameter287.__new__(_InputParameter287)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'id' in doc:
+            v = doc['id']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.id = v
+                else:
+                    self.id = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.id = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.id = None
+        if self.id is None:
+            if docRoot is not None:
+                self.id = docRoot
+            else:
+                raise ValidationException('Missing id')
+        base = self.id
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _trusted466, base, loadingOptions)
+            else:
+                self.secondaryFiles = _trusted_parse105(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'streamable' in doc:
+            v = doc['streamable']
+            if True:
+                self.streamable = v
+            else:
+                self.streamable = load_field(v, _trusted467, base, loadingOptions)
+        else:
+            self.streamable = None
+        if 'doc' in doc:
+            v = doc['doc']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.doc = load_field(v, _trusted468, base, loadingOptions)
+            else:
+                self.doc = _trusted_parse107(v, base, loadingOptions, probe=True)
+        else:
+            self.doc = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.format = load_field(v, _trusted488, base, loadingOptions)
+            else:
+                self.format = _trusted_parse127(v, base, loadingOptions, probe=True)
+        else:
+            self.format = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _trusted473, base, loadingOptions)
+            else:
+                self.inputBinding = _trusted_parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+        if 'default' in doc:
+            v = doc['default']
+            if not isinstance(v, dict) and True:
+                self.default = v
+            else:
+                self.default = load_field(v, _trusted489, base, loadingOptions)
+        else:
+            self.default = None
+        if 'type' in doc:
+            v = doc['type']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.type = load_field(v, _trusted491, base, loadingOptions)
+            else:
+                self.type = _trusted_parse130(v, base, loadingOptions, probe=True)
+        else:
+            self.type = None
+    except ValidationException:
+        return _failed(_InputParameter287, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs286:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse30(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse250(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow289, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse250(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs290.issuperset(doc):
+        for k in doc:
+            if k not in _attrs290:
+                extension = True
+    self = _OutputArraySchema291.__new__(_OutputArraySchema291)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _trusted486, base, loadingOptions)
+        else:
+            self.items = _trusted_parse125(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted453, base, loadingOptions)
+        else:
+            self.type = _trusted_parse92(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_OutputArraySchema291, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs290:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse29(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse251(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow293, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse251(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs294.issuperset(doc):
+        for k in doc:
+            if k not in _attrs294:
+                extension = True
+    self = _OutputEnumSchema295.__new__(_OutputEnumSchema295)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _trusted448, base, loadingOptions)
+        else:
+            self.symbols = _trusted_parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted450, base, loadingOptions)
+        else:
+            self.type = _trusted_parse89(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_OutputEnumSchema295, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs294:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse28(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse252(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow296, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse252(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs297.issuperset(doc):
+        for k in doc:
+            if k not in _attrs297:
+                extension = True
+    self = _OutputRecordSchema298.__new__(_OutputRecordSchema298)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _trusted485, base, loadingOptions)
+            else:
+                self.fields = _trusted_parse124(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted446, base, loadingOptions)
+        else:
+            self.type = _trusted_parse85(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_OutputRecordSchema298, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs297:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse27(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse253(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow300, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse253(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs301.issuperset(doc):
+        for k in doc:
+            if k not in _attrs301:
+                extension = True
+    self = _OutputRecordField302.__new__(_OutputRecordField302)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted481, base, loadingOptions)
+        else:
+            self.type = _trusted_parse120(v, base, loadingOptions, probe=True)
+        if 'outputBinding' in doc:
+            v = doc['outputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.outputBinding = load_field(v, _trusted482, base, loadingOptions)
+            else:
+                self.outputBinding = _trusted_parse121(v, base, loadingOptions, probe=True)
+        else:
+            self.outputBinding = None
+    except ValidationException:
+        return _failed(_OutputRecordField302, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs301:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse26(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse254(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow304, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse254(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs305.issuperset(doc):
+        for k in doc:
+            if k not in _attrs305:
+                extension = True
+    self = _InputArraySchema306.__new__(_InputArraySchema306)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _trusted477, base, loadingOptions)
+        else:
+            self.items = _trusted_parse116(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted453, base, loadingOptions)
+        else:
+            self.type = _trusted_parse92(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _trusted473, base, loadingOptions)
+            else:
+                self.inputBinding = _trusted_parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+    except ValidationException:
+        return _failed(_InputArraySchema306, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs305:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse25(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse255(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow308, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse255(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs309.issuperset(doc):
+        for k in doc:
+            if k not in _attrs309:
+                extension = True
+    self = _InputEnumSchema310.__new__(_InputEnumSchema310)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _trusted448, base, loadingOptions)
+        else:
+            self.symbols = _trusted_parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted450, base, loadingOptions)
+        else:
+            self.type = _trusted_parse89(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _trusted473, base, loadingOptions)
+            else:
+                self.inputBinding = _trusted_parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+    except ValidationException:
+        return _failed(_InputEnumSchema310, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs309:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse24(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse256(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow311, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse256(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs312.issuperset(doc):
+        for k in doc:
+            if k not in _attrs312:
+                extension = True
+    self = _InputRecordSchema313.__new__(_InputRecordSchema313)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                self.name = '_:' + str(uuid.uuid4())
+        base = self.name
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _trusted476, base, loadingOptions)
+            else:
+                self.fields = _trusted_parse115(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted446, base, loadingOptions)
+        else:
+            self.type = _trusted_parse85(v, base, loadingOptions, probe=True)
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_InputRecordSchema313, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs312:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse23(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse257(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow315, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse257(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs316.issuperset(doc):
+        for k in doc:
+            if k not in _attrs316:
+                extension = True
+    self = _InputRecordField317.__new__(_InputRecordField317)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted472, base, loadingOptions)
+        else:
+            self.type = _trusted_parse111(v, base, loadingOptions, probe=True)
+        if 'inputBinding' in doc:
+            v = doc['inputBinding']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.inputBinding = load_field(v, _trusted473, base, loadingOptions)
+            else:
+                self.inputBinding = _trusted_parse112(v, base, loadingOptions, probe=True)
+        else:
+            self.inputBinding = None
+        if 'label' in doc:
+            v = doc['label']
+            if True:
+                self.label = v
+            else:
+                self.label = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.label = None
+    except ValidationException:
+        return _failed(_InputRecordField317, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs316:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse22(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow319(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse21(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow320(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse20(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow321(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse19(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow322(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse18(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow323, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse17(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow324(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse16(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    return _slow325(doc, baseuri, loadingOptions, docRoot)
+
+def _trusted_parse15(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse258(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow326, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse258(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'Directory':
+        return _failed(_Directory328, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs327.issuperset(doc):
+        for k in doc:
+            if k not in _attrs327:
+                extension = True
+    self = _Directory328.__new__(_Directory328)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'location' in doc:
+            v = doc['location']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, False, None)
+                if True:
+                    self.location = v
+                else:
+                    self.location = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.location = load_field(v, _trusted456, base, loadingOptions)
+        else:
+            self.location = None
+        if 'path' in doc:
+            v = doc['path']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, False, None)
+                if True:
+                    self.path = v
+                else:
+                    self.path = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.path = load_field(v, _trusted456, base, loadingOptions)
+        else:
+            self.path = None
+        if 'basename' in doc:
+            v = doc['basename']
+            if True:
+                self.basename = v
+            else:
+                self.basename = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.basename = None
+        if 'listing' in doc:
+            v = doc['listing']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.listing = load_field(v, _trusted460, base, loadingOptions)
+            else:
+                self.listing = _trusted_parse99(v, base, loadingOptions, probe=True)
+        else:
+            self.listing = None
+    except ValidationException:
+        return _failed(_Directory328, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs327:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse14(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse259(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow331, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse259(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if doc.get('class') != 'File':
+        return _failed(_File333, doc, baseuri, loadingOptions, docRoot, probe)
+    extension = False
+    if not _attrs332.issuperset(doc):
+        for k in doc:
+            if k not in _attrs332:
+                extension = True
+    self = _File333.__new__(_File333)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'location' in doc:
+            v = doc['location']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, False, None)
+                if True:
+                    self.location = v
+                else:
+                    self.location = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.location = load_field(v, _trusted456, base, loadingOptions)
+        else:
+            self.location = None
+        if 'path' in doc:
+            v = doc['path']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, False, False, None)
+                if True:
+                    self.path = v
+                else:
+                    self.path = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.path = load_field(v, _trusted456, base, loadingOptions)
+        else:
+            self.path = None
+        if 'basename' in doc:
+            v = doc['basename']
+            if True:
+                self.basename = v
+            else:
+                self.basename = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.basename = None
+        if 'dirname' in doc:
+            v = doc['dirname']
+            if True:
+                self.dirname = v
+            else:
+                self.dirname = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.dirname = None
+        if 'nameroot' in doc:
+            v = doc['nameroot']
+            if True:
+                self.nameroot = v
+            else:
+                self.nameroot = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.nameroot = None
+        if 'nameext' in doc:
+            v = doc['nameext']
+            if True:
+                self.nameext = v
+            else:
+                self.nameext = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.nameext = None
+        if 'checksum' in doc:
+            v = doc['checksum']
+            if True:
+                self.checksum = v
+            else:
+                self.checksum = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.checksum = None
+        if 'size' in doc:
+            v = doc['size']
+            if True:
+                self.size = v
+            else:
+                self.size = load_field(v, _trusted457, base, loadingOptions)
+        else:
+            self.size = None
+        if 'secondaryFiles' in doc:
+            v = doc['secondaryFiles']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.secondaryFiles = load_field(v, _trusted460, base, loadingOptions)
+            else:
+                self.secondaryFiles = _trusted_parse99(v, base, loadingOptions, probe=True)
+        else:
+            self.secondaryFiles = None
+        if 'format' in doc:
+            v = doc['format']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.format = v
+                else:
+                    self.format = _trusted_parse76(v, base, loadingOptions, probe=True)
+            else:
+                self.format = load_field(v, _trusted461, base, loadingOptions)
+        else:
+            self.format = None
+        if 'contents' in doc:
+            v = doc['contents']
+            if True:
+                self.contents = v
+            else:
+                self.contents = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.contents = None
+    except ValidationException:
+        return _failed(_File333, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs332:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse13(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow334, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse12(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow335, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse11(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse260(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow336, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse260(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs337.issuperset(doc):
+        for k in doc:
+            if k not in _attrs337:
+                extension = True
+    self = _ArraySchema338.__new__(_ArraySchema338)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('items')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.items = load_field(v, _trusted451, base, loadingOptions)
+        else:
+            self.items = _trusted_parse90(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted453, base, loadingOptions)
+        else:
+            self.type = _trusted_parse92(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_ArraySchema338, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs337:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse10(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse261(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow340, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse261(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs341.issuperset(doc):
+        for k in doc:
+            if k not in _attrs341:
+                extension = True
+    self = _EnumSchema342.__new__(_EnumSchema342)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        v = doc.get('symbols')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.symbols = load_field(v, _trusted448, base, loadingOptions)
+        else:
+            self.symbols = _trusted_parse87(v, base, loadingOptions, probe=True)
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted450, base, loadingOptions)
+        else:
+            self.type = _trusted_parse89(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_EnumSchema342, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs341:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse9(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse262(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow343, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse262(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs344.issuperset(doc):
+        for k in doc:
+            if k not in _attrs344:
+                extension = True
+    self = _RecordSchema345.__new__(_RecordSchema345)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'fields' in doc:
+            v = doc['fields']
+            if isinstance(v, dict) and ('$import' in v or '$include' in v):
+                self.fields = load_field(v, _trusted444, base, loadingOptions)
+            else:
+                self.fields = _trusted_parse83(v, base, loadingOptions, probe=True)
+        else:
+            self.fields = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted446, base, loadingOptions)
+        else:
+            self.type = _trusted_parse85(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_RecordSchema345, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs344:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse8(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if isinstance(doc, dict):
+        return _trusted_parse263(doc, baseuri, loadingOptions, docRoot, probe)
+    return _failed(_slow347, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse263(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    extension = False
+    if not _attrs348.issuperset(doc):
+        for k in doc:
+            if k not in _attrs348:
+                extension = True
+    self = _RecordField349.__new__(_RecordField349)
+    self.loadingOptions = loadingOptions
+    base = baseuri
+    try:
+        if 'name' in doc:
+            v = doc['name']
+            if isinstance(v, str):
+                v = expand_url(v, base, loadingOptions, True, False, None)
+                if True:
+                    self.name = v
+                else:
+                    self.name = _trusted_parse2(v, base, loadingOptions, probe=True)
+            else:
+                self.name = load_field(v, _trusted436, base, loadingOptions)
+        else:
+            self.name = None
+        if self.name is None:
+            if docRoot is not None:
+                self.name = docRoot
+            else:
+                raise ValidationException('Missing name')
+        base = self.name
+        if 'doc' in doc:
+            v = doc['doc']
+            if True:
+                self.doc = v
+            else:
+                self.doc = load_field(v, _trusted437, base, loadingOptions)
+        else:
+            self.doc = None
+        v = doc.get('type')
+        if isinstance(v, dict) and ('$import' in v or '$include' in v):
+            self.type = load_field(v, _trusted441, base, loadingOptions)
+        else:
+            self.type = _trusted_parse80(v, base, loadingOptions, probe=True)
+    except ValidationException:
+        return _failed(_RecordField349, doc, baseuri, loadingOptions, docRoot, probe)
+    self.extension_fields = _no_extension_fields
+    if extension:
+        self.extension_fields = {}
+        for k in doc:
+            if k not in _attrs348:
+                self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]
+    return self
+
+def _trusted_parse7(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow352, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse6(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow353, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse5(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow354, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse4(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow356, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse3(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow357, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse2(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow358, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse1(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow359, doc, baseuri, loadingOptions, docRoot, probe)
+
+def _trusted_parse0(doc, baseuri, loadingOptions, docRoot=None, probe=False):
+    if True:
+        return doc
+    return _failed(_slow360, doc, baseuri, loadingOptions, docRoot, probe)
+
+# Each module level loader that has a parser, and the parser
+parsers = [
+    (m.inttype, _parse0),
+    (m.booltype, _parse1),
+    (m.strtype, _parse2),
+    (m.Any_type, _parse3),
+    (m.floattype, _parse4),
+    (m.None_type, _parse5),
+    (m.PrimitiveTypeLoader, _parse6),
+    (m.AnyLoader, _parse7),
+    (m.RecordFieldLoader, _parse8),
+    (m.RecordSchemaLoader, _parse9),
+    (m.EnumSchemaLoader, _parse10),
+    (m.ArraySchemaLoader, _parse11),
+    (m.CWLVersionLoader, _parse12),
+    (m.CWLTypeLoader, _parse13),
+    (m.FileLoader, _parse14),
+    (m.DirectoryLoader, _parse15),
+    (m.SchemaBaseLoader, _parse16),
+    (m.ParameterLoader, _parse17),
+    (m.ExpressionLoader, _parse18),
+    (m.InputBindingLoader, _parse19),
+    (m.OutputBindingLoader, _parse20),
+    (m.InputSchemaLoader, _parse21),
+    (m.OutputSchemaLoader, _parse22),
+    (m.InputRecordFieldLoader, _parse23),
+    (m.InputRecordSchemaLoader, _parse24),
+    (m.InputEnumSchemaLoader, _parse25),
+    (m.InputArraySchemaLoader, _parse26),
+    (m.OutputRecordFieldLoader, _parse27),
+    (m.OutputRecordSchemaLoader, _parse28),
+    (m.OutputEnumSchemaLoader, _parse29),
+    (m.OutputArraySchemaLoader, _parse30),
+    (m.InputParameterLoader, _parse31),
+    (m.OutputParameterLoader, _parse32),
+    (m.ProcessRequirementLoader, _parse33),
+    (m.ProcessLoader, _parse34),
+    (m.InlineJavascriptRequirementLoader, _parse35),
+    (m.SchemaDefRequirementLoader, _parse36),
+    (m.EnvironmentDefLoader, _parse37),
+    (m.CommandLineBindingLoader, _parse38),
+    (m.CommandOutputBindingLoader, _parse39),
+    (m.CommandInputRecordFieldLoader, _parse40),
+    (m.CommandInputRecordSchemaLoader, _parse41),
+    (m.CommandInputEnumSchemaLoader, _parse42),
+    (m.CommandInputArraySchemaLoader, _parse43),
+    (m.CommandOutputRecordFieldLoader, _parse44),
+    (m.CommandOutputRecordSchemaLoader, _parse45),
+    (m.CommandOutputEnumSchemaLoader, _parse46),
+    (m.CommandOutputArraySchemaLoader, _parse47),
+    (m.CommandInputParameterLoader, _parse48),
+    (m.CommandOutputParameterLoader, _parse49),
+    (m.stdoutLoader, _parse50),
+    (m.stderrLoader, _parse51),
+    (m.CommandLineToolLoader, _parse52),
+    (m.DockerRequirementLoader, _parse53),
+    (m.SoftwareRequirementLoader, _parse54),
+    (m.SoftwarePackageLoader, _parse55),
+    (m.DirentLoader, _parse56),
+    (m.InitialWorkDirRequirementLoader, _parse57),
+    (m.EnvVarRequirementLoader, _parse58),
+    (m.ShellCommandRequirementLoader, _parse59),
+    (m.ResourceRequirementLoader, _parse60),
+    (m.ExpressionToolOutputParameterLoader, _parse61),
+    (m.ExpressionToolLoader, _parse62),
+    (m.LinkMergeMethodLoader, _parse63),
+    (m.WorkflowOutputParameterLoader, _parse64),
+    (m.SinkLoader, _parse65),
+    (m.WorkflowStepInputLoader, _parse66),
+    (m.WorkflowStepOutputLoader, _parse67),
+    (m.ScatterMethodLoader, _parse68),
+    (m.WorkflowStepLoader, _parse69),
+    (m.WorkflowLoader, _parse70),
+    (m.SubworkflowFeatureRequirementLoader, _parse71),
+    (m.ScatterFeatureRequirementLoader, _parse72),
+    (m.MultipleInputFeatureRequirementLoader, _parse73),
+    (m.StepInputExpressionRequirementLoader, _parse74),
+    (m.uri_strtype_True_False_None, _parse75),
+    (m.union_of_None_type_or_strtype, _parse76),
+    (m.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype, _parse77),
+    (m.array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype, _parse78),
+    (m.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype, _parse79),
+    (m.typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2, _parse80),
+    (m.array_of_RecordFieldLoader, _parse81),
+    (m.union_of_None_type_or_array_of_RecordFieldLoader, _parse82),
+    (m.idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader, _parse83),
+    (m.Record_symbolLoader, _parse84),
+    (m.typedsl_Record_symbolLoader_2, _parse85),
+    (m.array_of_strtype, _parse86),
+    (m.uri_array_of_strtype_True_False_None, _parse87),
+    (m.Enum_symbolLoader, _parse88),
+    (m.typedsl_Enum_symbolLoader_2, _parse89),
+    (m.uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2, _parse90),
+    (m.Array_symbolLoader, _parse91),
+    (m.typedsl_Array_symbolLoader_2, _parse92),
+    (m.File_classLoader, _parse93),
+    (m.uri_File_classLoader_False_True_None, _parse94),
+    (m.uri_union_of_None_type_or_strtype_False_False_None, _parse95),
+    (m.union_of_None_type_or_inttype, _parse96),
+    (m.union_of_FileLoader_or_DirectoryLoader, _parse97),
+    (m.array_of_union_of_FileLoader_or_DirectoryLoader, _parse98),
+    (m.union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader, _parse99),
+    (m.uri_union_of_None_type_or_strtype_True_False_None, _parse100),
+    (m.Directory_classLoader, _parse101),
+    (m.uri_Directory_classLoader_False_True_None, _parse102),
+    (m.union_of_strtype_or_ExpressionLoader, _parse103),
+    (m.array_of_union_of_strtype_or_ExpressionLoader, _parse104),
+    (m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, _parse105),
+    (m.union_of_None_type_or_booltype, _parse106),
+    (m.union_of_None_type_or_strtype_or_array_of_strtype, _parse107),
+    (m.union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype, _parse108),
+    (m.array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype, _parse109),
+    (m.union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype, _parse110),
+    (m.typedsl_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2, _parse111),
+    (m.union_of_None_type_or_CommandLineBindingLoader, _parse112),
+    (m.array_of_InputRecordFieldLoader, _parse113),
+    (m.union_of_None_type_or_array_of_InputRecordFieldLoader, _parse114),
+    (m.idmap_fields_union_of_None_type_or_array_of_InputRecordFieldLoader, _parse115),
+    (m.uri_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_False_True_2, _parse116),
+    (m.union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype, _parse117),
+    (m.array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype, _parse118),
+    (m.union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype, _parse119),
+    (m.typedsl_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, _parse120),
+    (m.union_of_None_type_or_CommandOutputBindingLoader, _parse121),
+    (m.array_of_OutputRecordFieldLoader, _parse122),
+    (m.union_of_None_type_or_array_of_OutputRecordFieldLoader, _parse123),
+    (m.idmap_fields_union_of_None_type_or_array_of_OutputRecordFieldLoader, _parse124),
+    (m.uri_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_False_True_2, _parse125),
+    (m.union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader, _parse126),
+    (m.uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None, _parse127),
+    (m.union_of_None_type_or_Any_type, _parse128),
+    (m.union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype, _parse129),
+    (m.typedsl_union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2, _parse130),
+    (m.union_of_None_type_or_strtype_or_ExpressionLoader, _parse131),
+    (m.uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, _parse132),
+    (m.array_of_InputParameterLoader, _parse133),
+    (m.idmap_inputs_array_of_InputParameterLoader, _parse134),
+    (m.array_of_OutputParameterLoader, _parse135),
+    (m.idmap_outputs_array_of_OutputParameterLoader, _parse136),
+    (m.union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, _parse137),
+    (m.array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, _parse138),
+    (m.union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, _parse139),
+    (m.idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, _parse140),
+    (m.array_of_Any_type, _parse141),
+    (m.union_of_None_type_or_array_of_Any_type, _parse142),
+    (m.idmap_hints_union_of_None_type_or_array_of_Any_type, _parse143),
+    (m.union_of_None_type_or_CWLVersionLoader, _parse144),
+    (m.uri_union_of_None_type_or_CWLVersionLoader_False_True_None, _parse145),
+    (m.uri_strtype_False_True_None, _parse146),
+    (m.union_of_None_type_or_array_of_strtype, _parse147),
+    (m.union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader, _parse148),
+    (m.array_of_union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader, _parse149),
+    (m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_strtype, _parse150),
+    (m.union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype, _parse151),
+    (m.array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype, _parse152),
+    (m.union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype, _parse153),
+    (m.typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2, _parse154),
+    (m.array_of_CommandInputRecordFieldLoader, _parse155),
+    (m.union_of_None_type_or_array_of_CommandInputRecordFieldLoader, _parse156),
+    (m.idmap_fields_union_of_None_type_or_array_of_CommandInputRecordFieldLoader, _parse157),
+    (m.uri_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_False_True_2, _parse158),
+    (m.union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype, _parse159),
+    (m.array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype, _parse160),
+    (m.union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype, _parse161),
+    (m.typedsl_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2, _parse162),
+    (m.array_of_CommandOutputRecordFieldLoader, _parse163),
+    (m.union_of_None_type_or_array_of_CommandOutputRecordFieldLoader, _parse164),
+    (m.idmap_fields_union_of_None_type_or_array_of_CommandOutputRecordFieldLoader, _parse165),
+    (m.uri_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_False_True_2, _parse166),
+    (m.union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype, _parse167),
+    (m.typedsl_union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2, _parse168),
+    (m.union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype, _parse169),
+    (m.typedsl_union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2, _parse170),
+    (m.array_of_CommandInputParameterLoader, _parse171),
+    (m.idmap_inputs_array_of_CommandInputParameterLoader, _parse172),
+    (m.array_of_CommandOutputParameterLoader, _parse173),
+    (m.idmap_outputs_array_of_CommandOutputParameterLoader, _parse174),
+    (m.union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader, _parse175),
+    (m.array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader, _parse176),
+    (m.union_of_None_type_or_array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader, _parse177),
+    (m.array_of_inttype, _parse178),
+    (m.union_of_None_type_or_array_of_inttype, _parse179),
+    (m.array_of_SoftwarePackageLoader, _parse180),
+    (m.idmap_packages_array_of_SoftwarePackageLoader, _parse181),
+    (m.union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader, _parse182),
+    (m.array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader, _parse183),
+    (m.union_of_array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader_or_strtype_or_ExpressionLoader, _parse184),
+    (m.array_of_EnvironmentDefLoader, _parse185),
+    (m.idmap_envDef_array_of_EnvironmentDefLoader, _parse186),
+    (m.union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, _parse187),
+    (m.union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype, _parse188),
+    (m.typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, _parse189),
+    (m.array_of_ExpressionToolOutputParameterLoader, _parse190),
+    (m.idmap_outputs_array_of_ExpressionToolOutputParameterLoader, _parse191),
+    (m.uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0, _parse192),
+    (m.union_of_None_type_or_LinkMergeMethodLoader, _parse193),
+    (m.uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_2, _parse194),
+    (m.array_of_WorkflowStepInputLoader, _parse195),
+    (m.idmap_in__array_of_WorkflowStepInputLoader, _parse196),
+    (m.union_of_strtype_or_WorkflowStepOutputLoader, _parse197),
+    (m.array_of_union_of_strtype_or_WorkflowStepOutputLoader, _parse198),
+    (m.union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader, _parse199),
+    (m.uri_union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader_True_False_None, _parse200),
+    (m.union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, _parse201),
+    (m.uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None, _parse202),
+    (m.union_of_None_type_or_ScatterMethodLoader, _parse203),
+    (m.uri_union_of_None_type_or_ScatterMethodLoader_False_True_None, _parse204),
+    (m.array_of_WorkflowOutputParameterLoader, _parse205),
+    (m.idmap_outputs_array_of_WorkflowOutputParameterLoader, _parse206),
+    (m.array_of_WorkflowStepLoader, _parse207),
+    (m.union_of_array_of_WorkflowStepLoader, _parse208),
+    (m.idmap_steps_union_of_array_of_WorkflowStepLoader, _parse209),
+    (m.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, _parse210),
+    (m.array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, _parse211),
+    (m.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, _parse212),
+]
+
+# Each module level loader, the loader to use in its place when validation is
+# off, and that loader's parser if it has one
+trusted_loaders = [
+    (m.inttype, _trusted361, _trusted_parse0),
+    (m.booltype, _trusted362, _trusted_parse1),
+    (m.strtype, _trusted363, _trusted_parse2),
+    (m.Any_type, _trusted364, _trusted_parse3),
+    (m.floattype, _trusted365, _trusted_parse4),
+    (m.None_type, _trusted366, _trusted_parse5),
+    (m.PrimitiveTypeLoader, _trusted367, _trusted_parse6),
+    (m.AnyLoader, _trusted368, _trusted_parse7),
+    (m.RecordFieldLoader, _trusted369, _trusted_parse8),
+    (m.RecordSchemaLoader, _trusted370, _trusted_parse9),
+    (m.EnumSchemaLoader, _trusted371, _trusted_parse10),
+    (m.ArraySchemaLoader, _trusted372, _trusted_parse11),
+    (m.CWLVersionLoader, _trusted373, _trusted_parse12),
+    (m.CWLTypeLoader, _trusted374, _trusted_parse13),
+    (m.FileLoader, _trusted375, _trusted_parse14),
+    (m.DirectoryLoader, _trusted376, _trusted_parse15),
+    (m.SchemaBaseLoader, _trusted377, _trusted_parse16),
+    (m.ParameterLoader, _trusted378, _trusted_parse17),
+    (m.ExpressionLoader, _trusted379, _trusted_parse18),
+    (m.InputBindingLoader, _trusted380, _trusted_parse19),
+    (m.OutputBindingLoader, _trusted381, _trusted_parse20),
+    (m.InputSchemaLoader, _trusted382, _trusted_parse21),
+    (m.OutputSchemaLoader, _trusted383, _trusted_parse22),
+    (m.InputRecordFieldLoader, _trusted384, _trusted_parse23),
+    (m.InputRecordSchemaLoader, _trusted385, _trusted_parse24),
+    (m.InputEnumSchemaLoader, _trusted386, _trusted_parse25),
+    (m.InputArraySchemaLoader, _trusted387, _trusted_parse26),
+    (m.OutputRecordFieldLoader, _trusted388, _trusted_parse27),
+    (m.OutputRecordSchemaLoader, _trusted389, _trusted_parse28),
+    (m.OutputEnumSchemaLoader, _trusted390, _trusted_parse29),
+    (m.OutputArraySchemaLoader, _trusted391, _trusted_parse30),
+    (m.InputParameterLoader, _trusted392, _trusted_parse31),
+    (m.OutputParameterLoader, _trusted393, _trusted_parse32),
+    (m.ProcessRequirementLoader, _trusted394, _trusted_parse33),
+    (m.ProcessLoader, _trusted395, _trusted_parse34),
+    (m.InlineJavascriptRequirementLoader, _trusted396, _trusted_parse35),
+    (m.SchemaDefRequirementLoader, _trusted397, _trusted_parse36),
+    (m.EnvironmentDefLoader, _trusted398, _trusted_parse37),
+    (m.CommandLineBindingLoader, _trusted399, _trusted_parse38),
+    (m.CommandOutputBindingLoader, _trusted400, _trusted_parse39),
+    (m.CommandInputRecordFieldLoader, _trusted401, _trusted_parse40),
+    (m.CommandInputRecordSchemaLoader, _trusted402, _trusted_parse41),
+    (m.CommandInputEnumSchemaLoader, _trusted403, _trusted_parse42),
+    (m.CommandInputArraySchemaLoader, _trusted404, _trusted_parse43),
+    (m.CommandOutputRecordFieldLoader, _trusted405, _trusted_parse44),
+    (m.CommandOutputRecordSchemaLoader, _trusted406, _trusted_parse45),
+    (m.CommandOutputEnumSchemaLoader, _trusted407, _trusted_parse46),
+    (m.CommandOutputArraySchemaLoader, _trusted408, _trusted_parse47),
+    (m.CommandInputParameterLoader, _trusted409, _trusted_parse48),
+    (m.CommandOutputParameterLoader, _trusted410, _trusted_parse49),
+    (m.stdoutLoader, _trusted411, _trusted_parse50),
+    (m.stderrLoader, _trusted412, _trusted_parse51),
+    (m.CommandLineToolLoader, _trusted413, _trusted_parse52),
+    (m.DockerRequirementLoader, _trusted414, _trusted_parse53),
+    (m.SoftwareRequirementLoader, _trusted415, _trusted_parse54),
+    (m.SoftwarePackageLoader, _trusted416, _trusted_parse55),
+    (m.DirentLoader, _trusted417, _trusted_parse56),
+    (m.InitialWorkDirRequirementLoader, _trusted418, _trusted_parse57),
+    (m.EnvVarRequirementLoader, _trusted419, _trusted_parse58),
+    (m.ShellCommandRequirementLoader, _trusted420, _trusted_parse59),
+    (m.ResourceRequirementLoader, _trusted421, _trusted_parse60),
+    (m.ExpressionToolOutputParameterLoader, _trusted422, _trusted_parse61),
+    (m.ExpressionToolLoader, _trusted423, _trusted_parse62),
+    (m.LinkMergeMethodLoader, _trusted424, _trusted_parse63),
+    (m.WorkflowOutputParameterLoader, _trusted425, _trusted_parse64),
+    (m.SinkLoader, _trusted426, _trusted_parse65),
+    (m.WorkflowStepInputLoader, _trusted427, _trusted_parse66),
+    (m.WorkflowStepOutputLoader, _trusted428, _trusted_parse67),
+    (m.ScatterMethodLoader, _trusted429, _trusted_parse68),
+    (m.WorkflowStepLoader, _trusted430, _trusted_parse69),
+    (m.WorkflowLoader, _trusted431, _trusted_parse70),
+    (m.SubworkflowFeatureRequirementLoader, _trusted432, _trusted_parse71),
+    (m.ScatterFeatureRequirementLoader, _trusted433, _trusted_parse72),
+    (m.MultipleInputFeatureRequirementLoader, _trusted434, _trusted_parse73),
+    (m.StepInputExpressionRequirementLoader, _trusted435, _trusted_parse74),
+    (m.uri_strtype_True_False_None, _trusted436, _trusted_parse75),
+    (m.union_of_None_type_or_strtype, _trusted437, _trusted_parse76),
+    (m.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype, _trusted438, _trusted_parse77),
+    (m.array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype, _trusted439, _trusted_parse78),
+    (m.union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype, _trusted440, _trusted_parse79),
+    (m.typedsl_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_2, _trusted441, _trusted_parse80),
+    (m.array_of_RecordFieldLoader, _trusted442, _trusted_parse81),
+    (m.union_of_None_type_or_array_of_RecordFieldLoader, _trusted443, _trusted_parse82),
+    (m.idmap_fields_union_of_None_type_or_array_of_RecordFieldLoader, _trusted444, _trusted_parse83),
+    (m.Record_symbolLoader, _trusted445, _trusted_parse84),
+    (m.typedsl_Record_symbolLoader_2, _trusted446, _trusted_parse85),
+    (m.array_of_strtype, _trusted447, _trusted_parse86),
+    (m.uri_array_of_strtype_True_False_None, _trusted448, _trusted_parse87),
+    (m.Enum_symbolLoader, _trusted449, _trusted_parse88),
+    (m.typedsl_Enum_symbolLoader_2, _trusted450, _trusted_parse89),
+    (m.uri_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_or_array_of_union_of_PrimitiveTypeLoader_or_RecordSchemaLoader_or_EnumSchemaLoader_or_ArraySchemaLoader_or_strtype_False_True_2, _trusted451, _trusted_parse90),
+    (m.Array_symbolLoader, _trusted452, _trusted_parse91),
+    (m.typedsl_Array_symbolLoader_2, _trusted453, _trusted_parse92),
+    (m.File_classLoader, _trusted454, _trusted_parse93),
+    (m.uri_File_classLoader_False_True_None, _trusted455, _trusted_parse94),
+    (m.uri_union_of_None_type_or_strtype_False_False_None, _trusted456, _trusted_parse95),
+    (m.union_of_None_type_or_inttype, _trusted457, _trusted_parse96),
+    (m.union_of_FileLoader_or_DirectoryLoader, _trusted458, _trusted_parse97),
+    (m.array_of_union_of_FileLoader_or_DirectoryLoader, _trusted459, _trusted_parse98),
+    (m.union_of_None_type_or_array_of_union_of_FileLoader_or_DirectoryLoader, _trusted460, _trusted_parse99),
+    (m.uri_union_of_None_type_or_strtype_True_False_None, _trusted461, _trusted_parse100),
+    (m.Directory_classLoader, _trusted462, _trusted_parse101),
+    (m.uri_Directory_classLoader_False_True_None, _trusted463, _trusted_parse102),
+    (m.union_of_strtype_or_ExpressionLoader, _trusted464, _trusted_parse103),
+    (m.array_of_union_of_strtype_or_ExpressionLoader, _trusted465, _trusted_parse104),
+    (m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_union_of_strtype_or_ExpressionLoader, _trusted466, _trusted_parse105),
+    (m.union_of_None_type_or_booltype, _trusted467, _trusted_parse106),
+    (m.union_of_None_type_or_strtype_or_array_of_strtype, _trusted468, _trusted_parse107),
+    (m.union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype, _trusted469, _trusted_parse108),
+    (m.array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype, _trusted470, _trusted_parse109),
+    (m.union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype, _trusted471, _trusted_parse110),
+    (m.typedsl_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2, _trusted472, _trusted_parse111),
+    (m.union_of_None_type_or_CommandLineBindingLoader, _trusted473, _trusted_parse112),
+    (m.array_of_InputRecordFieldLoader, _trusted474, _trusted_parse113),
+    (m.union_of_None_type_or_array_of_InputRecordFieldLoader, _trusted475, _trusted_parse114),
+    (m.idmap_fields_union_of_None_type_or_array_of_InputRecordFieldLoader, _trusted476, _trusted_parse115),
+    (m.uri_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_False_True_2, _trusted477, _trusted_parse116),
+    (m.union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype, _trusted478, _trusted_parse117),
+    (m.array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype, _trusted479, _trusted_parse118),
+    (m.union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype, _trusted480, _trusted_parse119),
+    (m.typedsl_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, _trusted481, _trusted_parse120),
+    (m.union_of_None_type_or_CommandOutputBindingLoader, _trusted482, _trusted_parse121),
+    (m.array_of_OutputRecordFieldLoader, _trusted483, _trusted_parse122),
+    (m.union_of_None_type_or_array_of_OutputRecordFieldLoader, _trusted484, _trusted_parse123),
+    (m.idmap_fields_union_of_None_type_or_array_of_OutputRecordFieldLoader, _trusted485, _trusted_parse124),
+    (m.uri_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_False_True_2, _trusted486, _trusted_parse125),
+    (m.union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader, _trusted487, _trusted_parse126),
+    (m.uri_union_of_None_type_or_strtype_or_array_of_strtype_or_ExpressionLoader_True_False_None, _trusted488, _trusted_parse127),
+    (m.union_of_None_type_or_Any_type, _trusted489, _trusted_parse128),
+    (m.union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype, _trusted490, _trusted_parse129),
+    (m.typedsl_union_of_None_type_or_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader_or_strtype_2, _trusted491, _trusted_parse130),
+    (m.union_of_None_type_or_strtype_or_ExpressionLoader, _trusted492, _trusted_parse131),
+    (m.uri_union_of_None_type_or_strtype_or_ExpressionLoader_True_False_None, _trusted493, _trusted_parse132),
+    (m.array_of_InputParameterLoader, _trusted494, _trusted_parse133),
+    (m.idmap_inputs_array_of_InputParameterLoader, _trusted495, _trusted_parse134),
+    (m.array_of_OutputParameterLoader, _trusted496, _trusted_parse135),
+    (m.idmap_outputs_array_of_OutputParameterLoader, _trusted497, _trusted_parse136),
+    (m.union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, _trusted498, _trusted_parse137),
+    (m.array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, _trusted499, _trusted_parse138),
+    (m.union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, _trusted500, _trusted_parse139),
+    (m.idmap_requirements_union_of_None_type_or_array_of_union_of_InlineJavascriptRequirementLoader_or_SchemaDefRequirementLoader_or_DockerRequirementLoader_or_SoftwareRequirementLoader_or_InitialWorkDirRequirementLoader_or_EnvVarRequirementLoader_or_ShellCommandRequirementLoader_or_ResourceRequirementLoader_or_SubworkflowFeatureRequirementLoader_or_ScatterFeatureRequirementLoader_or_MultipleInputFeatureRequirementLoader_or_StepInputExpressionRequirementLoader, _trusted501, _trusted_parse140),
+    (m.array_of_Any_type, _trusted502, _trusted_parse141),
+    (m.union_of_None_type_or_array_of_Any_type, _trusted503, _trusted_parse142),
+    (m.idmap_hints_union_of_None_type_or_array_of_Any_type, _trusted504, _trusted_parse143),
+    (m.union_of_None_type_or_CWLVersionLoader, _trusted505, _trusted_parse144),
+    (m.uri_union_of_None_type_or_CWLVersionLoader_False_True_None, _trusted506, _trusted_parse145),
+    (m.uri_strtype_False_True_None, _trusted507, _trusted_parse146),
+    (m.union_of_None_type_or_array_of_strtype, _trusted508, _trusted_parse147),
+    (m.union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader, _trusted509, _trusted_parse148),
+    (m.array_of_union_of_InputRecordSchemaLoader_or_InputEnumSchemaLoader_or_InputArraySchemaLoader, _trusted510, _trusted_parse149),
+    (m.union_of_None_type_or_strtype_or_ExpressionLoader_or_array_of_strtype, _trusted511, _trusted_parse150),
+    (m.union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype, _trusted512, _trusted_parse151),
+    (m.array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype, _trusted513, _trusted_parse152),
+    (m.union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype, _trusted514, _trusted_parse153),
+    (m.typedsl_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2, _trusted515, _trusted_parse154),
+    (m.array_of_CommandInputRecordFieldLoader, _trusted516, _trusted_parse155),
+    (m.union_of_None_type_or_array_of_CommandInputRecordFieldLoader, _trusted517, _trusted_parse156),
+    (m.idmap_fields_union_of_None_type_or_array_of_CommandInputRecordFieldLoader, _trusted518, _trusted_parse157),
+    (m.uri_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_False_True_2, _trusted519, _trusted_parse158),
+    (m.union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype, _trusted520, _trusted_parse159),
+    (m.array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype, _trusted521, _trusted_parse160),
+    (m.union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype, _trusted522, _trusted_parse161),
+    (m.typedsl_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2, _trusted523, _trusted_parse162),
+    (m.array_of_CommandOutputRecordFieldLoader, _trusted524, _trusted_parse163),
+    (m.union_of_None_type_or_array_of_CommandOutputRecordFieldLoader, _trusted525, _trusted_parse164),
+    (m.idmap_fields_union_of_None_type_or_array_of_CommandOutputRecordFieldLoader, _trusted526, _trusted_parse165),
+    (m.uri_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_False_True_2, _trusted527, _trusted_parse166),
+    (m.union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype, _trusted528, _trusted_parse167),
+    (m.typedsl_union_of_None_type_or_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandInputRecordSchemaLoader_or_CommandInputEnumSchemaLoader_or_CommandInputArraySchemaLoader_or_strtype_2, _trusted529, _trusted_parse168),
+    (m.union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype, _trusted530, _trusted_parse169),
+    (m.typedsl_union_of_None_type_or_CWLTypeLoader_or_stdoutLoader_or_stderrLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_CommandOutputRecordSchemaLoader_or_CommandOutputEnumSchemaLoader_or_CommandOutputArraySchemaLoader_or_strtype_2, _trusted531, _trusted_parse170),
+    (m.array_of_CommandInputParameterLoader, _trusted532, _trusted_parse171),
+    (m.idmap_inputs_array_of_CommandInputParameterLoader, _trusted533, _trusted_parse172),
+    (m.array_of_CommandOutputParameterLoader, _trusted534, _trusted_parse173),
+    (m.idmap_outputs_array_of_CommandOutputParameterLoader, _trusted535, _trusted_parse174),
+    (m.union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader, _trusted536, _trusted_parse175),
+    (m.array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader, _trusted537, _trusted_parse176),
+    (m.union_of_None_type_or_array_of_union_of_strtype_or_ExpressionLoader_or_CommandLineBindingLoader, _trusted538, _trusted_parse177),
+    (m.array_of_inttype, _trusted539, _trusted_parse178),
+    (m.union_of_None_type_or_array_of_inttype, _trusted540, _trusted_parse179),
+    (m.array_of_SoftwarePackageLoader, _trusted541, _trusted_parse180),
+    (m.idmap_packages_array_of_SoftwarePackageLoader, _trusted542, _trusted_parse181),
+    (m.union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader, _trusted543, _trusted_parse182),
+    (m.array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader, _trusted544, _trusted_parse183),
+    (m.union_of_array_of_union_of_FileLoader_or_DirectoryLoader_or_DirentLoader_or_strtype_or_ExpressionLoader_or_strtype_or_ExpressionLoader, _trusted545, _trusted_parse184),
+    (m.array_of_EnvironmentDefLoader, _trusted546, _trusted_parse185),
+    (m.idmap_envDef_array_of_EnvironmentDefLoader, _trusted547, _trusted_parse186),
+    (m.union_of_None_type_or_inttype_or_strtype_or_ExpressionLoader, _trusted548, _trusted_parse187),
+    (m.union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype, _trusted549, _trusted_parse188),
+    (m.typedsl_union_of_None_type_or_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_or_array_of_union_of_CWLTypeLoader_or_OutputRecordSchemaLoader_or_OutputEnumSchemaLoader_or_OutputArraySchemaLoader_or_strtype_2, _trusted550, _trusted_parse189),
+    (m.array_of_ExpressionToolOutputParameterLoader, _trusted551, _trusted_parse190),
+    (m.idmap_outputs_array_of_ExpressionToolOutputParameterLoader, _trusted552, _trusted_parse191),
+    (m.uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_0, _trusted553, _trusted_parse192),
+    (m.union_of_None_type_or_LinkMergeMethodLoader, _trusted554, _trusted_parse193),
+    (m.uri_union_of_None_type_or_strtype_or_array_of_strtype_False_False_2, _trusted555, _trusted_parse194),
+    (m.array_of_WorkflowStepInputLoader, _trusted556, _trusted_parse195),
+    (m.idmap_in__array_of_WorkflowStepInputLoader, _trusted557, _trusted_parse196),
+    (m.union_of_strtype_or_WorkflowStepOutputLoader, _trusted558, _trusted_parse197),
+    (m.array_of_union_of_strtype_or_WorkflowStepOutputLoader, _trusted559, _trusted_parse198),
+    (m.union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader, _trusted560, _trusted_parse199),
+    (m.uri_union_of_array_of_union_of_strtype_or_WorkflowStepOutputLoader_True_False_None, _trusted561, _trusted_parse200),
+    (m.union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, _trusted562, _trusted_parse201),
+    (m.uri_union_of_strtype_or_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_False_False_None, _trusted563, _trusted_parse202),
+    (m.union_of_None_type_or_ScatterMethodLoader, _trusted564, _trusted_parse203),
+    (m.uri_union_of_None_type_or_ScatterMethodLoader_False_True_None, _trusted565, _trusted_parse204),
+    (m.array_of_WorkflowOutputParameterLoader, _trusted566, _trusted_parse205),
+    (m.idmap_outputs_array_of_WorkflowOutputParameterLoader, _trusted567, _trusted_parse206),
+    (m.array_of_WorkflowStepLoader, _trusted568, _trusted_parse207),
+    (m.union_of_array_of_WorkflowStepLoader, _trusted569, _trusted_parse208),
+    (m.idmap_steps_union_of_array_of_WorkflowStepLoader, _trusted570, _trusted_parse209),
+    (m.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, _trusted571, _trusted_parse210),
+    (m.array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, _trusted572, _trusted_parse211),
+    (m.union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader_or_array_of_union_of_CommandLineToolLoader_or_ExpressionToolLoader_or_WorkflowLoader, _trusted573, _trusted_parse212),
+]
@@ -0,0 +1,140 @@
+import os.path as path
+from typing import Any, Dict, IO, List, Tuple
+
+import ruamel.yaml as yaml
+from ruamel.yaml.events import (DocumentEndEvent, DocumentStartEvent, MappingEndEvent,
+                                MappingStartEvent, ScalarEvent, SequenceEndEvent, SequenceStartEvent)
+from ruamel.yaml.nodes import ScalarNode
+
+from . import cwl_model
+from .nested_map import copy_node, map_tree
+
+MAP_TAG = "tag:yaml.org,2002:map"
+SEQ_TAG = "tag:yaml.org,2002:seq"
+
+def relativise_uri(s: str, base_id: str, this_cwl_filename: str) -> str:
+    if s.startswith(base_id):
+        return s[len(base_id) + 1:].replace("#", "")
+    elif s.startswith(this_cwl_filename):
+        return "#" + s[len(this_cwl_filename) + 1:].replace("#", "")
+    elif s.startswith("file://"):
+        return path.relpath(s, path.dirname(base_id))
+    else:
+        return s
+
+def sorted_items(mapping: Dict[Any, Any]) -> List[Tuple[Any, Any]]:
+    # The same ordering the yaml representer gives a dict
+    items = list(mapping.items())
+    try:
+        return sorted(items)
+    except TypeError:
+        return items
+
+def plain_cwl(cwl: Any, base_cwl_filename: str) -> Any:
+    """
+    Build the plain dict/list form of a cwl_model document, with its URIs
+    relative to base_cwl_filename, in one pass over its records. The result
+    is the same as relativise(save(cwl), base_cwl_filename), pureified.
+    """
+    this_cwl_filename = "file://" + base_cwl_filename
+    # Each id is referred to from many places, so share one copy of it
+    strings = {} # type: Dict[str, str]
+
+    def relativise(s: str, base_id: str) -> str:
+        relative = relativise_uri(s, base_id, this_cwl_filename)
+        return s if relative is s else strings.setdefault(relative, relative)
+
+    def plain_node(node: Any, base_id: str) -> Tuple[Any, str]:
+        if isinstance(node, str):
+            # relativise visits each string twice
+            return relativise(relativise(node, base_id), base_id), base_id
+        elif isinstance(node, cwl_model.Savable):
+            node = dict(node.save_items())
+        elif isinstance(node, dict):
+            node = dict(node)
+        elif isinstance(node, list):
+            return list(node), base_id
+        else:
+            return node, base_id
+
+        node_id = node.get("id")
+        if node_id is not None:
+            node["id"] = relativise(node_id, base_id)
+            base_id = node_id
+        return node, base_id
+
+    # As with relativise, the id of the document itself is not a base
+    if isinstance(cwl, cwl_model.Savable):
+        cwl = dict(cwl.save_items(top=True))
+    elif isinstance(cwl, (dict, list)):
+        cwl = copy_node(cwl)
+    else:
+        return plain_node(cwl, this_cwl_filename)[0]
+
+    # plain_node copies every dict and list, so the copies are filled in in place
+    return map_tree(cwl, plain_node, this_cwl_filename)
+
+class CWLWriter:
+    """
+    Writes the plain dict/list form of a CWL document to a stream as YAML
+    events, one node at a time. The output is the same as
+    yaml.dump(cwl, stream, default_flow_style=False), except that a dict or
+    list that appears more than once is written out in full each time rather
+    than as an alias: documents share the nodes they have in common with the
+    ones they were made from.
+    """
+    def __init__(self, stream: IO[str]) -> None:
+        self.dumper = yaml.Dumper(stream, default_flow_style=False)
+
+    def write(self, cwl: Any) -> None:
+        dumper = self.dumper
+
+        dumper.open()
+        dumper.emit(DocumentStartEvent(explicit=dumper.use_explicit_start, version=dumper.use_version, tags=dumper.use_tags))
+        self.write_node(cwl)
+        dumper.emit(DocumentEndEvent(explicit=dumper.use_explicit_end))
+        dumper.close()
+        dumper.dispose()
+
+    def write_node(self, node: Any) -> None:
+        if isinstance(node, dict):
+            self.dumper.emit(MappingStartEvent(None, MAP_TAG, True, flow_style=False, comment=None, nr_items=len(node)))
+            for key, value in sorted_items(node):
+                self.write_leaf(key)
+                self.write_node(value)
+            self.dumper.emit(MappingEndEvent(comment=[None, None]))
+        elif isinstance(node, list):
+            self.dumper.emit(SequenceStartEvent(None, SEQ_TAG, True, flow_style=False, comment=None, nr_items=len(node)))
+            for item in node:
+                self.write_node(item)
+            self.dumper.emit(SequenceEndEvent(comment=[None, None]))
+        else:
+            self.write_leaf(node)
+
+    def write_leaf(self, value: Any) -> None:
+        dumper = self.dumper
+        node = dumper.represent_data(value)
+
+        if isinstance(node, ScalarNode):
+            implicit = (
+                node.tag == dumper.resolve(ScalarNode, node.value, (True, False)),
+                node.tag == dumper.resolve(ScalarNode, node.value, (False, True)),
+                node.tag.startswith("tag:yaml.org,2002:"),
+            )
+            dumper.emit(ScalarEvent(None, node.tag, implicit, node.value, style=node.style, comment=node.comment))
+        else:
+            dumper.anchor_node(node)
+            dumper.serialize_node(node, None, None)
+            dumper.anchors = {}
+            dumper.serialized_nodes = {}
+
+        dumper.represented_objects = {}
+        dumper.object_keeper = []
+        dumper.alias_key = None
+
+def dump_cwl(cwl: Any, stream: IO[str]) -> None:
+    """
+    Write the plain form of a CWL document to stream as YAML, without building
+    its representation graph in memory.
+    """
+    CWLWriter(stream).write(cwl)
@@ -0,0 +1,147 @@
+import hashlib
+import logging
+import os
+import os.path as path
+import pickle
+import tempfile
+from typing import Any, Callable, List, Tuple
+
+from . import cwl_model
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever loading, saving or relativising a document gives a different result.
+LOADER_VERSION = "2"
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+def file_hash(file_path):
+    with open(file_path, "rb") as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+class RecordingFetcher(cwl_model.LocalFetcher):
+    """
+    A LocalFetcher that remembers the local files it read, so that documents
+    pulled in with $import or $include invalidate the cache entry too.
+    """
+    def __init__(self):
+        super().__init__()
+        self.local_paths = [] # type: List[str]
+
+    def fetch_text(self, url):
+        text = super().fetch_text(url)
+        if url.startswith("file://"):
+            self.local_paths.append(cwl_model.urllib.request.url2pathname(cwl_model.urllib.parse.urlsplit(url).path))
+        return text
+
+class DocumentCache:
+    """
+    On-disk cache of loaded and relativised CWL documents.
+
+    Entries are keyed on the bytes of the document, LOADER_VERSION, the
+    absolute path of the document and whether it was validated, and the total size of the cache directory
+    is kept under max_size by evicting the least recently used entries.
+    """
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, cwl_path: str, validated: bool = True) -> str:
+        cwl_path = path.abspath(cwl_path)
+
+        digest = hashlib.sha256()
+        with open(cwl_path, "rb") as fp:
+            digest.update(fp.read())
+        digest.update(b"\0" + LOADER_VERSION.encode("utf-8"))
+        digest.update(b"\0" + cwl_path.encode("utf-8"))
+        if not validated:
+            digest.update(b"\0trusted")
+
+        return digest.hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        return path.join(self.cache_dir, key + ".pickle")
+
+    def load(self, cwl_path: str, load_document: Callable[[cwl_model.LocalFetcher], Any], validated: bool = True) -> Any:
+        """
+        Return the cached document for cwl_path, calling load_document with a
+        fetcher to load it on a miss. Documents loaded without validation are
+        cached apart from validated ones.
+        """
+        entry_path = self.entry_path(self.key(cwl_path, validated))
+
+        cwl = self.read_entry(entry_path)
+        if cwl is not None:
+            self.hits += 1
+            return cwl
+
+        self.misses += 1
+
+        fetcher = RecordingFetcher()
+        cwl = load_document(fetcher)
+
+        dependencies = [
+            (dependency, file_hash(dependency))
+            for dependency in set(fetcher.local_paths) if dependency != path.abspath(cwl_path)
+        ]
+        self.write_entry(entry_path, dependencies, cwl)
+
+        return cwl
+
+    def read_entry(self, entry_path: str) -> Any:
+        try:
+            with open(entry_path, "rb") as fp:
+                dependencies, cwl = pickle.load(fp) # type: Tuple[List[Tuple[str, str]], Any]
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("Ignoring unreadable cache entry %s", entry_path)
+            return None
+
+        for dependency, dependency_hash in dependencies:
+            if not path.isfile(dependency) or file_hash(dependency) != dependency_hash:
+                return None
+
+        # Mark the entry as recently used for eviction
+        os.utime(entry_path)
+
+        return cwl
+
+    def write_entry(self, entry_path: str, dependencies: List[Tuple[str, str]], cwl: Any) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump((dependencies, cwl), fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".pickle"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        entries.sort()
+        while total_size > self.max_size and entries:
+            _, size, entry_path = entries.pop(0)
+            try:
+                os.unlink(entry_path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            self.evictions += 1
+
+    def stats(self) -> str:
+        return f"document cache: {self.hits} hits, {self.misses} misses, {self.evictions} evictions"
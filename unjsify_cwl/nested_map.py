@@ -0,0 +1,78 @@
+from typing import Any, Callable, Optional, Tuple
+
+def map_tree(struct: Any, visit: Callable[[Any, Any], Tuple[Any, Any]], state: Any = None,
+             copy: Optional[Callable[[Any], Any]] = None) -> Any:
+    """
+    Map the dict values and list items under the dict or list struct, depth
+    first in document order, with an explicit stack rather than recursion.
+
+    Each dict value and list item is passed to visit(node, state), which
+    returns the node to put in its place and the state for its children; a
+    dict or list that it returns is then walked in turn with that state. The
+    state is handed on as it is, not copied, so visit must return a new state
+    rather than change the one it was given.
+
+    Without copy, dicts and lists are changed in place. With it, a dict or
+    list is copied with copy(node) before its first child is replaced, struct
+    is left as it is, and the copies are returned in its place.
+    """
+    # A frame is [node, its remaining keys, the state of its children,
+    # the node its children are written to, parent frame, key in parent]
+    root = [struct, iter(struct) if isinstance(struct, dict) else iter(range(len(struct))), state,
+            None if copy is not None else struct, None, None]
+    stack = [root]
+
+    while stack:
+        frame = stack[-1]
+        node, keys, node_state = frame[0], frame[1], frame[2]
+
+        for key in keys:
+            child = node[key]
+            new_child, child_state = visit(child, node_state)
+
+            if new_child is not child:
+                if frame[3] is None:
+                    frame[3] = copy(node)
+                frame[3][key] = new_child
+
+            if isinstance(new_child, (dict, list)):
+                stack.append([new_child, iter(new_child) if isinstance(new_child, dict) else iter(range(len(new_child))),
+                              child_state, None if copy is not None else new_child, frame, key])
+                break
+        else:
+            stack.pop()
+            # A copied node replaces the original in its parent's copy
+            parent = frame[4]
+            if copy is not None and frame[3] is not None and parent is not None:
+                if parent[3] is None:
+                    parent[3] = copy(parent[0])
+                parent[3][frame[5]] = frame[3]
+
+    return struct if root[3] is None else root[3]
+
+def copy_node(node):
+    return dict(node) if isinstance(node, dict) else list(node)
+
+def nested_leaf_map(func, struct):
+    """
+    Apply func to every leaf of struct, without changing struct: a dict or
+    list is copied only when a leaf beneath it changes, and shared otherwise.
+    """
+    def visit(node, state):
+        if isinstance(node, (dict, list)):
+            return node, state
+        new_node = func(node)
+        return (node if type(new_node) is type(node) and new_node == node else new_node), state
+
+    return map_tree(struct, visit, copy=copy_node) if isinstance(struct, (dict, list)) else visit(struct, None)[0]
+
+def inplace_nested_map(func, struct):
+    """
+    Replace every node under struct, in place, with func(node); leaves are
+    passed to func twice, as the node and then as the new node.
+    """
+    def visit(node, state):
+        new_node = func(node)
+        return (new_node if isinstance(new_node, (dict, list)) else func(new_node)), None
+
+    return map_tree(struct, visit) if isinstance(struct, (dict, list)) else func(struct)
@@ -0,0 +1,529 @@
+"""
+Generates cwl_parsers, the specialized parse functions of the loaders and
+record types of cwl_model. Only ./generate_parsers and the tests import this
+module; cwl_model loads the generated module.
+"""
+from __future__ import absolute_import
+import keyword
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Text, Tuple, Union
+
+import six
+from six.moves import builtins
+
+from . import cwl_model
+
+# The parse function of a loader that has no generator: its own load
+_LOAD = "lambda doc, baseuri, loadingOptions, docRoot=None, probe=False: %s.load(doc, baseuri, loadingOptions, docRoot)"
+
+def _attribute_name(field):
+    # type: (Text) -> str
+    # Fields named after Python keywords are stored with a trailing underscore
+    return field + "_" if keyword.iskeyword(field) else field
+
+def _type_source(tp):
+    # type: (Any) -> str
+    if isinstance(tp, tuple):
+        return "(%s%s)" % (", ".join(_type_source(t) for t in tp), "," if len(tp) == 1 else "")
+    if tp is type(None):
+        return "type(None)"
+    assert getattr(builtins, tp.__name__, None) is tp, tp
+    return tp.__name__
+
+def _module_loaders():
+    # type: () -> Tuple[List[cwl_model._Loader], List[Text]]
+    values = list(six.itervalues(vars(cwl_model)))
+    loaders = [v for v in values if isinstance(v, cwl_model._Loader)]
+    discriminators = sorted(set(
+        v.discriminator for v in values
+        if isinstance(v, type) and issubclass(v, cwl_model.Savable) and getattr(v, "discriminator", None) is not None))
+    return loaders, discriminators
+
+class _Namespace(object):
+    """
+The module level names of the generated module that the parse functions
+use, each assigned the source of an expression, and shared by the compilers
+that write into the module.
+    """
+    def __init__(self):
+        # type: () -> None
+        self.module_names = {}  # type: Dict[int, str]
+        for name, value in six.iteritems(vars(cwl_model)):
+            if isinstance(value, cwl_model._Loader) or (isinstance(value, type) and issubclass(value, cwl_model.Savable)):
+                self.module_names.setdefault(id(value), name)
+        self.names = {}  # type: Dict[str, str]
+        self.source = []  # type: List[Text]
+
+    def ref(self, source, prefix):
+        # type: (str, str) -> str
+        """A name assigned source, the same one each time source is given."""
+        if source not in self.names:
+            self.names[source] = "%s%d" % (prefix, len(self.names))
+            self.source.append(u"%s = %s" % (self.names[source], source))
+        return self.names[source]
+
+    def module_ref(self, value):
+        # type: (Any) -> str
+        """The source of a loader or record type of cwl_model."""
+        if id(value) not in self.module_names:
+            raise ValueError("%r is not a module level loader or record type of cwl_model" % (value,))
+        return "m." + self.module_names[id(value)]
+
+class _ParserCompiler(object):
+    """
+Generates a specialized parse function for every loader and record type:
+direct type checks in place of union dispatch, URI expansion and simple field
+checks inlined into the record, and no load_field call per field.
+
+A generated function returns exactly what the loader's own `load` returns.
+Where it can't (an $import in a list, a value of an unexpected type) it calls
+that `load` instead. Invalid input is also handed to it, for the exact error,
+unless `probe` is set: a union trying its alternates, or a record or list
+that redoes the whole parse when a part fails, only needs to know that the
+parse failed.
+
+Given the compiler of the `validating` parsers, the parsers are for trusted
+input instead, which is taken to be valid: values are not checked
+against primitive, enum and Any types, and fields that aren't in the schema
+are not an error. Only what's needed to normalize the document (id maps, the
+type DSL, URI expansion) and to pick the alternate of a union is done; the
+alternates are told apart with the validating parsers.
+    """
+    _buckets = (
+        (u"doc is None", type(None)),
+        (u"isinstance(doc, bool)", bool),
+        (u"isinstance(doc, int)", int),
+        (u"isinstance(doc, float)", float),
+        (u"isinstance(doc, str)", str),
+        (u"isinstance(doc, list)", list),
+        (u"isinstance(doc, dict)", dict),
+    )
+
+    def __init__(self, namespace, discriminators, prefix, validating=None):
+        # type: (_Namespace, Sequence[Text], str, Optional[_ParserCompiler]) -> None
+        self.namespace = namespace
+        self.discriminators = discriminators
+        self.prefix = prefix
+        # The compiler of the validating parsers, for a trusted one
+        self.validating = validating
+        self.trusted = validating is not None
+        self.trusted_loaders = {}  # type: Dict[int, Tuple[cwl_model._Loader, str]]
+        self.names = {}  # type: Dict[int, str]
+        self.queue = []  # type: List[Tuple[str, Any]]
+        self.source = []  # type: List[Text]
+
+    def ref(self, source, prefix):
+        # type: (str, str) -> str
+        return self.namespace.ref(source, prefix)
+
+    def module_ref(self, value):
+        # type: (Any) -> str
+        return self.namespace.module_ref(value)
+
+    def parser(self, loader):
+        # type: (Any) -> str
+        """The name of the parse function for `loader` (a _Loader or a record class)."""
+        if id(loader) not in self.names:
+            if isinstance(loader, type) or type(loader) in self._generators:
+                name = "%s%d" % (self.prefix, len(self.names))
+                self.queue.append((name, loader))
+            else:
+                name = self.ref(_LOAD % self.module_ref(loader), "_load")
+            self.names[id(loader)] = name
+        return self.names[id(loader)]
+
+    def check(self, loader, var):
+        # type: (cwl_model._Loader, str) -> Union[str, None]
+        """An expression that is true exactly when loader.load(var) would
+        return var unchanged, or None when there is no such expression."""
+        if isinstance(loader, cwl_model._PrimitiveLoader):
+            if loader.tp is type(None):
+                return "%s is None" % var
+            return "isinstance(%s, %s)" % (var, self.ref(_type_source(loader.tp), "_type"))
+        if isinstance(loader, cwl_model._AnyLoader):
+            return "%s is not None" % var
+        if isinstance(loader, cwl_model._EnumLoader):
+            return "(isinstance(%s, str) and %s in %s)" % (var, var, self.ref("frozenset(%r)" % sorted(loader.symbols), "_symbols"))
+        if isinstance(loader, cwl_model._UnionLoader):
+            checks = [self.check(t, var) for t in loader.alternates]
+            if all(c is not None for c in checks):
+                return "(%s)" % " or ".join(checks)
+        return None
+
+    def assumed(self, loader, var):
+        # type: (cwl_model._Loader, str) -> Union[str, None]
+        """check(), except that trusted input always passes it."""
+        check = self.check(loader, var)
+        if check is not None and self.trusted:
+            return "True"
+        return check
+
+    def loader(self, loader):
+        # type: (cwl_model._Loader) -> str
+        """A name for `loader` to hand to load_field."""
+        if not self.trusted:
+            return self.ref(self.module_ref(loader), "_loader")
+        name = self.ref("_TrustedLoader(%s)" % self.module_ref(loader), "_trusted")
+        self.trusted_loaders[id(loader)] = (loader, name)
+        return name
+
+    def compile(self, loaders):
+        # type: (Iterable[cwl_model._Loader]) -> None
+        for loader in loaders:
+            self.parser(loader)
+        while self.queue:
+            name, loader = self.queue.pop()
+            if isinstance(loader, type):
+                lines = self.record(loader, name)
+            else:
+                lines = self._generators[type(loader)](self, loader)
+            self.source.append(u"def %s(doc, baseuri, loadingOptions, docRoot=None, probe=False):" % name)
+            self.source.extend(u"    " + line for line in lines)
+            self.source.append(u"")
+
+    def parsers(self, loaders):
+        # type: (Iterable[cwl_model._Loader]) -> List[Tuple[str, str]]
+        """The loaders that have a generated parser, and its name."""
+        return [
+            (self.module_ref(loader), self.names[id(loader)]) for loader in loaders
+            if self.names.get(id(loader), "").startswith(self.prefix)
+        ]
+
+    def slow(self, loader):
+        # type: (cwl_model._Loader) -> str
+        return u"return %s(doc, baseuri, loadingOptions, docRoot)" % self.slow_ref(loader)
+
+    def fail(self, loader):
+        # type: (cwl_model._Loader) -> str
+        """For where the slow `load` is certain to fail: a nested parse only
+        needs to know that it failed, anything else needs the exact error."""
+        return u"return _failed(%s, doc, baseuri, loadingOptions, docRoot, probe)" % self.slow_ref(loader)
+
+    def slow_ref(self, loader):
+        # type: (cwl_model._Loader) -> str
+        """A name for the generic `load` of loader."""
+        return self.ref("m.%s.load.__get__(%s)" % (type(loader).__name__, self.module_ref(loader)), "_slow")
+
+    def checked(self, loader):
+        return [u"if %s:" % self.assumed(loader, "doc"), u"    return doc", self.fail(loader)]
+
+    def record_loader(self, loader):
+        if "attrs" not in vars(loader.classtype):
+            # An abstract record type
+            return [self.slow(loader)]
+        return [
+            u"if isinstance(doc, dict):",
+            u"    return %s(doc, baseuri, loadingOptions, docRoot, probe)" % self.parser(loader.classtype),
+            self.fail(loader),
+        ]
+
+    def array(self, loader):
+        lines = [
+            u"if not isinstance(doc, list):",
+            u"    " + self.fail(loader),
+            u"r = []",
+            u"try:",
+            u"    for item in doc:",
+            u"        if isinstance(item, list):",
+            u"            r.extend(%s(item, baseuri, loadingOptions, probe=True))" % self.parser(loader),
+            u"            continue",
+            u"        if isinstance(item, dict) and ('$import' in item or '$include' in item):",
+            u"            " + self.slow(loader),
+        ]
+        check = self.assumed(loader.items, "item")
+        if check is not None:
+            lines += [
+                u"        if %s:" % check,
+                u"            r.append(item)",
+                u"            continue",
+            ]
+        lines += [
+            u"        lf = %s(item, baseuri, loadingOptions, probe=True)" % self.parser(loader.items),
+            u"        if isinstance(lf, list):",
+            u"            r.extend(lf)",
+            u"        else:",
+            u"            r.append(lf)",
+            u"except ValidationException:",
+            u"    " + self.fail(loader),
+            u"return r",
+        ]
+        return lines
+
+    def union(self, loader):
+        if self.check(loader, "doc") is not None:
+            return self.checked(loader)
+
+        lines = []
+        for i, (test, tp) in enumerate(self._buckets):
+            lines.append(u"%s %s:" % ("if" if i == 0 else "elif", test))
+            if tp is dict:
+                default = [t for t in loader.alternates if t.may_load(dict, None)]
+                first = True
+                for discriminator in self.discriminators:
+                    candidates = [t for t in loader.alternates if t.may_load(dict, discriminator)]
+                    if candidates != default:
+                        lines.append(u"    %s doc.get('class') == %r:" % ("if" if first else "elif", discriminator))
+                        lines.extend(u"        " + line for line in self.candidates(loader, candidates))
+                        first = False
+                if not first:
+                    lines.append(u"    else:")
+                    lines.extend(u"        " + line for line in self.candidates(loader, default))
+                else:
+                    lines.extend(u"    " + line for line in self.candidates(loader, default))
+            else:
+                candidates = [t for t in loader.alternates if t.may_load(tp, None)]
+                lines.extend(u"    " + line for line in self.candidates(loader, candidates))
+        lines.append(self.slow(loader))
+        return lines
+
+    def candidates(self, loader, candidates):
+        if self.trusted and len(candidates) == 1 and self.check(candidates[0], "doc") is None:
+            # Nothing to choose between
+            return [u"return %s(doc, baseuri, loadingOptions, docRoot, probe)" % self.parser(candidates[0])]
+
+        lines = []
+        for t in candidates:
+            check = self.check(t, "doc")
+            if check is not None:
+                lines += [u"if %s:" % check, u"    return doc"]
+            else:
+                lines += [
+                    u"try:",
+                    u"    return %s(doc, baseuri, loadingOptions, docRoot, True)" % self.candidate(t),
+                    u"except ValidationException:",
+                    u"    pass",
+                ]
+        lines.append(self.fail(loader))
+        return lines
+
+    def candidate(self, loader):
+        # type: (cwl_model._Loader) -> str
+        """The parse function to try an alternate of a union with."""
+        if not self.trusted:
+            return self.parser(loader)
+        # Only a full check tells the alternates apart
+        return self.validating.names[id(loader)]
+
+    def uri(self, loader):
+        args = u"baseuri, loadingOptions, %r, %r, %r" % (loader.scoped_id, loader.vocab_term, loader.scoped_ref)
+        lines = [
+            u"if isinstance(doc, list):",
+            u"    doc = [expand_url(i, %s) for i in doc]" % args,
+            u"elif isinstance(doc, str):",
+            u"    doc = expand_url(doc, %s)" % args,
+        ]
+        check = self.assumed(loader.inner, "doc")
+        if check is not None:
+            lines += [u"if %s:" % check, u"    return doc"]
+        lines.append(u"return %s(doc, baseuri, loadingOptions, probe=probe)" % self.parser(loader.inner))
+        return lines
+
+    def typedsl(self, loader):
+        resolve = self.ref(self.module_ref(loader) + ".resolve", "_resolve")
+        return [
+            u"if isinstance(doc, list):",
+            u"    r = []",
+            u"    for d in doc:",
+            u"        if isinstance(d, str):",
+            u"            resolved = %s(d, baseuri, loadingOptions)" % resolve,
+            u"            if isinstance(resolved, list):",
+            u"                for i in resolved:",
+            u"                    if i not in r:",
+            u"                        r.append(i)",
+            u"            elif resolved not in r:",
+            u"                r.append(resolved)",
+            u"        else:",
+            u"            r.append(d)",
+            u"    doc = r",
+            u"elif isinstance(doc, str):",
+            u"    doc = %s(doc, baseuri, loadingOptions)" % resolve,
+            u"return %s(doc, baseuri, loadingOptions, probe=probe)" % self.parser(loader.inner),
+        ]
+
+    def idmap(self, loader):
+        lines = [
+            u"if isinstance(doc, dict):",
+            u"    r = []",
+            u"    for k in sorted(doc.keys()):",
+            u"        val = doc[k]",
+            u"        if isinstance(val, dict):",
+            u"            v = copy.copy(val)",
+            u"            if hasattr(val, 'lc'):",
+            u"                v.lc.data = val.lc.data",
+            u"                v.lc.filename = val.lc.filename",
+        ]
+        if loader.mapPredicate:
+            lines += [
+                u"        else:",
+                u"            v = {%r: val}" % loader.mapPredicate,
+            ]
+        else:
+            lines += [
+                u"        else:",
+                u"            " + self.fail(loader),
+            ]
+        lines += [
+            u"        v[%r] = k" % loader.mapSubject,
+            u"        r.append(v)",
+            u"    doc = r",
+            u"return %s(doc, baseuri, loadingOptions, probe=probe)" % self.parser(loader.inner),
+        ]
+        return lines
+
+    def record(self, cls, name):
+        if cls._reusable:
+            # Parse with a second function, which a reload can skip
+            fresh = name + "_fresh"
+            self.source.append(u"def %s(doc, baseuri, loadingOptions, docRoot=None, probe=False):" % fresh)
+            self.source.extend(u"    " + line for line in self.record_fields(cls))
+            self.source.append(u"")
+            return [
+                u"if loadingOptions.reuse is None:",
+                u"    return %s(doc, baseuri, loadingOptions, docRoot, probe)" % fresh,
+                u"return loadingOptions.reuse.load(%s, doc, baseuri, loadingOptions, docRoot, probe)" % fresh,
+            ]
+        return self.record_fields(cls)
+
+    def record_fields(self, cls):
+        attrs = self.ref(self.module_ref(cls) + ".attrs", "_attrs")
+        new = self.ref(self.module_ref(cls), "_" + cls.__name__)
+        fail = u"return _failed(%s, doc, baseuri, loadingOptions, docRoot, probe)" % new
+        lines = []
+        if getattr(cls, "discriminator", None) is not None:
+            lines += [u"if doc.get('class') != %r:" % cls.discriminator, u"    " + fail]
+        lines += [
+            u"extension = False",
+            u"if not %s.issuperset(doc):" % attrs,
+            u"    for k in doc:",
+            u"        if k not in %s:" % attrs,
+        ]
+        if not self.trusted:
+            lines += [
+                u"            if ':' not in k:",
+                u"                " + fail,
+            ]
+        lines += [
+            u"            extension = True",
+            u"self = %s.__new__(%s)" % (new, new),
+            u"self.loadingOptions = loadingOptions",
+            u"base = baseuri",
+            u"try:",
+        ]
+        if not cls._fields:
+            lines.append(u"    pass")
+        for name, loader_name, optional in cls._fields:
+            field = self.field(name, getattr(cwl_model, loader_name))
+            if optional:
+                lines += [u"    if %r in doc:" % name, u"        v = doc[%r]" % name]
+                lines += [u"        " + line for line in field]
+                lines += [u"    else:", u"        self.%s = None" % _attribute_name(name)]
+            else:
+                lines += [u"    v = doc.get(%r)" % name]
+                lines += [u"    " + line for line in field]
+            if name == cls._identifier:
+                name = _attribute_name(name)
+                lines += [
+                    u"    if self.%s is None:" % name,
+                    u"        if docRoot is not None:",
+                    u"            self.%s = docRoot" % name,
+                    u"        else:",
+                    u"            self.%s = '_:' + str(uuid.uuid4())" % name if cls._identifier_uuid
+                    else u"            raise ValidationException('Missing %s')" % name,
+                    u"    base = self.%s" % name,
+                ]
+        lines += [
+            u"except ValidationException:",
+            u"    " + fail,
+            u"self.extension_fields = _no_extension_fields",
+            u"if extension:",
+            u"    self.extension_fields = {}",
+            u"    for k in doc:",
+            u"        if k not in %s:" % attrs,
+            u"            self.extension_fields[expand_url(k, u'', loadingOptions, scoped_id=False, vocab_term=False)] = doc[k]",
+            u"return self",
+        ]
+        return lines
+
+    def field(self, name, loader):
+        # type: (Text, cwl_model._Loader) -> List[Text]
+        target = u"self.%s" % _attribute_name(name)
+        generic = u"%s = load_field(v, %s, base, loadingOptions)" % (target, self.loader(loader))
+        check = self.assumed(loader, "v")
+        if check is not None:
+            if loader.may_load(dict, None):
+                # load_field would follow an $import
+                check = "not isinstance(v, dict) and %s" % check
+            return [u"if %s:" % check, u"    %s = v" % target, u"else:", u"    " + generic]
+        if isinstance(loader, cwl_model._URILoader) and self.assumed(loader.inner, "v") is not None:
+            return [
+                u"if isinstance(v, str):",
+                u"    v = expand_url(v, base, loadingOptions, %r, %r, %r)" % (loader.scoped_id, loader.vocab_term, loader.scoped_ref),
+                u"    if %s:" % self.assumed(loader.inner, "v"),
+                u"        %s = v" % target,
+                u"    else:",
+                u"        %s = %s(v, base, loadingOptions, probe=True)" % (target, self.parser(loader.inner)),
+                u"else:",
+                u"    " + generic,
+            ]
+        return [
+            u"if isinstance(v, dict) and ('$import' in v or '$include' in v):",
+            u"    " + generic,
+            u"else:",
+            u"    %s = %s(v, base, loadingOptions, probe=True)" % (target, self.parser(loader)),
+        ]
+
+    _generators = {
+        cwl_model._AnyLoader: checked,
+        cwl_model._PrimitiveLoader: checked,
+        cwl_model._EnumLoader: checked,
+        cwl_model._RecordLoader: record_loader,
+        cwl_model._ArrayLoader: array,
+        cwl_model._UnionLoader: union,
+        cwl_model._URILoader: uri,
+        cwl_model._TypeDSLLoader: typedsl,
+        cwl_model._IdMapLoader: idmap,
+    }
+
+_HEADER = u"""\
+# Generated from the loaders of cwl_model by ./generate_parsers; do not edit.
+from __future__ import absolute_import
+import copy
+import uuid
+
+from . import cwl_model as m
+from .cwl_model import (ValidationException, expand_url, load_field,
+                        _failed, _no_extension_fields, _TrustedLoader)
+"""
+
+def generate():
+    # type: () -> Text
+    """The source of cwl_parsers."""
+    loaders, discriminators = _module_loaders()
+    namespace = _Namespace()
+
+    validating = _ParserCompiler(namespace, discriminators, "_parse")
+    validating.compile(loaders)
+
+    trusted = _ParserCompiler(namespace, discriminators, "_trusted_parse", validating)
+    for loader in loaders:
+        trusted.loader(loader)
+    trusted.compile(loaders)
+    trusted_parsers = dict(trusted.parsers(loaders))
+
+    lines = [_HEADER]
+    lines.extend(namespace.source)
+    lines.append(u"")
+    lines.extend(validating.source)
+    lines.extend(trusted.source)
+    lines.append(u"# Each module level loader that has a parser, and the parser")
+    lines.append(u"parsers = [")
+    lines.extend(u"    (%s, %s)," % parser for parser in validating.parsers(loaders))
+    lines.append(u"]")
+    lines.append(u"")
+    lines.append(u"# Each module level loader, the loader to use in its place when validation is")
+    lines.append(u"# off, and that loader's parser if it has one")
+    lines.append(u"trusted_loaders = [")
+    for loader, name in six.itervalues(trusted.trusted_loaders):
+        module_ref = namespace.module_ref(loader)
+        lines.append(u"    (%s, %s, %s)," % (module_ref, name, trusted_parsers.get(module_ref)))
+    lines.append(u"]")
+    return u"\n".join(lines) + u"\n"
@@ -0,0 +1,120 @@
+"""
+Generated CWL documents, of any size, for the tests and benchmarks.
+"""
+import os
+import os.path as path
+
+import ruamel.yaml as yaml
+
+def write_cwl(filename, cwl):
+    """Write cwl as YAML to filename, making its directory if need be."""
+    os.makedirs(path.dirname(str(filename)), exist_ok=True)
+    with open(str(filename), "w") as fp:
+        yaml.dump(cwl, fp, default_flow_style=False)
+
+def js_tool(i):
+    """A tool with expressions in an input binding and an output binding."""
+    return {
+        "cwlVersion": "v1.0",
+        "class": "CommandLineTool",
+        "requirements": [{"class": "InlineJavascriptRequirement", "expressionLib": [f"function scale(x) {{ return x * {i}; }}"]}],
+        "baseCommand": ["echo", f"tool{i}"],
+        "inputs": [
+            {"id": "number", "type": "int", "inputBinding": {"valueFrom": "${return scale(inputs.number);}"}},
+            {"id": "label", "type": "string", "default": f"label{i}", "inputBinding": {"prefix": "--label"}},
+        ],
+        "outputs": [
+            {"id": "out", "type": "string", "outputBinding": {"glob": "out.txt", "loadContents": True, "outputEval": "$(self[0].contents.trim())"}},
+        ],
+        "stdout": "out.txt",
+    }
+
+def workflow(steps):
+    """A workflow whose steps, (id, run) pairs, each take its input number."""
+    return {
+        "cwlVersion": "v1.0",
+        "class": "Workflow",
+        "requirements": [{"class": "SubworkflowFeatureRequirement"}],
+        "inputs": {"number": "int"},
+        "outputs": {step_id: {"type": "string", "outputSource": f"{step_id}/out"} for step_id, _ in steps},
+        "steps": [{"id": step_id, "run": run, "in": {"number": "number"}, "out": ["out"]} for step_id, run in steps],
+    }
+
+def inline_workflow(width):
+    """
+    A workflow of width steps that all run the same kind of inline tool, each
+    reading the workflow input and the output of the step before it.
+    """
+    steps = []
+    for i in range(width):
+        steps.append({
+            "id": f"step{i}",
+            "in": {
+                "reads": "reads",
+                "previous": f"step{i - 1}/out" if i > 0 else "reads",
+                "label": {"default": f"sample{i}"},
+            },
+            "out": ["out", "log"],
+            "run": {
+                "class": "CommandLineTool",
+                "baseCommand": "cat",
+                "inputs": {
+                    "reads": "File",
+                    "previous": "File",
+                    "label": "string?",
+                    "threads": {"type": "int", "default": 1},
+                },
+                "outputs": {
+                    "out": "stdout",
+                    "log": {"type": "File?", "outputBinding": {"glob": "*.log"}},
+                },
+            },
+        })
+
+    return {
+        "cwlVersion": "v1.0",
+        "class": "Workflow",
+        "inputs": {"reads": "File"},
+        "outputs": {
+            f"out{i}": {"type": "File", "outputSource": f"step{i}/out"}
+            for i in range(width)
+        },
+        "steps": steps,
+    }
+
+def packed_workflow(width):
+    """
+    inline_workflow(width) with each step's tool moved into a $graph entry of
+    its own.
+    """
+    workflow = inline_workflow(width)
+    graph = []
+    for i, step in enumerate(workflow["steps"]):
+        tool = dict(step["run"], id=f"tool{i}")
+        graph.append(tool)
+        step["run"] = f"#tool{i}"
+
+    graph.append(dict(workflow, id="main"))
+    return {"cwlVersion": "v1.0", "$graph": graph}
+
+def packed_tools(width):
+    """A $graph of width tools, each with a few inputs and outputs."""
+    return {
+        "cwlVersion": "v1.0",
+        "$graph": [{
+            "id": f"tool{i}",
+            "class": "CommandLineTool",
+            "requirements": [{"class": "InlineJavascriptRequirement"}],
+            "baseCommand": ["echo", f"tool{i}"],
+            "inputs": {
+                "number": {"type": "int", "inputBinding": {"valueFrom": f"$(self * {i})"}},
+                "label": {"type": "string?", "default": f"label{i}", "inputBinding": {"prefix": "--label"}},
+                "reads": {"type": {"type": "array", "items": "File"}, "secondaryFiles": [".bai"]},
+            },
+            "outputs": {
+                "out": "stdout",
+                "log": {"type": "File?", "outputBinding": {"glob": "*.log"}},
+            },
+            "stdout": "out.txt",
+        } for i in range(width)],
+    }
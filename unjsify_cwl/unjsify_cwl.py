@@ -1,5 +1,6 @@
 import argparse
-import copy
+import hashlib
+import io
 import itertools
 import json
 import os
@@ -7,17 +8,20 @@ import os.path as path
 import re
 import shutil
 import sys
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Union
 import types
 import tempfile
 import logging
-from collections import namedtuple
+from collections import Counter, namedtuple
 import time
+from concurrent.futures import Executor
 
-import pkg_resources
 import ruamel.yaml as yaml
 
 from .get_expressions import scan_expression, is_parameter_reference
+from .document_cache import DocumentCache
+from .cwl_writer import dump_cwl, plain_cwl
+from .nested_map import inplace_nested_map, nested_leaf_map
 from . import cwl_model
 
 def dict_map(func, d):
@@ -28,9 +32,93 @@ OUTPUT_EXPR_SYMBOL = "__output_exprs"
 
 logger = logging.getLogger()
 
+class CWLMap(list):
+    """
+    A CWL map in list form, a list of objects each named by its id_token
+    field, that also finds them by name in constant time. It is still a list,
+    and the cwl_map functions below take it like any other; changes made
+    through them, or with append, keep the index, and any other change to the
+    list rebuilds it on the next lookup.
+    """
+    def __init__(self, elements=(), id_token="id"):
+        super().__init__(elements)
+        self.id_token = id_token
+        self.positions = None # type: Optional[Dict[str, int]]
+
+    def position(self, name):
+        if self.positions is None:
+            positions = {}
+            for i, element in enumerate(self):
+                positions.setdefault(element[self.id_token], i)
+            self.positions = positions
+        return self.positions.get(name)
+
+    def get(self, name):
+        i = self.position(name)
+        return None if i is None else self[i]
+
+    def set(self, name, value):
+        i = self.position(name)
+        if i is not None:
+            super().__setitem__(i, value)
+            if value.get(self.id_token) != name:
+                self.positions = None
+
+    def append(self, element):
+        super().append(element)
+        if self.positions is not None:
+            self.positions.setdefault(element[self.id_token], len(self) - 1)
+
+    def copy(self):
+        return CWLMap(self, self.id_token)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.positions = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.positions = None
+
+    def __iadd__(self, elements):
+        result = super().__iadd__(elements)
+        self.positions = None
+        return result
+
+    def remove(self, element):
+        super().remove(element)
+        self.positions = None
+
+    def insert(self, i, element):
+        super().insert(i, element)
+        self.positions = None
+
+    def extend(self, elements):
+        super().extend(elements)
+        self.positions = None
+
+    def pop(self, i=-1):
+        element = super().pop(i)
+        self.positions = None
+        return element
+
+    def clear(self):
+        super().clear()
+        self.positions = None
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.positions = None
+
+    def reverse(self):
+        super().reverse()
+        self.positions = None
+
 def get_cwl_map(cwl_map, name, id_token="id"):
     if isinstance(cwl_map, dict):
         return cwl_map.get(name)
+    elif isinstance(cwl_map, CWLMap) and cwl_map.id_token == id_token:
+        return cwl_map.get(name)
     else:
         for element in cwl_map:
             if element[id_token] == name:
@@ -39,6 +127,8 @@ def get_cwl_map(cwl_map, name, id_token="id"):
 def set_cwl_map(cwl_map, name, value, id_token="id"):
     if isinstance(cwl_map, dict):
         cwl_map[name] = value
+    elif isinstance(cwl_map, CWLMap) and cwl_map.id_token == id_token:
+        cwl_map.set(name, value)
     else:
         for i, element in enumerate(cwl_map):
             if element[id_token] == name:
@@ -47,6 +137,10 @@ def set_cwl_map(cwl_map, name, value, id_token="id"):
 def remove_cwl_map(cwl_map, name, id_token="id"):
     if isinstance(cwl_map, dict):
         del cwl_map[name]
+    elif isinstance(cwl_map, CWLMap) and cwl_map.id_token == id_token:
+        element = cwl_map.get(name)
+        if element is not None:
+            cwl_map.remove(element)
     else:
         for element in cwl_map:
             if element[id_token] == name:
@@ -65,6 +159,12 @@ def add_cwl_map(cwl_map, name, id_token="id", object=None):
 
     return object
 
+def copy_cwl_map(cwl_map, id_token="id"):
+    """
+    A copy of cwl_map to change; a map in list form is copied to a CWLMap.
+    """
+    return dict(cwl_map) if isinstance(cwl_map, dict) else CWLMap(cwl_map, id_token)
+
 def get_map_keys(cwl_map, id_token="id"):
     if isinstance(cwl_map, dict):
         return list(cwl_map.keys())
@@ -88,7 +188,7 @@ def map_to_array(cwl_map, id_token="id", secondary_symbol="source"):
 def is_path_in(test_path, containing_path):
     return path.commonpath([path.abspath(test_path), path.abspath(containing_path)]) == path.abspath(containing_path)
 
-def unjsify(workflow_location: str, outdir: str, base_cwldir: str, language: str):
+def unjsify(workflow_location: str, outdir: str, base_cwldir: str, language: str, run=None):
     if not path.isdir(outdir):
         os.mkdir(outdir)
 
@@ -100,10 +200,11 @@ def unjsify(workflow_location: str, outdir: str, base_cwldir: str, language: str
         raise ValueError
 
     with open(path.join(outdir, "eval_exprs.cwl"), "wb") as eval_exprs_dest:
-        with pkg_resources.resource_stream(__name__, eval_exprs_filename) as eval_exprs_source:
+        # The eval_exprs_*.cwl files are installed next to this module
+        with open(path.join(path.dirname(__file__), eval_exprs_filename), "rb") as eval_exprs_source:
             shutil.copyfileobj(eval_exprs_source, eval_exprs_dest)
 
-    return unjsify_workflow(workflow_location, outdir, base_cwldir)
+    return unjsify_workflow(workflow_location, outdir, base_cwldir, run)
 
 
 def frozon(json_ob):
@@ -122,20 +223,62 @@ def frozon(json_ob):
     else:
         return json_ob
 
-cwl_file_cache = {} # type: Dict[str, Any]
-
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
-
-def pureify(cwl):
-    def pureify_node(node):
-        if isinstance(node, CommentedMap):
-            return dict(node)
-        elif isinstance(node, CommentedSeq):
-            return list(node)
-        else:
-            return node
+class UnjsifyRun:
+    """
+    The settings of a run of unjsify, and the documents and results it keeps
+    as it goes. Each run has its own, which is passed down to everything that
+    loads, unjsifies or writes a document.
+    """
 
-    return inplace_nested_map(pureify_node, cwl)
+    def __init__(self, document_cache=None, load_executor=None, unjsify_executor=None, fast_yaml=False, low_memory=False, trusted=False, fetch_workers=None):
+        self.document_cache = document_cache # type: Optional[DocumentCache]
+        self.load_executor = load_executor # type: Optional[Executor]
+        self.unjsify_executor = unjsify_executor # type: Optional[Executor]
+        self.fast_yaml = fast_yaml
+        self.low_memory = low_memory
+        self.trusted = trusted
+        self.fetch_workers = fetch_workers # type: Optional[int]
+
+        # One loading context for every document in the run, so that parsed
+        # files, the fetcher and the vocabularies are shared
+        self.loading_options = self.new_loading_options(load_executor)
+        # Loaded documents, by path
+        self.cwl_file_cache = {} # type: Dict[str, Any]
+        # Documents loaded across load_executor ahead of get_cwl, by path
+        self.prefetched_cwl = {} # type: Dict[str, Any]
+        # unjsify_tool_once results, by the digest of the tool
+        self.unjsified_tools = {} # type: Dict[str, Any]
+        # unjsify_tool_parts results being worked out by unjsify_executor, by the digest of the tool
+        self.pending_tools = {} # type: Dict[str, Any]
+        # New subworkflows, by the location of the subworkflow and of eval_exprs.cwl
+        self.unjsified_workflows = {} # type: Dict[Any, Any]
+        # Output files written so far
+        self.written_cwl_files = set()
+        # The output files, and their text being dumped by unjsify_executor, in the order they are written
+        self.pending_cwl_files = [] # type: List[Any]
+        # The entries of new $graph documents, by output file, written once the workflow is done
+        self.new_graphs = {} # type: Dict[str, CWLMap]
+        # Tools and subworkflows unjsified, and reused
+        self.counts = Counter() # type: Counter
+
+    def new_loading_options(self, executor=None):
+        """
+        A new loading context with the settings of this run. Process pool
+        workers each load with one of their own, without an executor.
+        """
+        return cwl_model.LoadingOptions(
+            executor=executor, fast_yaml=self.fast_yaml, low_memory=self.low_memory,
+            validate=not self.trusted, fetch_workers=self.fetch_workers
+        )
+
+    def stats(self) -> str:
+        return (
+            f"unjsified {self.counts['tools']} tools and {self.counts['workflows']} subworkflows, "
+            f"reused them {self.counts['tool reuses']} and {self.counts['workflow reuses']} times"
+        )
+
+# What loading a document raises when the document, rather than unjsifycwl, is at fault
+LOAD_ERRORS = (cwl_model.ValidationException, yaml.YAMLError, OSError, ValueError)
 
 def expand_cwl(cwl, cwl_dir):
     if isinstance(cwl, dict):
@@ -171,42 +314,46 @@ def dictify_cwl(cwl):
 
     return inplace_nested_map(dictify_node, cwl)
 
-def relativise(cwl, base_cwl_filename):
-    this_cwl_filename = "file://" + base_cwl_filename
+def load_cwl_document(cwl_path, loading_options=None):
+    # url = "file://" + path.abspath(cwl_path)
+    # raw_cwl = metaschema_loader.fetch(url)
+    # schema_doc, _ = metaschema_loader.resolve_all(raw_cwl, url)
+    if loading_options is None:
+        loading_options = cwl_model.LoadingOptions()
+    cwl = plain_cwl(cwl_model.load_document("file://" + path.abspath(cwl_path), "", loading_options), path.abspath(cwl_path))
 
-    def relativise_str(s, base_id):
-        if s.startswith(base_id):
-            return s[len(base_id) + 1:].replace("#", "")
-        elif s.startswith(this_cwl_filename):
-            return "#" + s[len(this_cwl_filename) + 1:].replace("#", "")
-        elif s.startswith("file://"):
-            return path.relpath(s, path.dirname(base_id))
-        else:
-            return s
+    logger.debug(f"{cwl_path}: expand_url memo {loading_options.expand_url_memo}, save_relative_uri memo {loading_options.relative_uri_memo}")
 
-    def relativise_node(node, base_id):
-        if isinstance(node, dict) and node.get("id") is not None:
-            old_node_id = node["id"]
-            node["id"] = relativise_str(node["id"], base_id)
-            base_id = old_node_id
-        if isinstance(node, str):
-            return relativise_str(node, base_id), base_id
-        else:
-            return node, base_id
+    return cwl
 
-    return inplace_nested_map_with_state(relativise_node, cwl, this_cwl_filename)
+def load_cwl_fragment(cwl_path, fragment, loading_options):
+    """
+    Load only the process with id fragment from the $graph document at cwl_path.
+    """
+    cwl_path = path.abspath(cwl_path)
 
-def load_cwl_document(cwl_path):
-    # url = "file://" + path.abspath(cwl_path)
-    # raw_cwl = metaschema_loader.fetch(url)
-    # schema_doc, _ = metaschema_loader.resolve_all(raw_cwl, url)
-    return relativise(
-        cwl_model.save(cwl_model.load_document("file://" + path.abspath(cwl_path), "")),
-        path.abspath(cwl_path)
-    )
+    graph = cwl_model.load_document("file://" + cwl_path, "", cwl_model.LoadingOptions(copyfrom=loading_options, lazy_graph=True))
+    assert isinstance(graph, cwl_model.LazyGraph)
 
-def get_cwl(cwl_path):
-    global cwl_file_cache
+    process = graph.get(f"file://{cwl_path}#{fragment}")
+    if process is None:
+        raise ValueError(f"Not found hash {fragment} in cwl graph")
+
+    # Relativise it as an entry of the graph, the way load_cwl_document would
+    return plain_cwl([process], cwl_path)[0]
+
+def get_cwl(cwl_path, run=None):
+    """
+    Load the CWL document at cwl_path in its plain dict/list form, with
+    references relative to the file.
+
+    Documents are cached in run, and the same one is handed to every caller,
+    so it must not be modified: copy the dicts and lists on the way to a
+    change. Without a run, the document is loaded in one of its own.
+    """
+    if run is None:
+        run = UnjsifyRun()
+    loading_options = run.loading_options
 
     hash_pos = cwl_path.find("#")
 
@@ -214,23 +361,71 @@ def get_cwl(cwl_path):
         hash_part = cwl_path[hash_pos+1:]
         cwl_path = cwl_path[:hash_pos]
 
-    if cwl_file_cache.get(cwl_path) is not None:
-        cwl = cwl_file_cache[cwl_path]
+        if run.document_cache is None and run.cwl_file_cache.get(cwl_path) is None:
+            fragment_path = f"{cwl_path}#{hash_part}"
+            if run.cwl_file_cache.get(fragment_path) is not None:
+                return run.cwl_file_cache[fragment_path]
+
+            cwl = load_cwl_fragment(cwl_path, hash_part, loading_options)
+            run.cwl_file_cache[fragment_path] = cwl
+            return cwl
+
+    if run.cwl_file_cache.get(cwl_path) is not None:
+        cwl = run.cwl_file_cache[cwl_path]
+    elif run.document_cache is not None:
+        def load_document(fetcher):
+            # Parse everything again, so that the fetcher sees all the files
+            # the cache entry depends on
+            cache_loading_options = cwl_model.LoadingOptions(copyfrom=loading_options, fetcher=fetcher)
+            cache_loading_options.idx = {}
+            return load_cwl_document(cwl_path, cache_loading_options)
+
+        cwl = run.document_cache.load(cwl_path, load_document, validated=loading_options.validate)
+        run.cwl_file_cache[cwl_path] = cwl
     else:
-        cwl = load_cwl_document(cwl_path)
+        if cwl_path in run.prefetched_cwl:
+            cwl = run.prefetched_cwl.pop(cwl_path)
+        else:
+            cwl = load_cwl_document(cwl_path, loading_options)
 
-        cwl_file_cache[cwl_path] = copy.deepcopy(cwl)
+        run.cwl_file_cache[cwl_path] = cwl
 
     if hash_pos != -1:
         assert isinstance(cwl, list)
 
         for cwl_file in cwl:
             if cwl_file["id"] == hash_part:
-                return pureify(cwl)
+                return cwl_file
 
-        raise ValueError(f"Not found hash {hash_pos} in cwl graph")
+        raise ValueError(f"Not found hash {hash_part} in cwl graph")
     else:
-        return pureify(cwl)
+        return cwl
+
+def prefetch_cwl(cwl_paths: List[str], run):
+    """
+    Load the documents at cwl_paths across the load executor of run, ready
+    for get_cwl.
+
+    Documents that fail to load are left for get_cwl to load, and fail, in
+    their usual order.
+    """
+    if run.load_executor is None or run.document_cache is not None:
+        return
+
+    # Fragments of $graph documents are loaded on their own by get_cwl
+    cwl_paths = sorted(set(
+        cwl_path for cwl_path in cwl_paths if "#" not in cwl_path
+    ).difference(run.cwl_file_cache, run.prefetched_cwl))
+    if len(cwl_paths) < 2:
+        return
+
+    # Each worker loads with its own context
+    futures = [(cwl_path, run.load_executor.submit(load_cwl_document, cwl_path, run.new_loading_options())) for cwl_path in cwl_paths]
+    for cwl_path, future in futures:
+        try:
+            run.prefetched_cwl[cwl_path] = future.result()
+        except LOAD_ERRORS:
+            pass
 
 def resolve_path(current_workflow, path_to_resolve):
     if path_to_resolve[0] == "#":
@@ -310,7 +505,7 @@ def unjsify_workflow_exprs(workflow_step, eval_exprs_location, expressionLib):
     if ids == []:
         return None
 
-    new_workflow_step = copy.deepcopy(workflow_step)
+    new_workflow_step = {**workflow_step, "in": copy_cwl_map(workflow_step["in"])}
 
     if expressionLib is None:
         workflow_expression_lib_dict = {}
@@ -322,7 +517,8 @@ def unjsify_workflow_exprs(workflow_step, eval_exprs_location, expressionLib):
         }
 
     for id_to_delete in ids:
-        del new_workflow_step["in"][id_to_delete]["valueFrom"]
+        step_in = new_workflow_step["in"][id_to_delete]
+        new_workflow_step["in"][id_to_delete] = {key: value for key, value in step_in.items() if key != "valueFrom"}
 
     workflow_expr_step = {
         "id": EVAL_WORKFLOW_EXPRS,
@@ -365,41 +561,162 @@ def unjsify_workflow_exprs(workflow_step, eval_exprs_location, expressionLib):
 
     return new_workflow_step, (workflow_expr_step, workflow_expr_process_step), redirections
 
-def write_new_cwl(old_location, cwl, outdir, base_cwldir):
+def write_new_cwl(old_location, cwl, outdir, base_cwldir, run):
+    """
+    Write cwl as the new document for old_location. Every step that runs a
+    document gets the same new document, so each output file is only written
+    the first time in a run.
+    """
     if not is_path_in(old_location, base_cwldir):
         raise Exception(f"Invalid reference to file {old_location}, outside the basedir of {base_cwldir}")
 
+    out_file = path.join(outdir, path.relpath(old_location, base_cwldir))
+    if out_file in run.written_cwl_files:
+        return
+    run.written_cwl_files.add(out_file)
+
     hash_pos = old_location.find("#")
 
     if hash_pos != -1:
+        # Every new entry of a $graph document goes into the one new copy of it
         hash_part = old_location[hash_pos+1:]
-        base_cwl = get_cwl(old_location[:hash_pos])
+        graph_file = out_file[:out_file.rfind("#")]
+        graph = run.new_graphs.get(graph_file)
+        if graph is None:
+            graph = run.new_graphs[graph_file] = copy_cwl_map(get_cwl(old_location[:hash_pos], run))
+        set_cwl_map(graph, hash_part, {**cwl, "id": hash_part})
+        return
 
-        set_cwl_map(base_cwl["$graph"], hash_part, cwl)
-        cwl = base_cwl
+    write_cwl_file(out_file, cwl, run)
 
-    out_file = path.join(outdir, path.relpath(old_location, base_cwldir))
+def write_new_graphs(run):
+    """
+    Write the new $graph documents of run, with the entries write_new_cwl
+    has put in them.
+    """
+    for out_file, graph in run.new_graphs.items():
+        write_cwl_file(out_file, {"cwlVersion": "v1.0", "$graph": graph}, run)
+    run.new_graphs.clear()
+
+def write_cwl_file(out_file, cwl, run):
+    if run.unjsify_executor is not None:
+        run.pending_cwl_files.append((out_file, run.unjsify_executor.submit(dump_cwl_text, cwl)))
+        return
 
     os.makedirs(path.dirname(out_file), exist_ok=True)
 
     with open(out_file, "w") as output_file:
-        yaml.dump(cwl, output_file, default_flow_style=False)
+        dump_cwl(cwl, output_file)
+
+def dump_cwl_text(cwl):
+    output = io.StringIO()
+    dump_cwl(cwl, output)
+    return output.getvalue()
+
+def write_pending_cwl_files(run):
+    """
+    Write the output files dumped across the unjsify executor of run, in the
+    order a serial run would have written them.
+    """
+    try:
+        for out_file, future in run.pending_cwl_files:
+            text = future.result()
+
+            os.makedirs(path.dirname(out_file), exist_ok=True)
+
+            with open(out_file, "w") as output_file:
+                output_file.write(text)
+    finally:
+        run.pending_cwl_files.clear()
+
+def submit_tools(workflow_cwl, workflow_location, run):
+    """
+    Start unjsifying the tools run by workflow_cwl and its subworkflows across
+    the unjsify executor of run, visiting them in the order unjsify_workflow_helper will.
+    A document that fails to load stops the walk, for the helper to fail on
+    it in its usual place.
+    """
+    workflows = [(workflow_cwl, workflow_location)]
+    visited = set()
+
+    while workflows:
+        workflow_cwl, workflow_location = workflows.pop()
+        prefetch_cwl([resolve_path(workflow_location, step["run"]) for step in workflow_cwl["steps"] if isinstance(step["run"], str)], run)
+
+        subworkflows = []
+        for step in workflow_cwl["steps"]:
+            if isinstance(step["run"], str):
+                step_run_location = resolve_path(workflow_location, step["run"])
+                try:
+                    step_tool_cwl = get_cwl(step_run_location, run)
+                except LOAD_ERRORS:
+                    return
+            else:
+                step_run_location = workflow_location
+                step_tool_cwl = step["run"]
+
+            if step_tool_cwl["class"] == "Workflow":
+                if step_run_location not in visited or not isinstance(step["run"], str):
+                    visited.add(step_run_location)
+                    subworkflows.append((step_tool_cwl, step_run_location))
+            elif step_tool_cwl["class"] in ("CommandLineTool", "ExpressionTool"):
+                if step_tool_cwl["class"] == "ExpressionTool":
+                    step_tool_cwl = expression_tool_to_command_line_tool(step_tool_cwl)
+
+                digest = tool_digest(step_tool_cwl)
+                if digest is not None and digest not in run.unjsified_tools and digest not in run.pending_tools:
+                    run.pending_tools[digest] = run.unjsify_executor.submit(unjsify_tool_parts, step_tool_cwl)
+
+        # The helper goes into each subworkflow as it comes to it
+        workflows.extend(reversed(subworkflows))
+
+def unjsify_workflow(workflow_location: str, outdir: str, base_cwldir: str, run=None):
+    """
+    Unjsify the workflow or tool at workflow_location, and the documents it
+    runs, into outdir, as run, or a run with the default settings. Returns
+    the run.
+    """
+    if run is None:
+        run = UnjsifyRun()
 
-def unjsify_workflow(workflow_location: str, outdir: str, base_cwldir: str):
     eval_exprs_location = path.relpath(path.join(base_cwldir, "eval_exprs.cwl"), path.dirname(workflow_location))
-    workflow_cwl = get_cwl(workflow_location)
+    workflow_cwl = get_cwl(workflow_location, run)
+
+    if run.unjsify_executor is not None and workflow_cwl["class"] == "Workflow":
+        submit_tools(workflow_cwl, workflow_location, run)
+
+    try:
+        new_workflow_cwl = unjsify_workflow_helper(workflow_cwl, workflow_location, outdir, base_cwldir, eval_exprs_location, run)
 
-    new_workflow_cwl = unjsify_workflow_helper(workflow_cwl, workflow_location, outdir, base_cwldir, eval_exprs_location)
+        write_new_cwl(workflow_location, new_workflow_cwl, outdir, base_cwldir, run)
+        write_new_graphs(run)
+    finally:
+        run.pending_tools.clear()
+        write_pending_cwl_files(run)
 
-    write_new_cwl(workflow_location, new_workflow_cwl, outdir, base_cwldir)
+    return run
+
+def expression_tool_to_command_line_tool(tool_cwl):
+    requirements = tool_cwl.get("requirements")
+    requirements = copy_cwl_map([] if requirements is None else requirements, "class")
+    requirements.append({
+        "class": "InlineJavascriptRequirement"
+    })
+
+    return {
+        **{key: value for key, value in tool_cwl.items() if key != "expression"},
+        "class": "CommandLineTool",
+        "arguments": ["bash", "-c", 'echo $0 | cut -c 2- > cwl.output.json', "|" + tool_cwl["expression"]],
+        "requirements": requirements,
+    }
 
-def unjsify_workflow_helper(workflow_cwl: Dict[str, Any], workflow_location: str, outdir: str, base_cwldir: str, eval_exprs_location: str):
+def unjsify_workflow_helper(workflow_cwl: Dict[str, Any], workflow_location: str, outdir: str, base_cwldir: str, eval_exprs_location: str, run: UnjsifyRun):
     """
     Unjsify a workflow.
 
     Note: workflow_content can be a string or a cwl workflow, to represent a path or a literal workflow.
     """
-    my_write_new_cwl = lambda old_location, cwl: write_new_cwl(old_location, cwl, outdir, base_cwldir)
+    my_write_new_cwl = lambda old_location, cwl: write_new_cwl(old_location, cwl, outdir, base_cwldir, run)
 
     if workflow_cwl["class"] != "Workflow":
         inputs_ids = get_map_keys(workflow_cwl["inputs"], "id")
@@ -421,30 +738,31 @@ def unjsify_workflow_helper(workflow_cwl: Dict[str, Any], workflow_location: str
             }]
         }
 
-        global cwl_file_cache
-        cwl_file_cache[resolve_path(workflow_location, "__" + path.basename(workflow_location))] = get_cwl(workflow_location)
+        run.cwl_file_cache[resolve_path(workflow_location, "__" + path.basename(workflow_location))] = get_cwl(workflow_location, run)
 
-    new_workflow_cwl = copy.deepcopy(workflow_cwl)
+    # Only the requirements and the steps are changed; workflow_cwl itself may
+    # be shared through the cwl_file_cache of run
+    new_workflow_cwl = dict(workflow_cwl)
+    new_workflow_cwl["requirements"] = copy_cwl_map(workflow_cwl.get("requirements", []), "class")
+    new_workflow_cwl["steps"] = CWLMap(dict(step) for step in workflow_cwl["steps"])
 
     workflow_expression_lib = None
     if get_cwl_map(workflow_cwl.get("requirements", {}), "InlineJavascriptRequirement", "class") is not None:
         workflow_expression_lib = get_cwl_map(workflow_cwl["requirements"], "InlineJavascriptRequirement", "class").get("expressionLib", None)
         remove_cwl_map(new_workflow_cwl["requirements"], "InlineJavascriptRequirement", "class")
 
-
-    if "requirements" not in new_workflow_cwl:
-        new_workflow_cwl["requirements"] = []
-
     # this is needed to pass multiple inputs to the expression evaluation step and have subworkflows for grouping
     add_cwl_map(new_workflow_cwl["requirements"], "MultipleInputFeatureRequirement", "class")
     add_cwl_map(new_workflow_cwl["requirements"], "SubworkflowFeatureRequirement", "class")
     add_cwl_map(new_workflow_cwl["requirements"], "StepInputExpressionRequirement", "class")
 
+    prefetch_cwl([resolve_path(workflow_location, step["run"]) for step in workflow_cwl["steps"] if isinstance(step["run"], str)], run)
+
     for i, step in enumerate(workflow_cwl["steps"]):
         step_id = step["id"]
         if isinstance(step["run"], str):
             step_run_location = resolve_path(workflow_location, step["run"])
-            step_tool_cwl = get_cwl(step_run_location)
+            step_tool_cwl = get_cwl(step_run_location, run)
         else:
             step_run_location = None
             step_tool_cwl = step["run"]
@@ -469,17 +787,9 @@ def unjsify_workflow_helper(workflow_cwl: Dict[str, Any], workflow_location: str
             output_redirections = {}
 
             if step_tool_cwl["class"] == "ExpressionTool":
-                step_tool_cwl["class"] = "CommandLineTool"
-                step_tool_cwl["arguments"] = ["bash", "-c", 'echo $0 | cut -c 2- > cwl.output.json', "|" + step_tool_cwl["expression"]]
-
-                if step_tool_cwl.get("requirements") is None:
-                    step_tool_cwl["requirements"] = []
-                step_tool_cwl["requirements"].append({
-                    "class": "InlineJavascriptRequirement"
-                })
-                del step_tool_cwl["expression"]
+                step_tool_cwl = expression_tool_to_command_line_tool(step_tool_cwl)
 
-            result = unjsify_tool_step(step_tool_cwl, step, eval_exprs_location)
+            result = unjsify_tool_step(step_tool_cwl, step, eval_exprs_location, run)
             if result is not None:
                 new_tool, (inputs_expr_step, output_processing_step, process_expr_step), output_redirections = result
             else:
@@ -506,7 +816,14 @@ def unjsify_workflow_helper(workflow_cwl: Dict[str, Any], workflow_location: str
                     })
 
             if any([workflow_expr_step, workflow_expr_process_step, runtime_expr_step, inputs_expr_step, output_processing_step]):
+                wrapper_id = {}
+                if step_run_location is not None and "#" in step["run"]:
+                    # Without an id of its own, the wrapper's reference to the
+                    # $graph entry would resolve against a blank node
+                    wrapper_id = {"id": f"{step_id}_unjsified"}
+
                 get_cwl_map(new_workflow_cwl["steps"], step_id)["run"] = {
+                    **wrapper_id,
                     "class": "Workflow",
                     "inputs": dict(map(lambda input_name: (input_name, {
                         "type": "Any?"
@@ -526,67 +843,39 @@ def unjsify_workflow_helper(workflow_cwl: Dict[str, Any], workflow_location: str
                                 **({EXPR_SYMBOL: f"{EVAL_INPUT_EXPRS}/output"} if inputs_expr_step is not None else {})
                             },
                             "out": step["out"],
-                            "run": step["run"]
+                            "run": step["run"] if step_run_location is not None else new_tool
                         },
                         output_processing_step
                     ]))
                 }
         elif step_tool_cwl["class"] == "Workflow":
             if step_run_location is None:
-                new_workflow_location = workflow_location
-            else:
-                new_workflow_location = step_run_location
-
-            new_workflow = unjsify_workflow_helper(step_tool_cwl, new_workflow_location, outdir, base_cwldir, eval_exprs_location)
-
-            if step_run_location is None:
+                new_workflow = unjsify_workflow_helper(step_tool_cwl, workflow_location, outdir, base_cwldir, eval_exprs_location, run)
                 get_cwl_map(new_workflow_cwl["steps"], step_id)["run"] = new_workflow
             else:
-                my_write_new_cwl(step_run_location, new_workflow)
+                unjsify_subworkflow(step_tool_cwl, step_run_location, outdir, base_cwldir, eval_exprs_location, run)
         else:
             raise Exception(f'Unknown step type {step_tool_cwl["class"]}')
 
     return new_workflow_cwl
 
-def inplace_nested_leaf_map(func, struct):
-    if isinstance(struct, dict):
-        for key, value in struct.items():
-            struct[key] = inplace_nested_leaf_map(func, value)
-        return struct
-    elif isinstance(struct, list):
-        for i, item in enumerate(struct):
-            struct[i] = inplace_nested_leaf_map(func, item)
-        return struct
-    else:
-        return func(struct)
-
+def unjsify_subworkflow(workflow_cwl, workflow_location, outdir, base_cwldir, eval_exprs_location, run):
+    """
+    Unjsify the subworkflow at workflow_location and write it out, along with
+    the documents its steps run. A subworkflow run from several places is
+    only unjsified the first time in a run.
+    """
+    key = (workflow_location, eval_exprs_location)
+    if key in run.unjsified_workflows:
+        run.counts["workflow reuses"] += 1
+        return run.unjsified_workflows[key]
 
-def inplace_nested_map_with_state(func, struct, state=None):
-    if state is None:
-        state = {}
+    run.counts["workflows"] += 1
+    new_workflow = unjsify_workflow_helper(workflow_cwl, workflow_location, outdir, base_cwldir, eval_exprs_location, run)
+    write_new_cwl(workflow_location, new_workflow, outdir, base_cwldir, run)
 
-    if isinstance(struct, dict):
-        for key, value in struct.items():
-            struct[key] = inplace_nested_map_with_state(func, *func(value, copy.deepcopy(state)))
-        return struct
-    elif isinstance(struct, list):
-        for i, item in enumerate(struct):
-            struct[i] = inplace_nested_map_with_state(func, *func(item, copy.deepcopy(state)))
-        return struct
-    else:
-        return func(struct, copy.deepcopy(state))[0]
-
-def inplace_nested_map(func, struct):
-    if isinstance(struct, dict):
-        for key, value in struct.items():
-            struct[key] = inplace_nested_map(func, func(value))
-        return struct
-    elif isinstance(struct, list):
-        for i, item in enumerate(struct):
-            struct[i] = inplace_nested_map(func, func(item))
-        return struct
-    else:
-        return func(struct)
+    run.unjsified_workflows[key] = new_workflow
+    return new_workflow
 
 def replace_expr(node, on_found_expr):
     value_arr = list(node)
@@ -612,15 +901,55 @@ def map_by_property(lst, property, lazy=True):
     else:
         return list(r)
 
-def unjsify_tool_step(tool_cwl, tool_step, eval_exprs_location):
-    output_processing_step = None
-    inputs_expr_step = None
+UnjsifiedTool = namedtuple(
+    "UnjsifiedTool",
+    ["new_tool", "input_expressions", "output_expressions", "output_redirections", "expression_lib_dict", "inputs_to_process", "inputs_expr_process_step"]
+)
+
+def tagged_json_value(value):
+    # YAML timestamps load as dates, which JSON has no type for; tag them with
+    # their type so that they don't hash the same as the string they print as
+    return {"\0" + type(value).__name__: str(value)}
+
+def tool_digest(tool_cwl):
+    """
+    The sha256 of the content of tool_cwl, or None if it can't be written as
+    JSON, such as when it has keys that aren't strings.
+    """
+    try:
+        text = json.dumps(tool_cwl, sort_keys=True, default=tagged_json_value)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def unjsify_tool_once(tool_cwl, run):
+    """
+    The parts of unjsifying tool_cwl that don't depend on the step running
+    it, or None if it has no InlineJavascriptRequirement. Results are kept by
+    the content of the tool, so each different tool is unjsified once however
+    many steps of run run it; they are shared, and must not be modified.
+    """
+    digest = tool_digest(tool_cwl)
+    if digest is None:
+        run.counts["tools"] += 1
+        return unjsify_tool_parts(tool_cwl)
+
+    if digest in run.unjsified_tools:
+        run.counts["tool reuses"] += 1
+        return run.unjsified_tools[digest]
+
+    run.counts["tools"] += 1
+    future = run.pending_tools.pop(digest, None)
+    run.unjsified_tools[digest] = unjsified_tool = unjsify_tool_parts(tool_cwl) if future is None else future.result()
+    return unjsified_tool
+
+def unjsify_tool_parts(tool_cwl):
     inputs_expr_process_step = None
     js_req = get_cwl_map(tool_cwl.get("requirements", []), "InlineJavascriptRequirement", "class")
     if js_req is None:
         return
 
-    input_expressions, output_expressions, output_redirections, new_tool = unjsify_tool(tool_cwl)
+    input_expressions, output_expressions, output_redirections, new_tool, js_req = unjsify_tool(tool_cwl)
     if js_req.get("expressionLib") is None:
         expression_lib_dict = {} # type: JSONType
     else:
@@ -628,21 +957,11 @@ def unjsify_tool_step(tool_cwl, tool_step, eval_exprs_location):
             "expressionLib": {"default": ";".join(js_req["expressionLib"])}
         }
 
-
-    def add_defaults(step_input_name):
-        if "default" in get_cwl_map(tool_cwl["inputs"], step_input_name):
-            default_value = get_cwl_map(tool_cwl["inputs"], step_input_name)["default"]
-
-            return [step_input_name, default_value]
-        else:
-            return step_input_name
-
     inputs_to_process = {}
 
-    for input in tool_cwl["inputs"]:
+    for input in new_tool["inputs"]:
         if input.get("inputBinding", {}).get("loadContents", False) == True:
-            inputs_to_process[input["id"]] = copy.deepcopy(input)
-            inputs_to_process[input["id"]]["id"] = inputs_to_process[input["id"]]["id"].split("/")[-1] + "_in"
+            inputs_to_process[input["id"]] = {**input, "id": input["id"].split("/")[-1] + "_in"}
 
     if inputs_to_process != {}:
         inputs_expr_process_step = {
@@ -670,6 +989,26 @@ def unjsify_tool_step(tool_cwl, tool_step, eval_exprs_location):
             }
         }
 
+    return UnjsifiedTool(new_tool, input_expressions, output_expressions, output_redirections, expression_lib_dict, inputs_to_process, inputs_expr_process_step)
+
+def unjsify_tool_step(tool_cwl, tool_step, eval_exprs_location, run):
+    output_processing_step = None
+    inputs_expr_step = None
+
+    unjsified_tool = unjsify_tool_once(tool_cwl, run)
+    if unjsified_tool is None:
+        return
+
+    new_tool, input_expressions, output_expressions, output_redirections, expression_lib_dict, inputs_to_process, inputs_expr_process_step = unjsified_tool
+
+    def add_defaults(step_input_name):
+        if "default" in get_cwl_map(new_tool["inputs"], step_input_name):
+            default_value = get_cwl_map(new_tool["inputs"], step_input_name)["default"]
+
+            return [step_input_name, default_value]
+        else:
+            return step_input_name
+
     if len(input_expressions) != 0:
         inputs_expr_step = {
             "id": EVAL_INPUT_EXPRS,
@@ -677,7 +1016,7 @@ def unjsify_tool_step(tool_cwl, tool_step, eval_exprs_location):
             "in": {
                 "input_values": {
                     "source": list(map(
-                        lambda x: PROCESS_INPUT_EXPRS + "/" + inputs_to_process[x]["id"][:-3] if x in get_map_keys(inputs_to_process) else x,
+                        lambda x: PROCESS_INPUT_EXPRS + "/" + inputs_to_process[x]["id"][:-3] if x in inputs_to_process else x,
                         get_map_keys(tool_step["in"])
                     ))
                 },
@@ -717,9 +1056,18 @@ def unjsify_tool_step(tool_cwl, tool_step, eval_exprs_location):
     return new_tool, (inputs_expr_step, output_processing_step, inputs_expr_process_step), output_redirections
 
 def unjsify_tool(cwl):
+    """
+    Move the expressions of a tool out to be evaluated by steps before and
+    after it. cwl is left as it is: the new tool shares what it doesn't change.
+    Returns the expressions, the outputs they replace, the new tool and its
+    InlineJavascriptRequirement, as rewritten with the tool.
+    """
     input_expressions = []
     output_expressions = []
-    for _input in cwl["inputs"]:
+
+    cwl = dict(cwl)
+    cwl["inputs"] = copy_cwl_map(cwl["inputs"])
+    for index, _input in enumerate(list(cwl["inputs"])):
         if isinstance(_input, str):
             input = cwl["inputs"][_input]
             input_id = _input
@@ -732,11 +1080,16 @@ def unjsify_tool(cwl):
             return f"inputs.{EXPR_SYMBOL}[{len(input_expressions) - 1}]"
 
         if input.get("inputBinding", {}).get("valueFrom") is not None:
-            input["inputBinding"]["valueFrom"] = replace_expr(input["inputBinding"]["valueFrom"], on_found_input_expr)
+            new_input = {**input, "inputBinding": {
+                **input["inputBinding"],
+                "valueFrom": replace_expr(input["inputBinding"]["valueFrom"], on_found_input_expr)
+            }}
+            cwl["inputs"][_input if isinstance(_input, str) else index] = new_input
 
     output_redirections = {}
 
-    for _output in cwl["outputs"]:
+    cwl["outputs"] = copy_cwl_map(cwl["outputs"])
+    for index, _output in enumerate(list(cwl["outputs"])):
         if isinstance(_output, str):
             output = cwl["outputs"][_output]
             output_id = _output
@@ -753,15 +1106,20 @@ def unjsify_tool(cwl):
                 output_expressions.append({"outputId": output_id, "expr": expression})
                 return f"self[{len(output_expressions) - 1}]"
 
-            output["outputBinding"]["outputEval"] = replace_expr(output["outputBinding"]["outputEval"], on_found_output_expr)
+            new_output = {**output, "outputBinding": {
+                **output["outputBinding"],
+                "outputEval": replace_expr(output["outputBinding"]["outputEval"], on_found_output_expr)
+            }}
 
             if found_output_expression:
                 output_redirections[output_id] = {
-                    "outputEval": output["outputBinding"]["outputEval"],
+                    "outputEval": new_output["outputBinding"]["outputEval"],
                     "type": output["type"]
                 }
-                del output["outputBinding"]["outputEval"]
-                output["type"] = "Any?"
+                del new_output["outputBinding"]["outputEval"]
+                new_output["type"] = "Any?"
+
+            cwl["outputs"][_output if isinstance(_output, str) else index] = new_output
 
     def on_found_expr(expression):
         input_expressions.append({"self": None, "expr": expression})
@@ -773,8 +1131,12 @@ def unjsify_tool(cwl):
         else:
             return node
 
-    inplace_nested_leaf_map(visit_cwl_node, cwl)
+    cwl = nested_leaf_map(visit_cwl_node, cwl)
+
+    js_req = None
     if cwl.get("requirements") is not None:
+        js_req = get_cwl_map(cwl["requirements"], "InlineJavascriptRequirement", "class")
+        cwl["requirements"] = copy_cwl_map(cwl["requirements"], "class")
         remove_cwl_map(cwl["requirements"], "InlineJavascriptRequirement", "class")
 
     if len(input_expressions) != 0:
@@ -786,7 +1148,7 @@ def unjsify_tool(cwl):
         })
 
 
-    return input_expressions, output_expressions, output_redirections, cwl
+    return input_expressions, output_expressions, output_redirections, cwl, js_req
 
 def main():
     parser = argparse.ArgumentParser(__name__)
@@ -794,11 +1156,52 @@ def main():
     parser.add_argument("-b", "--base-dir", help="Base directory for the CWL files")
     parser.add_argument("-o", "--output", help="Output directory for results.")
     parser.add_argument("--language", help="Language to use ('js' or 'python').", default="js")
+    parser.add_argument("--cache-dir", help="Directory to cache loaded CWL documents in between runs.")
+    parser.add_argument("--cache-size", help="Maximum size of the document cache in megabytes.", type=int, default=256)
+    parser.add_argument("--load-workers", help="Number of processes to load CWL documents with.", type=int, default=1)
+    parser.add_argument("--fast-yaml", help="Parse CWL documents with libyaml, without line and column information.", action="store_true")
+    parser.add_argument("--low-memory", help="Don't keep the parsed YAML of documents once they are loaded.", action="store_true")
+    parser.add_argument("--trusted", help="Don't validate the CWL documents, which must already be valid.", action="store_true")
+    parser.add_argument("--fetch-workers", help="Number of remote documents to fetch at once.", type=int)
+    parser.add_argument("--jobs", help="Number of processes to unjsify tools and write output files with.", type=int, default=1)
+    parser.add_argument("-v", "--verbose", help="Report what the run did, such as how often tools were reused; twice for more detail.", action="count", default=0)
     args = parser.parse_args()
 
+    logging.basicConfig(format="%(message)s", level=[logging.WARNING, logging.INFO, logging.DEBUG][min(args.verbose, 2)])
+
     if args.base_dir is None:
         args.base_dir = path.dirname(args.cwl_workflow)
-    unjsify(args.cwl_workflow, args.output, args.base_dir, args.language)
+
+    document_cache = None
+    if args.cache_dir is not None:
+        document_cache = DocumentCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+    load_executor = None
+    if args.load_workers > 1:
+        # Only imported here, as it pulls in multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        load_executor = ProcessPoolExecutor(args.load_workers)
+
+    unjsify_executor = None
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        unjsify_executor = ProcessPoolExecutor(args.jobs)
+
+    try:
+        run = UnjsifyRun(
+            document_cache=document_cache, load_executor=load_executor, unjsify_executor=unjsify_executor,
+            fast_yaml=args.fast_yaml, low_memory=args.low_memory, trusted=args.trusted, fetch_workers=args.fetch_workers
+        )
+        unjsify(args.cwl_workflow, args.output, args.base_dir, args.language, run)
+    finally:
+        if load_executor is not None:
+            load_executor.shutdown()
+        if unjsify_executor is not None:
+            unjsify_executor.shutdown()
+
+    logger.info(run.stats())
+    if document_cache is not None:
+        logger.info(document_cache.stats())
 
 if __name__ == "__main__":
     main()